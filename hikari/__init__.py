@@ -77,6 +77,7 @@ from hikari.files import Resourceish
 from hikari.guilds import *
 from hikari.impl import ClientCredentialsStrategy
 from hikari.impl import GatewayBot
+from hikari.impl import GatewayCluster
 from hikari.impl import RESTApp
 from hikari.impl import RESTBot
 from hikari.intents import *
@@ -50,6 +50,7 @@ from hikari.files import Resourceish as Resourceish
 from hikari.guilds import *
 from hikari.impl import ClientCredentialsStrategy as ClientCredentialsStrategy
 from hikari.impl import GatewayBot as GatewayBot
+from hikari.impl import GatewayCluster as GatewayCluster
 from hikari.impl import RESTApp as RESTApp
 from hikari.impl import RESTBot as RESTBot
 from hikari.intents import *
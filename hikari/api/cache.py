@@ -29,6 +29,7 @@ import abc
 import typing
 
 from hikari import iterators
+from hikari import undefined
 
 if typing.TYPE_CHECKING:
     from hikari import channels
@@ -36,10 +37,12 @@ if typing.TYPE_CHECKING:
     from hikari import guilds
     from hikari import invites
     from hikari import messages
+    from hikari import permissions as permissions_
     from hikari import presences
     from hikari import snowflakes
     from hikari import users
     from hikari import voices
+    from hikari.internal import data_binding
 
 _KeyT = typing.TypeVar("_KeyT", bound=typing.Hashable)
 _ValueT = typing.TypeVar("_ValueT")
@@ -407,6 +410,83 @@ class Cache(abc.ABC):
             The object of the member found in the cache, else `builtins.None`.
         """
 
+    @abc.abstractmethod
+    def get_member_permissions(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        user: snowflakes.SnowflakeishOr[users.PartialUser],
+        /,
+        channel: typing.Optional[snowflakes.SnowflakeishOr[channels.PartialChannel]] = None,
+    ) -> typing.Optional[permissions_.Permissions]:
+        """Compute a member's effective permissions from the cache.
+
+        This combines the permissions of the guild's `@everyone` role, the
+        member's roles and, if a channel is passed, the channel's permission
+        overwrites.
+
+        !!! note
+            Implementations may memoize the results of this, but they must
+            stay consistent with the cached guild, roles, members and channels.
+
+        Parameters
+        ----------
+        guild : hikari.snowflakes.SnowflakeishOr[hikari.guilds.PartialGuild]
+            Object or ID of the guild to compute the member's permissions in.
+        user : hikari.snowflakes.SnowflakeishOr[hikari.users.PartialUser]
+            Object or ID of the user to compute the member's permissions for.
+
+        Other Parameters
+        ----------------
+        channel : typing.Optional[hikari.snowflakes.SnowflakeishOr[hikari.channels.PartialChannel]]
+            Object or ID of the guild channel to compute the member's
+            permissions in. If left as `builtins.None` then the member's
+            guild-wide permissions are returned.
+
+        Returns
+        -------
+        typing.Optional[hikari.permissions.Permissions]
+            The member's effective permissions, else `builtins.None` if the
+            guild, its `@everyone` role, the member or the channel isn't
+            cached.
+        """
+
+    @abc.abstractmethod
+    def get_members_with_permissions(
+        self,
+        channel: snowflakes.SnowflakeishOr[channels.PartialChannel],
+        permissions: permissions_.Permissions,
+        /,
+        members: undefined.UndefinedOr[
+            typing.Iterable[snowflakes.SnowflakeishOr[users.PartialUser]]
+        ] = undefined.UNDEFINED,
+    ) -> typing.Sequence[snowflakes.Snowflake]:
+        """Get the IDs of the cached members which have permissions in a channel.
+
+        This is faster than calling `Cache.get_member_permissions` for each
+        member.
+
+        Parameters
+        ----------
+        channel : hikari.snowflakes.SnowflakeishOr[hikari.channels.PartialChannel]
+            Object or ID of the guild channel to check the permissions in.
+        permissions : hikari.permissions.Permissions
+            The permissions the members must all have in the channel.
+
+        Other Parameters
+        ----------------
+        members : hikari.undefined.UndefinedOr[typing.Iterable[hikari.snowflakes.SnowflakeishOr[hikari.users.PartialUser]]]
+            Objects or IDs of the members to check. If left as
+            `hikari.undefined.UNDEFINED` then every member cached for the
+            channel's guild will be checked.
+
+        Returns
+        -------
+        typing.Sequence[hikari.snowflakes.Snowflake]
+            The IDs of the members which have all of the permissions in the
+            channel, in the order they were checked. Members which aren't
+            cached are left out.
+        """  # noqa E501 - Line too long
+
     @abc.abstractmethod
     def get_members_view(self) -> CacheView[snowflakes.Snowflake, CacheView[snowflakes.Snowflake, guilds.Member]]:
         """Get a view of all the members objects in the cache.
@@ -435,6 +515,29 @@ class Cache(abc.ABC):
             The view of user IDs to the members cached for the specified guild.
         """
 
+    @abc.abstractmethod
+    def get_members_view_for_role(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        role: snowflakes.SnowflakeishOr[guilds.PartialRole],
+        /,
+    ) -> CacheView[snowflakes.Snowflake, guilds.Member]:
+        """Get a view of the members cached for a specific guild with a role.
+
+        Parameters
+        ----------
+        guild : hikari.snowflakes.SnowflakeishOr[hikari.guilds.PartialGuild]
+            Object or ID of the guild to get the cached members for.
+        role : hikari.snowflakes.SnowflakeishOr[hikari.guilds.PartialRole]
+            Object or ID of the role to get the cached members for.
+
+        Returns
+        -------
+        CacheView[hikari.snowflakes.Snowflake, hikari.guilds.Member]
+            The view of user IDs to the members cached for the specified guild
+            which have the specified role.
+        """
+
     @abc.abstractmethod
     def get_message(
         self, message: snowflakes.SnowflakeishOr[messages.PartialMessage], /
@@ -882,6 +985,47 @@ class MutableCache(Cache, abc.ABC):
             be added (else `builtins.None`).
         """  # noqa E501 - Line too long
 
+    @abc.abstractmethod
+    def replace_guild_contents(
+        self,
+        guild: guilds.GatewayGuild,
+        /,
+        *,
+        channels: typing.Iterable[channels.GuildChannel] = (),
+        emojis: typing.Iterable[emojis.KnownCustomEmoji] = (),
+        roles: typing.Iterable[guilds.Role] = (),
+        members: typing.Iterable[guilds.Member] = (),
+        presences: typing.Iterable[presences.MemberPresence] = (),
+        voice_states: typing.Iterable[voices.VoiceState] = (),
+    ) -> None:
+        """Replace a guild and all the resources cached for it.
+
+        This is equivalent to updating the guild, then clearing the channels,
+        emojis, roles, members, presences and voice states cached for it before
+        setting the given ones, but avoids repeating the work shared between
+        each of the individual calls.
+
+        Parameters
+        ----------
+        guild : hikari.guilds.GatewayGuild
+            The object of the guild to add to the cache.
+
+        Other Parameters
+        ----------------
+        channels : typing.Iterable[hikari.channels.GuildChannel]
+            The channels to cache for the guild.
+        emojis : typing.Iterable[hikari.emojis.KnownCustomEmoji]
+            The emojis to cache for the guild.
+        roles : typing.Iterable[hikari.guilds.Role]
+            The roles to cache for the guild.
+        members : typing.Iterable[hikari.guilds.Member]
+            The members to cache for the guild.
+        presences : typing.Iterable[hikari.presences.MemberPresence]
+            The presences to cache for the guild.
+        voice_states : typing.Iterable[hikari.voices.VoiceState]
+            The voice states to cache for the guild.
+        """
+
     @abc.abstractmethod
     def clear_guild_channels(self) -> CacheView[snowflakes.Snowflake, channels.GuildChannel]:
         """Remove all guild channels from the cache.
@@ -1168,6 +1312,47 @@ class MutableCache(Cache, abc.ABC):
             The object of the member to add to the cache.
         """
 
+    @abc.abstractmethod
+    def set_members_bulk(self, members: typing.Iterable[guilds.Member], /) -> None:
+        """Add multiple member objects to the cache.
+
+        This is faster than calling `MutableCache.set_member` for each member,
+        especially when consecutive members belong to the same guild.
+
+        Parameters
+        ----------
+        members : typing.Iterable[hikari.guilds.Member]
+            The objects of the members to add to the cache.
+        """
+
+    @abc.abstractmethod
+    def set_member_payloads(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        member_payloads: typing.Iterable[data_binding.JSONObject],
+        /,
+        *,
+        presence_payloads: typing.Iterable[data_binding.JSONObject] = (),
+    ) -> None:
+        """Add members and their presences to the cache from raw gateway payloads.
+
+        This is used for member chunks which no event listener needs, so
+        implementations may defer deserializing the members until they are
+        read.
+
+        Parameters
+        ----------
+        guild : hikari.snowflakes.SnowflakeishOr[hikari.guilds.PartialGuild]
+            Object or ID of the guild the members belong to.
+        member_payloads : typing.Iterable[hikari.internal.data_binding.JSONObject]
+            The payloads of the members to add to the cache.
+
+        Other Parameters
+        ----------------
+        presence_payloads : typing.Iterable[hikari.internal.data_binding.JSONObject]
+            The payloads of the members' presences to add to the cache.
+        """
+
     @abc.abstractmethod
     def update_member(
         self, member: guilds.Member, /
@@ -1251,6 +1436,20 @@ class MutableCache(Cache, abc.ABC):
             The object of the presence to add to the cache.
         """
 
+    @abc.abstractmethod
+    def set_presences_bulk(self, presences: typing.Iterable[presences.MemberPresence], /) -> None:
+        """Add multiple presence objects to the cache.
+
+        This is faster than calling `MutableCache.set_presence` for each
+        presence, especially when consecutive presences belong to the same
+        guild.
+
+        Parameters
+        ----------
+        presences : typing.Iterable[hikari.presences.MemberPresence]
+            The objects of the presences to add to the cache.
+        """
+
     @abc.abstractmethod
     def update_presence(
         self, presence: presences.MemberPresence, /
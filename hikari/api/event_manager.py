@@ -41,7 +41,8 @@ if typing.TYPE_CHECKING:
     EventT_co = typing.TypeVar("EventT_co", bound=base_events.Event, covariant=True)
     EventT_inv = typing.TypeVar("EventT_inv", bound=base_events.Event)
     PredicateT = typing.Callable[[EventT_co], bool]
-    CallbackT = typing.Callable[[EventT_inv], typing.Coroutine[typing.Any, typing.Any, None]]
+    KeyT = typing.Tuple[str, typing.Any]
+    CallbackT = typing.Callable[[EventT_inv], typing.Optional[typing.Coroutine[typing.Any, typing.Any, None]]]
     ConsumerT = typing.Callable[
         [gateway_shard.GatewayShard, data_binding.JSONObject], typing.Coroutine[typing.Any, typing.Any, None]
     ]
@@ -137,7 +138,7 @@ class EventManager(abc.ABC):
     @abc.abstractmethod
     def consume_raw_event(
         self, event_name: str, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject
-    ) -> None:
+    ) -> typing.Optional[typing.Awaitable[None]]:
         """Consume a raw event.
 
         Parameters
@@ -149,6 +150,13 @@ class EventManager(abc.ABC):
         payload : hikari.internal.data_binding.JSONObject
             Payload of the event being triggered.
 
+        Returns
+        -------
+        typing.Optional[typing.Awaitable[builtins.None]]
+            `builtins.None`, or an awaitable which the shard must wait for
+            before it consumes any more events. This lets the event manager
+            apply backpressure when it cannot keep up with the shard.
+
         Raises
         ------
         builtins.LookupError
@@ -241,7 +249,13 @@ class EventManager(abc.ABC):
     # For the sake of UX, I will check this at runtime instead and let the
     # user use a static type checker.
     @abc.abstractmethod
-    def subscribe(self, event_type: typing.Type[typing.Any], callback: CallbackT[typing.Any]) -> None:
+    def subscribe(
+        self,
+        event_type: typing.Type[typing.Any],
+        callback: CallbackT[typing.Any],
+        *,
+        serial_key: typing.Optional[str] = None,
+    ) -> None:
         """Subscribe a given callback to a given event type.
 
         Parameters
@@ -251,10 +265,33 @@ class EventManager(abc.ABC):
             subclasses of the given type.
             `T` must be a subclass of `hikari.events.base_events.Event`.
         callback
-            Must be a coroutine function to invoke. This should
+            The coroutine function or function to invoke. This should
             consume an instance of the given event, or an instance of a valid
             subclass if one exists. Any result is discarded.
 
+            Functions which are not coroutine functions are called inline
+            while the event is being dispatched, which avoids the overhead
+            of scheduling a task for cheap callbacks. These must not block.
+
+        Other Parameters
+        ----------------
+        serial_key : typing.Optional[builtins.str]
+            If provided, the name of an attribute of the event (such as
+            `"guild_id"` or `"channel_id"`) to serialize calls to this
+            coroutine function by. Events which share a value for this
+            attribute will be handled one at a time in the order they were
+            dispatched, while events with different values are still handled
+            concurrently.
+
+            Events which do not have this attribute are all handled in a
+            single queue.
+
+        Raises
+        ------
+        builtins.TypeError
+            If `serial_key` is passed for a callback which is not a coroutine
+            function.
+
         Example
         -------
         The following demonstrates subscribing a callback to message creation
@@ -331,7 +368,7 @@ class EventManager(abc.ABC):
 
         Returns
         -------
-        typing.Collection[typing.Callable[[T], typing.Coroutine[typing.Any, typing.Any, builtins.None]]
+        typing.Collection[typing.Callable[[T], typing.Optional[typing.Coroutine[typing.Any, typing.Any, builtins.None]]]
             A copy of the collection of listeners for the event. Will return
             an empty collection if nothing is registered.
 
@@ -346,6 +383,8 @@ class EventManager(abc.ABC):
     def listen(
         self,
         event_type: typing.Optional[typing.Type[EventT_co]] = None,
+        *,
+        serial_key: typing.Optional[str] = None,
     ) -> typing.Callable[[CallbackT[EventT_co]], CallbackT[EventT_co]]:
         """Generate a decorator to subscribe a callback to an event type.
 
@@ -360,11 +399,18 @@ class EventManager(abc.ABC):
 
             `T` must be a subclass of `hikari.events.base_events.Event`.
 
+        Other Parameters
+        ----------------
+        serial_key : typing.Optional[builtins.str]
+            If provided, the name of an attribute of the event to serialize
+            calls to the decorated coroutine function by. See
+            `EventManager.subscribe` for more information.
+
         Returns
         -------
         typing.Callable[[T], T]
-            A decorator for a coroutine function that passes it to
-            `EventManager.subscribe` before returning the function
+            A decorator for a coroutine function or function that passes it
+            to `EventManager.subscribe` before returning the function
             reference.
 
         See Also
@@ -449,6 +495,8 @@ class EventManager(abc.ABC):
         /,
         timeout: typing.Union[float, int, None],
         predicate: typing.Optional[PredicateT[EventT_co]] = None,
+        *,
+        key: typing.Optional[KeyT] = None,
     ) -> EventT_co:
         """Wait for a given event to occur once, then return the event.
 
@@ -473,6 +521,16 @@ class EventManager(abc.ABC):
             result in "leaking" of coroutines that never complete if called in
             an uncontrolled way, so is not recommended).
 
+        Other Parameters
+        ----------------
+        key : typing.Optional[typing.Tuple[builtins.str, typing.Any]]
+            A 2-`builtins.tuple` of an attribute name (nested attributes are
+            referred to using the `.` operator) and the value it must be equal
+            to, such as `("channel_id", channel_id)`. This is checked before
+            `predicate`, and lets the event manager index waiters by the
+            value, which is much faster than a predicate when there are many
+            waiters for the same event type. The value must be hashable.
+
         Returns
         -------
         hikari.events.base_events.Event
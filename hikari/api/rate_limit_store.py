@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Interface used to share REST rate limit state between processes."""
+from __future__ import annotations
+
+__all__: typing.List[str] = ["RateLimitStore"]
+
+import abc
+import typing
+
+
+class RateLimitStore(abc.ABC):
+    """Interface for REST rate limit state which is shared between processes.
+
+    Several processes which make requests using the same token can share a
+    store so they follow the same bucket and global rate limits. Each
+    process keeps enforcing its own limits as well, so the store is only
+    consulted in addition to them.
+
+    All the processes sharing a store must use the same token.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    @abc.abstractmethod
+    async def get_bucket_hash(self, route: str, /) -> typing.Optional[str]:
+        """Get the bucket hash which a route was last seen using.
+
+        Parameters
+        ----------
+        route : builtins.str
+            The method and path template of the route, separated by a space.
+
+        Returns
+        -------
+        typing.Optional[builtins.str]
+            The `X-RateLimit-Bucket` header last received for the route, or
+            `builtins.None` if it is not known.
+        """
+
+    @abc.abstractmethod
+    async def set_bucket_hash(self, route: str, bucket_hash: str, /) -> None:
+        """Set the bucket hash which a route is using.
+
+        Parameters
+        ----------
+        route : builtins.str
+            The method and path template of the route, separated by a space.
+        bucket_hash : builtins.str
+            The `X-RateLimit-Bucket` header received for the route.
+        """
+
+    @abc.abstractmethod
+    async def reserve(self, real_bucket_hash: typing.Optional[str], /, *, use_global_rate_limit: bool) -> float:
+        """Try to reserve a request on a bucket.
+
+        Parameters
+        ----------
+        real_bucket_hash : typing.Optional[builtins.str]
+            The real bucket hash of the bucket to reserve the request on, or
+            `builtins.None` if the bucket is not known yet.
+
+        Other Parameters
+        ----------------
+        use_global_rate_limit : builtins.bool
+            Whether the request is subject to the global rate limit.
+
+        Returns
+        -------
+        builtins.float
+            `0` if the request was reserved, otherwise the number of seconds
+            to wait before trying to reserve it again.
+        """
+
+    @abc.abstractmethod
+    async def update_bucket(self, real_bucket_hash: str, /, *, remaining: int, limit: int, reset_after: float) -> None:
+        """Update the state of a bucket using the headers of a response.
+
+        As other processes may have requests in flight which are not counted
+        in the headers yet, these should only be allowed to make the bucket
+        more restrictive until its current window resets.
+
+        Parameters
+        ----------
+        real_bucket_hash : builtins.str
+            The real bucket hash of the bucket to update.
+
+        Other Parameters
+        ----------------
+        remaining : builtins.int
+            The `X-RateLimit-Remaining` header cast to an `builtins.int`.
+        limit : builtins.int
+            The `X-RateLimit-Limit` header cast to an `builtins.int`.
+        reset_after : builtins.float
+            The number of seconds until the bucket resets.
+        """
+
+    @abc.abstractmethod
+    async def throttle_global(self, retry_after: float, /) -> None:
+        """Stop any requests subject to the global rate limit being reserved for a while.
+
+        Parameters
+        ----------
+        retry_after : builtins.float
+            The number of seconds to stop reserving requests for.
+        """
+
+    @abc.abstractmethod
+    async def close(self) -> None:
+        """Close the store and release any resources it holds."""
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Interface used to resolve entities from the cache, falling back to REST."""
+from __future__ import annotations
+
+__all__: typing.List[str] = ["Resolver"]
+
+import abc
+import typing
+
+if typing.TYPE_CHECKING:
+    from hikari import channels
+    from hikari import emojis
+    from hikari import guilds
+    from hikari import snowflakes
+    from hikari import users as users_
+
+
+class Resolver(abc.ABC):
+    """Interface for resolving entities from the cache, falling back to REST.
+
+    Each call first checks the cache. On a miss, the entity is fetched using
+    the REST API, and concurrent calls for the same entity share the same
+    request. Where the cache can hold the fetched entity, it is stored so
+    later calls do not need to fetch it again.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    @abc.abstractmethod
+    async def channel(self, channel: snowflakes.SnowflakeishOr[channels.PartialChannel], /) -> channels.PartialChannel:
+        """Resolve a channel.
+
+        Guild channels which had to be fetched are stored in the cache.
+
+        Parameters
+        ----------
+        channel : hikari.snowflakes.SnowflakeishOr[hikari.channels.PartialChannel]
+            The channel to resolve. This may be the object or the ID of an
+            existing channel.
+
+        Returns
+        -------
+        hikari.channels.PartialChannel
+            The resolved channel.
+
+        Raises
+        ------
+        hikari.errors.NotFoundError
+            If the channel is not found.
+        hikari.errors.HTTPError
+            If the channel had to be fetched and the request failed.
+        """
+
+    @abc.abstractmethod
+    async def emoji(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        emoji: snowflakes.SnowflakeishOr[emojis.CustomEmoji],
+        /,
+    ) -> emojis.KnownCustomEmoji:
+        """Resolve a guild's emoji.
+
+        Emojis which had to be fetched are stored in the cache.
+
+        Parameters
+        ----------
+        guild : hikari.snowflakes.SnowflakeishOr[hikari.guilds.PartialGuild]
+            The guild the emoji belongs to. This may be the object or the ID
+            of an existing guild.
+        emoji : hikari.snowflakes.SnowflakeishOr[hikari.emojis.CustomEmoji]
+            The emoji to resolve. This may be the object or the ID of an
+            existing emoji.
+
+        Returns
+        -------
+        hikari.emojis.KnownCustomEmoji
+            The resolved emoji.
+
+        Raises
+        ------
+        hikari.errors.NotFoundError
+            If the guild or the emoji are not found.
+        hikari.errors.HTTPError
+            If the emoji had to be fetched and the request failed.
+        """
+
+    @abc.abstractmethod
+    async def guild(self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /) -> guilds.Guild:
+        """Resolve a guild.
+
+        A fetched `hikari.guilds.RESTGuild` is not stored in the cache, as
+        the cache only holds the guilds received over the gateway.
+
+        Parameters
+        ----------
+        guild : hikari.snowflakes.SnowflakeishOr[hikari.guilds.PartialGuild]
+            The guild to resolve. This may be the object or the ID of an
+            existing guild.
+
+        Returns
+        -------
+        hikari.guilds.Guild
+            The resolved guild. This will be a `hikari.guilds.GatewayGuild`
+            if it was in the cache, otherwise a `hikari.guilds.RESTGuild`.
+
+        Raises
+        ------
+        hikari.errors.NotFoundError
+            If the guild is not found.
+        hikari.errors.HTTPError
+            If the guild had to be fetched and the request failed.
+        """
+
+    @abc.abstractmethod
+    async def member(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        user: snowflakes.SnowflakeishOr[users_.PartialUser],
+        /,
+    ) -> guilds.Member:
+        """Resolve a guild member.
+
+        Members which had to be fetched are stored in the cache.
+
+        Parameters
+        ----------
+        guild : hikari.snowflakes.SnowflakeishOr[hikari.guilds.PartialGuild]
+            The guild the member is in. This may be the object or the ID of an
+            existing guild.
+        user : hikari.snowflakes.SnowflakeishOr[hikari.users.PartialUser]
+            The user of the member to resolve. This may be the object or the
+            ID of an existing user.
+
+        Returns
+        -------
+        hikari.guilds.Member
+            The resolved member.
+
+        Raises
+        ------
+        hikari.errors.NotFoundError
+            If the guild or the member are not found.
+        hikari.errors.HTTPError
+            If the member had to be fetched and the request failed.
+        """
+
+    @abc.abstractmethod
+    async def members(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        users: typing.Iterable[snowflakes.SnowflakeishOr[users_.PartialUser]],
+        /,
+        *,
+        max_concurrency: int = 10,
+    ) -> typing.Mapping[snowflakes.Snowflake, guilds.Member]:
+        """Resolve many members of a guild.
+
+        Parameters
+        ----------
+        guild : hikari.snowflakes.SnowflakeishOr[hikari.guilds.PartialGuild]
+            The guild the members are in. This may be the object or the ID of
+            an existing guild.
+        users : typing.Iterable[hikari.snowflakes.SnowflakeishOr[hikari.users.PartialUser]]
+            The users of the members to resolve. These may be objects or the
+            IDs of existing users.
+
+        Other Parameters
+        ----------------
+        max_concurrency : builtins.int
+            The maximum number of members to fetch at once. Defaults to `10`.
+
+        Returns
+        -------
+        typing.Mapping[hikari.snowflakes.Snowflake, hikari.guilds.Member]
+            Mapping of user IDs to the resolved members. Members which were
+            not found are left out.
+
+        Raises
+        ------
+        builtins.ValueError
+            If `max_concurrency` is not a positive integer.
+        hikari.errors.HTTPError
+            If a member had to be fetched and the request failed for any
+            reason other than the member not being found.
+        """
+
+    @abc.abstractmethod
+    async def user(self, user: snowflakes.SnowflakeishOr[users_.PartialUser], /) -> users_.User:
+        """Resolve a user.
+
+        A fetched user is not stored in the cache, as the cache only holds
+        the users of the members it holds.
+
+        Parameters
+        ----------
+        user : hikari.snowflakes.SnowflakeishOr[hikari.users.PartialUser]
+            The user to resolve. This may be the object or the ID of an
+            existing user.
+
+        Returns
+        -------
+        hikari.users.User
+            The resolved user.
+
+        Raises
+        ------
+        hikari.errors.NotFoundError
+            If the user is not found.
+        hikari.errors.HTTPError
+            If the user had to be fetched and the request failed.
+        """
+
+    @abc.abstractmethod
+    async def users(
+        self,
+        users: typing.Iterable[snowflakes.SnowflakeishOr[users_.PartialUser]],
+        /,
+        *,
+        max_concurrency: int = 10,
+    ) -> typing.Mapping[snowflakes.Snowflake, users_.User]:
+        """Resolve many users.
+
+        Parameters
+        ----------
+        users : typing.Iterable[hikari.snowflakes.SnowflakeishOr[hikari.users.PartialUser]]
+            The users to resolve. These may be objects or the IDs of existing
+            users.
+
+        Other Parameters
+        ----------------
+        max_concurrency : builtins.int
+            The maximum number of users to fetch at once. Defaults to `10`.
+
+        Returns
+        -------
+        typing.Mapping[hikari.snowflakes.Snowflake, hikari.users.User]
+            Mapping of user IDs to the resolved users. Users which were not
+            found are left out.
+
+        Raises
+        ------
+        builtins.ValueError
+            If `max_concurrency` is not a positive integer.
+        hikari.errors.HTTPError
+            If a user had to be fetched and the request failed for any
+            reason other than the user not being found.
+        """
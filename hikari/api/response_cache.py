@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Interface used to cache the responses of REST requests."""
+from __future__ import annotations
+
+__all__: typing.List[str] = ["ResponseCache"]
+
+import abc
+import typing
+
+if typing.TYPE_CHECKING:
+    from hikari.internal import data_binding
+    from hikari.internal import routes
+
+    _QueryT = typing.Tuple[typing.Tuple[str, str], ...]
+
+
+class ResponseCache(abc.ABC):
+    """Interface for caching the responses of REST `GET` requests.
+
+    The REST client only uses this for requests made with its own
+    authorization, so an implementation must never be shared between
+    clients using different tokens.
+
+    The cached responses are the decoded JSON bodies and are shared between
+    every request they are returned to, so they must not be mutated.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    @abc.abstractmethod
+    def is_cacheable(self, route: routes.CompiledRoute, /) -> bool:
+        """Check whether the responses of a route should be cached.
+
+        Parameters
+        ----------
+        route : hikari.internal.routes.CompiledRoute
+            The route of the request.
+
+        Returns
+        -------
+        builtins.bool
+            `builtins.True` if the responses of the route should be cached,
+            otherwise `builtins.False`.
+        """
+
+    @abc.abstractmethod
+    def get_response(
+        self, route: routes.CompiledRoute, query: _QueryT, /
+    ) -> typing.Union[None, data_binding.JSONObject, data_binding.JSONArray]:
+        """Get a cached response.
+
+        Parameters
+        ----------
+        route : hikari.internal.routes.CompiledRoute
+            The route of the request.
+        query : typing.Tuple[typing.Tuple[builtins.str, builtins.str], ...]
+            The query parameters of the request.
+
+        Returns
+        -------
+        typing.Union[builtins.None, hikari.internal.data_binding.JSONObject, hikari.internal.data_binding.JSONArray]
+            The cached response, or `builtins.None` if there is no response
+            cached for the request or it has expired.
+        """
+
+    @abc.abstractmethod
+    def set_response(
+        self,
+        route: routes.CompiledRoute,
+        query: _QueryT,
+        response: typing.Union[data_binding.JSONObject, data_binding.JSONArray],
+        /,
+        *,
+        requested_at: float,
+    ) -> None:
+        """Cache the response of a request.
+
+        Parameters
+        ----------
+        route : hikari.internal.routes.CompiledRoute
+            The route of the request.
+        query : typing.Tuple[typing.Tuple[builtins.str, builtins.str], ...]
+            The query parameters of the request.
+        response : typing.Union[hikari.internal.data_binding.JSONObject, hikari.internal.data_binding.JSONArray]
+            The decoded response.
+        requested_at : builtins.float
+            The `hikari.internal.time.monotonic` time the request was made at.
+
+            If the route was invalidated after this, the response may already
+            be out of date and should not be cached.
+        """
+
+    @abc.abstractmethod
+    def invalidate(self, route: routes.CompiledRoute, /) -> None:
+        """Remove the cached responses of a route, regardless of their query.
+
+        Parameters
+        ----------
+        route : hikari.internal.routes.CompiledRoute
+            The route to remove the responses of.
+        """
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Remove all of the cached responses."""
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Interfaces used to persist gateway sessions between restarts."""
+from __future__ import annotations
+
+__all__: typing.List[str] = ["GatewaySession", "SessionStore"]
+
+import abc
+import typing
+
+import attr
+
+from hikari.internal import attr_extensions
+
+if typing.TYPE_CHECKING:
+    from hikari import snowflakes
+
+
+@attr_extensions.with_copy
+@attr.define(hash=True, kw_only=True, weakref_slot=False)
+class GatewaySession:
+    """The state needed to resume a shard's gateway session."""
+
+    shard_id: int = attr.field()
+    """The ID of the shard the session belongs to."""
+
+    shard_count: int = attr.field()
+    """The shard count the session was started with."""
+
+    session_id: str = attr.field()
+    """The ID of the session, as given in the `READY` event."""
+
+    seq: int = attr.field()
+    """The sequence number of the last event received in the session."""
+
+    user_id: snowflakes.Snowflake = attr.field()
+    """The ID of the bot user the session was started for."""
+
+
+class SessionStore(abc.ABC):
+    """Interface for persisting gateway sessions so they can be resumed after a restart.
+
+    A session may only be resumed by a shard with the same ID and shard count,
+    and only once, so implementations should not return a session again after
+    it has been deleted.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    @abc.abstractmethod
+    async def load_session(self, shard_id: int, shard_count: int, /) -> typing.Optional[GatewaySession]:
+        """Load the stored session for a shard.
+
+        Parameters
+        ----------
+        shard_id : builtins.int
+            The ID of the shard to load the session for.
+        shard_count : builtins.int
+            The shard count the session must have been started with.
+
+        Returns
+        -------
+        typing.Optional[GatewaySession]
+            The stored session, or `builtins.None` if there was no session
+            stored for the shard with this shard count.
+        """
+
+    @abc.abstractmethod
+    async def save_session(self, session: GatewaySession, /) -> None:
+        """Store a session, replacing any session stored for the same shard.
+
+        Parameters
+        ----------
+        session : GatewaySession
+            The session to store.
+        """
+
+    @abc.abstractmethod
+    async def delete_session(self, shard_id: int, /) -> None:
+        """Delete the stored session for a shard, if there is one.
+
+        Parameters
+        ----------
+        shard_id : builtins.int
+            The ID of the shard to delete the session for.
+        """
@@ -31,9 +31,13 @@ __all__: typing.List[str] = [
     "HTTPSettings",
     "CacheComponents",
     "CacheSettings",
+    "DispatchOverflowPolicy",
+    "DispatchSettings",
+    "ResponseCacheSettings",
 ]
 
 import base64
+import datetime
 import ssl as ssl_
 import typing
 
@@ -43,6 +47,7 @@ import yarl
 from hikari.internal import attr_extensions
 from hikari.internal import data_binding
 from hikari.internal import enums
+from hikari.internal import routes
 
 _BASICAUTH_TOKEN_PREFIX: typing.Final[str] = "Basic"  # nosec
 _PROXY_AUTHENTICATION_HEADER: typing.Final[str] = "Proxy-Authentication"
@@ -265,6 +270,44 @@ class HTTPTimeoutSettings:
 class HTTPSettings:
     """Settings to control HTTP clients."""
 
+    coalesce_get_requests: bool = attr.field(default=False, validator=attr.validators.instance_of(bool))
+    """Toggle whether to coalesce identical REST `GET` requests made at the same time.
+
+    If `builtins.True`, a `GET` request made while an identical one (same
+    route, query, reason and authorization) is still in flight will not be
+    sent. Instead, it waits for the request in flight and receives the same
+    response, which saves both the round trip and the bucket quota.
+
+    The decoded response is shared between all of the coalesced requests.
+    This is safe for the models hikari builds from it, but anything handling
+    the raw response must not mutate it.
+
+    Returns
+    -------
+    builtins.bool
+        `builtins.True` to enable this behavior, `builtins.False` to disable
+        it.
+    """
+
+    concurrent_bucket_requests: bool = attr.field(default=False, validator=attr.validators.instance_of(bool))
+    """Toggle whether to allow concurrent requests within a single rate limit bucket.
+
+    By default, only one request is ever in flight on each REST rate limit
+    bucket at a time, which means that many requests to the same route are
+    limited by the round-trip latency rather than by the actual rate limit.
+
+    If `builtins.True`, up to the remaining number of requests in the current
+    rate limit window will be allowed in flight on a bucket at once. Buckets
+    whose limits are not yet known are still serialized until the first
+    response is received.
+
+    Returns
+    -------
+    builtins.bool
+        `builtins.True` to enable this behavior, `builtins.False` to disable
+        it.
+    """
+
     enable_cleanup_closed: bool = attr.field(default=True, validator=attr.validators.instance_of(bool))
     """Toggle whether to clean up closed transports.
 
@@ -464,3 +507,244 @@ class CacheSettings:
 
     Defaults to `50`.
     """
+
+    columnar_members: bool = attr.field(default=False)
+    """Whether to store the cached members of each guild in packed columns.
+
+    This greatly reduces the memory used by large member caches, at the cost
+    of building the member's data each time it is accessed. This will have no
+    effect if the members cache is not enabled.
+
+    Defaults to `builtins.False`.
+    """
+
+    lazy_members: bool = attr.field(default=False)
+    """Whether to only deserialize the members of member chunks when they are read.
+
+    Member chunks which no listener, waiter or stream receives are cached
+    straight from their payloads, keeping the payload's fields as they were
+    sent until the member is accessed. This makes caching large guilds faster
+    when most members are never read, at the cost of building the member each
+    time it is accessed. This will have no effect if the members cache is not
+    enabled.
+
+    This cannot be used with `CacheSettings.columnar_members`.
+
+    Defaults to `builtins.False`.
+    """
+
+    max_materialized_members: int = attr.field(default=0)
+    """The number of recently read lazily cached members to keep built.
+
+    This will have no effect unless `CacheSettings.lazy_members` is enabled.
+
+    Defaults to `0`.
+    """
+
+    max_members_per_guild: typing.Optional[int] = attr.field(default=None)
+    """The maximum number of members to store for each guild.
+
+    When a guild goes over this, the members which were least recently
+    created or updated are removed from the cache first. Members which are
+    still referenced by a cached voice state or message stay available
+    through those entities. Users are removed from the cache once no member
+    or other entity references them.
+
+    This cannot be used with `CacheSettings.columnar_members`.
+
+    Defaults to `builtins.None`, which stores every member.
+    """
+
+    member_expiry: typing.Optional[datetime.timedelta] = attr.field(default=None)
+    """How long to store a member for after it was last created or updated.
+
+    Expired members are removed as the members of their guild are modified,
+    in the same way as with `CacheSettings.max_members_per_guild`.
+
+    This cannot be used with `CacheSettings.columnar_members`.
+
+    Defaults to `builtins.None`, which stores members until they are removed.
+    """
+
+    max_presences_per_guild: typing.Optional[int] = attr.field(default=None)
+    """The maximum number of presences to store for each guild.
+
+    When a guild goes over this, the presences which were least recently
+    updated are removed from the cache first.
+
+    Defaults to `builtins.None`, which stores every presence.
+    """
+
+    presence_expiry: typing.Optional[datetime.timedelta] = attr.field(default=None)
+    """How long to store a presence for after it was last updated.
+
+    Expired presences are removed as the presences of their guild are modified.
+
+    Defaults to `builtins.None`, which stores presences until they are removed.
+    """
+
+    @max_members_per_guild.validator
+    @max_presences_per_guild.validator
+    def _validate_limit(self, attrib: attr.Attribute[typing.Optional[int]], value: typing.Optional[int]) -> None:
+        if value is not None and value <= 0:
+            raise ValueError(f"CacheSettings.{attrib.name} must be None or a POSITIVE integer")
+
+    @member_expiry.validator
+    @presence_expiry.validator
+    def _validate_expiry(
+        self, attrib: attr.Attribute[typing.Optional[datetime.timedelta]], value: typing.Optional[datetime.timedelta]
+    ) -> None:
+        if value is not None and value <= datetime.timedelta():
+            raise ValueError(f"CacheSettings.{attrib.name} must be None or a POSITIVE timedelta")
+
+    @max_members_per_guild.validator
+    @member_expiry.validator
+    def _validate_member_policy(self, attrib: attr.Attribute[typing.Any], value: typing.Any) -> None:
+        # Setting a member policy after columnar_members is enabled skips that field's validator.
+        if value is not None and self.columnar_members:
+            raise ValueError(f"CacheSettings.{attrib.name} cannot be used with columnar_members")
+
+    @lazy_members.validator
+    def _validate_lazy_members(self, _: attr.Attribute[bool], value: bool) -> None:
+        # Enabling lazy_members after columnar_members is enabled skips that field's validator.
+        if value and self.columnar_members:
+            raise ValueError("CacheSettings.lazy_members cannot be used with columnar_members")
+
+    @max_materialized_members.validator
+    def _validate_max_materialized_members(self, _: attr.Attribute[int], value: int) -> None:
+        if value < 0:
+            raise ValueError("CacheSettings.max_materialized_members must be a NON-NEGATIVE integer")
+
+    @columnar_members.validator
+    def _validate_columnar_members(self, _: attr.Attribute[bool], value: bool) -> None:
+        if value and (self.max_members_per_guild is not None or self.member_expiry is not None):
+            raise ValueError("CacheSettings.columnar_members cannot be used with a member limit or expiry")
+
+        if value and self.lazy_members:
+            raise ValueError("CacheSettings.columnar_members cannot be used with lazy_members")
+
+
+@typing.final
+class DispatchOverflowPolicy(str, enums.Enum):
+    """What to do with an event when the dispatch queue of its shard is full."""
+
+    BLOCK = "block"
+    """Stop reading from the shard until there is space in the queue."""
+
+    DROP_OLDEST = "drop_oldest"
+    """Discard the oldest event in the queue to make space for the new event."""
+
+    DROP_BY_TYPE = "drop_by_type"
+    """Discard the new event if it is one of `DispatchSettings.droppable_events`.
+
+    Any other event will block the shard until there is space in the queue,
+    as with `DispatchOverflowPolicy.BLOCK`.
+    """
+
+
+@attr_extensions.with_copy
+@attr.define(kw_only=True, weakref_slot=False)
+class DispatchSettings:
+    """Settings to bound how many gateway events are processed at once.
+
+    When these are used, each shard gets a queue of raw events which is
+    consumed by a fixed number of worker tasks, instead of creating a new
+    task for every event received.
+    """
+
+    max_queue_size: int = attr.field(default=1_000)
+    """The maximum number of events to queue for each shard.
+
+    Defaults to `1000`.
+    """
+
+    workers: int = attr.field(default=8)
+    """The number of worker tasks processing the events of each shard.
+
+    Defaults to `8`.
+    """
+
+    overflow_policy: DispatchOverflowPolicy = attr.field(default=DispatchOverflowPolicy.BLOCK)
+    """What to do with new events when the queue of a shard is full.
+
+    Defaults to `DispatchOverflowPolicy.BLOCK`.
+    """
+
+    droppable_events: typing.AbstractSet[str] = attr.field(
+        default=frozenset(("PRESENCE_UPDATE", "TYPING_START")), converter=frozenset
+    )
+    """The names of the raw events which may be discarded when a queue is full.
+
+    This only has an effect with `DispatchOverflowPolicy.DROP_BY_TYPE`.
+
+    Defaults to `PRESENCE_UPDATE` and `TYPING_START`.
+    """
+
+    @max_queue_size.validator
+    @workers.validator
+    def _(self, attrib: attr.Attribute[int], value: int) -> None:
+        if not isinstance(value, int) or value <= 0:
+            raise ValueError(f"DispatchSettings.{attrib.name} must be a POSITIVE integer")
+
+
+def _default_response_ttls() -> typing.Dict[routes.Route, float]:
+    return {
+        routes.GET_GUILD: 60.0,
+        routes.GET_GUILD_CHANNELS: 60.0,
+        routes.GET_GUILD_EMOJIS: 60.0,
+        routes.GET_GUILD_ROLES: 60.0,
+        routes.GET_MY_APPLICATION: 300.0,
+    }
+
+
+@attr_extensions.with_copy
+@attr.define(kw_only=True, weakref_slot=False)
+class ResponseCacheSettings:
+    """Settings to control the caching of REST responses.
+
+    Only successful `GET` responses for the routes in `ttls` are cached, and
+    only for requests made with the client's own token. Each REST client
+    gets its own cache.
+    """
+
+    max_entries: int = attr.field(default=1_024)
+    """The maximum number of responses to cache.
+
+    Once this is reached, the least recently used responses are removed first.
+
+    Defaults to `1024`.
+    """
+
+    ttls: typing.Mapping[routes.Route, float] = attr.field(factory=_default_response_ttls)
+    """How long the responses of each route should be cached for, in seconds.
+
+    The responses of routes which are not in this mapping are never cached.
+
+    Defaults to 60 seconds for fetching a guild and its channels, emojis and
+    roles, and 300 seconds for fetching the bot's application.
+    """
+
+    invalidate_on_events: bool = attr.field(default=True, validator=attr.validators.instance_of(bool))
+    """Whether to remove cached responses when a gateway event updates what they hold.
+
+    This only has an effect when running alongside a gateway connection, such
+    as with `hikari.impl.bot.GatewayBot`.
+
+    Defaults to `builtins.True`.
+    """
+
+    @max_entries.validator
+    def _validate_max_entries(self, _: attr.Attribute[int], value: int) -> None:
+        if not isinstance(value, int) or value <= 0:
+            raise ValueError("ResponseCacheSettings.max_entries must be a POSITIVE integer")
+
+    @ttls.validator
+    def _validate_ttls(
+        self, _: attr.Attribute[typing.Mapping[routes.Route, float]], value: typing.Mapping[routes.Route, float]
+    ) -> None:
+        for route, ttl in value.items():
+            if route.method != routes.GET:
+                raise ValueError(f"ResponseCacheSettings.ttls can only contain GET routes, not {route.method} {route}")
+
+            if not isinstance(ttl, (int, float)) or ttl <= 0:
+                raise ValueError(f"ResponseCacheSettings.ttls must map routes to POSITIVE numbers, not {ttl!r}")
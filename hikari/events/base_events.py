@@ -151,7 +151,7 @@ def is_no_recursive_throw_event(obj: typing.Union[T, typing.Type[T]]) -> bool:
 
 
 FailedEventT = typing.TypeVar("FailedEventT", bound=Event)
-FailedCallbackT = typing.Callable[[FailedEventT], typing.Coroutine[typing.Any, typing.Any, None]]
+FailedCallbackT = typing.Callable[[FailedEventT], typing.Optional[typing.Coroutine[typing.Any, typing.Any, None]]]
 
 
 @no_recursive_throw()
@@ -235,4 +235,6 @@ class ExceptionEvent(Event, typing.Generic[FailedEventT]):
         If an exception is thrown this time, it will need to be manually
         caught in-code, or will be discarded.
         """
-        await self.failed_callback(self.failed_event)
+        result = self.failed_callback(self.failed_event)
+        if result is not None:
+            await result
@@ -4,12 +4,17 @@
 from hikari.impl.bot import *
 from hikari.impl.buckets import *
 from hikari.impl.cache import *
+from hikari.impl.cluster import *
 from hikari.impl.entity_factory import *
 from hikari.impl.event_manager import *
 from hikari.impl.event_manager_base import *
 from hikari.impl.interaction_server import *
+from hikari.impl.rate_limit_store import *
 from hikari.impl.rate_limits import *
+from hikari.impl.resolver import *
+from hikari.impl.response_cache import *
 from hikari.impl.rest import *
 from hikari.impl.rest_bot import *
+from hikari.impl.session_store import *
 from hikari.impl.special_endpoints import *
 from hikari.impl.voice import *
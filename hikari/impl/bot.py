@@ -30,6 +30,7 @@ import asyncio
 import datetime
 import logging
 import math
+import pathlib
 import signal
 import sys
 import threading
@@ -46,29 +47,37 @@ from hikari import presences
 from hikari import snowflakes
 from hikari import traits
 from hikari import undefined
+from hikari.api import shard as gateway_shard
 from hikari.impl import cache as cache_impl
 from hikari.impl import entity_factory as entity_factory_impl
 from hikari.impl import event_factory as event_factory_impl
 from hikari.impl import event_manager as event_manager_impl
+from hikari.impl import resolver as resolver_impl
+from hikari.impl import response_cache as response_cache_impl
 from hikari.impl import rest as rest_impl
 from hikari.impl import shard as shard_impl
 from hikari.impl import voice as voice_impl
 from hikari.internal import aio
+from hikari.internal import data_binding
 from hikari.internal import time
 from hikari.internal import ux
 
 if typing.TYPE_CHECKING:
     import concurrent.futures
+    import os
 
     from hikari import channels
     from hikari import guilds
+    from hikari import sessions as sessions_
     from hikari import users as users_
     from hikari.api import cache as cache_
     from hikari.api import entity_factory as entity_factory_
     from hikari.api import event_factory as event_factory_
     from hikari.api import event_manager as event_manager_
+    from hikari.api import rate_limit_store as rate_limit_store_
+    from hikari.api import resolver as resolver_
     from hikari.api import rest as rest_
-    from hikari.api import shard as gateway_shard
+    from hikari.api import session_store as session_store_
     from hikari.api import voice as voice_
 
 _LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.bot")
@@ -121,6 +130,26 @@ class GatewayBot(traits.GatewayBotAware):
         override this setting.
     cache_settings : typing.Optional[hikari.config.CacheSettings]
         Optional cache settings. If unspecified, will use the defaults.
+    cache_snapshot_path : typing.Union[builtins.None, builtins.str, os.PathLike[builtins.str]]
+        If provided, a snapshot of the cache will be written to this file
+        when the bot is closed and loaded back into the cache the next time
+        the bot is started, so that the cache is warm before the gateway has
+        sent every guild again. Defaults to `builtins.None`.
+
+        The snapshot is deleted once it has been loaded. Cached guilds which
+        the bot has left in the meantime are removed when their shard
+        receives its `READY` event.
+    data_format : builtins.str
+        The data format to use for gateway payloads, either `"json"` or
+        `"etf"`. Defaults to `"json"`. REST payloads always use JSON.
+    dispatch_settings : typing.Optional[hikari.config.DispatchSettings]
+        Optional settings to process gateway events through a bounded queue
+        and a fixed number of worker tasks for each shard. If unspecified, a
+        new task is created for every event received.
+    dumps : hikari.internal.data_binding.JSONEncoder
+        The JSON encoder to use for gateway and REST payloads. Defaults to
+        `hikari.internal.data_binding.default_json_dumps`, which will use
+        `orjson` if it is installed.
     http_settings : typing.Optional[hikari.config.HTTPSettings]
         Optional custom HTTP configuration settings to use. Allows you to
         customise functionality such as whether SSL-verification is enabled,
@@ -130,6 +159,10 @@ class GatewayBot(traits.GatewayBotAware):
         Defaults to `hikari.intents.Intents.ALL_UNPRIVILEGED`. This allows you
         to change which intents your application will use on the gateway. This
         can be used to control and change the types of events you will receive.
+    loads : hikari.internal.data_binding.JSONDecoder
+        The JSON decoder to use for gateway and REST payloads. Defaults to
+        `hikari.internal.data_binding.default_json_loads`, which will use
+        `orjson` if it is installed.
     logs : typing.Union[builtins.None, LoggerLevel, typing.Dict[str, typing.Any]]
         Defaults to `"INFO"`.
 
@@ -172,11 +205,30 @@ class GatewayBot(traits.GatewayBotAware):
     proxy_settings : typing.Optional[config.ProxySettings]
         Custom proxy settings to use with network-layer logic
         in your application to get through an HTTP-proxy.
+    rate_limit_store : typing.Optional[hikari.api.rate_limit_store.RateLimitStore]
+        If provided, the REST rate limits are shared through this store with
+        other processes using the same token, such as other clusters or a
+        separate interaction server. Defaults to `builtins.None`.
+    response_cache_settings : typing.Optional[hikari.config.ResponseCacheSettings]
+        If provided, the responses of `GET` requests made by the REST client
+        are cached as configured by these settings. Unless
+        `hikari.config.ResponseCacheSettings.invalidate_on_events` is disabled,
+        cached responses are removed when a gateway event updates them.
+        Defaults to `builtins.None`, which disables caching responses.
     rest_url : typing.Optional[builtins.str]
         Defaults to the Discord REST API URL if `builtins.None`. Can be
         overridden if you are attempting to point to an unofficial endpoint, or
         if you are attempting to mock/stub the Discord API for any reason.
         Generally you do not want to change this.
+    session_store : typing.Optional[hikari.api.session_store.SessionStore]
+        If provided, the gateway sessions of all shards will be stored here
+        when the bot is closed, and resumed instead of identifying again
+        the next time the bot is started. Defaults to `builtins.None`.
+
+        Resuming does not replay the `GUILD_CREATE` events the cache is
+        populated from, so stored sessions are only resumed if the cache is
+        disabled (`hikari.config.CacheComponents.NONE`) or was restored from
+        `cache_snapshot_path`.
 
     !!! note
         `force_color` will always take precedence over `allow_color`.
@@ -214,8 +266,11 @@ class GatewayBot(traits.GatewayBotAware):
 
     __slots__: typing.Sequence[str] = (
         "_cache",
+        "_cache_snapshot_path",
         "_closing_event",
         "_closed_event",
+        "_data_format",
+        "_dumps",
         "_entity_factory",
         "_event_manager",
         "_event_factory",
@@ -223,7 +278,10 @@ class GatewayBot(traits.GatewayBotAware):
         "_http_settings",
         "_intents",
         "_is_alive",
+        "_loads",
         "_proxy_settings",
+        "_resolve",
+        "_session_store",
         "_rest",
         "_shards",
         "_token",
@@ -240,26 +298,39 @@ class GatewayBot(traits.GatewayBotAware):
         executor: typing.Optional[concurrent.futures.Executor] = None,
         force_color: bool = False,
         cache_settings: typing.Optional[config.CacheSettings] = None,
+        cache_snapshot_path: typing.Union[None, str, os.PathLike[str]] = None,
+        data_format: str = gateway_shard.GatewayDataFormat.JSON,
+        dispatch_settings: typing.Optional[config.DispatchSettings] = None,
+        dumps: data_binding.JSONEncoder = data_binding.default_json_dumps,
         http_settings: typing.Optional[config.HTTPSettings] = None,
         intents: intents_.Intents = intents_.Intents.ALL_UNPRIVILEGED,
+        loads: data_binding.JSONDecoder = data_binding.default_json_loads,
         logs: typing.Union[None, int, str, typing.Dict[str, typing.Any]] = "INFO",
         max_rate_limit: float = 300,
         max_retries: int = 3,
         proxy_settings: typing.Optional[config.ProxySettings] = None,
+        rate_limit_store: typing.Optional[rate_limit_store_.RateLimitStore] = None,
+        response_cache_settings: typing.Optional[config.ResponseCacheSettings] = None,
         rest_url: typing.Optional[str] = None,
+        session_store: typing.Optional[session_store_.SessionStore] = None,
     ) -> None:
         # Beautification and logging
         ux.init_logging(logs, allow_color, force_color)
         self.print_banner(banner, allow_color, force_color)
 
         # Settings and state
+        self._cache_snapshot_path = cache_snapshot_path
         self._closing_event: typing.Optional[asyncio.Event] = None
         self._closed_event: typing.Optional[asyncio.Event] = None
         self._is_alive = False
+        self._data_format = data_format
+        self._dumps = dumps
         self._executor = executor
         self._http_settings = http_settings if http_settings is not None else config.HTTPSettings()
         self._intents = intents
+        self._loads = loads
         self._proxy_settings = proxy_settings if proxy_settings is not None else config.ProxySettings()
+        self._session_store = session_store
         self._token = token
 
         # Caching
@@ -272,8 +343,23 @@ class GatewayBot(traits.GatewayBotAware):
         # Event creation
         self._event_factory = event_factory_impl.EventFactoryImpl(self)
 
+        # REST response caching
+        response_cache: typing.Optional[response_cache_impl.LRUResponseCache] = None
+        invalidated_response_cache: typing.Optional[response_cache_impl.LRUResponseCache] = None
+        if response_cache_settings is not None:
+            response_cache = response_cache_impl.LRUResponseCache(response_cache_settings)
+            if response_cache_settings.invalidate_on_events:
+                invalidated_response_cache = response_cache
+
         # Event handling
-        self._event_manager = event_manager_impl.EventManagerImpl(self._event_factory, self._intents, cache=self._cache)
+        self._event_manager = event_manager_impl.EventManagerImpl(
+            self._event_factory,
+            self._intents,
+            cache=self._cache,
+            cache_components=cache_settings.components,
+            dispatch_settings=dispatch_settings,
+            response_cache=invalidated_response_cache,
+        )
 
         # Voice subsystem
         self._voice = voice_impl.VoiceComponentImpl(self)
@@ -281,20 +367,27 @@ class GatewayBot(traits.GatewayBotAware):
         # RESTful API.
         self._rest = rest_impl.RESTClientImpl(
             cache=self._cache,
+            dumps=self._dumps,
             entity_factory=self._entity_factory,
             executor=self._executor,
             http_settings=self._http_settings,
+            loads=self._loads,
             max_rate_limit=max_rate_limit,
             proxy_settings=self._proxy_settings,
+            rate_limit_store=rate_limit_store,
+            response_cache=response_cache,
             rest_url=rest_url,
             max_retries=max_retries,
             token=token,
             token_type=applications.TokenType.BOT,
         )
 
+        # Cache-first entity resolution
+        self._resolve = resolver_impl.ResolverImpl(self._cache, self._rest)
+
         # We populate these on startup instead, as we need to possibly make some
         # HTTP requests to determine what to put in this mapping.
-        self._shards: typing.Dict[int, gateway_shard.GatewayShard] = {}
+        self._shards: typing.Dict[int, shard_impl.GatewayShardImpl] = {}
         self.shards: typing.Mapping[int, gateway_shard.GatewayShard] = types.MappingProxyType(self._shards)
 
     @property
@@ -350,6 +443,21 @@ class GatewayBot(traits.GatewayBotAware):
     def rest(self) -> rest_.RESTClient:
         return self._rest
 
+    @property
+    def resolve(self) -> resolver_.Resolver:
+        """Return a resolver which looks entities up in the cache before fetching them.
+
+        Entities which have to be fetched are stored in the cache where
+        possible, and concurrent lookups of the same entity share a single
+        request.
+
+        Returns
+        -------
+        hikari.api.resolver.Resolver
+            The resolver for this bot.
+        """
+        return self._resolve
+
     @property
     def is_alive(self) -> bool:
         return self._is_alive
@@ -399,15 +507,33 @@ class GatewayBot(traits.GatewayBotAware):
 
         _LOGGER.log(ux.TRACE, "StoppingEvent dispatch completed, now beginning termination")
 
+        resumable = self._session_store is not None
         calls = [
             ("rest", self._rest.close()),
             ("voice handler", self._voice.close()),
-            *((f"shard {s.id}", s.close()) for s in self._shards.values()),
+            *((f"shard {s.id}", s.close(resumable=resumable)) for s in self._shards.values()),
         ]
 
         for coro in asyncio.as_completed([handle(*pair) for pair in calls]):
             await coro
 
+        if self._session_store is not None:
+            sessions = [s.session for s in self._shards.values()]
+            calls = [
+                (f"saving session for shard {s.shard_id}", self._session_store.save_session(s)) for s in sessions if s
+            ]
+
+            for coro in asyncio.as_completed([handle(*pair) for pair in calls]):
+                await coro
+
+        await self._event_manager.close_dispatch_queues()
+
+        if self._cache_snapshot_path is not None and self._cache.settings.components != config.CacheComponents.NONE:
+            await handle(
+                "saving cache snapshot",
+                loop.run_in_executor(self._executor, self._cache.save_snapshot, self._cache_snapshot_path),
+            )
+
         # Clear out cache and shard map
         self._cache.clear()
         self._shards.clear()
@@ -435,12 +561,15 @@ class GatewayBot(traits.GatewayBotAware):
         await aio.first_completed(*awaitables)
 
     def listen(
-        self, event_type: typing.Optional[typing.Type[event_manager_.EventT_co]] = None
+        self,
+        event_type: typing.Optional[typing.Type[event_manager_.EventT_co]] = None,
+        *,
+        serial_key: typing.Optional[str] = None,
     ) -> typing.Callable[
         [event_manager_.CallbackT[event_manager_.EventT_co]],
         event_manager_.CallbackT[event_manager_.EventT_co],
     ]:
-        return self._event_manager.listen(event_type)
+        return self._event_manager.listen(event_type, serial_key=serial_key)
 
     @staticmethod
     def print_banner(banner: typing.Optional[str], allow_color: bool, force_color: bool) -> None:
@@ -774,18 +903,11 @@ class GatewayBot(traits.GatewayBotAware):
         if shard_ids is None:
             shard_ids = set(range(shard_count))
 
-        if requirements.session_start_limit.remaining < len(shard_ids) and not ignore_session_start_limit:
-            _LOGGER.critical(
-                "would have started %s session%s, but you only have %s session%s remaining until %s. Starting more "
-                "sessions than you are allowed to start may result in your token being reset. To skip this message, "
-                "use bot.run(..., ignore_session_start_limit=True) or bot.start(..., ignore_session_start_limit=True)",
-                len(shard_ids),
-                "s" if len(shard_ids) != 1 else "",
-                requirements.session_start_limit.remaining,
-                "s" if requirements.session_start_limit.remaining != 1 else "",
-                requirements.session_start_limit.reset_at,
-            )
-            raise errors.GatewayError("Attempted to start more sessions than were allowed in the given time-window")
+        sessions = await self._load_stored_state(shard_ids, shard_count)
+
+        if not ignore_session_start_limit:
+            # A shard falls back to identifying when its session can no longer be resumed, so those are counted too.
+            self._check_session_start_limit(requirements.session_start_limit, len(shard_ids))
 
         self._is_alive = True
         # This needs to be started before shards.
@@ -800,6 +922,9 @@ class GatewayBot(traits.GatewayBotAware):
             "s" if len(shard_ids) != 1 else "",
         )
 
+        if sessions:
+            _LOGGER.info("resuming %s stored session%s", len(sessions), "s" if len(sessions) != 1 else "")
+
         for window_start in range(0, shard_count, requirements.session_start_limit.max_concurrency):
             window = [
                 candidate_shard_id
@@ -855,6 +980,8 @@ class GatewayBot(traits.GatewayBotAware):
                         shard_count=shard_count,
                         url=requirements.url,
                         closing_event=self._closing_event,
+                        # Resumed shards share the identify windows as a failed resume identifies instead.
+                        session=sessions.get(candidate_shard_id),
                     )
                     for candidate_shard_id in window
                     if candidate_shard_id in shard_ids
@@ -875,8 +1002,14 @@ class GatewayBot(traits.GatewayBotAware):
         self._check_if_alive()
         return self._event_manager.stream(event_type, timeout=timeout, limit=limit)
 
-    def subscribe(self, event_type: typing.Type[typing.Any], callback: event_manager_.CallbackT[typing.Any]) -> None:
-        self._event_manager.subscribe(event_type, callback)
+    def subscribe(
+        self,
+        event_type: typing.Type[typing.Any],
+        callback: event_manager_.CallbackT[typing.Any],
+        *,
+        serial_key: typing.Optional[str] = None,
+    ) -> None:
+        self._event_manager.subscribe(event_type, callback, serial_key=serial_key)
 
     def unsubscribe(self, event_type: typing.Type[typing.Any], callback: event_manager_.CallbackT[typing.Any]) -> None:
         self._event_manager.unsubscribe(event_type, callback)
@@ -887,9 +1020,11 @@ class GatewayBot(traits.GatewayBotAware):
         /,
         timeout: typing.Union[float, int, None],
         predicate: typing.Optional[event_manager_.PredicateT[event_manager_.EventT_co]] = None,
+        *,
+        key: typing.Optional[event_manager_.KeyT] = None,
     ) -> event_manager_.EventT_co:
         self._check_if_alive()
-        return await self._event_manager.wait_for(event_type, timeout=timeout, predicate=predicate)
+        return await self._event_manager.wait_for(event_type, timeout=timeout, predicate=predicate, key=key)
 
     def _get_shard(self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild]) -> gateway_shard.GatewayShard:
         guild = snowflakes.Snowflake(guild)
@@ -965,8 +1100,11 @@ class GatewayBot(traits.GatewayBotAware):
         shard_count: int,
         url: str,
         closing_event: asyncio.Event,
+        session: typing.Optional[session_store_.GatewaySession] = None,
     ) -> shard_impl.GatewayShardImpl:
         new_shard = shard_impl.GatewayShardImpl(
+            data_format=self._data_format,
+            dumps=self._dumps,
             http_settings=self._http_settings,
             proxy_settings=self._proxy_settings,
             event_manager=self._event_manager,
@@ -977,6 +1115,8 @@ class GatewayBot(traits.GatewayBotAware):
             initial_idle_since=idle_since,
             initial_status=status,
             large_threshold=large_threshold,
+            loads=self._loads,
+            session=session,
             shard_id=shard_id,
             shard_count=shard_count,
             token=self._token,
@@ -994,6 +1134,67 @@ class GatewayBot(traits.GatewayBotAware):
 
         raise errors.GatewayError(f"shard {shard_id} shut down immediately when starting")
 
+    @staticmethod
+    def _check_session_start_limit(limit: sessions_.SessionStartLimit, session_count: int) -> None:
+        if limit.remaining < session_count:
+            _LOGGER.critical(
+                "would have started %s session%s, but you only have %s session%s remaining until %s. Starting more "
+                "sessions than you are allowed to start may result in your token being reset. To skip this message, "
+                "use bot.run(..., ignore_session_start_limit=True) or bot.start(..., ignore_session_start_limit=True)",
+                session_count,
+                "s" if session_count != 1 else "",
+                limit.remaining,
+                "s" if limit.remaining != 1 else "",
+                limit.reset_at,
+            )
+            raise errors.GatewayError("Attempted to start more sessions than were allowed in the given time-window")
+
+    async def _load_stored_state(
+        self, shard_ids: typing.AbstractSet[int], shard_count: int
+    ) -> typing.Dict[int, session_store_.GatewaySession]:
+        # The snapshot has to be restored first, as sessions are only resumable when the cache is populated.
+        cache_restored = await self._load_cache_snapshot()
+        return await self._load_sessions(shard_ids, shard_count, cache_restored)
+
+    async def _load_cache_snapshot(self) -> bool:
+        if self._cache_snapshot_path is None or self._cache.settings.components == config.CacheComponents.NONE:
+            return False
+
+        loop = asyncio.get_running_loop()
+        restored = await loop.run_in_executor(self._executor, self._cache.load_snapshot, self._cache_snapshot_path)
+        # Like stored sessions, a snapshot should only be used once so that a crash never restores a stale cache.
+        await loop.run_in_executor(self._executor, pathlib.Path(self._cache_snapshot_path).unlink, True)
+
+        if restored:
+            _LOGGER.info("restored cache from snapshot %s", self._cache_snapshot_path)
+
+        return restored
+
+    async def _load_sessions(
+        self, shard_ids: typing.AbstractSet[int], shard_count: int, cache_restored: bool
+    ) -> typing.Dict[int, session_store_.GatewaySession]:
+        if self._session_store is None:
+            return {}
+
+        sessions = {}
+        for shard_id in shard_ids:
+            session = await self._session_store.load_session(shard_id, shard_count)
+            # A session can only be resumed once, so it should not be used again if we crash.
+            await self._session_store.delete_session(shard_id)
+
+            if session is not None:
+                sessions[shard_id] = session
+
+        if sessions and not cache_restored and self._cache.settings.components != config.CacheComponents.NONE:
+            _LOGGER.warning(
+                "not resuming %s stored session%s as the cache would miss the guilds sent when identifying",
+                len(sessions),
+                "s" if len(sessions) != 1 else "",
+            )
+            return {}
+
+        return sessions
+
     @staticmethod
     def _destroy_loop(loop: asyncio.AbstractEventLoop) -> None:
         async def murder(future: asyncio.Future[typing.Any]) -> None:
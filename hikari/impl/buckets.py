@@ -180,6 +180,21 @@ At the time of writing, the only example of this appears to be on the
 `PATCH /channels/{channel_id}` endpoint. This has a limit of two changes per
 10 minutes. More details about how this is implemented have yet to be
 released or documented...
+
+Sharing rate limits between processes
+-------------------------------------
+
+Several processes making requests with the same token each only know about
+their own requests, so between them they can easily end up exceeding a
+limit. If a `hikari.api.rate_limit_store.RateLimitStore` is given to the
+`RESTBucketManager`, each request also has to reserve a unit in the store
+after acquiring its local bucket, waiting if the store says the bucket (or
+the global rate limit) is exhausted. The bucket hashes, the rate limit
+headers and any global rate limit a process learns about are published to
+the store once its request is done, so the other processes pick them up.
+
+If the store can't be reached, a warning is logged and requests carry on
+using just the local rate limits.
 """
 
 from __future__ import annotations
@@ -199,6 +214,8 @@ from hikari.internal import ux
 if typing.TYPE_CHECKING:
     import types
 
+    from hikari.api import rate_limit_store as rate_limit_store_
+
 UNKNOWN_HASH: typing.Final[str] = "UNKNOWN"
 """The hash used for an unknown bucket that has not yet been resolved."""
 
@@ -225,13 +242,36 @@ class RESTBucket(rate_limits.WindowedBurstRateLimiter):
 
     Additional logic is provided by the `RESTBucket.update_rate_limit` call
     which allows dynamically changing the enforced rate limits at any time.
+
+    By default, only one request may be in flight on a bucket at a time. If
+    `concurrent_requests` is enabled, a known bucket instead reserves one unit
+    of the window per request and lets the request proceed straight away, so
+    up to `remaining` requests can be in flight at once. The reservations are
+    reconciled against the response headers in `RESTBucket.update_rate_limit`.
+    Unknown buckets are always serialized, as nothing is known about their
+    limits until the first response comes back.
     """
 
-    __slots__: typing.Sequence[str] = ("_compiled_route", "_max_rate_limit", "_lock")
+    __slots__: typing.Sequence[str] = (
+        "_compiled_route",
+        "_concurrent_requests",
+        "_in_flight",
+        "_max_rate_limit",
+        "_lock",
+    )
 
-    def __init__(self, name: str, compiled_route: routes.CompiledRoute, max_rate_limit: float) -> None:
+    def __init__(
+        self,
+        name: str,
+        compiled_route: routes.CompiledRoute,
+        max_rate_limit: float,
+        *,
+        concurrent_requests: bool = False,
+    ) -> None:
         super().__init__(name, 1, 1)
         self._compiled_route = compiled_route
+        self._concurrent_requests = concurrent_requests
+        self._in_flight = 0
         self._max_rate_limit = max_rate_limit
         self._lock = asyncio.Lock()
 
@@ -244,7 +284,21 @@ class RESTBucket(rate_limits.WindowedBurstRateLimiter):
         exc: typing.Optional[BaseException],
         exc_tb: typing.Optional[types.TracebackType],
     ) -> None:
-        self._lock.release()
+        # Concurrent requests gave the lock back as soon as they reserved their unit, so only
+        # a request which kept hold of it for its whole duration has to release it here.
+        if self._in_flight:
+            self._in_flight -= 1
+        else:
+            self._lock.release()
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of concurrent requests currently in flight on this bucket.
+
+        This is always `0` unless `concurrent_requests` is enabled, as the
+        bucket's lock is otherwise held for the whole of each request.
+        """
+        return self._in_flight
 
     @property
     def is_unknown(self) -> bool:
@@ -268,20 +322,31 @@ class RESTBucket(rate_limits.WindowedBurstRateLimiter):
         if self.is_unknown:
             return
 
-        now = time.monotonic()
-        retry_after = self.reset_at - now
-
-        if self.is_rate_limited(now) and retry_after > self._max_rate_limit:
-            raise errors.RateLimitTooLongError(
-                route=self._compiled_route,
-                retry_after=retry_after,
-                max_retry_after=self._max_rate_limit,
-                reset_at=self.reset_at,
-                limit=self.limit,
-                period=self.period,
-            )
+        try:
+            now = time.monotonic()
+            retry_after = self.reset_at - now
+
+            if self.is_rate_limited(now) and retry_after > self._max_rate_limit:
+                raise errors.RateLimitTooLongError(
+                    route=self._compiled_route,
+                    retry_after=retry_after,
+                    max_retry_after=self._max_rate_limit,
+                    reset_at=self.reset_at,
+                    limit=self.limit,
+                    period=self.period,
+                )
+
+            await super().acquire()
 
-        await super().acquire()
+        except BaseException:
+            if self._concurrent_requests:
+                self._lock.release()
+            raise
+
+        if self._concurrent_requests:
+            # The unit for this request has been reserved by the drip, so let the next one through.
+            self._in_flight += 1
+            self._lock.release()
 
     def update_rate_limit(self, remaining: int, limit: int, reset_at: float) -> None:
         """Update the rate limit information.
@@ -298,11 +363,30 @@ class RESTBucket(rate_limits.WindowedBurstRateLimiter):
         !!! note
             The `reset_at` epoch is expected to be a `time.monotonic_timestamp`
             monotonic epoch, rather than a `time.time` date-based epoch.
+
+        !!! note
+            When `concurrent_requests` is enabled, this should be called while
+            the request that received these headers is still in flight. The
+            other requests in flight may not have been counted by Discord yet
+            and responses may arrive out of order, so the values are only ever
+            allowed to make the bucket more restrictive within the current
+            window.
         """
+        now = time.monotonic()
+
+        if self._concurrent_requests:
+            # Every other request in flight has already reserved its unit, but may not be reflected
+            # in these headers yet.
+            remaining -= max(0, self._in_flight - 1)
+
+            if self.reset_at > now:
+                remaining = min(self.remaining, remaining)
+                reset_at = max(self.reset_at, reset_at)
+
         self.remaining = remaining
         self.limit = limit
         self.reset_at = reset_at
-        self.period = max(0.0, self.reset_at - time.monotonic())
+        self.period = max(0.0, self.reset_at - now)
 
     def drip(self) -> None:
         """Decrement the remaining count for this bucket.
@@ -339,6 +423,49 @@ def _create_unknown_hash(route: routes.CompiledRoute) -> str:
     return UNKNOWN_HASH + routes.HASH_SEPARATOR + str(hash(route))
 
 
+def _create_route_key(route: routes.Route) -> str:
+    return f"{route.method} {route.path_template}"
+
+
+class _SharedBucketAcquisition:
+    """Acquisition of a local bucket which also reserves the request in the rate limit store."""
+
+    __slots__: typing.Sequence[str] = ("_bucket", "_compiled_route", "_manager", "_use_global_rate_limit")
+
+    def __init__(
+        self, manager: RESTBucketManager, compiled_route: routes.CompiledRoute, use_global_rate_limit: bool
+    ) -> None:
+        self._bucket: typing.Optional[RESTBucket] = None
+        self._compiled_route = compiled_route
+        self._manager = manager
+        self._use_global_rate_limit = use_global_rate_limit
+
+    async def __aenter__(self) -> None:
+        await self._manager._fetch_bucket_hash(self._compiled_route)
+        bucket = self._manager._get_bucket(self._compiled_route)
+        await bucket.acquire()
+
+        try:
+            await self._manager._reserve(bucket, self._compiled_route, self._use_global_rate_limit)
+        except BaseException:
+            await bucket.__aexit__(None, None, None)
+            raise
+
+        self._bucket = bucket
+
+    async def __aexit__(
+        self,
+        exc_type: typing.Optional[typing.Type[BaseException]],
+        exc: typing.Optional[BaseException],
+        exc_tb: typing.Optional[types.TracebackType],
+    ) -> None:
+        assert self._bucket is not None
+        try:
+            await self._manager._publish()
+        finally:
+            await self._bucket.__aexit__(exc_type, exc, exc_tb)
+
+
 class RESTBucketManager:
     """The main rate limiter implementation for HTTP clients.
 
@@ -351,6 +478,17 @@ class RESTBucketManager:
     max_rate_limit : builtins.float
         The max number of seconds to backoff for when rate limited. Anything
         greater than this will instead raise an error.
+
+    Other Parameters
+    ----------------
+    concurrent_requests : builtins.bool
+        Whether known buckets should allow up to their remaining number of
+        requests to be in flight at once instead of one at a time. See
+        `RESTBucket` for more information. Defaults to `builtins.False`.
+    store : typing.Optional[hikari.api.rate_limit_store.RateLimitStore]
+        The store to share rate limits with other processes through.
+        Defaults to `builtins.None`, which only enforces the rate limits this
+        process knows about.
     """
 
     __slots__: typing.Sequence[str] = (
@@ -359,6 +497,12 @@ class RESTBucketManager:
         "closed_event",
         "gc_task",
         "max_rate_limit",
+        "concurrent_requests",
+        "store",
+        "_is_store_available",
+        "_unpublished_bucket_hashes",
+        "_unpublished_buckets",
+        "_unpublished_global_retry_after",
     )
 
     routes_to_hashes: typing.Final[typing.MutableMapping[routes.Route, str]]
@@ -382,12 +526,31 @@ class RESTBucketManager:
     Anything greater than this will instead raise an error.
     """
 
-    def __init__(self, max_rate_limit: float) -> None:
+    concurrent_requests: bool
+    """Whether known buckets allow multiple requests to be in flight at once."""
+
+    store: typing.Optional[rate_limit_store_.RateLimitStore]
+    """The store rate limits are shared with other processes through, if any."""
+
+    def __init__(
+        self,
+        max_rate_limit: float,
+        *,
+        concurrent_requests: bool = False,
+        store: typing.Optional[rate_limit_store_.RateLimitStore] = None,
+    ) -> None:
         self.routes_to_hashes = {}
         self.real_hashes_to_buckets = {}
         self.closed_event: asyncio.Event = asyncio.Event()
         self.gc_task: typing.Optional[asyncio.Task[None]] = None
         self.max_rate_limit = max_rate_limit
+        self.concurrent_requests = concurrent_requests
+        self.store = store
+        self._is_store_available = True
+        # Rate limit state learnt from responses which hasn't been published to the store yet.
+        self._unpublished_bucket_hashes: typing.Dict[str, str] = {}
+        self._unpublished_buckets: typing.Dict[str, typing.Tuple[int, int, float]] = {}
+        self._unpublished_global_retry_after = 0.0
 
     def __enter__(self) -> RESTBucketManager:
         return self
@@ -533,7 +696,9 @@ class RESTBucketManager:
 
         _LOGGER.log(ux.TRACE, "purged %s stale buckets, %s remain in survival, %s active", dead, survival, active)
 
-    def acquire(self, compiled_route: routes.CompiledRoute) -> typing.AsyncContextManager[None]:
+    def acquire(
+        self, compiled_route: routes.CompiledRoute, *, use_global_rate_limit: bool = True
+    ) -> typing.AsyncContextManager[None]:
         """Acquire a bucket for the given route.
 
         Parameters
@@ -541,6 +706,13 @@ class RESTBucketManager:
         compiled_route : hikari.internal.routes.CompiledRoute
             The route to get the bucket for.
 
+        Other Parameters
+        ----------------
+        use_global_rate_limit : builtins.bool
+            Whether the request is subject to the global rate limit shared
+            through the `RESTBucketManager.store`. This has no effect if
+            there is no store. Defaults to `builtins.True`.
+
         Returns
         -------
         typing.AsyncContextManager[builtins.None]
@@ -550,6 +722,12 @@ class RESTBucketManager:
             You MUST keep the context manager acquired during the whole of the
             request. From making the request until calling `update_rate_limits`.
         """
+        if self.store is not None:
+            return _SharedBucketAcquisition(self, compiled_route, use_global_rate_limit)
+
+        return self._get_bucket(compiled_route)
+
+    def _get_bucket(self, compiled_route: routes.CompiledRoute) -> RESTBucket:
         template = compiled_route.route
 
         try:
@@ -563,7 +741,9 @@ class RESTBucketManager:
             _LOGGER.debug("%s is being mapped to existing bucket %s", compiled_route, real_bucket_hash)
         except KeyError:
             _LOGGER.debug("%s is being mapped to new bucket %s", compiled_route, real_bucket_hash)
-            bucket = RESTBucket(real_bucket_hash, compiled_route, self.max_rate_limit)
+            bucket = RESTBucket(
+                real_bucket_hash, compiled_route, self.max_rate_limit, concurrent_requests=self.concurrent_requests
+            )
             self.real_hashes_to_buckets[real_bucket_hash] = bucket
 
         return bucket
@@ -591,6 +771,9 @@ class RESTBucketManager:
         reset_after : builtins.float
             The `X-RateLimit-Reset-After` header cast to a `builtins.float`.
         """
+        if self.store is not None and self.routes_to_hashes.get(compiled_route.route) != bucket_header:
+            self._unpublished_bucket_hashes[_create_route_key(compiled_route.route)] = bucket_header
+
         self.routes_to_hashes[compiled_route.route] = bucket_header
         real_bucket_hash = compiled_route.create_real_bucket_hash(bucket_header)
 
@@ -625,13 +808,115 @@ class RESTBucketManager:
                     limit_header,
                     remaining_header,
                 )
-                bucket = RESTBucket(real_bucket_hash, compiled_route, self.max_rate_limit)
+                bucket = RESTBucket(
+                    real_bucket_hash, compiled_route, self.max_rate_limit, concurrent_requests=self.concurrent_requests
+                )
 
             self.real_hashes_to_buckets[real_bucket_hash] = bucket
 
         reset_at_monotonic = time.monotonic() + reset_after
         bucket.update_rate_limit(remaining_header, limit_header, reset_at_monotonic)
 
+        if self.store is not None:
+            self._unpublished_buckets[real_bucket_hash] = (remaining_header, limit_header, reset_at_monotonic)
+
+    def throttle_global(self, retry_after: float) -> None:
+        """Share a global rate limit with the other processes using the store.
+
+        This has no effect if there is no `RESTBucketManager.store`.
+
+        Parameters
+        ----------
+        retry_after : builtins.float
+            The number of seconds the global rate limit lasts for.
+        """
+        if self.store is not None:
+            self._unpublished_global_retry_after = max(self._unpublished_global_retry_after, retry_after)
+
+    async def _fetch_bucket_hash(self, compiled_route: routes.CompiledRoute) -> None:
+        assert self.store is not None
+        if compiled_route.route in self.routes_to_hashes:
+            return
+
+        try:
+            bucket_hash = await self.store.get_bucket_hash(_create_route_key(compiled_route.route))
+        except OSError as ex:
+            self._set_store_unavailable(ex)
+            return
+
+        self._set_store_available()
+        if bucket_hash is not None and compiled_route.route not in self.routes_to_hashes:
+            _LOGGER.debug("%s is using bucket %s according to the rate limit store", compiled_route, bucket_hash)
+            self.routes_to_hashes[compiled_route.route] = bucket_hash
+
+    async def _reserve(
+        self, bucket: RESTBucket, compiled_route: routes.CompiledRoute, use_global_rate_limit: bool
+    ) -> None:
+        assert self.store is not None
+        real_bucket_hash = None if bucket.is_unknown else bucket.name
+
+        while True:
+            try:
+                retry_after = await self.store.reserve(real_bucket_hash, use_global_rate_limit=use_global_rate_limit)
+            except OSError as ex:
+                self._set_store_unavailable(ex)
+                return
+
+            self._set_store_available()
+            if retry_after <= 0:
+                return
+
+            if retry_after > self.max_rate_limit:
+                raise errors.RateLimitTooLongError(
+                    route=compiled_route,
+                    retry_after=retry_after,
+                    max_retry_after=self.max_rate_limit,
+                    reset_at=time.monotonic() + retry_after,
+                    limit=bucket.limit,
+                    period=bucket.period,
+                )
+
+            _LOGGER.debug("%s is rate limited in the rate limit store, waiting %ss", compiled_route, retry_after)
+            await asyncio.sleep(retry_after)
+
+    async def _publish(self) -> None:
+        assert self.store is not None
+        bucket_hashes, self._unpublished_bucket_hashes = self._unpublished_bucket_hashes, {}
+        buckets, self._unpublished_buckets = self._unpublished_buckets, {}
+        global_retry_after, self._unpublished_global_retry_after = self._unpublished_global_retry_after, 0.0
+        if not bucket_hashes and not buckets and not global_retry_after:
+            return
+
+        try:
+            for route_key, bucket_hash in bucket_hashes.items():
+                await self.store.set_bucket_hash(route_key, bucket_hash)
+
+            now = time.monotonic()
+            for real_bucket_hash, (remaining, limit, reset_at) in buckets.items():
+                await self.store.update_bucket(
+                    real_bucket_hash, remaining=remaining, limit=limit, reset_after=max(0.0, reset_at - now)
+                )
+
+            if global_retry_after:
+                await self.store.throttle_global(global_retry_after)
+
+        except OSError as ex:
+            self._set_store_unavailable(ex)
+
+        else:
+            self._set_store_available()
+
+    def _set_store_available(self) -> None:
+        if not self._is_store_available:
+            _LOGGER.info("rate limit store is available again")
+            self._is_store_available = True
+
+    def _set_store_unavailable(self, ex: OSError) -> None:
+        # Only log the first failure, rather than one for every request until the store is back.
+        if self._is_store_available:
+            _LOGGER.warning("rate limit store is unavailable, only using local rate limits", exc_info=ex)
+            self._is_store_available = False
+
     @property
     def is_started(self) -> bool:
         """Return `builtins.True` if the rate limiter GC task is started."""
@@ -24,19 +24,34 @@
 
 from __future__ import annotations
 
-__all__: typing.List[str] = ["CacheImpl"]
+__all__: typing.List[str] = ["CacheImpl", "CacheMemoryReport", "GuildMemoryUsage", "MemoryUsage"]
 
 import copy
+import datetime
+import gc
+import heapq
+import itertools
 import logging
+import mmap
+import operator
+import os
+import pathlib
+import pickle  # noqa: S403 - Snapshots are only loaded through an allowlist of globals
+import sys
+import types
 import typing
 
+import attr
+
 from hikari import channels
 from hikari import config
 from hikari import emojis
 from hikari import messages
+from hikari import permissions as permissions_
 from hikari import snowflakes
 from hikari import undefined
 from hikari.api import cache
+from hikari.internal import attr_extensions
 from hikari.internal import cache as cache_utility
 from hikari.internal import collections
 
@@ -47,10 +62,276 @@ if typing.TYPE_CHECKING:
     from hikari import traits
     from hikari import users
     from hikari import voices
+    from hikari.internal import data_binding
 
+    _KeyT = typing.TypeVar("_KeyT", bound=typing.Hashable)
     _T = typing.TypeVar("_T")
 
 _LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.cache")
+_ADMINISTRATOR: typing.Final[int] = int(permissions_.Permissions.ADMINISTRATOR)
+_ALL_PERMISSIONS: typing.Final[int] = int(permissions_.Permissions.all_permissions())
+# The number of members whose permissions are memoized for each guild, as every channel is memoized separately.
+_MAX_PERMISSION_MEMBERS_PER_GUILD: typing.Final[int] = 1_000
+_SNAPSHOT_VERSION: typing.Final[int] = 3
+# Mutable mappings which are written to snapshots as they are, keeping any references between their entries.
+_SNAPSHOT_ENTRIES: typing.Final[typing.Sequence[str]] = (
+    "_activity_entries",
+    "_client_status_entries",
+    "_emoji_entries",
+    "_guild_channel_entries",
+    "_guild_entries",
+    "_invite_entries",
+    "_referenced_messages",
+    "_role_entries",
+    "_unknown_custom_emoji_entries",
+    "_user_entries",
+)
+_SNAPSHOT_BUILTINS: typing.Final[typing.AbstractSet[str]] = frozenset(
+    ("bytearray", "complex", "frozenset", "set", "slice")
+)
+# Modules whose classes make up a cache and so may be loaded from a snapshot.
+_SNAPSHOT_MODULES: typing.Final[typing.AbstractSet[str]] = frozenset(
+    (
+        "array",
+        "datetime",
+        "hikari.applications",
+        "hikari.channels",
+        "hikari.colors",
+        "hikari.config",
+        "hikari.embeds",
+        "hikari.emojis",
+        "hikari.files",
+        "hikari.guilds",
+        "hikari.impl.cache",
+        "hikari.interactions.base_interactions",
+        "hikari.internal.cache",
+        "hikari.internal.collections",
+        "hikari.invites",
+        "hikari.messages",
+        "hikari.permissions",
+        "hikari.presences",
+        "hikari.snowflakes",
+        "hikari.stickers",
+        "hikari.users",
+        "hikari.voices",
+    )
+)
+# Globals other than classes which objects in a snapshot are rebuilt with.
+_SNAPSHOT_GLOBALS: typing.Final[typing.AbstractSet[typing.Tuple[str, str]]] = frozenset(
+    (
+        ("array", "_array_reconstructor"),
+        ("hikari.internal.cache", "_get_columnar_member_cell"),
+        ("hikari.internal.cache", "_make_ref_cell"),
+        ("hikari.undefined", "UNDEFINED"),
+    )
+)
+
+
+def _snapshot_app() -> typing.NoReturn:
+    # This stands in for the app in snapshots and is swapped for the loading cache's app by the unpickler.
+    raise RuntimeError("the app placeholder of a cache snapshot must not be called")
+
+
+def _snapshot_cache() -> typing.NoReturn:
+    # This stands in for the cache in snapshots and is swapped for the loading cache by the unpickler.
+    raise RuntimeError("the cache placeholder of a cache snapshot must not be called")
+
+
+class _SnapshotPickler(pickle.Pickler):
+    __slots__: typing.Sequence[str] = ("_app", "_cache")
+
+    def __init__(self, file: typing.BinaryIO, app: traits.RESTAware, cache: CacheImpl, /) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._app = app
+        self._cache = cache
+
+    def reducer_override(self, obj: typing.Any) -> typing.Any:
+        # Unlike persistent_id, this is not called for builtin types, which make up most of a cache.
+        if obj is self._app:
+            return _snapshot_app, ()
+
+        if obj is self._cache:
+            return _snapshot_cache, ()
+
+        return NotImplemented
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    __slots__: typing.Sequence[str] = ("_app", "_cache")
+
+    def __init__(self, file: typing.Any, app: traits.RESTAware, cache: CacheImpl, /) -> None:
+        super().__init__(file)
+        self._app = app
+        self._cache = cache
+
+    def _get_app(self) -> traits.RESTAware:
+        return self._app
+
+    def _get_cache(self) -> CacheImpl:
+        return self._cache
+
+    def find_class(self, module: str, name: str) -> typing.Any:
+        if module == __name__ and name == _snapshot_app.__name__:
+            return self._get_app
+
+        if module == __name__ and name == _snapshot_cache.__name__:
+            return self._get_cache
+
+        if (module, name) in _SNAPSHOT_GLOBALS:
+            return super().find_class(module, name)
+
+        # Only the types a cache is made of may be loaded, so a snapshot can't be used to call arbitrary functions.
+        # Dotted names are looked up attribute by attribute, which could reach anything a module imports.
+        if "." not in name and (module in _SNAPSHOT_MODULES or (module == "builtins" and name in _SNAPSHOT_BUILTINS)):
+            obj = super().find_class(module, name)
+            # Classes a module imported from elsewhere aren't part of the allowed set.
+            if isinstance(obj, type) and obj.__module__ == module:
+                return obj
+
+        raise pickle.UnpicklingError(f"{module}.{name} is not allowed in a cache snapshot")
+
+
+class _EvictionCallback:
+    # This is called with the entries evicted from a guild's members or presences. It's used instead of a bound method
+    # so that the mappings it's attached to can be written to cache snapshots.
+    __slots__: typing.Sequence[str] = ("_cache", "_component")
+
+    def __init__(self, cache: CacheImpl, component: config.CacheComponents, /) -> None:
+        self._cache = cache
+        self._component = component
+
+    def __call__(self, value: typing.Any, /) -> None:
+        if self._component == config.CacheComponents.MEMBERS:
+            self._cache._evict_member(value)
+        else:
+            self._cache._remove_presence_assets(value)
+
+
+_ActivityKeyT = typing.Tuple[typing.Any, ...]
+
+
+def _activity_key(activity: typing.Union[presences.RichActivity, cache_utility.RichActivityData], /) -> _ActivityKeyT:
+    # This is the same for an activity and the data object built from it, so it can be used to find either.
+    emoji: typing.Union[str, int, None]
+    if isinstance(activity.emoji, cache_utility.RefCell):
+        emoji = activity.emoji.object.id
+    elif isinstance(activity.emoji, emojis.CustomEmoji):
+        emoji = activity.emoji.id
+    elif activity.emoji is not None:
+        emoji = activity.emoji.name if isinstance(activity.emoji, emojis.Emoji) else activity.emoji
+    else:
+        emoji = None
+
+    timestamps = activity.timestamps
+    party = activity.party
+    assets = activity.assets
+    secrets = activity.secrets
+    return (
+        activity.name,
+        activity.url,
+        activity.type,
+        activity.created_at,
+        (timestamps.start, timestamps.end) if timestamps is not None else None,
+        activity.application_id,
+        activity.details,
+        activity.state,
+        emoji,
+        (party.id, party.current_size, party.max_size) if party is not None else None,
+        (assets.large_image, assets.large_text, assets.small_image, assets.small_text) if assets is not None else None,
+        (secrets.join, secrets.spectate, secrets.match) if secrets is not None else None,
+        activity.is_instance,
+        activity.flags,
+        tuple(activity.buttons),
+    )
+
+
+# Objects which are shared between entries or belong to another entry, so shouldn't be counted towards an entry's size.
+_UNSIZED_TYPES: typing.Final[typing.Tuple[type, ...]] = (
+    type,
+    types.BuiltinFunctionType,
+    types.FunctionType,
+    types.MethodType,
+    types.ModuleType,
+    cache_utility.RefCell,
+)
+
+
+@attr_extensions.with_copy
+@attr.define(hash=False, kw_only=True, weakref_slot=False)
+class MemoryUsage:
+    """Approximate memory used by part of a cache."""
+
+    entries: int = attr.field()
+    """The number of entries stored."""
+
+    size: int = attr.field()
+    """The approximate number of bytes used by the entries and the structures they are stored in."""
+
+
+@attr_extensions.with_copy
+@attr.define(hash=False, kw_only=True, weakref_slot=False)
+class GuildMemoryUsage:
+    """Approximate memory used by the entities cached for a guild."""
+
+    guild_id: snowflakes.Snowflake = attr.field()
+    """The ID of the guild."""
+
+    components: typing.Mapping[config.CacheComponents, MemoryUsage] = attr.field()
+    """Mapping of the enabled guild-bound cache components to the memory they use for this guild.
+
+    The `hikari.config.CacheComponents.GUILDS` entry also includes the
+    structures used to keep track of the guild's other entities.
+    """
+
+    @property
+    def entries(self) -> int:
+        """Return the number of entries cached for this guild."""
+        return sum(usage.entries for usage in self.components.values())
+
+    @property
+    def size(self) -> int:
+        """Return the approximate number of bytes used by this guild's entries."""
+        return sum(usage.size for usage in self.components.values())
+
+
+@attr_extensions.with_copy
+@attr.define(hash=False, kw_only=True, weakref_slot=False)
+class CacheMemoryReport:
+    """Approximate memory used by a cache, as returned by `CacheImpl.memory_report`.
+
+    Entry counts are exact, while sizes are estimated from a sample of the
+    entries of each component, so sizes should be treated as a guide rather
+    than an exact measurement.
+    """
+
+    components: typing.Mapping[config.CacheComponents, MemoryUsage] = attr.field()
+    """Mapping of the enabled cache components to the memory they use."""
+
+    users: MemoryUsage = attr.field()
+    """Memory used by the users referenced by cached entities."""
+
+    guilds: typing.Mapping[snowflakes.Snowflake, GuildMemoryUsage] = attr.field(repr=False)
+    """Mapping of guild IDs to the memory used by each guild's entities."""
+
+    @property
+    def size(self) -> int:
+        """Return the approximate number of bytes used by the cache."""
+        return sum(usage.size for usage in self.components.values()) + self.users.size
+
+    def heaviest_guilds(self, count: int = 10, /) -> typing.Sequence[GuildMemoryUsage]:
+        """Get the guilds which use the most memory.
+
+        Parameters
+        ----------
+        count : builtins.int
+            The maximum number of guilds to return. Defaults to `10`.
+
+        Returns
+        -------
+        typing.Sequence[GuildMemoryUsage]
+            Up to `count` guilds, ordered from the largest to the smallest.
+        """
+        return heapq.nlargest(count, self.guilds.values(), key=operator.attrgetter("size"))
 
 
 # TODO: do we want to hide entities that are marked as "deleted" and being kept alive by references?
@@ -74,9 +355,13 @@ class CacheImpl(cache.MutableCache):
         "_intents",
         "_invite_entries",
         "_me",
+        "_permission_entries",
         "_role_entries",
         "_unknown_custom_emoji_entries",
+        "_activity_entries",
+        "_client_status_entries",
         "_user_entries",
+        "_materialized_members",
         "_message_entries",
         "_referenced_messages",
         "_settings",
@@ -89,12 +374,27 @@ class CacheImpl(cache.MutableCache):
     _guild_channel_entries: collections.ExtendedMutableMapping[snowflakes.Snowflake, channels.GuildChannel]
     _guild_entries: collections.ExtendedMutableMapping[snowflakes.Snowflake, cache_utility.GuildRecord]
     _invite_entries: collections.ExtendedMutableMapping[str, cache_utility.InviteData]
+    # Guild ID -> user ID -> channel ID (or None for guild-wide permissions) -> permissions.
+    _permission_entries: typing.Dict[
+        snowflakes.Snowflake,
+        collections.LimitedCapacityCacheMap[
+            snowflakes.Snowflake, typing.Dict[typing.Optional[snowflakes.Snowflake], permissions_.Permissions]
+        ],
+    ]
     _role_entries: collections.ExtendedMutableMapping[snowflakes.Snowflake, guilds.Role]
     _unknown_custom_emoji_entries: collections.ExtendedMutableMapping[
         snowflakes.Snowflake,
         cache_utility.RefCell[emojis.CustomEmoji],
     ]
+    # Activity keys -> the activities shared by every cached presence with the same activities.
+    _activity_entries: collections.ExtendedMutableMapping[
+        typing.Tuple[_ActivityKeyT, ...], cache_utility.RefCell[typing.Tuple[cache_utility.RichActivityData, ...]]
+    ]
+    # Statuses -> the client status object shared by every cached presence with the same statuses.
+    _client_status_entries: typing.Dict[typing.Tuple[typing.Union[presences.Status, str], ...], presences.ClientStatus]
     _user_entries: collections.ExtendedMutableMapping[snowflakes.Snowflake, cache_utility.RefCell[users.User]]
+    # ID of the cell -> the cell, for the lazily cached members which were most recently read.
+    _materialized_members: typing.Optional[collections.ExtendedMutableMapping[int, cache_utility.LazyMemberCell]]
     _message_entries: collections.ExtendedMutableMapping[
         snowflakes.Snowflake, cache_utility.RefCell[cache_utility.MessageData]
     ]
@@ -118,11 +418,23 @@ class CacheImpl(cache.MutableCache):
         self._guild_channel_entries = collections.FreezableDict()
         self._guild_entries = collections.FreezableDict()
         self._invite_entries = collections.FreezableDict()
+        self._permission_entries = {}
         self._role_entries = collections.FreezableDict()
         # This is a purely internal cache used for handling the caching and de-duplicating of the unknown custom emojis
         # found attached to cached presence activities.
         self._unknown_custom_emoji_entries = collections.FreezableDict()
+        # These are purely internal caches used for sharing identical activities and client statuses between the
+        # presences of a user in each guild, which are otherwise copies of each other.
+        self._activity_entries = collections.FreezableDict()
+        # There are only a handful of possible client statuses, so these are never removed.
+        self._client_status_entries = {}
         self._user_entries = collections.FreezableDict()
+        self._materialized_members = None
+        if self._settings.lazy_members and self._settings.max_materialized_members:
+            self._materialized_members = collections.LimitedCapacityCacheMap(
+                limit=self._settings.max_materialized_members, on_expire=cache_utility.LazyMemberCell.dematerialize
+            )
+
         self._message_entries = collections.LimitedCapacityCacheMap(
             limit=self._settings.max_messages, on_expire=self._on_message_expire
         )
@@ -132,15 +444,339 @@ class CacheImpl(cache.MutableCache):
         return (self._settings.components & required_flag) == required_flag
 
     @staticmethod
-    def _increment_ref_count(obj: cache_utility.RefCell[typing.Any], increment: int = 1) -> None:
+    def _increment_ref_count(obj: cache_utility.BaseRefCell[typing.Any], increment: int = 1) -> None:
         obj.ref_count += increment
 
+    @staticmethod
+    def _add_to_index(index: typing.Dict[_KeyT, typing.Set[_T]], key: _KeyT, value: _T) -> None:
+        try:
+            index[key].add(value)
+        except KeyError:
+            index[key] = {value}
+
+    @staticmethod
+    def _remove_from_index(index: typing.Dict[_KeyT, typing.Set[_T]], key: _KeyT, value: _T) -> None:
+        values = index.get(key)
+        if values is not None:
+            values.discard(value)
+            # Empty sets are removed so the index doesn't grow with every key it has ever seen.
+            if not values:
+                del index[key]
+
+    def _create_guild_entries(
+        self,
+        component: config.CacheComponents,
+        limit: typing.Optional[int],
+        expiry: typing.Optional[datetime.timedelta],
+        /,
+    ) -> collections.ExtendedMutableMapping[snowflakes.Snowflake, typing.Any]:
+        on_expire = _EvictionCallback(self, component)
+        if expiry is not None:
+            return collections.TimedCacheMap(expiry=expiry, limit=limit, on_expire=on_expire)
+
+        if limit is not None:
+            return collections.LimitedCapacityCacheMap(limit=limit, on_expire=on_expire)
+
+        return collections.FreezableDict()
+
     def clear(self) -> None:
         if self._settings.components == config.CacheComponents.NONE:
             return None
 
         self._create_cache()
 
+    def save_snapshot(self, path: typing.Union[str, os.PathLike[str]], /) -> None:
+        """Write a snapshot of the cache's contents to a file.
+
+        The snapshot can be loaded with `CacheImpl.load_snapshot` to warm
+        the cache of a new process, such as after restarting a bot which
+        resumes its gateway sessions.
+
+        !!! note
+            This is a blocking call, so you may want to run it in an executor.
+
+        Parameters
+        ----------
+        path : typing.Union[builtins.str, os.PathLike[builtins.str]]
+            The file to write the snapshot to. This will be replaced if it
+            already exists.
+        """
+        state: typing.Dict[str, typing.Any] = {name: getattr(self, name) for name in _SNAPSHOT_ENTRIES}
+        state["_me"] = self._me
+        # These are rebuilt on load so that they use the loading cache's limits and expiry callback.
+        state["_dm_channel_entries"] = self._dm_channel_entries.freeze()
+        state["_message_entries"] = self._message_entries.freeze()
+
+        file = pathlib.Path(path)
+        # Write to a temporary file first so that a crash never leaves a partially written snapshot behind.
+        temp_file = file.with_name(file.name + ".tmp")
+        with temp_file.open("wb") as fp:
+            _SnapshotPickler(fp, self._app, self).dump(
+                (_SNAPSHOT_VERSION, int(self._settings.components), self._settings.columnar_members, state)
+            )
+
+        os.replace(temp_file, file)
+
+    def load_snapshot(self, path: typing.Union[str, os.PathLike[str]], /) -> bool:
+        """Replace the cache's contents with a snapshot written by `CacheImpl.save_snapshot`.
+
+        Gateway events received after this will update the loaded entities
+        as normal, so any changes missed while the snapshot was on disk are
+        reconciled as the gateway replays or re-sends them.
+
+        The members and presences of each guild are limited and expired with
+        this cache's settings, rather than those the snapshot was written with.
+
+        !!! warning
+            Snapshots are pickled, so only load snapshots written by a process
+            you trust. Only the types which make up a cache may be loaded.
+
+        !!! note
+            This is a blocking call, so you may want to run it in an executor.
+
+        Parameters
+        ----------
+        path : typing.Union[builtins.str, os.PathLike[builtins.str]]
+            The file to load the snapshot from.
+
+        Returns
+        -------
+        builtins.bool
+            Whether the snapshot was loaded. This will be `builtins.False`
+            if the file does not exist, is corrupt, or was written by a
+            cache with different components or an older version of hikari,
+            in which case the cache is left unchanged.
+        """
+        try:
+            with open(path, "rb") as fp, mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                version, components, columnar_members, state = _SnapshotUnpickler(buffer, self._app, self).load()
+
+        except FileNotFoundError:
+            return False
+
+        except Exception as ex:
+            # A corrupt snapshot is no worse than a missing one; the cache will be filled by the gateway instead.
+            _LOGGER.warning("ignoring cache snapshot %s as it could not be loaded", path, exc_info=ex)
+            return False
+
+        if (
+            version != _SNAPSHOT_VERSION
+            or components != self._settings.components
+            or columnar_members != self._settings.columnar_members
+        ):
+            _LOGGER.warning("ignoring cache snapshot %s as it was written with different cache settings", path)
+            return False
+
+        self._create_cache()
+        for name in _SNAPSHOT_ENTRIES:
+            setattr(self, name, state[name])
+
+        self._me = state["_me"]
+        self._dm_channel_entries = collections.LimitedCapacityCacheMap(
+            state["_dm_channel_entries"], limit=self._settings.max_dm_channel_ids
+        )
+        self._message_entries = collections.LimitedCapacityCacheMap(
+            state["_message_entries"], limit=self._settings.max_messages, on_expire=self._on_message_expire
+        )
+        # The snapshot's limits and expiry are replaced with the loading cache's, evicting any entries over them.
+        for guild_record in tuple(self._guild_entries.values()):
+            if guild_record.members is not None and not self._settings.columnar_members:
+                guild_record.members = self._rebuild_guild_entries(
+                    config.CacheComponents.MEMBERS,
+                    guild_record.members,
+                    self._settings.max_members_per_guild,
+                    self._settings.member_expiry,
+                )
+
+            if guild_record.presences is not None:
+                guild_record.presences = self._rebuild_guild_entries(
+                    config.CacheComponents.PRESENCES,
+                    guild_record.presences,
+                    self._settings.max_presences_per_guild,
+                    self._settings.presence_expiry,
+                )
+
+        return True
+
+    def _rebuild_guild_entries(
+        self,
+        component: config.CacheComponents,
+        entries: collections.ExtendedMutableMapping[snowflakes.Snowflake, typing.Any],
+        limit: typing.Optional[int],
+        expiry: typing.Optional[datetime.timedelta],
+        /,
+    ) -> collections.ExtendedMutableMapping[snowflakes.Snowflake, typing.Any]:
+        new_entries = self._create_guild_entries(component, limit, expiry)
+        for key, value in entries.freeze().items():
+            new_entries[key] = value
+
+        return new_entries
+
+    def _estimate_size(self, obj: typing.Any, seen: typing.Set[int], /) -> int:
+        size = 0
+        if isinstance(obj, cache_utility.BaseRefCell):
+            size += sys.getsizeof(obj)
+            obj = obj.object
+
+        stack = [obj]
+        while stack:
+            obj = stack.pop()
+            if id(obj) in seen or obj is self._app or isinstance(obj, _UNSIZED_TYPES):
+                continue
+
+            seen.add(id(obj))
+            size += sys.getsizeof(obj)
+            stack.extend(gc.get_referents(obj))
+
+        return size
+
+    def _estimate_entry_size(
+        self,
+        values: typing.Iterable[typing.Any],
+        sample_size: int,
+        /,
+        *,
+        seen: typing.Optional[typing.Set[int]] = None,
+    ) -> float:
+        # Objects shared between the sampled entries are only counted once, as they are shared in the cache too.
+        seen = seen if seen is not None else set()
+        sizes = [self._estimate_size(value, seen) for value in itertools.islice(values, sample_size)]
+        return sum(sizes) / len(sizes) if sizes else 0.0
+
+    def memory_report(self, *, sample_size: int = 100) -> CacheMemoryReport:
+        """Estimate how much memory is used by each component of the cache and each cached guild.
+
+        This only walks a sample of each component's entries and counts the
+        rest, so it is cheap enough to call periodically. Entities referenced
+        by several others, such as users, are only counted once.
+
+        Other Parameters
+        ----------------
+        sample_size : builtins.int
+            The maximum number of entries of each component to measure to
+            estimate the size of the rest of its entries. Defaults to `100`.
+
+        Returns
+        -------
+        CacheMemoryReport
+            The memory report.
+        """
+        records = tuple(self._guild_entries.values())
+
+        def guild_bound(name: str) -> typing.Iterator[typing.Any]:
+            for record in records:
+                mapping = getattr(record, name)
+                # Columnar member stores know their own size, so they don't need to be sampled.
+                if mapping is not None and not isinstance(mapping, cache_utility.ColumnarMemberStore):
+                    yield from mapping.values()
+
+        guild_size = self._estimate_entry_size((r.guild for r in records if r.guild is not None), sample_size)
+        channel_size = self._estimate_entry_size(self._guild_channel_entries.values(), sample_size)
+        emoji_size = self._estimate_entry_size(self._emoji_entries.values(), sample_size)
+        invite_size = self._estimate_entry_size(self._invite_entries.values(), sample_size)
+        member_size = self._estimate_entry_size(guild_bound("members"), sample_size)
+        # Interned activities are counted once for the whole cache rather than for each presence which shares them.
+        activity_ids = {id(cell.object) for cell in self._activity_entries.values()}
+        presence_size = self._estimate_entry_size(guild_bound("presences"), sample_size, seen=activity_ids)
+        role_size = self._estimate_entry_size(self._role_entries.values(), sample_size)
+        voice_state_size = self._estimate_entry_size(guild_bound("voice_states"), sample_size)
+
+        guild_reports: typing.Dict[snowflakes.Snowflake, GuildMemoryUsage] = {}
+        for guild_id, record in self._guild_entries.items():
+            components: typing.Dict[config.CacheComponents, MemoryUsage] = {}
+            if self._is_cache_enabled_for(config.CacheComponents.GUILDS):
+                guild_entry_size = round(guild_size) if record.guild is not None else 0
+                components[config.CacheComponents.GUILDS] = MemoryUsage(
+                    entries=int(record.guild is not None), size=sys.getsizeof(record) + guild_entry_size
+                )
+
+            for component, entries, index, entry_size in (
+                (config.CacheComponents.GUILD_CHANNELS, record.channels, None, channel_size),
+                (config.CacheComponents.EMOJIS, record.emojis, None, emoji_size),
+                (config.CacheComponents.INVITES, record.invites, record.invite_channel_index, invite_size),
+                (config.CacheComponents.MEMBERS, record.members, record.member_role_index, member_size),
+                (config.CacheComponents.PRESENCES, record.presences, None, presence_size),
+                (config.CacheComponents.ROLES, record.roles, None, role_size),
+                (
+                    config.CacheComponents.VOICE_STATES,
+                    record.voice_states,
+                    record.voice_state_channel_index,
+                    voice_state_size,
+                ),
+            ):
+                if not self._is_cache_enabled_for(component):
+                    continue
+
+                if entries is None:
+                    components[component] = MemoryUsage(entries=0, size=0)
+                    continue
+
+                if isinstance(entries, cache_utility.ColumnarMemberStore):
+                    size = sys.getsizeof(entries)
+                else:
+                    # Channels, emojis, invites and roles are stored in cache-wide mappings; the guild holds their IDs.
+                    size = round(len(entries) * entry_size) + sys.getsizeof(entries)
+
+                if index is not None:
+                    size += sys.getsizeof(index) + sum(map(sys.getsizeof, index.values()))
+
+                components[component] = MemoryUsage(entries=len(entries), size=size)
+
+            guild_reports[guild_id] = GuildMemoryUsage(guild_id=guild_id, components=components)
+
+        def global_usage(
+            *mappings: collections.ExtendedMutableMapping[typing.Any, typing.Any], entry_size: float
+        ) -> MemoryUsage:
+            count = sum(map(len, mappings))
+            return MemoryUsage(entries=count, size=round(count * entry_size) + sum(map(sys.getsizeof, mappings)))
+
+        unknown_emoji_size = self._estimate_entry_size(self._unknown_custom_emoji_entries.values(), sample_size)
+        activity_size = self._estimate_entry_size(self._activity_entries.values(), sample_size)
+        component_reports: typing.Dict[config.CacheComponents, MemoryUsage] = {}
+        # Guild-bound components are the sum of their guilds, plus whatever they store outside of the guild records.
+        for component, extra_size in (
+            (config.CacheComponents.GUILDS, sys.getsizeof(self._guild_entries)),
+            (config.CacheComponents.GUILD_CHANNELS, sys.getsizeof(self._guild_channel_entries)),
+            (config.CacheComponents.EMOJIS, sys.getsizeof(self._emoji_entries)),
+            (config.CacheComponents.INVITES, sys.getsizeof(self._invite_entries)),
+            (config.CacheComponents.MEMBERS, 0),
+            # Unknown custom emojis are only cached for the activities of presences.
+            (
+                config.CacheComponents.PRESENCES,
+                global_usage(self._unknown_custom_emoji_entries, entry_size=unknown_emoji_size).size
+                + global_usage(self._activity_entries, entry_size=activity_size).size,
+            ),
+            (config.CacheComponents.ROLES, sys.getsizeof(self._role_entries)),
+            (config.CacheComponents.VOICE_STATES, 0),
+        ):
+            if self._is_cache_enabled_for(component):
+                usages = [report.components[component] for report in guild_reports.values()]
+                component_reports[component] = MemoryUsage(
+                    entries=sum(usage.entries for usage in usages),
+                    size=sum(usage.size for usage in usages) + extra_size,
+                )
+
+        if self._is_cache_enabled_for(config.CacheComponents.MESSAGES):
+            messages = (self._message_entries, self._referenced_messages)
+            message_size = self._estimate_entry_size(
+                itertools.chain.from_iterable(mapping.values() for mapping in messages), sample_size
+            )
+            component_reports[config.CacheComponents.MESSAGES] = global_usage(*messages, entry_size=message_size)
+
+        if self._is_cache_enabled_for(config.CacheComponents.DM_CHANNEL_IDS):
+            # Both the keys and the values are snowflakes, so each entry is estimated as two of the sampled values.
+            dm_channel_size = 2 * self._estimate_entry_size(self._dm_channel_entries.values(), sample_size)
+            component_reports[config.CacheComponents.DM_CHANNEL_IDS] = global_usage(
+                self._dm_channel_entries, entry_size=dm_channel_size
+            )
+
+        user_size = self._estimate_entry_size(self._user_entries.values(), sample_size)
+        return CacheMemoryReport(
+            components=component_reports,
+            users=global_usage(self._user_entries, entry_size=user_size),
+            guilds=guild_reports,
+        )
+
     def clear_dm_channel_ids(self) -> cache.CacheView[snowflakes.Snowflake, snowflakes.Snowflake]:
         if not self._is_cache_enabled_for(config.CacheComponents.DM_CHANNEL_IDS):
             return cache_utility.EmptyCacheView()
@@ -169,7 +805,7 @@ class CacheImpl(cache.MutableCache):
         if not self._is_cache_enabled_for(config.CacheComponents.DM_CHANNEL_IDS):
             return cache_utility.EmptyCacheView()
 
-        return cache_utility.CacheMappingView(self._dm_channel_entries.freeze())
+        return cache_utility.CacheMappingView(self._dm_channel_entries.view())
 
     def set_dm_channel_id(
         self,
@@ -262,7 +898,7 @@ class CacheImpl(cache.MutableCache):
         if not self._is_cache_enabled_for(config.CacheComponents.EMOJIS):
             return cache_utility.EmptyCacheView()
 
-        return cache_utility.CacheMappingView(self._emoji_entries.freeze(), builder=self._build_emoji)
+        return cache_utility.CacheMappingView(self._emoji_entries.view(), builder=self._build_emoji)
 
     def get_emojis_view_for_guild(
         self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
@@ -281,6 +917,15 @@ class CacheImpl(cache.MutableCache):
         if not self._is_cache_enabled_for(config.CacheComponents.EMOJIS):
             return None
 
+        self._set_emoji(emoji)
+        guild_record = self._get_or_create_guild_record(emoji.guild_id)
+
+        if guild_record.emojis is None:  # TODO: add test cases when it is not None?
+            guild_record.emojis = collections.SnowflakeSet()
+
+        guild_record.emojis.add(emoji.id)
+
+    def _set_emoji(self, emoji: emojis.KnownCustomEmoji, /) -> None:
         user: typing.Optional[cache_utility.RefCell[users.User]] = None
         if emoji.user:
             user = self._set_user(emoji.user)
@@ -289,12 +934,6 @@ class CacheImpl(cache.MutableCache):
 
         emoji_data = cache_utility.KnownCustomEmojiData.build_from_entity(emoji, user=user)
         self._emoji_entries[emoji.id] = emoji_data
-        guild_record = self._get_or_create_guild_record(emoji.guild_id)
-
-        if guild_record.emojis is None:  # TODO: add test cases when it is not None?
-            guild_record.emojis = collections.SnowflakeSet()
-
-        guild_record.emojis.add(emoji.id)
 
     def update_emoji(
         self, emoji: emojis.KnownCustomEmoji, /
@@ -324,6 +963,7 @@ class CacheImpl(cache.MutableCache):
 
         cached_guilds = {}
 
+        self._permission_entries.clear()
         for guild_id, guild_record in self._guild_entries.freeze().items():
             if guild_record.guild:
                 cached_guilds[guild_id] = guild_record.guild
@@ -347,6 +987,7 @@ class CacheImpl(cache.MutableCache):
         guild = guild_record.guild
 
         if guild:
+            self._invalidate_permissions(guild_id)
             guild_record.guild = None
             guild_record.is_available = None
             self._remove_guild_record_if_empty(guild_id, guild_record)
@@ -418,6 +1059,7 @@ class CacheImpl(cache.MutableCache):
         if not self._is_cache_enabled_for(config.CacheComponents.GUILDS):
             return None
 
+        self._invalidate_permissions(guild.id)
         guild_record = self._get_or_create_guild_record(guild.id)
         guild_record.guild = copy.copy(guild)
         guild_record.is_available = True
@@ -450,12 +1092,78 @@ class CacheImpl(cache.MutableCache):
         self.set_guild(guild)
         return cached_guild, self.get_guild(guild.id)
 
+    def replace_guild_contents(
+        self,
+        guild: guilds.GatewayGuild,
+        /,
+        *,
+        channels: typing.Iterable[channels.GuildChannel] = (),
+        emojis: typing.Iterable[emojis.KnownCustomEmoji] = (),
+        roles: typing.Iterable[guilds.Role] = (),
+        members: typing.Iterable[guilds.Member] = (),
+        presences: typing.Iterable[presences.MemberPresence] = (),
+        voice_states: typing.Iterable[voices.VoiceState] = (),
+    ) -> None:
+        self.update_guild(guild)
+        self.clear_guild_channels_for_guild(guild.id)
+        self.clear_emojis_for_guild(guild.id)
+        self.clear_roles_for_guild(guild.id)
+        self.clear_members_for_guild(guild.id)
+        self.clear_presences_for_guild(guild.id)
+        self.clear_voice_states_for_guild(guild.id)
+
+        # The record may have just been removed by the clears if it was left empty.
+        guild_record = self._get_or_create_guild_record(guild.id)
+        self._invalidate_permissions(guild.id)
+
+        if self._is_cache_enabled_for(config.CacheComponents.GUILD_CHANNELS):
+            channel_ids = []
+            for channel in channels:
+                self._guild_channel_entries[channel.id] = cache_utility.copy_guild_channel(channel)
+                channel_ids.append(channel.id)
+
+            if channel_ids:
+                guild_record.channels = collections.SnowflakeSet(*channel_ids)
+
+        if self._is_cache_enabled_for(config.CacheComponents.EMOJIS):
+            emoji_ids = []
+            for emoji in emojis:
+                self._set_emoji(emoji)
+                emoji_ids.append(emoji.id)
+
+            if emoji_ids:
+                guild_record.emojis = collections.SnowflakeSet(*emoji_ids)
+
+        if self._is_cache_enabled_for(config.CacheComponents.ROLES):
+            role_ids = []
+            for role in roles:
+                self._role_entries[role.id] = role
+                role_ids.append(role.id)
+
+            if role_ids:
+                guild_record.roles = collections.SnowflakeSet(*role_ids)
+
+        if self._is_cache_enabled_for(config.CacheComponents.MEMBERS):
+            for member in members:
+                self._set_member_in_record(guild_record, member, is_reference=False)
+
+        if self._is_cache_enabled_for(config.CacheComponents.PRESENCES):
+            for presence in presences:
+                self._set_presence_in_record(guild_record, presence)
+
+        if self._is_cache_enabled_for(config.CacheComponents.VOICE_STATES):
+            for voice_state in voice_states:
+                self._set_voice_state_in_record(guild_record, voice_state)
+
+        self._remove_guild_record_if_empty(guild.id, guild_record)
+
     def clear_guild_channels(self) -> cache.CacheView[snowflakes.Snowflake, channels.GuildChannel]:
         if not self._is_cache_enabled_for(config.CacheComponents.GUILD_CHANNELS):
             return cache_utility.EmptyCacheView()
 
         cached_channels = self._guild_channel_entries
         self._guild_channel_entries = collections.FreezableDict()
+        self._permission_entries.clear()
 
         for guild_id, guild_record in self._guild_entries.freeze().items():
             if guild_record.channels:
@@ -476,6 +1184,7 @@ class CacheImpl(cache.MutableCache):
             return cache_utility.EmptyCacheView()
 
         cached_channels = {sf: self._guild_channel_entries.pop(sf) for sf in guild_record.channels}
+        self._invalidate_permissions(guild_id)
         guild_record.channels = None
         self._remove_guild_record_if_empty(guild_id, guild_record)
         return cache_utility.CacheMappingView(cached_channels)
@@ -492,6 +1201,7 @@ class CacheImpl(cache.MutableCache):
         if not channel:
             return None
 
+        self._invalidate_permissions(channel.guild_id, channel_id=channel_id)
         guild_record = self._guild_entries.get(channel.guild_id)
         if guild_record and guild_record.channels:
             guild_record.channels.remove(channel_id)
@@ -512,7 +1222,7 @@ class CacheImpl(cache.MutableCache):
 
     def get_guild_channels_view(self) -> cache.CacheView[snowflakes.Snowflake, channels.GuildChannel]:
         return cache_utility.CacheMappingView(
-            self._guild_channel_entries.freeze(), builder=cache_utility.copy_guild_channel  # type: ignore[type-var]
+            self._guild_channel_entries.view(), builder=cache_utility.copy_guild_channel  # type: ignore[type-var]
         )
 
     def get_guild_channels_view_for_guild(
@@ -549,6 +1259,7 @@ class CacheImpl(cache.MutableCache):
             return None
 
         self._guild_channel_entries[channel.id] = cache_utility.copy_guild_channel(channel)
+        self._invalidate_permissions(channel.guild_id, channel_id=channel.id)
         guild_record = self._get_or_create_guild_record(channel.guild_id)
 
         if guild_record.channels is None:
@@ -592,6 +1303,7 @@ class CacheImpl(cache.MutableCache):
         for guild_id, guild_record in self._guild_entries.freeze().items():
             if guild_record.invites:
                 guild_record.invites = None
+                guild_record.invite_channel_index.clear()
                 self._remove_guild_record_if_empty(guild_id, guild_record)
 
         return cache_utility.CacheMappingView(cached_invites, builder=self._build_invite)
@@ -610,6 +1322,7 @@ class CacheImpl(cache.MutableCache):
 
         cached_invites = {invite_code: self._invite_entries.pop(invite_code) for invite_code in guild_record.invites}
         guild_record.invites = None
+        guild_record.invite_channel_index.clear()
         self._remove_guild_record_if_empty(guild_id, guild_record)
 
         for invite_data in cached_invites.values():
@@ -632,15 +1345,12 @@ class CacheImpl(cache.MutableCache):
         if not guild_record or not guild_record.invites:
             return cache_utility.EmptyCacheView()
 
+        codes = guild_record.invite_channel_index.pop(channel_id, ())
         cached_invites = {}
 
-        for code in tuple(guild_record.invites):
-            invite_data = self._invite_entries[code]
-            if invite_data.channel_id != channel_id:
-                continue
-
+        for code in codes:
+            invite_data = self._invite_entries.pop(code)
             cached_invites[code] = invite_data
-            del self._invite_entries[code]
             guild_record.invites.remove(code)
             self._remove_invite_users(invite_data)
 
@@ -667,6 +1377,7 @@ class CacheImpl(cache.MutableCache):
             guild_record = self._guild_entries.get(invite_data.guild_id)
             if guild_record and guild_record.invites:
                 guild_record.invites.remove(code)
+                self._remove_from_index(guild_record.invite_channel_index, invite_data.channel_id, code)
 
                 if not guild_record.invites:
                     guild_record.invites = None  # TODO: test when this is set to None
@@ -686,7 +1397,7 @@ class CacheImpl(cache.MutableCache):
         if not self._is_cache_enabled_for(config.CacheComponents.INVITES):
             return cache_utility.EmptyCacheView()
 
-        return cache_utility.CacheMappingView(self._invite_entries.freeze(), builder=self._build_invite)
+        return cache_utility.CacheMappingView(self._invite_entries.view(), builder=self._build_invite)
 
     def get_invites_view_for_guild(
         self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
@@ -717,11 +1428,11 @@ class CacheImpl(cache.MutableCache):
         if not guild_entry or not guild_entry.invites:
             return cache_utility.EmptyCacheView()
 
-        cached_invites = {
-            invite.code: invite
-            for invite in map(self._invite_entries.get, guild_entry.invites)
-            if invite and invite.channel_id == channel_id
-        }
+        codes = guild_entry.invite_channel_index.get(channel_id)
+        if not codes:
+            return cache_utility.EmptyCacheView()
+
+        cached_invites = {code: self._invite_entries[code] for code in codes}
         return cache_utility.CacheMappingView(cached_invites, builder=self._build_invite)
 
     def set_invite(self, invite: invites.InviteWithMetadata, /) -> None:
@@ -750,6 +1461,7 @@ class CacheImpl(cache.MutableCache):
                 guild_entry.invites = []
 
             guild_entry.invites.append(invite.code)
+            self._add_to_index(guild_entry.invite_channel_index, invite.channel_id, invite.code)
 
     def update_invite(
         self, invite: invites.InviteWithMetadata, /
@@ -782,38 +1494,52 @@ class CacheImpl(cache.MutableCache):
 
     def _build_member(
         self,
-        member_data: cache_utility.RefCell[cache_utility.MemberData],
+        member_data: cache_utility.BaseRefCell[cache_utility.MemberData],
     ) -> guilds.Member:
+        if self._materialized_members is not None and isinstance(member_data, cache_utility.LazyMemberCell):
+            # Re-inserting the cell marks it as the most recently read, so it will be the last to be dematerialized.
+            self._materialized_members.pop(id(member_data), None)
+            self._materialized_members[id(member_data)] = member_data
+            return member_data.materialize().build_entity(self._app)
+
         return member_data.object.build_entity(self._app)
 
     @staticmethod
     def _can_remove_member(
-        member: cache_utility.RefCell[cache_utility.MemberData],
+        member: cache_utility.BaseRefCell[cache_utility.MemberData],
     ) -> bool:
         return member.ref_count < 1 and member.object.has_been_deleted
 
     def _garbage_collect_member(
         self,
         guild_record: cache_utility.GuildRecord,
-        member: cache_utility.RefCell[cache_utility.MemberData],
+        member: cache_utility.BaseRefCell[cache_utility.MemberData],
         *,
         decrement: typing.Optional[int] = None,
         deleting: bool = False,
-    ) -> typing.Optional[cache_utility.RefCell[cache_utility.MemberData]]:
+    ) -> typing.Optional[cache_utility.BaseRefCell[cache_utility.MemberData]]:
         if deleting:
-            member.object.has_been_deleted = True
+            member_data = member.object
+            member_data.has_been_deleted = True
+            # Member stores may build the data object on access, so the change has to be written back to the cell.
+            member.object = member_data
 
         if decrement is not None:
             self._increment_ref_count(member, -decrement)
 
         user_id = member.object.user.object.id
-        if not guild_record.members or user_id not in guild_record.members:
+        if not guild_record.members or guild_record.members.get(user_id) is not member:
+            # A member which was evicted may still be referenced by an older cell than the one now cached.
+            self._release_evicted_member(guild_record, user_id, member)
             return None
 
         if not self._can_remove_member(member):
             return None
 
         del guild_record.members[user_id]
+        for role_id in member.object.role_ids:
+            self._remove_from_index(guild_record.member_role_index, role_id, user_id)
+
         self._garbage_collect_user(member.object.user, decrement=1)
 
         if not guild_record.members:
@@ -842,6 +1568,7 @@ class CacheImpl(cache.MutableCache):
         if not guild_record or not guild_record.members:
             return cache_utility.EmptyCacheView()
 
+        self._invalidate_permissions(guild_id)
         cached_members = guild_record.members.freeze()
         members_gen = (self._garbage_collect_member(guild_record, m, deleting=True) for m in cached_members.values())
         # _garbage_collect_member will only return the member data object if they could be removed, else None.
@@ -868,6 +1595,8 @@ class CacheImpl(cache.MutableCache):
         if not member_data:
             return None
 
+        self._invalidate_permissions(guild_id, user_id=user_id)
+
         if not guild_record.members:
             guild_record.members = None
             self._remove_guild_record_if_empty(guild_id, guild_record)
@@ -894,6 +1623,180 @@ class CacheImpl(cache.MutableCache):
         member = guild_record.members.get(user_id)
         return self._build_member(member) if member else None
 
+    def _invalidate_permissions(
+        self,
+        guild_id: snowflakes.Snowflake,
+        /,
+        *,
+        channel_id: typing.Optional[snowflakes.Snowflake] = None,
+        user_id: typing.Optional[snowflakes.Snowflake] = None,
+    ) -> None:
+        guild_permissions = self._permission_entries.get(guild_id)
+        if not guild_permissions:
+            return
+
+        if channel_id is not None:
+            for member_permissions in guild_permissions.values():
+                member_permissions.pop(channel_id, None)
+
+        elif user_id is not None:
+            guild_permissions.pop(user_id, None)
+
+        else:
+            del self._permission_entries[guild_id]
+
+    def _compute_role_permissions(
+        self,
+        guild_id: snowflakes.Snowflake,
+        everyone_role: guilds.Role,
+        role_ids: typing.Iterable[snowflakes.Snowflake],
+        channel: typing.Optional[channels.GuildChannel],
+    ) -> int:
+        # Flag operations are comparatively slow, so these are computed as ints.
+        value = int(everyone_role.permissions)
+        for role_id in role_ids:
+            role = self._role_entries.get(role_id)
+            if role:
+                value |= int(role.permissions)
+
+        if value & _ADMINISTRATOR:
+            return _ALL_PERMISSIONS
+
+        if channel is None:
+            return value
+
+        overwrites = channel.permission_overwrites
+        everyone_overwrite = overwrites.get(guild_id)
+        if everyone_overwrite:
+            value = (value & ~int(everyone_overwrite.deny)) | int(everyone_overwrite.allow)
+
+        allow = 0
+        deny = 0
+        for role_id in role_ids:
+            # Members' role IDs include the @everyone role, whose overwrite has already been applied.
+            if role_id == guild_id:
+                continue
+
+            role_overwrite = overwrites.get(role_id)
+            if role_overwrite:
+                allow |= int(role_overwrite.allow)
+                deny |= int(role_overwrite.deny)
+
+        return (value & ~deny) | allow
+
+    @staticmethod
+    def _apply_member_overwrite(
+        value: int, user_id: snowflakes.Snowflake, channel: typing.Optional[channels.GuildChannel]
+    ) -> int:
+        if channel is None or value & _ADMINISTRATOR:
+            return value
+
+        member_overwrite = channel.permission_overwrites.get(user_id)
+        if member_overwrite:
+            value = (value & ~int(member_overwrite.deny)) | int(member_overwrite.allow)
+
+        return value
+
+    def get_member_permissions(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        user: snowflakes.SnowflakeishOr[users.PartialUser],
+        /,
+        channel: typing.Optional[snowflakes.SnowflakeishOr[channels.PartialChannel]] = None,
+    ) -> typing.Optional[permissions_.Permissions]:
+        guild_id = snowflakes.Snowflake(guild)
+        user_id = snowflakes.Snowflake(user)
+        channel_id = None if channel is None else snowflakes.Snowflake(channel)
+
+        guild_permissions = self._permission_entries.get(guild_id)
+        if guild_permissions:
+            member_permissions = guild_permissions.get(user_id)
+            if member_permissions:
+                result = member_permissions.get(channel_id)
+                if result is not None:
+                    return result
+
+        guild_record = self._guild_entries.get(guild_id)
+        if not guild_record or not guild_record.guild or not guild_record.members:
+            return None
+
+        member = guild_record.members.get(user_id)
+        everyone_role = self._role_entries.get(guild_id)
+        if not member or member.object.has_been_deleted or not everyone_role:
+            return None
+
+        cached_channel: typing.Optional[channels.GuildChannel] = None
+        if channel_id is not None:
+            cached_channel = self._guild_channel_entries.get(channel_id)
+            if not cached_channel or cached_channel.guild_id != guild_id:
+                return None
+
+        if user_id == guild_record.guild.owner_id:
+            value = _ALL_PERMISSIONS
+        else:
+            value = self._compute_role_permissions(guild_id, everyone_role, member.object.role_ids, cached_channel)
+            value = self._apply_member_overwrite(value, user_id, cached_channel)
+
+        result = permissions_.Permissions(value)
+        guild_permissions = self._permission_entries.get(guild_id)
+        if guild_permissions is None:
+            guild_permissions = collections.LimitedCapacityCacheMap(limit=_MAX_PERMISSION_MEMBERS_PER_GUILD)
+            self._permission_entries[guild_id] = guild_permissions
+
+        guild_permissions.setdefault(user_id, {})[channel_id] = result
+        return result
+
+    def get_members_with_permissions(
+        self,
+        channel: snowflakes.SnowflakeishOr[channels.PartialChannel],
+        permissions: permissions_.Permissions,
+        /,
+        members: undefined.UndefinedOr[
+            typing.Iterable[snowflakes.SnowflakeishOr[users.PartialUser]]
+        ] = undefined.UNDEFINED,
+    ) -> typing.Sequence[snowflakes.Snowflake]:
+        cached_channel = self._guild_channel_entries.get(snowflakes.Snowflake(channel))
+        if not cached_channel:
+            return []
+
+        guild_id = cached_channel.guild_id
+        guild_record = self._guild_entries.get(guild_id)
+        everyone_role = self._role_entries.get(guild_id)
+        if not guild_record or not guild_record.guild or not guild_record.members or not everyone_role:
+            return []
+
+        cached_members = guild_record.members
+        owner_id = guild_record.guild.owner_id
+        user_ids = cached_members.keys() if members is undefined.UNDEFINED else map(snowflakes.Snowflake, members)
+        required = int(permissions)
+        # Members usually share a handful of role combinations, so their role permissions are only computed once.
+        role_permissions: typing.Dict[typing.Tuple[snowflakes.Snowflake, ...], int] = {}
+        results: typing.List[snowflakes.Snowflake] = []
+
+        for user_id in user_ids:
+            member = cached_members.get(user_id)
+            if not member:
+                continue
+
+            member_data = member.object
+            if member_data.has_been_deleted:
+                continue
+
+            if user_id == owner_id:
+                results.append(user_id)
+                continue
+
+            role_ids = member_data.role_ids
+            value = role_permissions.get(role_ids)
+            if value is None:
+                value = self._compute_role_permissions(guild_id, everyone_role, role_ids, cached_channel)
+                role_permissions[role_ids] = value
+
+            if self._apply_member_overwrite(value, user_id, cached_channel) & required == required:
+                results.append(user_id)
+
+        return results
+
     def get_members_view(
         self,
     ) -> cache.CacheView[snowflakes.Snowflake, cache.CacheView[snowflakes.Snowflake, guilds.Member]]:
@@ -901,7 +1804,7 @@ class CacheImpl(cache.MutableCache):
             return cache_utility.EmptyCacheView()
 
         views: typing.Mapping[snowflakes.Snowflake, cache.CacheView[snowflakes.Snowflake, guilds.Member]] = {
-            guild_id: cache_utility.CacheMappingView(view.members.freeze(), builder=self._build_member)  # type: ignore[type-var]
+            guild_id: cache_utility.CacheMappingView(view.members.view(), builder=self._build_member)  # type: ignore[type-var]
             for guild_id, view in self._guild_entries.items()
             if view.members
         }
@@ -924,37 +1827,263 @@ class CacheImpl(cache.MutableCache):
 
         return cache_utility.CacheMappingView(cached_members, builder=self._build_member)  # type: ignore[type-var]
 
+    def get_members_view_for_role(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        role: snowflakes.SnowflakeishOr[guilds.PartialRole],
+        /,
+    ) -> cache.CacheView[snowflakes.Snowflake, guilds.Member]:
+        if not self._is_cache_enabled_for(config.CacheComponents.MEMBERS):
+            return cache_utility.EmptyCacheView()
+
+        guild_record = self._guild_entries.get(snowflakes.Snowflake(guild))
+        if not guild_record or not guild_record.members:
+            return cache_utility.EmptyCacheView()
+
+        user_ids = guild_record.member_role_index.get(snowflakes.Snowflake(role))
+        if not user_ids:
+            return cache_utility.EmptyCacheView()
+
+        cached_members = {}
+        for user_id in user_ids:
+            member = guild_record.members[user_id]
+            if not member.object.has_been_deleted:
+                cached_members[user_id] = member
+
+        return cache_utility.CacheMappingView(cached_members, builder=self._build_member)  # type: ignore[type-var]
+
     def set_member(self, member: guilds.Member, /) -> None:
         if not self._is_cache_enabled_for(config.CacheComponents.MEMBERS):
             return None
 
         self._set_member(member, is_reference=False)
 
+    def set_members_bulk(self, members: typing.Iterable[guilds.Member], /) -> None:
+        if not self._is_cache_enabled_for(config.CacheComponents.MEMBERS):
+            return None
+
+        guild_id: typing.Optional[snowflakes.Snowflake] = None
+        guild_record: typing.Optional[cache_utility.GuildRecord] = None
+        for member in members:
+            # Members are usually grouped by guild, so we only look the record up when the guild changes.
+            if guild_record is None or member.guild_id != guild_id:
+                guild_id = member.guild_id
+                guild_record = self._get_or_create_guild_record(guild_id)
+
+            self._set_member_in_record(guild_record, member, is_reference=False)
+
     def _set_member(
         self, member: guilds.Member, /, *, is_reference: bool = True
-    ) -> cache_utility.RefCell[cache_utility.MemberData]:
+    ) -> cache_utility.BaseRefCell[cache_utility.MemberData]:
         guild_record = self._get_or_create_guild_record(member.guild_id)
+        return self._set_member_in_record(guild_record, member, is_reference=is_reference)
+
+    def set_member_payloads(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        member_payloads: typing.Iterable[data_binding.JSONObject],
+        /,
+        *,
+        presence_payloads: typing.Iterable[data_binding.JSONObject] = (),
+    ) -> None:
+        guild_id = snowflakes.Snowflake(guild)
+        entity_factory = self._app.entity_factory
+        if self._settings.lazy_members and self._is_cache_enabled_for(config.CacheComponents.MEMBERS):
+            guild_record = self._get_or_create_guild_record(guild_id)
+            for payload in member_payloads:
+                self._set_member_payload_in_record(guild_record, guild_id, payload)
+
+        elif self._is_cache_enabled_for(config.CacheComponents.MEMBERS):
+            self.set_members_bulk(
+                entity_factory.deserialize_member(payload, guild_id=guild_id) for payload in member_payloads
+            )
+
+        if self._is_cache_enabled_for(config.CacheComponents.PRESENCES):
+            self.set_presences_bulk(
+                entity_factory.deserialize_member_presence(payload, guild_id=guild_id) for payload in presence_payloads
+            )
+
+    def _get_or_create_members(
+        self, guild_record: cache_utility.GuildRecord, guild_id: snowflakes.Snowflake, /
+    ) -> collections.ExtendedMutableMapping[snowflakes.Snowflake, cache_utility.BaseRefCell[cache_utility.MemberData]]:
+        if guild_record.members is None:  # TODO: test when this is not None
+            if self._settings.columnar_members:
+                guild_record.members = cache_utility.ColumnarMemberStore(guild_id, self._user_entries)
+            else:
+                guild_record.members = self._create_guild_entries(
+                    config.CacheComponents.MEMBERS, self._settings.max_members_per_guild, self._settings.member_expiry
+                )
+
+        return guild_record.members
+
+    def _insert_member(
+        self,
+        guild_record: cache_utility.GuildRecord,
+        member_id: snowflakes.Snowflake,
+        cell: cache_utility.BaseRefCell[cache_utility.MemberData],
+        role_ids: typing.Iterable[snowflakes.Snowflake],
+        user: cache_utility.RefCell[users.User],
+        /,
+    ) -> cache_utility.BaseRefCell[cache_utility.MemberData]:
+        assert guild_record.members is not None
+        for role_id in role_ids:
+            self._add_to_index(guild_record.member_role_index, role_id, member_id)
+
+        self._increment_ref_count(user)
+        guild_record.members[member_id] = cell
+        # The columnar store keeps its own cell type, so we have to get the stored cell back.
+        return guild_record.members[member_id]
+
+    def _update_member_roles(
+        self,
+        guild_record: cache_utility.GuildRecord,
+        guild_id: snowflakes.Snowflake,
+        member_id: snowflakes.Snowflake,
+        old_role_ids: typing.Sequence[snowflakes.Snowflake],
+        role_ids: typing.Sequence[snowflakes.Snowflake],
+        /,
+    ) -> None:
+        if old_role_ids == role_ids:
+            return
+
+        for role_id in old_role_ids:
+            self._remove_from_index(guild_record.member_role_index, role_id, member_id)
+
+        for role_id in role_ids:
+            self._add_to_index(guild_record.member_role_index, role_id, member_id)
+
+        # Only a change to the member's roles can change their memoized permissions.
+        self._invalidate_permissions(guild_id, user_id=member_id)
+
+    def _mark_member_active(
+        self,
+        members: collections.ExtendedMutableMapping[
+            snowflakes.Snowflake, cache_utility.BaseRefCell[cache_utility.MemberData]
+        ],
+        member_id: snowflakes.Snowflake,
+        cell: cache_utility.BaseRefCell[cache_utility.MemberData],
+        /,
+    ) -> None:
+        if self._settings.max_members_per_guild is not None or self._settings.member_expiry is not None:
+            # Re-inserting the member marks it as the most recently active, so it will be the last to be evicted.
+            del members[member_id]
+            members[member_id] = cell
+
+    def _set_member_in_record(
+        self, guild_record: cache_utility.GuildRecord, member: guilds.Member, /, *, is_reference: bool = True
+    ) -> cache_utility.BaseRefCell[cache_utility.MemberData]:
         user = self._set_user(member.user)
         member_data = cache_utility.MemberData.build_from_entity(member, user=user)
+        members = self._get_or_create_members(guild_record, member.guild_id)
+        member_id = member.user.id
+        cell = members.get(member_id)
+        if cell is None:
+            cell = self._take_evicted_member(guild_record, member_id)
+            if cell is None:
+                member_data.has_been_deleted = is_reference
+                return self._insert_member(
+                    guild_record, member_id, cache_utility.RefCell(member_data), member_data.role_ids, user
+                )
+
+            member_data.has_been_deleted = is_reference and cell.object.has_been_deleted
+            cell.object = member_data
+            return self._insert_member(guild_record, member_id, cell, member_data.role_ids, user)
+
+        old_member_data = cell.object
+        self._update_member_roles(
+            guild_record, member.guild_id, member_id, old_member_data.role_ids, member_data.role_ids
+        )
+        member_data.has_been_deleted = is_reference and old_member_data.has_been_deleted
+        cell.object = member_data
+        self._mark_member_active(members, member_id, cell)
+        return cell
 
-        if guild_record.members is None:  # TODO: test when this is not None
-            guild_record.members = collections.FreezableDict()
+    def _set_member_payload_in_record(
+        self, guild_record: cache_utility.GuildRecord, guild_id: snowflakes.Snowflake, payload: data_binding.JSONObject
+    ) -> None:
+        user = self._set_user_payload(payload["user"])
+        role_ids = tuple(snowflakes.Snowflake(role_id) for role_id in payload["roles"])
+        # This matches the entity factory, which includes the guild's @everyone role in each member's roles.
+        if guild_id not in role_ids:
+            role_ids += (guild_id,)
+
+        members = self._get_or_create_members(guild_record, guild_id)
+        member_id = user.object.id
+        cell = members.get(member_id)
+        if cell is None:
+            cell = self._take_evicted_member(guild_record, member_id)
+            if cell is None:
+                cell = cache_utility.LazyMemberCell(payload, user, guild_id, role_ids)
+            else:
+                self._set_member_cell_payload(cell, payload, user, guild_id, role_ids)
 
-        if member.user.id not in guild_record.members:
-            self._increment_ref_count(member_data.user)
+            self._insert_member(guild_record, member_id, cell, role_ids, user)
+            return
 
-        try:
-            member_data.has_been_deleted = False
-            if is_reference:
-                member_data.has_been_deleted = guild_record.members[member.id].object.has_been_deleted
+        self._update_member_roles(guild_record, guild_id, member_id, cell.object.role_ids, role_ids)
+        self._set_member_cell_payload(cell, payload, user, guild_id, role_ids)
+        self._mark_member_active(members, member_id, cell)
 
-            guild_record.members[member.id].object = member_data
+    @staticmethod
+    def _set_member_cell_payload(
+        cell: cache_utility.BaseRefCell[cache_utility.MemberData],
+        payload: data_binding.JSONObject,
+        user: cache_utility.RefCell[users.User],
+        guild_id: snowflakes.Snowflake,
+        role_ids: typing.Tuple[snowflakes.Snowflake, ...],
+        /,
+    ) -> None:
+        if isinstance(cell, cache_utility.LazyMemberCell):
+            cell.set_payload(payload, user, guild_id, role_ids)
+        else:
+            cell.object = cache_utility.LazyMemberCell(payload, user, guild_id, role_ids).object
 
-        except KeyError:
-            member_data.has_been_deleted = is_reference
-            guild_record.members[member.id] = cache_utility.RefCell(member_data)
+    def _evict_member(self, member: cache_utility.BaseRefCell[cache_utility.MemberData], /) -> None:
+        # Anything still referencing the evicted member keeps its cell, but the member's reference to its user is
+        # released here as it will no longer be found in the guild's members when those references are released.
+        member_data = member.object
+        user_id = member_data.user.object.id
+        guild_record = self._guild_entries.get(member_data.guild_id)
+        if guild_record:
+            for role_id in member_data.role_ids:
+                self._remove_from_index(guild_record.member_role_index, role_id, user_id)
 
-        return guild_record.members[member.id]
+            # The cell is kept so that it's reused if the member is cached again, keeping its reference count.
+            if member.ref_count > 0:
+                if guild_record.evicted_members is None:
+                    guild_record.evicted_members = {}
+
+                guild_record.evicted_members[user_id] = member
+
+        self._garbage_collect_user(member_data.user, decrement=1)
+        self._invalidate_permissions(member_data.guild_id, user_id=user_id)
+
+    @staticmethod
+    def _take_evicted_member(
+        guild_record: cache_utility.GuildRecord, user_id: snowflakes.Snowflake, /
+    ) -> typing.Optional[cache_utility.BaseRefCell[cache_utility.MemberData]]:
+        if not guild_record.evicted_members:
+            return None
+
+        member = guild_record.evicted_members.pop(user_id, None)
+        if not guild_record.evicted_members:
+            guild_record.evicted_members = None
+
+        return member
+
+    def _release_evicted_member(
+        self,
+        guild_record: cache_utility.GuildRecord,
+        user_id: snowflakes.Snowflake,
+        member: cache_utility.BaseRefCell[cache_utility.MemberData],
+        /,
+    ) -> None:
+        if member.ref_count > 0 or not guild_record.evicted_members:
+            return
+
+        if guild_record.evicted_members.get(user_id) is member:
+            self._take_evicted_member(guild_record, user_id)
+            self._remove_guild_record_if_empty(member.object.guild_id, guild_record)
 
     def update_member(
         self, member: guilds.Member, /
@@ -985,10 +2114,61 @@ class CacheImpl(cache.MutableCache):
         self,
         presence_data: cache_utility.MemberPresenceData,
     ) -> None:
-        for activity_data in presence_data.activities:
+        if not presence_data.activities:
+            return
+
+        key = tuple(map(_activity_key, presence_data.activities))
+        activities = self._activity_entries[key]
+        self._increment_ref_count(activities, -1)
+        if activities.ref_count > 0:
+            return
+
+        del self._activity_entries[key]
+        for activity_data in activities.object:
             if isinstance(activity_data.emoji, cache_utility.RefCell):
                 self._garbage_collect_unknown_custom_emoji(activity_data.emoji, decrement=1)
 
+    def _intern_activities(
+        self, activities: typing.Sequence[presences.RichActivity], /
+    ) -> typing.Tuple[cache_utility.RichActivityData, ...]:
+        if not activities:
+            return ()
+
+        key = tuple(map(_activity_key, activities))
+        cell = self._activity_entries.get(key)
+        if cell is None:
+            # The same activities are usually sent for a user in every guild they share with us, so they're only built
+            # and reference their custom emojis the first time they're seen.
+            cell = cache_utility.RefCell(tuple(map(self._build_activity_data, activities)))
+            self._activity_entries[key] = cell
+
+        self._increment_ref_count(cell)
+        return cell.object
+
+    def _build_activity_data(self, activity: presences.RichActivity, /) -> cache_utility.RichActivityData:
+        emoji = activity.emoji
+        if not isinstance(emoji, emojis.CustomEmoji):
+            return cache_utility.RichActivityData.build_from_entity(activity)
+
+        if emoji.id in self._unknown_custom_emoji_entries:
+            self._unknown_custom_emoji_entries[emoji.id].object = copy.copy(emoji)
+            emoji_data = self._unknown_custom_emoji_entries[emoji.id]
+
+        else:
+            emoji_data = cache_utility.RefCell(copy.copy(emoji))
+            self._unknown_custom_emoji_entries[emoji.id] = emoji_data
+
+        self._increment_ref_count(emoji_data)
+        return cache_utility.RichActivityData.build_from_entity(activity, emoji=emoji_data)
+
+    def _intern_client_status(self, client_status: presences.ClientStatus, /) -> presences.ClientStatus:
+        key = (client_status.desktop, client_status.mobile, client_status.web)
+        interned = self._client_status_entries.get(key)
+        if interned is None:
+            interned = self._client_status_entries[key] = copy.copy(client_status)
+
+        return interned
+
     def clear_presences(
         self,
     ) -> cache.CacheView[snowflakes.Snowflake, cache.CacheView[snowflakes.Snowflake, presences.MemberPresence]]:
@@ -1072,7 +2252,7 @@ class CacheImpl(cache.MutableCache):
             return cache_utility.EmptyCacheView()
 
         views = {
-            guild_id: cache_utility.CacheMappingView(guild_record.presences.freeze(), builder=self._build_presence)
+            guild_id: cache_utility.CacheMappingView(guild_record.presences.view(), builder=self._build_presence)
             for guild_id, guild_record in self._guild_entries.items()
             if guild_record.presences
         }
@@ -1088,34 +2268,49 @@ class CacheImpl(cache.MutableCache):
         if not guild_record or not guild_record.presences:
             return cache_utility.EmptyCacheView()
 
-        return cache_utility.CacheMappingView(guild_record.presences.freeze(), builder=self._build_presence)
+        return cache_utility.CacheMappingView(guild_record.presences.view(), builder=self._build_presence)
 
     def set_presence(self, presence: presences.MemberPresence, /) -> None:
         if not self._is_cache_enabled_for(config.CacheComponents.PRESENCES):
             return None
 
-        presence_data = cache_utility.MemberPresenceData.build_from_entity(presence)
-        for activity, activity_data in zip(presence.activities, presence_data.activities):
-            emoji = activity.emoji
-            if not isinstance(emoji, emojis.CustomEmoji):
-                continue
+        guild_record = self._get_or_create_guild_record(presence.guild_id)
+        self._set_presence_in_record(guild_record, presence)
+
+    def set_presences_bulk(self, presences: typing.Iterable[presences.MemberPresence], /) -> None:
+        if not self._is_cache_enabled_for(config.CacheComponents.PRESENCES):
+            return None
 
-            if emoji.id in self._unknown_custom_emoji_entries:
-                self._unknown_custom_emoji_entries[emoji.id].object = copy.copy(emoji)
-                emoji_data = self._unknown_custom_emoji_entries[emoji.id]
+        guild_id: typing.Optional[snowflakes.Snowflake] = None
+        guild_record: typing.Optional[cache_utility.GuildRecord] = None
+        for presence in presences:
+            # Presences are usually grouped by guild, so we only look the record up when the guild changes.
+            if guild_record is None or presence.guild_id != guild_id:
+                guild_id = presence.guild_id
+                guild_record = self._get_or_create_guild_record(guild_id)
 
-            else:
-                emoji_data = cache_utility.RefCell(copy.copy(emoji))
-                self._unknown_custom_emoji_entries[emoji.id] = emoji_data
+            self._set_presence_in_record(guild_record, presence)
 
-            self._increment_ref_count(emoji_data)
-            activity_data.emoji = emoji_data
+    def _set_presence_in_record(
+        self, guild_record: cache_utility.GuildRecord, presence: presences.MemberPresence, /
+    ) -> None:
+        presence_data = cache_utility.MemberPresenceData.build_from_entity(
+            presence,
+            activities=self._intern_activities(presence.activities),
+            client_status=self._intern_client_status(presence.client_status),
+        )
 
-        guild_record = self._get_or_create_guild_record(presence.guild_id)
         if guild_record.presences is None:
-            guild_record.presences = collections.FreezableDict()
+            guild_record.presences = self._create_guild_entries(
+                config.CacheComponents.PRESENCES, self._settings.max_presences_per_guild, self._settings.presence_expiry
+            )
 
+        # Popping the old presence first moves the user to the end of the mapping, marking them as the most recently
+        # active for eviction.
+        old_presence_data = guild_record.presences.pop(presence.user_id, None)
         guild_record.presences[presence.user_id] = presence_data
+        if old_presence_data is not None:
+            self._remove_presence_assets(old_presence_data)
 
     def update_presence(
         self, presence: presences.MemberPresence, /
@@ -1133,6 +2328,7 @@ class CacheImpl(cache.MutableCache):
 
         roles = self._role_entries
         self._role_entries = collections.FreezableDict()
+        self._permission_entries.clear()
 
         for guild_id, guild_record in self._guild_entries.freeze().items():
             if guild_record.roles:  # TODO: test coverage for when not this
@@ -1155,6 +2351,7 @@ class CacheImpl(cache.MutableCache):
         view = cache_utility.CacheMappingView(
             {role_id: self._role_entries.pop(role_id) for role_id in guild_record.roles}
         )
+        self._invalidate_permissions(guild_id)
         guild_record.roles = None
         self._remove_guild_record_if_empty(guild_id, guild_record)
         return view
@@ -1168,6 +2365,7 @@ class CacheImpl(cache.MutableCache):
         if not role:
             return None
 
+        self._invalidate_permissions(role.guild_id)
         guild_record = self._guild_entries.get(role.guild_id)
         if guild_record and guild_record.roles:
             guild_record.roles.remove(role_id)
@@ -1189,7 +2387,7 @@ class CacheImpl(cache.MutableCache):
         if not self._is_cache_enabled_for(config.CacheComponents.ROLES):
             return cache_utility.EmptyCacheView()
 
-        return cache_utility.CacheMappingView(self._role_entries.freeze())
+        return cache_utility.CacheMappingView(self._role_entries.view())
 
     def get_roles_view_for_guild(
         self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
@@ -1208,6 +2406,7 @@ class CacheImpl(cache.MutableCache):
             return None
 
         self._role_entries[role.id] = role
+        self._invalidate_permissions(role.guild_id)
         guild_record = self._get_or_create_guild_record(role.guild_id)
 
         if guild_record.roles is None:  # TODO: test when this is not None
@@ -1247,20 +2446,34 @@ class CacheImpl(cache.MutableCache):
         if not self._user_entries:
             return cache_utility.EmptyCacheView()
 
-        cached_users = self._user_entries.freeze()
+        cached_users = self._user_entries.view()
         unwrapper = typing.cast(
             "typing.Callable[[cache_utility.RefCell[users.User]], users.User]", cache_utility.unwrap_ref_cell
         )
         return cache_utility.CacheMappingView(cached_users, builder=unwrapper)  # type: ignore[type-var]
 
+    def _set_user_payload(self, payload: data_binding.JSONObject, /) -> cache_utility.RefCell[users.User]:
+        # The user is built here and owned by the cache, so unlike with _set_user it doesn't have to be copied.
+        user = self._app.entity_factory.deserialize_user(payload)
+        cell = self._user_entries.get(user.id)
+        if cell is None:
+            cell = cache_utility.RefCell(user)
+            self._user_entries[user.id] = cell
+
+        else:
+            cell.object = user
+
+        return cell
+
     def _set_user(self, user: users.User, /) -> cache_utility.RefCell[users.User]:
-        try:
-            self._user_entries[user.id].object = copy.copy(user)
-            cell = self._user_entries[user.id]
-        except KeyError:
+        cell = self._user_entries.get(user.id)
+        if cell is None:
             cell = cache_utility.RefCell(copy.copy(user))
             self._user_entries[user.id] = cell
 
+        else:
+            cell.object = copy.copy(user)
+
         return cell
 
     def _build_voice_state(
@@ -1295,12 +2508,13 @@ class CacheImpl(cache.MutableCache):
         if not guild_record or not guild_record.voice_states:
             return cache_utility.EmptyCacheView()
 
+        user_ids = guild_record.voice_state_channel_index.pop(channel_id, ())
         cached_voice_states = {}
 
-        for user_id, voice_state in guild_record.voice_states.items():
-            if voice_state.channel_id == channel_id:
-                cached_voice_states[user_id] = voice_state
-                self._garbage_collect_member(guild_record, voice_state.member, decrement=1)
+        for user_id in user_ids:
+            voice_state = guild_record.voice_states.pop(user_id)
+            cached_voice_states[user_id] = voice_state
+            self._garbage_collect_member(guild_record, voice_state.member, decrement=1)
 
         if not guild_record.voice_states:
             guild_record.voice_states = None
@@ -1322,6 +2536,7 @@ class CacheImpl(cache.MutableCache):
 
         cached_voice_states = guild_record.voice_states
         guild_record.voice_states = None
+        guild_record.voice_state_channel_index.clear()
 
         for voice_state in cached_voice_states.values():
             self._garbage_collect_member(guild_record, voice_state.member, decrement=1)
@@ -1348,6 +2563,9 @@ class CacheImpl(cache.MutableCache):
         if not voice_state_data:
             return None
 
+        if voice_state_data.channel_id is not None:
+            self._remove_from_index(guild_record.voice_state_channel_index, voice_state_data.channel_id, user_id)
+
         if not guild_record.voice_states:
             guild_record.voice_states = None
 
@@ -1377,9 +2595,7 @@ class CacheImpl(cache.MutableCache):
             return cache_utility.EmptyCacheView()
 
         views = {
-            guild_id: cache_utility.CacheMappingView(
-                guild_record.voice_states.freeze(), builder=self._build_voice_state
-            )
+            guild_id: cache_utility.CacheMappingView(guild_record.voice_states.view(), builder=self._build_voice_state)
             for guild_id, guild_record in self._guild_entries.items()
             if guild_record.voice_states
         }
@@ -1400,12 +2616,11 @@ class CacheImpl(cache.MutableCache):
         if not guild_record or not guild_record.voice_states:
             return cache_utility.EmptyCacheView()
 
-        cached_voice_states = {
-            user_id: voice_state
-            for user_id, voice_state in guild_record.voice_states.items()
-            if voice_state.channel_id == channel_id
-        }
+        user_ids = guild_record.voice_state_channel_index.get(channel_id)
+        if not user_ids:
+            return cache_utility.EmptyCacheView()
 
+        cached_voice_states = {user_id: guild_record.voice_states[user_id] for user_id in user_ids}
         return cache_utility.CacheMappingView(cached_voice_states, builder=self._build_voice_state)
 
     def get_voice_states_view_for_guild(
@@ -1418,23 +2633,36 @@ class CacheImpl(cache.MutableCache):
         if not guild_record or not guild_record.voice_states:
             return cache_utility.EmptyCacheView()
 
-        return cache_utility.CacheMappingView(guild_record.voice_states.freeze(), builder=self._build_voice_state)
+        return cache_utility.CacheMappingView(guild_record.voice_states.view(), builder=self._build_voice_state)
 
     def set_voice_state(self, voice_state: voices.VoiceState, /) -> None:
         if not self._is_cache_enabled_for(config.CacheComponents.VOICE_STATES):
             return None
 
         guild_record = self._get_or_create_guild_record(voice_state.guild_id)
+        self._set_voice_state_in_record(guild_record, voice_state)
 
+    def _set_voice_state_in_record(
+        self, guild_record: cache_utility.GuildRecord, voice_state: voices.VoiceState, /
+    ) -> None:
         if guild_record.voice_states is None:  # TODO: test when this is not None
             guild_record.voice_states = collections.FreezableDict()
 
         member = self._set_member(voice_state.member)
         voice_state_data = cache_utility.VoiceStateData.build_from_entity(voice_state, member=member)
+        old_voice_state_data = guild_record.voice_states.get(voice_state.user_id)
 
-        if voice_state.user_id not in guild_record.voice_states:
+        if old_voice_state_data is None:
             self._increment_ref_count(member)
 
+        elif old_voice_state_data.channel_id is not None:
+            self._remove_from_index(
+                guild_record.voice_state_channel_index, old_voice_state_data.channel_id, voice_state.user_id
+            )
+
+        if voice_state.channel_id is not None:
+            self._add_to_index(guild_record.voice_state_channel_index, voice_state.channel_id, voice_state.user_id)
+
         guild_record.voice_states[voice_state.user_id] = voice_state_data
 
     def update_voice_state(
@@ -1538,8 +2766,12 @@ class CacheImpl(cache.MutableCache):
         if not self._is_cache_enabled_for(config.CacheComponents.MESSAGES):
             return cache_utility.EmptyCacheView()
 
-        cached_messages = self._message_entries.freeze()
-        cached_messages.update(self._referenced_messages)
+        cached_messages: typing.Mapping[
+            snowflakes.Snowflake, cache_utility.RefCell[cache_utility.MessageData]
+        ] = self._message_entries.view()
+        if self._referenced_messages:
+            cached_messages = {**cached_messages, **self._referenced_messages}
+
         return cache_utility.CacheMappingView(cached_messages, builder=self._build_message)  # type: ignore[type-var]
 
     def _set_message(
@@ -0,0 +1,550 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Multi-process clustering for `hikari.impl.bot.GatewayBot`.
+
+A `GatewayCluster` splits the shards of a bot across several worker
+processes, each of which runs its own `hikari.impl.bot.GatewayBot` with its
+own event manager and cache. This allows a large bot to make use of more than
+one CPU core for decompressing and deserializing gateway events.
+"""
+
+from __future__ import annotations
+
+__all__: typing.List[str] = ["GatewayCluster", "ClusterWorker", "ClusterWorkerState"]
+
+import asyncio
+import logging
+import math
+import multiprocessing
+import os
+import signal
+import typing
+
+import attr
+
+from hikari import config
+from hikari import errors
+from hikari import presences
+from hikari.impl import rest as rest_impl
+from hikari.internal import aio
+from hikari.internal import enums
+from hikari.internal import ux
+
+if typing.TYPE_CHECKING:
+    import datetime
+    from multiprocessing import connection as connection_
+    from multiprocessing import context as context_
+
+    from hikari.impl import bot as bot_impl
+
+    BotFactoryT = typing.Callable[[], bot_impl.GatewayBot]
+
+_LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.cluster")
+
+# How often workers report the heartbeat latencies of their shards, in seconds.
+_LATENCY_INTERVAL: typing.Final[float] = 5.0
+# How long to wait after a worker has started before starting the next one which
+# identifies in the same rate limit buckets, in seconds. This matches the identify
+# window used by GatewayBot when starting shards.
+_WINDOW: typing.Final[float] = 5.0
+
+# Messages sent over the pipe between the parent and the workers.
+_CLOSE: typing.Final[str] = "close"
+_LATENCIES: typing.Final[str] = "latencies"
+_STATE: typing.Final[str] = "state"
+
+
+@typing.final
+class ClusterWorkerState(int, enums.Enum):
+    """The lifecycle state of a cluster worker."""
+
+    STARTING = 0
+    """The worker process is running, but its shards have not all started yet."""
+
+    STARTED = 1
+    """All the shards of the worker have started."""
+
+    STOPPED = 2
+    """The worker has shut down, or its process has died."""
+
+
+@attr.define(kw_only=True, weakref_slot=False)
+class ClusterWorker:
+    """Information about a worker process in a `GatewayCluster`."""
+
+    id: int = attr.field()
+    """The ID of the worker, starting at 0."""
+
+    shard_ids: typing.FrozenSet[int] = attr.field()
+    """The IDs of the shards the worker runs."""
+
+    state: ClusterWorkerState = attr.field(default=ClusterWorkerState.STARTING)
+    """The current lifecycle state of the worker."""
+
+    heartbeat_latencies: typing.Mapping[int, float] = attr.field(factory=dict)
+    """Mapping of shard ID to heartbeat latency, as last reported by the worker."""
+
+
+def _split_contiguous(shard_ids: typing.Sequence[int], count: int) -> typing.List[typing.FrozenSet[int]]:
+    count = min(count, len(shard_ids))
+    size, remainder = divmod(len(shard_ids), count)
+    chunks = []
+    start = 0
+    for i in range(count):
+        end = start + size + (i < remainder)
+        chunks.append(frozenset(shard_ids[start:end]))
+        start = end
+
+    return chunks
+
+
+def _split_shard_ids(
+    shard_ids: typing.AbstractSet[int], worker_count: int, max_concurrency: int
+) -> typing.List[typing.List[typing.FrozenSet[int]]]:
+    # Shards only share an identify rate limit with the shards in the same bucket (shard_id % max_concurrency).
+    # The buckets are spread over lanes which can all be started at the same time, while the workers within a
+    # lane share buckets and have to be started one after another. The shards of a lane are split into
+    # contiguous ranges, so they identify in the same order as a single GatewayBot would.
+    ordered = sorted(shard_ids)
+    lane_count = min(worker_count, max_concurrency, len(ordered))
+    buckets: typing.List[typing.List[int]] = [[] for _ in range(lane_count)]
+    for shard_id in ordered:
+        bucket = shard_id % max_concurrency  # noqa: S001 - Modulo, not string formatting
+        buckets[bucket % lane_count].append(shard_id)  # noqa: S001 - Modulo, not string formatting
+
+    lanes = [lane for lane in buckets if lane]
+    size, remainder = divmod(worker_count, len(lanes))
+    return [_split_contiguous(lane, size + (i < remainder)) for i, lane in enumerate(lanes)]
+
+
+def _run_worker(
+    factory: BotFactoryT,
+    shard_ids: typing.FrozenSet[int],
+    shard_count: int,
+    start_kwargs: typing.Dict[str, typing.Any],
+    connection: connection_.Connection,
+) -> None:
+    # The parent is responsible for shutting the workers down, so a terminal interrupt
+    # should not kill them before the parent has had the chance to close them.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    asyncio.run(_work(factory, shard_ids, shard_count, start_kwargs, connection))
+
+
+async def _work(
+    factory: BotFactoryT,
+    shard_ids: typing.FrozenSet[int],
+    shard_count: int,
+    start_kwargs: typing.Dict[str, typing.Any],
+    connection: connection_.Connection,
+) -> None:
+    loop = asyncio.get_running_loop()
+    bot = factory()
+    # This blocks a thread until the parent asks us to close, or the parent dies.
+    close_requested = asyncio.ensure_future(loop.run_in_executor(None, connection.recv))
+    joiner: typing.Optional[asyncio.Future[None]] = None
+
+    try:
+        await bot.start(shard_ids=shard_ids, shard_count=shard_count, **start_kwargs)
+        connection.send((_STATE, ClusterWorkerState.STARTED))
+        joiner = asyncio.ensure_future(bot.join())
+
+        while not close_requested.done() and not joiner.done():
+            connection.send((_LATENCIES, dict(bot.heartbeat_latencies)))
+            await asyncio.wait(
+                (close_requested, joiner), timeout=_LATENCY_INTERVAL, return_when=asyncio.FIRST_COMPLETED
+            )
+
+    finally:
+        try:
+            if joiner is not None:
+                joiner.cancel()
+
+            if bot.is_alive:
+                await bot.close()
+            elif bot.rest.is_alive:
+                # The bot failed to start before it was alive, so it can't close the REST client itself.
+                await bot.rest.close()
+
+        finally:
+            connection.send((_STATE, ClusterWorkerState.STOPPED))
+
+
+class GatewayCluster:
+    """Runs the shards of a bot across several worker processes.
+
+    Each worker process calls `factory` to create its own
+    `hikari.impl.bot.GatewayBot`, so `factory` should also subscribe any
+    listeners the bot needs. Shards are grouped by their identify rate limit
+    bucket (`shard_id % max_concurrency`), so workers which do not share a
+    bucket start at the same time, while those that do are started one after
+    another.
+
+    Parameters
+    ----------
+    factory : typing.Callable[[], hikari.impl.bot.GatewayBot]
+        The function to create the bot in each worker. As this is sent to
+        the worker processes, it must be picklable, such as a function
+        defined at the top level of a module.
+    token : builtins.str
+        The bot token, used to look up the recommended shard count and the
+        session start limit.
+
+    Other Parameters
+    ----------------
+    workers : typing.Optional[builtins.int]
+        The number of worker processes to use. Defaults to the number of CPUs.
+        No more workers than there are shards will be started.
+    http_settings : typing.Optional[hikari.config.HTTPSettings]
+        Optional custom HTTP configuration settings for the lookups made by
+        the cluster itself.
+    proxy_settings : typing.Optional[hikari.config.ProxySettings]
+        Optional custom proxy settings for the lookups made by the cluster
+        itself.
+    start_method : builtins.str
+        The `multiprocessing` start method to create the workers with.
+        Defaults to `"spawn"`, which works on every platform.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_condition",
+        "_connections",
+        "_context",
+        "_factory",
+        "_http_settings",
+        "_listeners",
+        "_pollers",
+        "_processes",
+        "_proxy_settings",
+        "_token",
+        "_worker_count",
+        "_workers",
+    )
+
+    def __init__(
+        self,
+        factory: BotFactoryT,
+        token: str,
+        *,
+        workers: typing.Optional[int] = None,
+        http_settings: typing.Optional[config.HTTPSettings] = None,
+        proxy_settings: typing.Optional[config.ProxySettings] = None,
+        start_method: str = "spawn",
+    ) -> None:
+        self._condition: typing.Optional[asyncio.Condition] = None
+        self._connections: typing.Dict[int, connection_.Connection] = {}
+        self._context: context_.BaseContext = multiprocessing.get_context(start_method)
+        self._factory = factory
+        self._http_settings = http_settings if http_settings is not None else config.HTTPSettings()
+        self._listeners: typing.List[typing.Callable[[ClusterWorker], None]] = []
+        self._pollers: typing.List[asyncio.Task[None]] = []
+        self._processes: typing.List[multiprocessing.process.BaseProcess] = []
+        self._proxy_settings = proxy_settings if proxy_settings is not None else config.ProxySettings()
+        self._token = token
+        self._worker_count = workers if workers is not None else (os.cpu_count() or 1)
+        self._workers: typing.List[ClusterWorker] = []
+
+    @property
+    def heartbeat_latencies(self) -> typing.Mapping[int, float]:
+        """Return a mapping of shard ID to heartbeat latency across all workers.
+
+        This is updated every few seconds as the workers report it.
+        """
+        return {
+            shard_id: latency for worker in self._workers for shard_id, latency in worker.heartbeat_latencies.items()
+        }
+
+    @property
+    def heartbeat_latency(self) -> float:
+        """Return the average heartbeat latency of all started shards across all workers.
+
+        If no shards have a latency yet, this will be `float('nan')`.
+        """
+        latencies = [latency for latency in self.heartbeat_latencies.values() if not math.isnan(latency)]
+        return sum(latencies) / len(latencies) if latencies else float("nan")
+
+    @property
+    def is_alive(self) -> bool:
+        """Return whether any of the workers are still running."""
+        return any(worker.state is not ClusterWorkerState.STOPPED for worker in self._workers)
+
+    @property
+    def workers(self) -> typing.Sequence[ClusterWorker]:
+        """Return the workers of this cluster."""
+        return tuple(self._workers)
+
+    def add_state_listener(self, callback: typing.Callable[[ClusterWorker], None], /) -> None:
+        """Add a callback to call whenever a worker changes state.
+
+        Parameters
+        ----------
+        callback : typing.Callable[[ClusterWorker], builtins.None]
+            The callback, which is passed the worker after its state changed.
+        """
+        self._listeners.append(callback)
+
+    def remove_state_listener(self, callback: typing.Callable[[ClusterWorker], None], /) -> None:
+        """Remove a callback previously added with `add_state_listener`.
+
+        Parameters
+        ----------
+        callback : typing.Callable[[ClusterWorker], builtins.None]
+            The callback to remove.
+
+        Raises
+        ------
+        builtins.ValueError
+            If the callback was not added.
+        """
+        self._listeners.remove(callback)
+
+    async def start(
+        self,
+        *,
+        activity: typing.Optional[presences.Activity] = None,
+        afk: bool = False,
+        idle_since: typing.Optional[datetime.datetime] = None,
+        ignore_session_start_limit: bool = False,
+        large_threshold: int = 250,
+        shard_ids: typing.Optional[typing.AbstractSet[int]] = None,
+        shard_count: typing.Optional[int] = None,
+        status: presences.Status = presences.Status.ONLINE,
+    ) -> None:
+        """Start the worker processes and wait for all of their shards to start.
+
+        The parameters are the same as for `hikari.impl.bot.GatewayBot.start`,
+        and are passed on to the bot in each worker.
+
+        Raises
+        ------
+        hikari.errors.ComponentStateConflictError
+            If the cluster is already running.
+        hikari.errors.GatewayError
+            If a worker shut down before all of its shards started, or if more
+            sessions would be started than the session start limit allows.
+        builtins.TypeError
+            If `shard_ids` is passed without `shard_count`.
+        """
+        if self.is_alive:
+            raise errors.ComponentStateConflictError("cluster is already running")
+
+        if shard_ids is not None and shard_count is None:
+            raise TypeError("'shard_ids' must be passed with 'shard_count'")
+
+        async with rest_impl.RESTApp(http_settings=self._http_settings, proxy_settings=self._proxy_settings).acquire(
+            self._token, "Bot"
+        ) as rest:
+            requirements = await rest.fetch_gateway_bot_info()
+
+        if shard_count is None:
+            shard_count = requirements.shard_count
+
+        if shard_ids is None:
+            shard_ids = set(range(shard_count))
+
+        if requirements.session_start_limit.remaining < len(shard_ids) and not ignore_session_start_limit:
+            raise errors.GatewayError("Attempted to start more sessions than were allowed in the given time-window")
+
+        start_kwargs = {
+            "activity": activity,
+            "afk": afk,
+            "idle_since": idle_since,
+            "ignore_session_start_limit": ignore_session_start_limit,
+            "large_threshold": large_threshold,
+            "status": status,
+        }
+
+        self._condition = asyncio.Condition()
+        self._workers = []
+        lanes = []
+        max_concurrency = requirements.session_start_limit.max_concurrency
+        for lane_shard_ids in _split_shard_ids(shard_ids, self._worker_count, max_concurrency):
+            lane = [ClusterWorker(id=len(self._workers) + i, shard_ids=ids) for i, ids in enumerate(lane_shard_ids)]
+            self._workers.extend(lane)
+            lanes.append(lane)
+
+        _LOGGER.info(
+            "starting %s shards across %s workers in %s concurrent lane%s",
+            len(shard_ids),
+            len(self._workers),
+            len(lanes),
+            "s" if len(lanes) != 1 else "",
+        )
+        await asyncio.gather(*(self._start_lane(lane, shard_count, start_kwargs) for lane in lanes))
+
+        failed = [worker for worker in self._workers if worker.state is not ClusterWorkerState.STARTED]
+        if failed:
+            for worker in failed:
+                if worker.id not in self._connections:
+                    # Workers which were never spawned would otherwise never leave STARTING.
+                    worker.state = ClusterWorkerState.STOPPED
+
+            await self.close()
+            raise errors.GatewayError(f"cluster worker {failed[0].id} shut down before all of its shards started")
+
+    async def join(self) -> None:
+        """Wait for all the workers to stop."""
+        if self._condition is None:
+            return
+
+        async with self._condition:
+            await self._condition.wait_for(lambda: not self.is_alive)
+
+        await asyncio.gather(*self._pollers)
+
+        loop = asyncio.get_running_loop()
+        for process in self._processes:
+            await loop.run_in_executor(None, process.join)
+
+        self._connections.clear()
+        self._pollers.clear()
+        self._processes.clear()
+
+    async def close(self) -> None:
+        """Close all the workers and wait for them to stop."""
+        for worker in self._workers:
+            connection = self._connections.get(worker.id)
+            if connection is not None and worker.state is not ClusterWorkerState.STOPPED:
+                try:
+                    connection.send((_CLOSE, None))
+                except OSError:
+                    # The worker has already died
+                    pass
+
+        await self.join()
+
+    def run(
+        self,
+        *,
+        activity: typing.Optional[presences.Activity] = None,
+        afk: bool = False,
+        idle_since: typing.Optional[datetime.datetime] = None,
+        ignore_session_start_limit: bool = False,
+        large_threshold: int = 250,
+        shard_ids: typing.Optional[typing.AbstractSet[int]] = None,
+        shard_count: typing.Optional[int] = None,
+        status: presences.Status = presences.Status.ONLINE,
+    ) -> None:
+        """Start the cluster and block until all of the workers have stopped.
+
+        A keyboard interrupt will close all the workers. The parameters are
+        the same as for `GatewayCluster.start`.
+        """
+        loop = aio.get_or_make_loop()
+
+        try:
+            loop.run_until_complete(
+                self.start(
+                    activity=activity,
+                    afk=afk,
+                    idle_since=idle_since,
+                    ignore_session_start_limit=ignore_session_start_limit,
+                    large_threshold=large_threshold,
+                    shard_ids=shard_ids,
+                    shard_count=shard_count,
+                    status=status,
+                )
+            )
+            loop.run_until_complete(self.join())
+
+        except KeyboardInterrupt:
+            _LOGGER.info("received interrupt, closing all workers")
+            loop.run_until_complete(self.close())
+
+    async def _start_lane(
+        self, workers: typing.Sequence[ClusterWorker], shard_count: int, start_kwargs: typing.Dict[str, typing.Any]
+    ) -> None:
+        assert self._condition is not None
+
+        for i, worker in enumerate(workers):
+            if i != 0:
+                # The previous worker identified in the same buckets, so its last identify window has to pass first.
+                await asyncio.sleep(_WINDOW)
+
+            if any(self._workers[worker_id].state is ClusterWorkerState.STOPPED for worker_id in self._connections):
+                # A worker in another lane failed to start, so the cluster is about to be closed.
+                return
+
+            self._spawn(worker, shard_count, {**start_kwargs, "check_for_updates": worker.id == 0})
+
+            async with self._condition:
+                await self._condition.wait_for(lambda: worker.state is not ClusterWorkerState.STARTING)
+
+            if worker.state is ClusterWorkerState.STOPPED:
+                return
+
+            _LOGGER.info("worker %s started shards %s", worker.id, sorted(worker.shard_ids))
+
+    def _spawn(self, worker: ClusterWorker, shard_count: int, start_kwargs: typing.Dict[str, typing.Any]) -> None:
+        parent_connection, child_connection = self._context.Pipe()
+        process = self._context.Process(
+            target=_run_worker,
+            args=(self._factory, worker.shard_ids, shard_count, start_kwargs, child_connection),
+            name=f"hikari cluster worker {worker.id}",
+        )
+        process.start()
+        # Our copy of the child's end has to be closed, otherwise we will never see EOF if the worker dies.
+        child_connection.close()
+
+        self._connections[worker.id] = parent_connection
+        self._processes.append(process)
+        self._pollers.append(
+            asyncio.create_task(self._poll(worker, parent_connection), name=f"poll cluster worker {worker.id}")
+        )
+
+    async def _poll(self, worker: ClusterWorker, connection: connection_.Connection) -> None:
+        loop = asyncio.get_running_loop()
+
+        while worker.state is not ClusterWorkerState.STOPPED:
+            try:
+                kind, value = await loop.run_in_executor(None, connection.recv)
+            except (EOFError, OSError):
+                _LOGGER.log(ux.TRACE, "lost connection to cluster worker %s", worker.id)
+                await self._set_state(worker, ClusterWorkerState.STOPPED)
+                break
+
+            if kind == _LATENCIES:
+                worker.heartbeat_latencies = value
+            elif kind == _STATE:
+                # Enum members do not keep their identity when pickled.
+                await self._set_state(worker, ClusterWorkerState(value))
+
+        # The worker is done with the pipe, and closing our end lets it shut down.
+        connection.close()
+
+    async def _set_state(self, worker: ClusterWorker, state: ClusterWorkerState) -> None:
+        if worker.state is state:
+            return
+
+        worker.state = state
+        if state is ClusterWorkerState.STOPPED:
+            worker.heartbeat_latencies = {}
+
+        for listener in tuple(self._listeners):
+            try:
+                listener(worker)
+            except Exception as ex:
+                _LOGGER.error("cluster state listener raised an exception", exc_info=ex)
+
+        assert self._condition is not None
+        async with self._condition:
+            self._condition.notify_all()
@@ -32,11 +32,23 @@ import random
 import typing
 
 from hikari import channels
+from hikari import config
 from hikari import errors
 from hikari import intents as intents_
 from hikari import presences
 from hikari import snowflakes
+from hikari.events import channel_events
+from hikari.events import guild_events
+from hikari.events import interaction_events
+from hikari.events import member_events
+from hikari.events import message_events
+from hikari.events import reaction_events
+from hikari.events import role_events
+from hikari.events import shard_events
+from hikari.events import typing_events
+from hikari.events import voice_events
 from hikari.impl import event_manager_base
+from hikari.internal import routes
 from hikari.internal import time
 
 if typing.TYPE_CHECKING:
@@ -45,11 +57,44 @@ if typing.TYPE_CHECKING:
     from hikari import voices
     from hikari.api import cache as cache_
     from hikari.api import event_factory as event_factory_
+    from hikari.api import response_cache as response_cache_
     from hikari.api import shard as gateway_shard
-    from hikari.events import guild_events as guild_events
     from hikari.internal import data_binding
 
 
+_GUILD_RESPONSE_ROUTES: typing.Final[typing.Sequence[typing.Tuple[routes.Route, str, str]]] = (
+    (routes.GET_GUILD, "guild", "id"),
+    (routes.GET_GUILD_CHANNELS, "guild", "id"),
+    (routes.GET_GUILD_EMOJIS, "guild", "id"),
+    (routes.GET_GUILD_ROLES, "guild", "id"),
+)
+_CHANNEL_RESPONSE_ROUTES: typing.Final[typing.Sequence[typing.Tuple[routes.Route, str, str]]] = (
+    (routes.GET_CHANNEL, "channel", "id"),
+    (routes.GET_GUILD_CHANNELS, "guild", "guild_id"),
+)
+_ROLE_RESPONSE_ROUTES: typing.Final[typing.Sequence[typing.Tuple[routes.Route, str, str]]] = (
+    (routes.GET_GUILD, "guild", "guild_id"),
+    (routes.GET_GUILD_ROLES, "guild", "guild_id"),
+)
+_RESPONSE_INVALIDATIONS: typing.Final[typing.Mapping[str, typing.Sequence[typing.Tuple[routes.Route, str, str]]]] = {
+    # Each raw event maps to the routes whose cached responses it makes stale, along with the
+    # route parameter to compile them with and the payload field which holds its value.
+    "GUILD_CREATE": _GUILD_RESPONSE_ROUTES,
+    "GUILD_UPDATE": ((routes.GET_GUILD, "guild", "id"),),
+    "GUILD_DELETE": _GUILD_RESPONSE_ROUTES,
+    "GUILD_EMOJIS_UPDATE": (
+        (routes.GET_GUILD, "guild", "guild_id"),
+        (routes.GET_GUILD_EMOJIS, "guild", "guild_id"),
+    ),
+    "GUILD_ROLE_CREATE": _ROLE_RESPONSE_ROUTES,
+    "GUILD_ROLE_UPDATE": _ROLE_RESPONSE_ROUTES,
+    "GUILD_ROLE_DELETE": _ROLE_RESPONSE_ROUTES,
+    "CHANNEL_CREATE": _CHANNEL_RESPONSE_ROUTES,
+    "CHANNEL_UPDATE": _CHANNEL_RESPONSE_ROUTES,
+    "CHANNEL_DELETE": _CHANNEL_RESPONSE_ROUTES,
+}
+
+
 def _fixed_size_nonce() -> str:
     # This generates nonces of length 28 for use in member chunking.
     head = time.monotonic_ns().to_bytes(8, "big")
@@ -75,7 +120,7 @@ async def _request_guild_members(
 class EventManagerImpl(event_manager_base.EventManagerBase):
     """Provides event handling logic for Discord events."""
 
-    __slots__: typing.Sequence[str] = ("_cache",)
+    __slots__: typing.Sequence[str] = ("_cache", "_response_cache")
 
     def __init__(
         self,
@@ -84,9 +129,30 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
         /,
         *,
         cache: typing.Optional[cache_.MutableCache] = None,
+        cache_components: config.CacheComponents = config.CacheComponents.ALL,
+        dispatch_settings: typing.Optional[config.DispatchSettings] = None,
+        response_cache: typing.Optional[response_cache_.ResponseCache] = None,
     ) -> None:
         self._cache = cache
-        super().__init__(event_factory=event_factory, intents=intents)
+        self._response_cache = response_cache
+        super().__init__(
+            event_factory=event_factory,
+            intents=intents,
+            cache_components=cache_components if cache else config.CacheComponents.NONE,
+            dispatch_settings=dispatch_settings,
+        )
+
+    def consume_raw_event(
+        self, event_name: str, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject
+    ) -> typing.Optional[typing.Awaitable[None]]:
+        # This has to happen before the event is filtered, as the responses are stale whether or not
+        # anything is listening for the event.
+        if self._response_cache is not None and (invalidations := _RESPONSE_INVALIDATIONS.get(event_name)):
+            for route, parameter, field in invalidations:
+                if (value := payload.get(field)) is not None:
+                    self._response_cache.invalidate(route.compile(**{parameter: value}))
+
+        return super().consume_raw_event(event_name, shard, payload)
 
     async def on_ready(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#ready for more info."""
@@ -96,12 +162,21 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
         if self._cache:
             self._cache.update_me(event.my_user)
 
+            # A cache restored from a snapshot may still hold guilds which were left while the bot was offline, and
+            # those won't be sent again, so any cached guild this shard is no longer in has to be removed here.
+            guild_ids = set(event.unavailable_guilds)
+            for guild_id in tuple(self._cache.get_guilds_view()):
+                if guild_id not in guild_ids and snowflakes.calculate_shard_id(shard.shard_count, guild_id) == shard.id:
+                    self._remove_guild_from_cache(guild_id)
+
         await self.dispatch(event)
 
+    @event_manager_base.filtered((shard_events.ShardResumedEvent,))
     async def on_resumed(self, shard: gateway_shard.GatewayShard, _: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#resumed for more info."""
         await self.dispatch(self._event_factory.deserialize_resumed_event(shard))
 
+    @event_manager_base.filtered((channel_events.GuildChannelCreateEvent,), config.CacheComponents.GUILD_CHANNELS)
     async def on_channel_create(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#channel-create for more info."""
         event = self._event_factory.deserialize_channel_create_event(shard, payload)
@@ -114,6 +189,7 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
 
         await self.dispatch(event)
 
+    @event_manager_base.filtered((channel_events.GuildChannelUpdateEvent,), config.CacheComponents.GUILD_CHANNELS)
     async def on_channel_update(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#channel-update for more info."""
         old = self._cache.get_guild_channel(snowflakes.Snowflake(payload["id"])) if self._cache else None
@@ -127,6 +203,7 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
 
         await self.dispatch(event)
 
+    @event_manager_base.filtered((channel_events.GuildChannelDeleteEvent,), config.CacheComponents.GUILD_CHANNELS)
     async def on_channel_delete(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#channel-delete for more info."""
         event = self._event_factory.deserialize_channel_delete_event(shard, payload)
@@ -136,42 +213,37 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
 
         await self.dispatch(event)
 
+    @event_manager_base.filtered((channel_events.GuildPinsUpdateEvent, channel_events.DMPinsUpdateEvent))
     async def on_channel_pins_update(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#channel-pins-update for more info."""
         # TODO: we need a method for this specifically
         await self.dispatch(self._event_factory.deserialize_channel_pins_update_event(shard, payload))
 
+    @event_manager_base.filtered(
+        (guild_events.GuildAvailableEvent, shard_events.MemberChunkEvent),
+        config.CacheComponents.GUILDS
+        | config.CacheComponents.GUILD_CHANNELS
+        | config.CacheComponents.EMOJIS
+        | config.CacheComponents.ROLES
+        | config.CacheComponents.MEMBERS
+        | config.CacheComponents.PRESENCES
+        | config.CacheComponents.VOICE_STATES,
+    )
     async def on_guild_create(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#guild-create for more info."""
         event = self._event_factory.deserialize_guild_create_event(shard, payload)
 
         if self._cache:
-            self._cache.update_guild(event.guild)
-
-            self._cache.clear_guild_channels_for_guild(event.guild.id)
-            for channel in event.channels.values():
-                self._cache.set_guild_channel(channel)
-
-            self._cache.clear_emojis_for_guild(event.guild.id)
-            for emoji in event.emojis.values():
-                self._cache.set_emoji(emoji)
-
-            self._cache.clear_roles_for_guild(event.guild.id)
-            for role in event.roles.values():
-                self._cache.set_role(role)
-
-            # TODO: do we really want to invalidate these all after an outage.
-            self._cache.clear_members_for_guild(event.guild.id)
-            for member in event.members.values():
-                self._cache.set_member(member)
-
-            self._cache.clear_presences_for_guild(event.guild.id)
-            for presence in event.presences.values():
-                self._cache.set_presence(presence)
-
-            self._cache.clear_voice_states_for_guild(event.guild.id)
-            for voice_state in event.voice_states.values():
-                self._cache.set_voice_state(voice_state)
+            # TODO: do we really want to invalidate the members after an outage.
+            self._cache.replace_guild_contents(
+                event.guild,
+                channels=event.channels.values(),
+                emojis=event.emojis.values(),
+                roles=event.roles.values(),
+                members=event.members.values(),
+                presences=event.presences.values(),
+                voice_states=event.voice_states.values(),
+            )
 
             members_declared = self._intents & intents_.Intents.GUILD_MEMBERS
             presences_declared = self._intents & intents_.Intents.GUILD_PRESENCES
@@ -190,6 +262,10 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
 
         await self.dispatch(event)
 
+    @event_manager_base.filtered(
+        (guild_events.GuildUpdateEvent,),
+        config.CacheComponents.GUILDS | config.CacheComponents.EMOJIS | config.CacheComponents.ROLES,
+    )
     async def on_guild_update(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#guild-update for more info."""
         old = self._cache.get_guild(snowflakes.Snowflake(payload["id"])) if self._cache else None
@@ -208,6 +284,17 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
 
         await self.dispatch(event)
 
+    @event_manager_base.filtered(
+        (guild_events.GuildUnavailableEvent, guild_events.GuildLeaveEvent),
+        config.CacheComponents.GUILDS
+        | config.CacheComponents.GUILD_CHANNELS
+        | config.CacheComponents.EMOJIS
+        | config.CacheComponents.ROLES
+        | config.CacheComponents.MEMBERS
+        | config.CacheComponents.PRESENCES
+        | config.CacheComponents.VOICE_STATES
+        | config.CacheComponents.INVITES,
+    )
     async def on_guild_delete(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#guild-delete for more info."""
         event: typing.Union[guild_events.GuildUnavailableEvent, guild_events.GuildLeaveEvent]
@@ -221,26 +308,33 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
             event = self._event_factory.deserialize_guild_leave_event(shard, payload)
 
             if self._cache:
-                #  TODO: this doesn't work in all intent scenarios
-                self._cache.delete_guild(event.guild_id)
-                self._cache.clear_voice_states_for_guild(event.guild_id)
-                self._cache.clear_invites_for_guild(event.guild_id)
-                self._cache.clear_members_for_guild(event.guild_id)
-                self._cache.clear_presences_for_guild(event.guild_id)
-                self._cache.clear_guild_channels_for_guild(event.guild_id)
-                self._cache.clear_emojis_for_guild(event.guild_id)
-                self._cache.clear_roles_for_guild(event.guild_id)
+                self._remove_guild_from_cache(event.guild_id)
 
         await self.dispatch(event)
 
+    def _remove_guild_from_cache(self, guild_id: snowflakes.Snowflake, /) -> None:
+        assert self._cache is not None
+        #  TODO: this doesn't work in all intent scenarios
+        self._cache.delete_guild(guild_id)
+        self._cache.clear_voice_states_for_guild(guild_id)
+        self._cache.clear_invites_for_guild(guild_id)
+        self._cache.clear_members_for_guild(guild_id)
+        self._cache.clear_presences_for_guild(guild_id)
+        self._cache.clear_guild_channels_for_guild(guild_id)
+        self._cache.clear_emojis_for_guild(guild_id)
+        self._cache.clear_roles_for_guild(guild_id)
+
+    @event_manager_base.filtered((guild_events.BanCreateEvent,))
     async def on_guild_ban_add(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#guild-ban-add for more info."""
         await self.dispatch(self._event_factory.deserialize_guild_ban_add_event(shard, payload))
 
+    @event_manager_base.filtered((guild_events.BanDeleteEvent,))
     async def on_guild_ban_remove(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#guild-ban-remove for more info."""
         await self.dispatch(self._event_factory.deserialize_guild_ban_remove_event(shard, payload))
 
+    @event_manager_base.filtered((guild_events.EmojisUpdateEvent,), config.CacheComponents.EMOJIS)
     async def on_guild_emojis_update(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#guild-emojis-update for more info."""
         guild_id = snowflakes.Snowflake(payload["guild_id"])
@@ -254,24 +348,29 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
 
         await self.dispatch(event)
 
+    @event_manager_base.filtered(())
     async def on_guild_integrations_update(self, _: gateway_shard.GatewayShard, __: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#guild-integrations-update for more info."""
         # This is only here to stop this being logged or dispatched as an "unknown event".
         # This event is made redundant by INTEGRATION_CREATE/DELETE/UPDATE and is thus not parsed or dispatched.
         return None
 
+    @event_manager_base.filtered((guild_events.IntegrationCreateEvent,))
     async def on_integration_create(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         event = self._event_factory.deserialize_integration_create_event(shard, payload)
         await self.dispatch(event)
 
+    @event_manager_base.filtered((guild_events.IntegrationDeleteEvent,))
     async def on_integration_delete(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         event = self._event_factory.deserialize_integration_delete_event(shard, payload)
         await self.dispatch(event)
 
+    @event_manager_base.filtered((guild_events.IntegrationUpdateEvent,))
     async def on_integration_update(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         event = self._event_factory.deserialize_integration_update_event(shard, payload)
         await self.dispatch(event)
 
+    @event_manager_base.filtered((member_events.MemberCreateEvent,), config.CacheComponents.MEMBERS)
     async def on_guild_member_add(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#guild-member-add for more info."""
         event = self._event_factory.deserialize_guild_member_add_event(shard, payload)
@@ -281,6 +380,7 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
 
         await self.dispatch(event)
 
+    @event_manager_base.filtered((member_events.MemberDeleteEvent,), config.CacheComponents.MEMBERS)
     async def on_guild_member_remove(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#guild-member-remove for more info."""
         old: typing.Optional[guilds.Member] = None
@@ -292,6 +392,7 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
         event = self._event_factory.deserialize_guild_member_remove_event(shard, payload, old_member=old)
         await self.dispatch(event)
 
+    @event_manager_base.filtered((member_events.MemberUpdateEvent,), config.CacheComponents.MEMBERS)
     async def on_guild_member_update(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#guild-member-update for more info."""
         old: typing.Optional[guilds.Member] = None
@@ -307,19 +408,29 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
 
         await self.dispatch(event)
 
+    @event_manager_base.filtered(
+        (shard_events.MemberChunkEvent,), config.CacheComponents.MEMBERS | config.CacheComponents.PRESENCES
+    )
     async def on_guild_members_chunk(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#guild-members-chunk for more info."""
+        if self._cache and not self._consumers["guild_members_chunk"].is_dispatching:
+            # Nothing receives the chunk event, so the cache is left to decide how much of the payload to deserialize.
+            self._cache.set_member_payloads(
+                snowflakes.Snowflake(payload["guild_id"]),
+                payload["members"],
+                presence_payloads=payload.get("presences", ()),
+            )
+            return
+
         event = self._event_factory.deserialize_guild_member_chunk_event(shard, payload)
 
         if self._cache:
-            for member in event.members.values():
-                self._cache.set_member(member)
-
-            for presence in event.presences.values():
-                self._cache.set_presence(presence)
+            self._cache.set_members_bulk(event.members.values())
+            self._cache.set_presences_bulk(event.presences.values())
 
         await self.dispatch(event)
 
+    @event_manager_base.filtered((role_events.RoleCreateEvent,), config.CacheComponents.ROLES)
     async def on_guild_role_create(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#guild-role-create for more info."""
         event = self._event_factory.deserialize_guild_role_create_event(shard, payload)
@@ -329,6 +440,7 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
 
         await self.dispatch(event)
 
+    @event_manager_base.filtered((role_events.RoleUpdateEvent,), config.CacheComponents.ROLES)
     async def on_guild_role_update(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#guild-role-update for more info."""
         old = self._cache.get_role(snowflakes.Snowflake(payload["role"]["id"])) if self._cache else None
@@ -339,6 +451,7 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
 
         await self.dispatch(event)
 
+    @event_manager_base.filtered((role_events.RoleDeleteEvent,), config.CacheComponents.ROLES)
     async def on_guild_role_delete(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#guild-role-delete for more info."""
         old: typing.Optional[guilds.Role] = None
@@ -349,6 +462,7 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
 
         await self.dispatch(event)
 
+    @event_manager_base.filtered((channel_events.InviteCreateEvent,), config.CacheComponents.INVITES)
     async def on_invite_create(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#invite-create for more info."""
         event = self._event_factory.deserialize_invite_create_event(shard, payload)
@@ -358,6 +472,7 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
 
         await self.dispatch(event)
 
+    @event_manager_base.filtered((channel_events.InviteDeleteEvent,), config.CacheComponents.INVITES)
     async def on_invite_delete(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#invite-delete for more info."""
         old: typing.Optional[invites.InviteWithMetadata] = None
@@ -368,6 +483,9 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
 
         await self.dispatch(event)
 
+    @event_manager_base.filtered(
+        (message_events.GuildMessageCreateEvent, message_events.DMMessageCreateEvent), config.CacheComponents.MESSAGES
+    )
     async def on_message_create(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#message-create for more info."""
         event = self._event_factory.deserialize_message_create_event(shard, payload)
@@ -377,6 +495,9 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
 
         await self.dispatch(event)
 
+    @event_manager_base.filtered(
+        (message_events.GuildMessageUpdateEvent, message_events.DMMessageUpdateEvent), config.CacheComponents.MESSAGES
+    )
     async def on_message_update(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#message-update for more info."""
         old = self._cache.get_message(snowflakes.Snowflake(payload["id"])) if self._cache else None
@@ -387,6 +508,9 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
 
         await self.dispatch(event)
 
+    @event_manager_base.filtered(
+        (message_events.GuildMessageDeleteEvent, message_events.DMMessageDeleteEvent), config.CacheComponents.MESSAGES
+    )
     async def on_message_delete(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#message-delete for more info."""
         event = self._event_factory.deserialize_message_delete_event(shard, payload)
@@ -396,6 +520,9 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
 
         await self.dispatch(event)
 
+    @event_manager_base.filtered(
+        (message_events.GuildMessageDeleteEvent, message_events.DMMessageDeleteEvent), config.CacheComponents.MESSAGES
+    )
     async def on_message_delete_bulk(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#message-delete-bulk for more info."""
         event = self._event_factory.deserialize_message_delete_bulk_event(shard, payload)
@@ -406,6 +533,7 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
 
         await self.dispatch(event)
 
+    @event_manager_base.filtered((reaction_events.GuildReactionAddEvent, reaction_events.DMReactionAddEvent))
     async def on_message_reaction_add(
         self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject
     ) -> None:
@@ -414,24 +542,32 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
 
     # TODO: this is unlikely but reaction cache?
 
+    @event_manager_base.filtered((reaction_events.GuildReactionDeleteEvent, reaction_events.DMReactionDeleteEvent))
     async def on_message_reaction_remove(
         self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject
     ) -> None:
         """See https://discord.com/developers/docs/topics/gateway#message-reaction-remove for more info."""
         await self.dispatch(self._event_factory.deserialize_message_reaction_remove_event(shard, payload))
 
+    @event_manager_base.filtered(
+        (reaction_events.GuildReactionDeleteAllEvent, reaction_events.DMReactionDeleteAllEvent)
+    )
     async def on_message_reaction_remove_all(
         self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject
     ) -> None:
         """See https://discord.com/developers/docs/topics/gateway#message-reaction-remove-all for more info."""
         await self.dispatch(self._event_factory.deserialize_message_reaction_remove_all_event(shard, payload))
 
+    @event_manager_base.filtered(
+        (reaction_events.GuildReactionDeleteEmojiEvent, reaction_events.DMReactionDeleteEmojiEvent)
+    )
     async def on_message_reaction_remove_emoji(
         self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject
     ) -> None:
         """See https://discord.com/developers/docs/topics/gateway#message-reaction-remove-emoji for more info."""
         await self.dispatch(self._event_factory.deserialize_message_reaction_remove_emoji_event(shard, payload))
 
+    @event_manager_base.filtered((guild_events.PresenceUpdateEvent,), config.CacheComponents.PRESENCES)
     async def on_presence_update(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#presence-update for more info."""
         old: typing.Optional[presences.MemberPresence] = None
@@ -450,6 +586,7 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
         # TODO: update user here when partial_user is set self._cache.update_user(event.partial_user)
         await self.dispatch(event)
 
+    @event_manager_base.filtered((typing_events.GuildTypingEvent, typing_events.DMTypingEvent))
     async def on_typing_start(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#typing-start for more info."""
         await self.dispatch(self._event_factory.deserialize_typing_start_event(shard, payload))
@@ -464,6 +601,7 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
 
         await self.dispatch(event)
 
+    @event_manager_base.filtered((voice_events.VoiceStateUpdateEvent,), config.CacheComponents.VOICE_STATES)
     async def on_voice_state_update(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#voice-state-update for more info."""
         old: typing.Optional[voices.VoiceState] = None
@@ -481,14 +619,17 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
 
         await self.dispatch(event)
 
+    @event_manager_base.filtered((voice_events.VoiceServerUpdateEvent,))
     async def on_voice_server_update(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#voice-server-update for more info."""
         await self.dispatch(self._event_factory.deserialize_voice_server_update_event(shard, payload))
 
+    @event_manager_base.filtered((channel_events.WebhookUpdateEvent,))
     async def on_webhooks_update(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#webhooks-update for more info."""
         await self.dispatch(self._event_factory.deserialize_webhook_update_event(shard, payload))
 
+    @event_manager_base.filtered((interaction_events.InteractionCreateEvent,))
     async def on_interaction_create(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#interaction-create for more info."""
         await self.dispatch(self._event_factory.deserialize_interaction_create_event(shard, payload))
@@ -24,21 +24,27 @@
 
 from __future__ import annotations
 
-__all__: typing.List[str] = ["EventManagerBase", "EventStream"]
+__all__: typing.List[str] = ["DispatchQueueStatistics", "EventManagerBase", "EventStream"]
 
 import asyncio
+import collections
 import inspect
 import logging
 import typing
 import warnings
 import weakref
 
+import attr
+
+from hikari import config
 from hikari import errors
 from hikari import iterators
 from hikari.api import event_manager as event_manager_
 from hikari.events import base_events
+from hikari.events import shard_events
 from hikari.internal import aio
 from hikari.internal import reflect
+from hikari.internal import spel
 
 if typing.TYPE_CHECKING:
     import types
@@ -54,6 +60,8 @@ if typing.TYPE_CHECKING:
     ConsumerT = typing.Callable[
         [gateway_shard.GatewayShard, data_binding.JSONObject], typing.Coroutine[typing.Any, typing.Any, None]
     ]
+    EventTypesT = typing.Tuple[typing.Type[base_events.Event], ...]
+    AsyncCallbackT = typing.Callable[[event_manager_.EventT_inv], typing.Coroutine[typing.Any, typing.Any, None]]
     ListenerMapT = typing.MutableMapping[
         typing.Type[event_manager_.EventT_co],
         typing.MutableSequence[event_manager_.CallbackT[event_manager_.EventT_co]],
@@ -62,9 +70,218 @@ if typing.TYPE_CHECKING:
         event_manager_.PredicateT[event_manager_.EventT_co], asyncio.Future[event_manager_.EventT_co]
     ]
     WaiterMapT = typing.MutableMapping[
-        typing.Type[event_manager_.EventT_co], typing.MutableSet[WaiterT[event_manager_.EventT_co]]
+        typing.Type[event_manager_.EventT_co], "_AttributeIndex[WaiterT[event_manager_.EventT_co]]"
+    ]
+    StreamRefT = weakref.ReferenceType["EventStream[event_manager_.EventT_co]"]
+    StreamMapT = typing.MutableMapping[
+        typing.Type[event_manager_.EventT_co], "_AttributeIndex[StreamRefT[event_manager_.EventT_co]]"
+    ]
+    DispatchItemT = typing.Tuple[ConsumerT, gateway_shard.GatewayShard, data_binding.JSONObject]
+    DispatchTableT = typing.Tuple[
+        typing.Tuple[event_manager_.CallbackT[event_manager_.EventT_co], ...],
+        typing.Tuple[AsyncCallbackT[event_manager_.EventT_co], ...],
+        typing.Tuple["_SerialListener", ...],
+        # The waiters and streams are stored for all event types, so these are typed with the base event type.
+        typing.Tuple[typing.Tuple[typing.Type[base_events.Event], "_AttributeIndex[WaiterT[base_events.Event]]"], ...],
+        typing.Tuple["_AttributeIndex[StreamRefT[base_events.Event]]", ...],
     ]
 
+_ItemT = typing.TypeVar("_ItemT")
+
+_ConsumerCallbackT = typing.TypeVar("_ConsumerCallbackT", bound=typing.Callable[..., typing.Any])
+
+
+def filtered(
+    event_types: typing.Iterable[typing.Type[base_events.Event]],
+    cache_components: config.CacheComponents = config.CacheComponents.NONE,
+    /,
+) -> typing.Callable[[_ConsumerCallbackT], _ConsumerCallbackT]:
+    """Declare what a raw event consumer produces, so it can be skipped when unused.
+
+    A consumer decorated with this will only be called for a raw event if a
+    listener, waiter or stream is registered for one of `event_types` (or one
+    of their parent types), or if one of `cache_components` is enabled.
+    Consumers without this decorator are always called.
+
+    Parameters
+    ----------
+    event_types : typing.Iterable[typing.Type[hikari.events.base_events.Event]]
+        The concrete event types the consumer may dispatch.
+    cache_components : hikari.config.CacheComponents
+        The cache components the consumer updates.
+
+    Returns
+    -------
+    typing.Callable[[T], T]
+        Decorator for the consumer.
+    """
+    event_types = tuple(event_types)
+
+    def decorator(consumer: _ConsumerCallbackT, /) -> _ConsumerCallbackT:
+        consumer.__event_types__ = event_types  # type: ignore[attr-defined]
+        consumer.__cache_components__ = cache_components  # type: ignore[attr-defined]
+        return consumer
+
+    return decorator
+
+
+@attr.define(kw_only=True, weakref_slot=False)
+class DispatchQueueStatistics:
+    """Counters for the dispatch queue of a shard.
+
+    These are only kept when the event manager was given
+    `hikari.config.DispatchSettings`.
+    """
+
+    depth: int = attr.field(default=0)
+    """Number of events currently waiting in the queue."""
+
+    max_depth: int = attr.field(default=0)
+    """Highest number of events which have been waiting in the queue at once."""
+
+    queued_events: int = attr.field(default=0)
+    """Total number of events which have been added to the queue."""
+
+    dropped_events: int = attr.field(default=0)
+    """Total number of events discarded because the queue was full."""
+
+    blocked_events: int = attr.field(default=0)
+    """Total number of events which had to wait for space in the queue.
+
+    The shard stops reading from the gateway while this happens.
+    """
+
+    def record_depth(self, depth: int) -> None:
+        """Update the current depth of the queue."""
+        self.depth = depth
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+
+@attr.define(weakref_slot=False)
+class _DispatchQueue:
+    queue: asyncio.Queue[DispatchItemT] = attr.field()
+    """The raw events waiting to be consumed."""
+
+    statistics: DispatchQueueStatistics = attr.field(factory=DispatchQueueStatistics)
+    """The counters for this queue."""
+
+    workers: typing.List[asyncio.Task[None]] = attr.field(factory=list)
+    """The tasks consuming the queue."""
+
+    is_closing: bool = attr.field(default=False)
+    """Whether the workers should stop."""
+
+
+@attr.define(weakref_slot=False)
+class _Consumer:
+    callback: ConsumerT = attr.field()
+    """The method which consumes the raw event."""
+
+    event_types: typing.Optional[EventTypesT] = attr.field()
+    """The event types dispatched by the consumer, or `builtins.None` if it is never skipped."""
+
+    cache_components: config.CacheComponents = attr.field()
+    """The cache components updated by the consumer."""
+
+    is_enabled: bool = attr.field(default=True)
+    """Whether anything currently needs the output of this consumer."""
+
+    is_dispatching: bool = attr.field(default=True)
+    """Whether anything currently receives the events dispatched by this consumer."""
+
+
+@attr.define(weakref_slot=False)
+class _AttributeIndex(typing.Generic[_ItemT]):
+    """A set of items, bucketed by the value an attribute of an event must have for them to match it."""
+
+    unkeyed: typing.Set[_ItemT] = attr.field(factory=set)
+    """Items which must be checked against every event."""
+
+    keyed: typing.Dict[
+        str, typing.Tuple[spel.AttrGetter[typing.Any, typing.Any], typing.Dict[typing.Any, typing.Set[_ItemT]]]
+    ] = attr.field(factory=dict)
+    """Mapping of attribute names to their getter and the items waiting for each value of it."""
+
+    def __bool__(self) -> bool:
+        return bool(self.unkeyed or self.keyed)
+
+    def add(self, item: _ItemT, key: typing.Optional[event_manager_.KeyT], /) -> None:
+        if key is None:
+            self.unkeyed.add(item)
+            return
+
+        attr_name, value = key
+        try:
+            buckets = self.keyed[attr_name][1]
+        except KeyError:
+            buckets = {}
+            self.keyed[attr_name] = (spel.AttrGetter(attr_name), buckets)
+
+        try:
+            buckets[value].add(item)
+        except KeyError:
+            buckets[value] = {item}
+
+    def discard(self, item: _ItemT, key: typing.Optional[event_manager_.KeyT], /) -> None:
+        if key is None:
+            self.unkeyed.discard(item)
+            return
+
+        attr_name, value = key
+        try:
+            buckets = self.keyed[attr_name][1]
+            bucket = buckets[value]
+        except KeyError:
+            return
+
+        bucket.discard(item)
+        if not bucket:
+            del buckets[value]
+            if not buckets:
+                del self.keyed[attr_name]
+
+    def matching(
+        self, event: base_events.Event, /
+    ) -> typing.List[typing.Tuple[typing.Optional[event_manager_.KeyT], typing.Set[_ItemT]]]:
+        """Return the buckets of items which may match the event, along with their keys."""
+        matches: typing.List[typing.Tuple[typing.Optional[event_manager_.KeyT], typing.Set[_ItemT]]] = []
+        if self.unkeyed:
+            matches.append((None, self.unkeyed))
+
+        for attr_name, (getter, buckets) in self.keyed.items():
+            try:
+                value = getter(event)
+                bucket = buckets.get(value)
+            except (AttributeError, TypeError):
+                # The attribute does not exist on this event type, or its value is unhashable
+                continue
+
+            if bucket:
+                matches.append(((attr_name, value), bucket))
+
+        return matches
+
+
+@attr.define(weakref_slot=False)
+class _SerialListener:
+    """A coroutine function listener which handles events one at a time for each value of an attribute."""
+
+    callback: AsyncCallbackT[typing.Any] = attr.field()
+    """The coroutine function to call."""
+
+    getter: spel.AttrGetter[base_events.Event, typing.Any] = attr.field()
+    """Getter for the attribute to serialize calls to the callback by."""
+
+    queues: typing.Dict[typing.Any, typing.Deque[typing.Tuple[base_events.Event, asyncio.Future[None]]]] = attr.field(
+        factory=dict
+    )
+    """Mapping of keys to the events which are waiting to be handled for them."""
+
+
+def _is_coroutine_callback(callback: event_manager_.CallbackT[typing.Any], /) -> bool:
+    return inspect.iscoroutinefunction(callback) or inspect.iscoroutinefunction(getattr(callback, "__call__", None))
+
 
 def _generate_weak_listener(
     reference: weakref.WeakMethod,
@@ -89,6 +306,10 @@ class EventStream(event_manager_.EventStream[event_manager_.EventT]):
         will return a wrapping lazy iterator, calling it on an inactive "closed"
         event stream will return the event stream and add the given predicates
         to the streamer.
+
+        If any of these predicates compare an attribute to a value, such as
+        `stream.filter(("channel_id", channel_id))`, the first of them is used
+        to index the stream so it is only given events which match it.
     """
 
     __slots__: typing.Sequence[str] = (
@@ -97,8 +318,10 @@ class EventStream(event_manager_.EventStream[event_manager_.EventT]):
         "_event_manager",
         "_event_type",
         "_filters",
+        "_index_key",
         "_queue",
         "_registered_listener",
+        "_stream_reference",
         "_timeout",
     )
 
@@ -114,6 +337,7 @@ class EventStream(event_manager_.EventStream[event_manager_.EventT]):
         self._active = False
         self._event_type = event_type
         self._filters: iterators.All[event_manager_.EventT] = iterators.All(())
+        self._index_key: typing.Optional[event_manager_.KeyT] = None
         # We accept `None` to represent unlimited here to be consistent with how `None` is already used to represent
         # unlimited for timeout in other places.
         self._queue: asyncio.Queue[event_manager_.EventT] = asyncio.Queue(limit or 0)
@@ -121,6 +345,8 @@ class EventStream(event_manager_.EventStream[event_manager_.EventT]):
             typing.Callable[[event_manager_.EventT], typing.Coroutine[typing.Any, typing.Any, None]]
         ] = None
         # The registered wrapping function for the weak ref to this class's _listener method.
+        self._stream_reference: typing.Optional[StreamRefT[event_manager_.EventT]] = None
+        # The weak ref to this stream registered with the event manager's index, if _index_key is set.
         self._timeout = timeout
 
     async def __aenter__(self) -> EventStream[event_manager_.EventT]:
@@ -182,6 +408,9 @@ class EventStream(event_manager_.EventStream[event_manager_.EventT]):
         return result
 
     async def _listener(self, event: event_manager_.EventT) -> None:
+        self._push(event)
+
+    def _push(self, event: event_manager_.EventT) -> None:
         if not self._filters(event):
             return
 
@@ -199,6 +428,12 @@ class EventStream(event_manager_.EventStream[event_manager_.EventT]):
 
             self._registered_listener = None
 
+        if self._active and self._stream_reference is not None:
+            assert isinstance(self._event_manager, EventManagerBase)
+            assert self._index_key is not None
+            self._event_manager._remove_stream(self._event_type, self._stream_reference, self._index_key)
+            self._stream_reference = None
+
         self._active = False
 
     def filter(
@@ -210,6 +445,12 @@ class EventStream(event_manager_.EventStream[event_manager_.EventT]):
             return super().filter(*predicates, **attrs)
 
         self._filters |= self._map_predicates_and_attr_getters("filter", *predicates, **attrs)
+
+        if self._index_key is None:
+            keys = [p for p in predicates if isinstance(p, tuple)]
+            keys.extend(attrs.items())
+            self._index_key = next((key for key in keys if _is_hashable(key[1])), None)
+
         return self
 
     async def open(self) -> None:
@@ -218,13 +459,27 @@ class EventStream(event_manager_.EventStream[event_manager_.EventT]):
             # listener with a weakref then try to close this on deletion. While this may lead to their consoles being
             # spammed, this is a small price to pay as it'll be way more obvious what's wrong than if we just left them
             # with a vague ominous memory leak.
-            reference = weakref.WeakMethod(self._listener)  # type: ignore[arg-type]
-            listener = _generate_weak_listener(reference)
-            self._registered_listener = listener
-            self._event_manager.subscribe(self._event_type, listener)
+            if self._index_key is not None and isinstance(self._event_manager, EventManagerBase):
+                # Indexed streams are fed directly by dispatch, which only keeps a weak reference to them.
+                self._stream_reference = self._event_manager._add_stream(self._event_type, self, self._index_key)
+            else:
+                reference = weakref.WeakMethod(self._listener)  # type: ignore[arg-type]
+                listener = _generate_weak_listener(reference)
+                self._registered_listener = listener
+                self._event_manager.subscribe(self._event_type, listener)
+
             self._active = True
 
 
+def _is_hashable(value: typing.Any, /) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+
+    return True
+
+
 def _default_predicate(_: event_manager_.EventT_inv) -> bool:
     return True
 
@@ -244,39 +499,233 @@ class EventManagerBase(event_manager_.EventManager):
     is the raw event name being dispatched in lower-case.
     """
 
-    __slots__: typing.Sequence[str] = ("_event_factory", "_intents", "_listeners", "_consumers", "_waiters")
+    __slots__: typing.Sequence[str] = (
+        "_cache_components",
+        "_consumers",
+        "_dispatch_queues",
+        "_dispatch_settings",
+        "_dispatch_tables",
+        "_event_factory",
+        "_intents",
+        "_listeners",
+        "_payload_events_enabled",
+        "_serial_listeners",
+        "_streams",
+        "_subtype_listeners",
+        "_waiters",
+    )
 
-    def __init__(self, event_factory: event_factory_.EventFactory, intents: intents_.Intents) -> None:
-        self._consumers: typing.Dict[str, ConsumerT] = {}
+    def __init__(
+        self,
+        event_factory: event_factory_.EventFactory,
+        intents: intents_.Intents,
+        *,
+        cache_components: config.CacheComponents = config.CacheComponents.NONE,
+        dispatch_settings: typing.Optional[config.DispatchSettings] = None,
+    ) -> None:
+        self._cache_components = cache_components
+        self._consumers: typing.Dict[str, _Consumer] = {}
+        self._dispatch_queues: typing.Dict[int, _DispatchQueue] = {}
+        self._dispatch_settings = dispatch_settings
+        # A dict can't tie the event type of each value to its key, so the cached values are typed with typing.Any.
+        self._dispatch_tables: typing.Dict[typing.Type[base_events.Event], DispatchTableT[typing.Any]] = {}
         self._event_factory = event_factory
         self._intents = intents
         self._listeners: ListenerMapT[base_events.Event] = {}
+        self._payload_events_enabled = False
+        self._serial_listeners: typing.Dict[
+            typing.Tuple[typing.Type[base_events.Event], event_manager_.CallbackT[typing.Any]], _SerialListener
+        ] = {}
+        self._streams: StreamMapT[base_events.Event] = {}
+        self._subtype_listeners: typing.Dict[
+            typing.Type[base_events.Event], typing.Tuple[event_manager_.CallbackT[typing.Any], ...]
+        ] = {}
         self._waiters: WaiterMapT[base_events.Event] = {}
 
         for name, member in inspect.getmembers(self):
             if name.startswith("on_"):
-                self._consumers[name[3:]] = member
+                event_types = getattr(member, "__event_types__", None)
+                components = getattr(member, "__cache_components__", config.CacheComponents.NONE)
+                self._consumers[name[3:]] = _Consumer(member, event_types, components)
+
+        self._update_consumers()
+
+    @property
+    def dispatch_queue_statistics(self) -> typing.Mapping[int, DispatchQueueStatistics]:
+        """Counters for the dispatch queue of each shard, mapped by shard ID.
+
+        This will be empty unless `hikari.config.DispatchSettings` were given.
+        """
+        return {shard_id: dispatch_queue.statistics for shard_id, dispatch_queue in self._dispatch_queues.items()}
 
     def consume_raw_event(
         self, event_name: str, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject
-    ) -> None:
-        payload_event = self._event_factory.deserialize_shard_payload_event(shard, payload, name=event_name)
-        self.dispatch(payload_event)
-        callback = self._consumers[event_name.casefold()]
-        asyncio.create_task(self._handle_dispatch(callback, shard, payload), name=f"dispatch {event_name}")
+    ) -> typing.Optional[typing.Awaitable[None]]:
+        if self._payload_events_enabled:
+            payload_event = self._event_factory.deserialize_shard_payload_event(shard, payload, name=event_name)
+            self.dispatch(payload_event)
+
+        consumer = self._consumers[event_name.casefold()]
+        if not consumer.is_enabled:
+            return None
+
+        if self._dispatch_settings is None:
+            asyncio.create_task(self._handle_dispatch(consumer.callback, shard, payload), name=f"dispatch {event_name}")
+            return None
+
+        return self._enqueue(self._dispatch_settings, event_name, (consumer.callback, shard, payload))
+
+    async def close_dispatch_queues(self) -> None:
+        """Stop the dispatch queue workers and discard any events still queued.
+
+        The queues will be recreated when the next event is received.
+        """
+        dispatch_queues = list(self._dispatch_queues.values())
+        self._dispatch_queues.clear()
+
+        workers: typing.List[asyncio.Task[None]] = []
+        for dispatch_queue in dispatch_queues:
+            dispatch_queue.is_closing = True
+            for worker in dispatch_queue.workers:
+                worker.cancel()
+                workers.append(worker)
+
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    def _enqueue(
+        self, settings: config.DispatchSettings, event_name: str, item: DispatchItemT, /
+    ) -> typing.Optional[typing.Awaitable[None]]:
+        shard_id = item[1].id
+        try:
+            dispatch_queue = self._dispatch_queues[shard_id]
+        except KeyError:
+            dispatch_queue = self._dispatch_queues[shard_id] = _DispatchQueue(asyncio.Queue(settings.max_queue_size))
+            dispatch_queue.workers.extend(
+                asyncio.create_task(self._dispatch_worker(dispatch_queue), name=f"shard {shard_id} dispatch worker {i}")
+                for i in range(settings.workers)
+            )
+
+        queue = dispatch_queue.queue
+        statistics = dispatch_queue.statistics
+
+        if queue.full():
+            if settings.overflow_policy is config.DispatchOverflowPolicy.DROP_OLDEST:
+                queue.get_nowait()
+                queue.task_done()
+                statistics.dropped_events += 1
+
+            elif (
+                settings.overflow_policy is config.DispatchOverflowPolicy.DROP_BY_TYPE
+                and event_name in settings.droppable_events
+            ):
+                statistics.dropped_events += 1
+                return None
+
+            else:
+                statistics.blocked_events += 1
+                return self._put_when_free(dispatch_queue, item)
+
+        queue.put_nowait(item)
+        statistics.queued_events += 1
+        statistics.record_depth(queue.qsize())
+        return None
+
+    @staticmethod
+    async def _put_when_free(dispatch_queue: _DispatchQueue, item: DispatchItemT, /) -> None:
+        await dispatch_queue.queue.put(item)
+        dispatch_queue.statistics.queued_events += 1
+        dispatch_queue.statistics.record_depth(dispatch_queue.queue.qsize())
+
+    async def _dispatch_worker(self, dispatch_queue: _DispatchQueue, /) -> None:
+        queue = dispatch_queue.queue
+
+        # _handle_dispatch suppresses cancellation, so we also need to check whether we were closed.
+        while not dispatch_queue.is_closing:
+            callback, shard, payload = await queue.get()
+            dispatch_queue.statistics.depth = queue.qsize()
+
+            try:
+                await self._handle_dispatch(callback, shard, payload)
+            finally:
+                queue.task_done()
+
+    def _update_consumers(self) -> None:
+        # This is only called when an event type gains its first or loses its last listener or waiter, so
+        # consume_raw_event can skip unused consumers with a single attribute lookup.
+        used_event_types = (*self._listeners, *self._waiters, *self._streams)
+
+        for consumer in self._consumers.values():
+            consumer.is_dispatching = consumer.event_types is None or any(
+                issubclass(et, used) for et in consumer.event_types for used in used_event_types
+            )
+            consumer.is_enabled = consumer.is_dispatching or bool(consumer.cache_components & self._cache_components)
+
+        self._payload_events_enabled = any(
+            issubclass(shard_events.ShardPayloadEvent, used) for used in used_event_types
+        )
+
+    def _invalidate_dispatch_tables(self) -> None:
+        self._dispatch_tables.clear()
+        self._subtype_listeners.clear()
+
+    def _build_dispatch_table(
+        self, event_type: typing.Type[event_manager_.EventT_co], /
+    ) -> DispatchTableT[event_manager_.EventT_co]:
+        # We only need to iterate through the MRO until we hit Event, as
+        # anything after that is random garbage we don't care about, as they do
+        # not describe event types. This improves efficiency as well.
+        mro = event_type.mro()
+        sync_listeners: typing.List[event_manager_.CallbackT[event_manager_.EventT_co]] = []
+        listeners: typing.List[AsyncCallbackT[event_manager_.EventT_co]] = []
+        serial_listeners: typing.List[_SerialListener] = []
+        waiter_indexes: typing.List[
+            typing.Tuple[typing.Type[base_events.Event], _AttributeIndex[WaiterT[base_events.Event]]]
+        ] = []
+        stream_indexes: typing.List[_AttributeIndex[StreamRefT[base_events.Event]]] = []
+
+        for cls in mro[: mro.index(base_events.Event) + 1]:
+            for callback in self._listeners.get(cls, ()):
+                serial_listener = self._serial_listeners.get((cls, callback))
+                if serial_listener is not None:
+                    serial_listeners.append(serial_listener)
+                elif _is_coroutine_callback(callback):
+                    listeners.append(callback)  # type: ignore[arg-type]
+                else:
+                    sync_listeners.append(callback)
+
+            if cls in self._waiters:
+                waiter_indexes.append((cls, self._waiters[cls]))
+
+            if cls in self._streams:
+                stream_indexes.append(self._streams[cls])
+
+        table = (
+            tuple(sync_listeners),
+            tuple(listeners),
+            tuple(serial_listeners),
+            tuple(waiter_indexes),
+            tuple(stream_indexes),
+        )
+        self._dispatch_tables[event_type] = table
+        return table
 
     def subscribe(
         self,
         event_type: typing.Type[event_manager_.EventT_co],
         callback: event_manager_.CallbackT[event_manager_.EventT_co],
         *,
+        serial_key: typing.Optional[str] = None,
         _nested: int = 0,
     ) -> None:
         if not issubclass(event_type, base_events.Event):
             raise TypeError("Cannot subscribe to a non-Event type")
 
-        if not inspect.iscoroutinefunction(callback):
-            raise TypeError("Cannot subscribe a non-coroutine function callback")
+        if not callable(callback):
+            raise TypeError("Cannot subscribe a non-callable callback")
+
+        is_coroutine = _is_coroutine_callback(callback)
+        if serial_key is not None and not is_coroutine:
+            raise TypeError("Cannot serialize a non-coroutine function callback")
 
         # `_nested` is used to show the correct source code snippet if an intent
         # warning is triggered.
@@ -284,15 +733,24 @@ class EventManagerBase(event_manager_.EventManager):
 
         if event_type not in self._listeners:
             self._listeners[event_type] = []
+            self._update_consumers()
+
+        self._invalidate_dispatch_tables()
 
         _LOGGER.debug(
-            "subscribing callback 'async def %s%s' to event-type %s.%s",
+            "subscribing callback '%s %s%s' to event-type %s.%s",
+            "async def" if is_coroutine else "def",
             getattr(callback, "__name__", "<anon>"),
             inspect.signature(callback),
             event_type.__module__,
             event_type.__qualname__,
         )
 
+        if serial_key is not None:
+            self._serial_listeners[(event_type, callback)] = _SerialListener(
+                callback, spel.AttrGetter(serial_key)  # type: ignore[arg-type]
+            )
+
         self._listeners[event_type].append(callback)  # type: ignore[arg-type]
 
     def _check_intents(self, event_type: typing.Type[event_manager_.EventT_co], nested: int) -> None:
@@ -322,10 +780,17 @@ class EventManagerBase(event_manager_.EventManager):
         polymorphic: bool = True,
     ) -> typing.Collection[event_manager_.CallbackT[event_manager_.EventT_co]]:
         if polymorphic:
+            try:
+                return list(self._subtype_listeners[event_type])
+            except KeyError:
+                pass
+
             listeners: typing.List[event_manager_.CallbackT[event_manager_.EventT_co]] = []
             for subscribed_event_type, subscribed_listeners in self._listeners.items():
                 if issubclass(subscribed_event_type, event_type):
                     listeners += subscribed_listeners
+
+            self._subtype_listeners[event_type] = tuple(listeners)
             return listeners
         else:
             items = self._listeners.get(event_type)
@@ -348,12 +813,19 @@ class EventManagerBase(event_manager_.EventManager):
                 event_type.__qualname__,
             )
             self._listeners[event_type].remove(callback)  # type: ignore[arg-type]
+            if callback not in self._listeners[event_type]:
+                self._serial_listeners.pop((event_type, callback), None)
+
+            self._invalidate_dispatch_tables()
             if not self._listeners[event_type]:
                 del self._listeners[event_type]
+                self._update_consumers()
 
     def listen(
         self,
         event_type: typing.Optional[typing.Type[event_manager_.EventT_co]] = None,
+        *,
+        serial_key: typing.Optional[str] = None,
     ) -> typing.Callable[
         [event_manager_.CallbackT[event_manager_.EventT_co]], event_manager_.CallbackT[event_manager_.EventT_co]
     ]:
@@ -378,7 +850,7 @@ class EventManagerBase(event_manager_.EventManager):
 
                 event_type = event_param.annotation
 
-            self.subscribe(event_type, callback, _nested=1)
+            self.subscribe(event_type, callback, serial_key=serial_key, _nested=1)
             return callback
 
         return decorator
@@ -387,35 +859,53 @@ class EventManagerBase(event_manager_.EventManager):
         if not isinstance(event, base_events.Event):
             raise TypeError(f"Events must be subclasses of {base_events.Event.__name__}, not {type(event).__name__}")
 
-        # We only need to iterate through the MRO until we hit Event, as
-        # anything after that is random garbage we don't care about, as they do
-        # not describe event types. This improves efficiency as well.
-        mro = type(event).mro()
-
-        tasks: typing.List[typing.Coroutine[None, typing.Any, None]] = []
-
-        for cls in mro[: mro.index(base_events.Event) + 1]:
-            if cls in self._listeners:
-                for callback in self._listeners[cls]:
-                    tasks.append(self._invoke_callback(callback, event))
-
-            if cls not in self._waiters:
-                continue
-
-            waiter_set = self._waiters[cls]
-            for waiter in tuple(waiter_set):
-                predicate, future = waiter
-                if not future.done():
-                    try:
-                        result = predicate(event)
-                        if not result:
-                            continue
-                    except Exception as ex:
-                        future.set_exception(ex)
-                    else:
-                        future.set_result(event)
-
-                waiter_set.remove(waiter)
+        try:
+            sync_listeners, listeners, serial_listeners, waiter_indexes, stream_indexes = self._dispatch_tables[
+                type(event)
+            ]
+        except KeyError:
+            (
+                sync_listeners,
+                listeners,
+                serial_listeners,
+                waiter_indexes,
+                stream_indexes,
+            ) = self._build_dispatch_table(type(event))
+
+        tasks: typing.List[typing.Awaitable[typing.Any]] = [
+            self._invoke_callback(callback, event) for callback in listeners
+        ]
+        tasks.extend(self._enqueue_serial(serial_listener, event) for serial_listener in serial_listeners)
+        tasks.extend(self._invoke_sync_callbacks(sync_listeners, event))
+
+        for cls, waiter_index in waiter_indexes:
+            for key, waiter_set in waiter_index.matching(event):
+                for waiter in tuple(waiter_set):
+                    predicate, future = waiter
+                    if not future.done():
+                        try:
+                            result = predicate(event)
+                            if not result:
+                                continue
+                        except Exception as ex:
+                            future.set_exception(ex)
+                        else:
+                            future.set_result(event)
+
+                    waiter_index.discard(waiter, key)
+
+            if not waiter_index and self._waiters.get(cls) is waiter_index:
+                del self._waiters[cls]
+                self._update_consumers()
+                self._invalidate_dispatch_tables()
+
+        for stream_index in stream_indexes:
+            for _, references in stream_index.matching(event):
+                for reference in tuple(references):
+                    stream = reference()
+                    # Streams which were not closed are cleaned up by EventStream.__del__
+                    if stream is not None:
+                        stream._push(event)
 
         return asyncio.gather(*tasks) if tasks else aio.completed_future()
 
@@ -435,6 +925,8 @@ class EventManagerBase(event_manager_.EventManager):
         /,
         timeout: typing.Union[float, int, None],
         predicate: typing.Optional[event_manager_.PredicateT[event_manager_.EventT_co]] = None,
+        *,
+        key: typing.Optional[event_manager_.KeyT] = None,
     ) -> event_manager_.EventT_co:
 
         if predicate is None:
@@ -445,19 +937,61 @@ class EventManagerBase(event_manager_.EventManager):
         future: asyncio.Future[event_manager_.EventT_co] = asyncio.get_running_loop().create_future()
 
         try:
-            waiter_set = self._waiters[event_type]
+            waiter_index = self._waiters[event_type]
         except KeyError:
-            waiter_set = set()
-            self._waiters[event_type] = waiter_set
+            waiter_index = _AttributeIndex()
+            self._waiters[event_type] = waiter_index
+            self._update_consumers()
+            self._invalidate_dispatch_tables()
 
         pair = (predicate, future)
 
-        waiter_set.add(pair)  # type: ignore[arg-type]
+        waiter_index.add(pair, key)  # type: ignore[arg-type]
         try:
             return await asyncio.wait_for(future, timeout=timeout)
-        except asyncio.TimeoutError:
-            waiter_set.remove(pair)  # type: ignore[arg-type]
-            raise
+        finally:
+            # This will already have been removed if an event was received.
+            waiter_index.discard(pair, key)  # type: ignore[arg-type]
+            if not waiter_index and self._waiters.get(event_type) is waiter_index:
+                del self._waiters[event_type]
+                self._update_consumers()
+                self._invalidate_dispatch_tables()
+
+    def _add_stream(
+        self,
+        event_type: typing.Type[event_manager_.EventT_co],
+        stream: EventStream[event_manager_.EventT_co],
+        key: event_manager_.KeyT,
+        /,
+    ) -> StreamRefT[event_manager_.EventT_co]:
+        try:
+            stream_index = self._streams[event_type]
+        except KeyError:
+            stream_index = _AttributeIndex()
+            self._streams[event_type] = stream_index
+            self._update_consumers()
+
+        reference = weakref.ref(stream)
+        stream_index.add(reference, key)  # type: ignore[arg-type]
+        self._invalidate_dispatch_tables()
+        return reference
+
+    def _remove_stream(
+        self,
+        event_type: typing.Type[event_manager_.EventT_co],
+        reference: StreamRefT[event_manager_.EventT_co],
+        key: event_manager_.KeyT,
+        /,
+    ) -> None:
+        stream_index = self._streams.get(event_type)
+        if stream_index is None:
+            return
+
+        stream_index.discard(reference, key)  # type: ignore[arg-type]
+        self._invalidate_dispatch_tables()
+        if not stream_index:
+            del self._streams[event_type]
+            self._update_consumers()
 
     @staticmethod
     async def _handle_dispatch(
@@ -481,28 +1015,97 @@ class EventManagerBase(event_manager_.EventManager):
                 }
             )
 
+    def _enqueue_serial(self, listener: _SerialListener, event: base_events.Event, /) -> asyncio.Future[None]:
+        try:
+            key = listener.getter(event)
+            hash(key)
+        except (AttributeError, TypeError):
+            # Events without a usable value for the key all share a single queue.
+            key = None
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+        try:
+            listener.queues[key].append((event, future))
+        except KeyError:
+            queue = listener.queues[key] = collections.deque(((event, future),))
+            asyncio.create_task(self._run_serial_listener(listener, key, queue), name=f"serial listener for {key!r}")
+
+        return future
+
+    async def _run_serial_listener(
+        self,
+        listener: _SerialListener,
+        key: typing.Any,
+        queue: typing.Deque[typing.Tuple[base_events.Event, asyncio.Future[None]]],
+        /,
+    ) -> None:
+        # The queue is only removed once it is empty, so any events dispatched for this key in the meantime
+        # will be picked up by this task instead of starting another one.
+        try:
+            while queue:
+                event, future = queue[0]
+                await self._invoke_callback(listener.callback, event)
+                queue.popleft()
+                if not future.done():
+                    future.set_result(None)
+
+        finally:
+            for _, future in queue:
+                future.cancel()
+
+            del listener.queues[key]
+
+    def _invoke_sync_callbacks(
+        self,
+        callbacks: typing.Iterable[event_manager_.CallbackT[event_manager_.EventT_inv]],
+        event: event_manager_.EventT_inv,
+    ) -> typing.List[asyncio.Future[typing.Any]]:
+        # These are cheap enough that scheduling them as tasks would cost more than just calling them.
+        exception_dispatches = []
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception as ex:
+                exception_dispatch = self._handle_callback_exception(callback, event, ex)
+                if exception_dispatch is not None:
+                    exception_dispatches.append(exception_dispatch)
+
+        return exception_dispatches
+
     async def _invoke_callback(
-        self, callback: event_manager_.CallbackT[event_manager_.EventT_inv], event: event_manager_.EventT_inv
+        self, callback: AsyncCallbackT[event_manager_.EventT_inv], event: event_manager_.EventT_inv
     ) -> None:
         try:
             await callback(event)
         except Exception as ex:
-            # Skip the first frame in logs, we don't care for it.
-            trio = type(ex), ex, ex.__traceback__.tb_next if ex.__traceback__ is not None else None
-
-            if base_events.is_no_recursive_throw_event(event):
-                _LOGGER.error(
-                    "an exception occurred handling an event (%s), but it has been ignored",
-                    type(event).__name__,
-                    exc_info=trio,
-                )
-            else:
-                exception_event = base_events.ExceptionEvent(
-                    exception=ex,
-                    failed_event=event,
-                    failed_callback=callback,
-                )
+            exception_dispatch = self._handle_callback_exception(callback, event, ex)
+            if exception_dispatch is not None:
+                await exception_dispatch
+
+    def _handle_callback_exception(
+        self,
+        callback: event_manager_.CallbackT[event_manager_.EventT_inv],
+        event: event_manager_.EventT_inv,
+        ex: Exception,
+    ) -> typing.Optional[asyncio.Future[typing.Any]]:
+        # Skip the first frame in logs, we don't care for it.
+        trio = type(ex), ex, ex.__traceback__.tb_next if ex.__traceback__ is not None else None
+
+        if base_events.is_no_recursive_throw_event(event):
+            _LOGGER.error(
+                "an exception occurred handling an event (%s), but it has been ignored",
+                type(event).__name__,
+                exc_info=trio,
+            )
+            return None
+
+        exception_event = base_events.ExceptionEvent(
+            exception=ex,
+            failed_event=event,
+            failed_callback=callback,
+        )
 
-                log = _LOGGER.debug if self.get_listeners(type(exception_event), polymorphic=True) else _LOGGER.error
-                log("an exception occurred handling an event (%s)", type(event).__name__, exc_info=trio)
-                await self.dispatch(exception_event)
+        log = _LOGGER.debug if self.get_listeners(type(exception_event), polymorphic=True) else _LOGGER.error
+        log("an exception occurred handling an event (%s)", type(event).__name__, exc_info=trio)
+        return self.dispatch(exception_event)
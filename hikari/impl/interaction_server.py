@@ -44,8 +44,6 @@ if typing.TYPE_CHECKING:
     import socket as socket_
     import ssl
 
-    import aiohttp.typedefs
-
     from hikari.api import entity_factory as entity_factory_api
     from hikari.api import rest as rest_api
     from hikari.interactions import command_interactions
@@ -114,12 +112,6 @@ class _Response:
         return self._status_code
 
 
-# Constant response
-_PONG_RESPONSE: typing.Final[_Response] = _Response(
-    _OK_STATUS, data_binding.dump_json({"type": _PONG_RESPONSE_TYPE}).encode(), content_type=_JSON_TYPE_WITH_CHARSET
-)
-
-
 class InteractionServer(interaction_server.InteractionServer):
     """Standard implementation of `hikari.api.interaction_server.InteractionServer`.
 
@@ -130,10 +122,12 @@ class InteractionServer(interaction_server.InteractionServer):
 
     Other Parameters
     ----------------
-    dumps : aiohttp.typedefs.JSONEncoder
-        The JSON encoder this server should use. Defaults to `json.dumps`.
-    loads : aiohttp.typedefs.JSONDecoder
-        The JSON decoder this server should use. Defaults to `json.loads`.
+    dumps : hikari.internal.data_binding.JSONEncoder
+        The JSON encoder this server should use. Defaults to
+        `hikari.internal.data_binding.default_json_dumps`.
+    loads : hikari.internal.data_binding.JSONDecoder
+        The JSON decoder this server should use. Defaults to
+        `hikari.internal.data_binding.default_json_loads`.
     public_key : builtins.bytes
         The public key this server should use for verifying request payloads from
         Discord. If left as `builtins.None` then the client will try to work this
@@ -158,9 +152,9 @@ class InteractionServer(interaction_server.InteractionServer):
     def __init__(
         self,
         *,
-        dumps: aiohttp.typedefs.JSONEncoder = data_binding.dump_json,
+        dumps: data_binding.JSONEncoder = data_binding.default_json_dumps,
         entity_factory: entity_factory_api.EntityFactory,
-        loads: aiohttp.typedefs.JSONDecoder = data_binding.load_json,
+        loads: data_binding.JSONDecoder = data_binding.default_json_loads,
         rest_client: rest_api.RESTClient,
         public_key: typing.Optional[bytes] = None,
     ) -> None:
@@ -326,7 +320,10 @@ class InteractionServer(interaction_server.InteractionServer):
             return _Response(_BAD_REQUEST_STATUS, b"Invalid request signature")
 
         try:
-            payload = self._loads(body.decode("utf-8"))
+            payload = self._loads(body)
+            if not isinstance(payload, dict):
+                raise TypeError(f"Expected a JSON object but got {type(payload).__name__}")
+
             interaction_type = int(payload["type"])
 
         except (data_binding.JSONDecodeError, ValueError, TypeError) as exc:
@@ -339,7 +336,8 @@ class InteractionServer(interaction_server.InteractionServer):
 
         if interaction_type == _PING_INTERACTION_TYPE:
             _LOGGER.debug("Responding to ping interaction")
-            return _PONG_RESPONSE
+            pong = self._dumps({"type": _PONG_RESPONSE_TYPE})
+            return _Response(_OK_STATUS, pong.encode(), content_type=_JSON_TYPE_WITH_CHARSET)
 
         try:
             interaction = self._entity_factory.deserialize_interaction(payload)
@@ -358,7 +356,7 @@ class InteractionServer(interaction_server.InteractionServer):
             _LOGGER.debug("Dispatching interaction %s", interaction.id)
             try:
                 result = await listener(interaction)
-                payload = self._dumps(result.build(self._entity_factory))
+                response_payload = self._dumps(result.build(self._entity_factory))
 
             except Exception as exc:
                 asyncio.get_running_loop().call_exception_handler(
@@ -366,7 +364,7 @@ class InteractionServer(interaction_server.InteractionServer):
                 )
                 return _Response(_INTERNAL_SERVER_ERROR_STATUS, b"Exception occurred during interaction dispatch")
 
-            return _Response(_OK_STATUS, payload.encode(), content_type=_JSON_TYPE_WITH_CHARSET)
+            return _Response(_OK_STATUS, response_payload.encode(), content_type=_JSON_TYPE_WITH_CHARSET)
 
         _LOGGER.debug(
             "Ignoring interaction %s of type %s without registered listener", interaction.id, interaction.type
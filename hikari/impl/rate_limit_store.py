@@ -0,0 +1,442 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Basic implementation of REST rate limit state shared between processes on a host.
+
+A `RateLimitCoordinator` holds the state and serves it over a Unix socket,
+and each process connects to it using a `UnixSocketRateLimitStore`:
+
+```py
+import asyncio
+
+from hikari.impl import rate_limit_store
+
+
+async def main():
+    coordinator = rate_limit_store.RateLimitCoordinator("/run/my-bot/rate-limits.sock")
+    await coordinator.start()
+    await coordinator.join()
+
+
+asyncio.run(main())
+```
+
+```py
+import hikari
+from hikari.impl import rate_limit_store
+
+bot = hikari.GatewayBot(
+    "...",
+    rate_limit_store=rate_limit_store.UnixSocketRateLimitStore("/run/my-bot/rate-limits.sock"),
+)
+```
+
+!!! note
+    Unix sockets are not available on Windows.
+"""
+
+from __future__ import annotations
+
+__all__: typing.List[str] = ["RateLimitCoordinator", "UnixSocketRateLimitStore"]
+
+import asyncio
+import logging
+import os
+import socket
+import stat
+import typing
+
+from hikari import errors
+from hikari.api import rate_limit_store
+from hikari.internal import data_binding
+from hikari.internal import time
+from hikari.internal import ux
+
+if typing.TYPE_CHECKING:
+    _RequestT = typing.List[typing.Any]
+
+_LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.ratelimits")
+
+
+def _bind_unix_socket(path: str, /) -> socket.socket:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        # Like asyncio, replace the socket of a coordinator which didn't shut down cleanly.
+        try:
+            if stat.S_ISSOCK(os.stat(path).st_mode):
+                os.remove(path)
+        except FileNotFoundError:
+            pass
+
+        # Only the current user may connect, so the socket must never be reachable with looser permissions. As the
+        # umask is process-wide, it's only changed around the bind, which doesn't yield to other tasks.
+        old_umask = os.umask(0o177)
+        try:
+            sock.bind(path)
+        finally:
+            os.umask(old_umask)
+
+    except BaseException:
+        sock.close()
+        raise
+
+    return sock
+
+
+class _BucketState:
+    __slots__: typing.Sequence[str] = ("limit", "period", "remaining", "reset_at")
+
+    def __init__(self, remaining: int, limit: int, reset_at: float, period: float) -> None:
+        self.limit = limit
+        self.period = period
+        self.remaining = remaining
+        self.reset_at = reset_at
+
+
+class RateLimitCoordinator:
+    """Server which holds the REST rate limit state of the processes on a host.
+
+    Processes connect to it over a Unix socket using a
+    `UnixSocketRateLimitStore`. All of them must use the same token.
+
+    As the state is kept by a single process, its monotonic clock is used
+    for all the times, so the clocks of the connected processes don't need
+    to agree.
+
+    Parameters
+    ----------
+    path : typing.Union[builtins.str, os.PathLike[builtins.str]]
+        The path of the Unix socket to listen on. Only the user running the
+        coordinator is allowed to connect to it, as webhook tokens are part
+        of some bucket hashes.
+
+    Other Parameters
+    ----------------
+    expire_after : builtins.float
+        Time after a bucket last reset after which it is removed. Defaults to
+        `10` seconds.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_bucket_hashes",
+        "_buckets",
+        "_closed_event",
+        "_connections",
+        "_expire_after",
+        "_gc_task",
+        "_global_reset_at",
+        "_path",
+        "_server",
+    )
+
+    def __init__(self, path: typing.Union[str, os.PathLike[str]], /, *, expire_after: float = 10.0) -> None:
+        self._bucket_hashes: typing.Dict[str, str] = {}
+        self._buckets: typing.Dict[str, _BucketState] = {}
+        self._closed_event: typing.Optional[asyncio.Event] = None
+        self._connections: typing.Set[asyncio.StreamWriter] = set()
+        self._expire_after = expire_after
+        self._gc_task: typing.Optional[asyncio.Task[None]] = None
+        self._global_reset_at = 0.0
+        self._path = os.fspath(path)
+        self._server: typing.Optional[asyncio.AbstractServer] = None
+
+    @property
+    def is_alive(self) -> bool:
+        """Whether the coordinator is listening for connections."""
+        return self._server is not None
+
+    @property
+    def path(self) -> str:
+        """Path of the Unix socket the coordinator listens on."""
+        return self._path
+
+    async def start(self) -> None:
+        """Start listening for connections.
+
+        Raises
+        ------
+        hikari.errors.ComponentStateConflictError
+            If the coordinator is already running.
+        """
+        if self._server is not None:
+            raise errors.ComponentStateConflictError("coordinator is already running")
+
+        self._closed_event = asyncio.Event()
+        self._server = await asyncio.start_unix_server(self._handle_connection, sock=_bind_unix_socket(self._path))
+        self._gc_task = asyncio.create_task(self._gc(), name="rate limit coordinator garbage collector")
+        _LOGGER.info("rate limit coordinator listening on %s", self._path)
+
+    async def close(self) -> None:
+        """Stop listening for connections and forget all the state.
+
+        Raises
+        ------
+        hikari.errors.ComponentStateConflictError
+            If the coordinator is not running.
+        """
+        if self._server is None or self._closed_event is None:
+            raise errors.ComponentStateConflictError("coordinator is not running")
+
+        server = self._server
+        self._server = None
+        self._closed_event.set()
+
+        if self._gc_task is not None:
+            self._gc_task.cancel()
+            self._gc_task = None
+
+        # Closing the server only stops new connections being accepted.
+        server.close()
+        for writer in self._connections:
+            writer.close()
+
+        await server.wait_closed()
+        self._bucket_hashes.clear()
+        self._buckets.clear()
+        self._global_reset_at = 0.0
+
+        try:
+            os.unlink(self._path)
+        except FileNotFoundError:
+            pass
+
+    async def join(self) -> None:
+        """Wait for the coordinator to be closed.
+
+        Raises
+        ------
+        hikari.errors.ComponentStateConflictError
+            If the coordinator is not running.
+        """
+        if self._closed_event is None or self._closed_event.is_set():
+            raise errors.ComponentStateConflictError("coordinator is not running")
+
+        await self._closed_event.wait()
+
+    def get_bucket_hash(self, route: str, /) -> typing.Optional[str]:
+        """Get the bucket hash which a route was last seen using.
+
+        See `hikari.api.rate_limit_store.RateLimitStore.get_bucket_hash`.
+        """
+        return self._bucket_hashes.get(route)
+
+    def set_bucket_hash(self, route: str, bucket_hash: str, /) -> None:
+        """Set the bucket hash which a route is using.
+
+        See `hikari.api.rate_limit_store.RateLimitStore.set_bucket_hash`.
+        """
+        self._bucket_hashes[route] = bucket_hash
+
+    def reserve(self, real_bucket_hash: typing.Optional[str], /, *, use_global_rate_limit: bool) -> float:
+        """Try to reserve a request on a bucket.
+
+        See `hikari.api.rate_limit_store.RateLimitStore.reserve`.
+        """
+        now = time.monotonic()
+
+        if use_global_rate_limit and self._global_reset_at > now:
+            return self._global_reset_at - now
+
+        if real_bucket_hash is None or (bucket := self._buckets.get(real_bucket_hash)) is None:
+            return 0.0
+
+        if bucket.reset_at <= now:
+            bucket.remaining = bucket.limit
+            bucket.reset_at = now + bucket.period
+
+        if bucket.remaining <= 0:
+            return bucket.reset_at - now
+
+        bucket.remaining -= 1
+        return 0.0
+
+    def update_bucket(self, real_bucket_hash: str, /, *, remaining: int, limit: int, reset_after: float) -> None:
+        """Update the state of a bucket using the headers of a response.
+
+        See `hikari.api.rate_limit_store.RateLimitStore.update_bucket`.
+        """
+        now = time.monotonic()
+        reset_at = now + reset_after
+        bucket = self._buckets.get(real_bucket_hash)
+
+        if bucket is None:
+            self._buckets[real_bucket_hash] = _BucketState(remaining, limit, reset_at, reset_after)
+            return
+
+        # Requests reserved by other processes may not be counted in these headers yet, and responses may
+        # arrive out of order, so they can only make the current window more restrictive.
+        if bucket.reset_at > now:
+            remaining = min(bucket.remaining, remaining)
+            reset_at = max(bucket.reset_at, reset_at)
+
+        bucket.remaining = remaining
+        bucket.limit = limit
+        bucket.reset_at = reset_at
+        bucket.period = reset_at - now
+
+    def throttle_global(self, retry_after: float, /) -> None:
+        """Stop any requests subject to the global rate limit being reserved for a while.
+
+        See `hikari.api.rate_limit_store.RateLimitStore.throttle_global`.
+        """
+        self._global_reset_at = max(self._global_reset_at, time.monotonic() + retry_after)
+
+    def do_gc_pass(self) -> None:
+        """Remove the buckets which have not been used for a while."""
+        now = time.monotonic()
+        dead = [
+            real_bucket_hash
+            for real_bucket_hash, bucket in self._buckets.items()
+            if bucket.reset_at + self._expire_after < now
+        ]
+
+        for real_bucket_hash in dead:
+            del self._buckets[real_bucket_hash]
+
+        _LOGGER.log(ux.TRACE, "purged %s stale shared buckets, %s remain", len(dead), len(self._buckets))
+
+    async def _gc(self) -> None:
+        while True:
+            await asyncio.sleep(20)
+            self.do_gc_pass()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._connections.add(writer)
+
+        try:
+            while line := await reader.readline():
+                request = data_binding.default_json_loads(line)
+                assert isinstance(request, list)
+                # The result is wrapped in an array, as not all results are valid JSON documents on their own.
+                writer.write(data_binding.default_json_dumps([self._handle_request(request)]).encode() + b"\n")
+                await writer.drain()
+
+        except ConnectionError:
+            pass
+
+        except Exception as ex:
+            _LOGGER.warning("closing rate limit store connection after an invalid request", exc_info=ex)
+
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    def _handle_request(self, request: _RequestT, /) -> typing.Any:
+        operation, *args = request
+
+        if operation == "get_bucket_hash":
+            return self.get_bucket_hash(args[0])
+
+        if operation == "set_bucket_hash":
+            return self.set_bucket_hash(args[0], args[1])
+
+        if operation == "reserve":
+            return self.reserve(args[0], use_global_rate_limit=args[1])
+
+        if operation == "update_bucket":
+            return self.update_bucket(args[0], remaining=args[1], limit=args[2], reset_after=args[3])
+
+        if operation == "throttle_global":
+            return self.throttle_global(args[0])
+
+        raise ValueError(f"unknown operation {operation!r}")
+
+
+class UnixSocketRateLimitStore(rate_limit_store.RateLimitStore):
+    """Rate limit store which uses a `RateLimitCoordinator` over a Unix socket.
+
+    The connection is opened when the store is first used, and is reopened
+    if it is lost.
+
+    Parameters
+    ----------
+    path : typing.Union[builtins.str, os.PathLike[builtins.str]]
+        The path of the Unix socket the coordinator listens on.
+    """
+
+    __slots__: typing.Sequence[str] = ("_lock", "_path", "_reader", "_writer")
+
+    def __init__(self, path: typing.Union[str, os.PathLike[str]], /) -> None:
+        self._lock: typing.Optional[asyncio.Lock] = None
+        self._path = os.fspath(path)
+        self._reader: typing.Optional[asyncio.StreamReader] = None
+        self._writer: typing.Optional[asyncio.StreamWriter] = None
+
+    @property
+    def path(self) -> str:
+        """Path of the Unix socket the coordinator listens on."""
+        return self._path
+
+    async def get_bucket_hash(self, route: str, /) -> typing.Optional[str]:
+        result = await self._request(["get_bucket_hash", route])
+        assert result is None or isinstance(result, str)
+        return result
+
+    async def set_bucket_hash(self, route: str, bucket_hash: str, /) -> None:
+        await self._request(["set_bucket_hash", route, bucket_hash])
+
+    async def reserve(self, real_bucket_hash: typing.Optional[str], /, *, use_global_rate_limit: bool) -> float:
+        result = await self._request(["reserve", real_bucket_hash, use_global_rate_limit])
+        assert isinstance(result, (int, float))
+        return float(result)
+
+    async def update_bucket(self, real_bucket_hash: str, /, *, remaining: int, limit: int, reset_after: float) -> None:
+        await self._request(["update_bucket", real_bucket_hash, remaining, limit, reset_after])
+
+    async def throttle_global(self, retry_after: float, /) -> None:
+        await self._request(["throttle_global", retry_after])
+
+    async def close(self) -> None:
+        self._disconnect()
+
+    async def _request(self, request: _RequestT, /) -> typing.Any:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if self._reader is None or self._writer is None:
+                self._reader, self._writer = await asyncio.open_unix_connection(self._path)
+
+            try:
+                self._writer.write(data_binding.default_json_dumps(request).encode() + b"\n")
+                await self._writer.drain()
+                line = await self._reader.readline()
+
+            except BaseException:
+                # We can't tell whether the response is still on its way, so the connection can't be reused.
+                self._disconnect()
+                raise
+
+            if not line:
+                self._disconnect()
+                raise ConnectionResetError("rate limit coordinator closed the connection")
+
+        response = data_binding.default_json_loads(line)
+        assert isinstance(response, list)
+        return response[0]
+
+    def _disconnect(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+        self._reader = None
+        self._writer = None
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Basic implementation of a cache-first entity resolver."""
+
+from __future__ import annotations
+
+__all__: typing.List[str] = ["ResolverImpl"]
+
+import asyncio
+import typing
+
+from hikari import channels
+from hikari import errors
+from hikari import snowflakes
+from hikari.api import resolver
+from hikari.internal import aio
+
+if typing.TYPE_CHECKING:
+    from hikari import emojis
+    from hikari import guilds
+    from hikari import users as users_
+    from hikari.api import cache as cache_
+    from hikari.api import rest as rest_
+
+    _KeyT = typing.Tuple[typing.Union[str, snowflakes.Snowflake], ...]
+
+_T = typing.TypeVar("_T")
+
+
+class ResolverImpl(resolver.Resolver):
+    """Resolver which checks a cache before fetching entities using REST.
+
+    Parameters
+    ----------
+    cache : hikari.api.cache.MutableCache
+        The cache to check and to store fetched entities in.
+    rest : hikari.api.rest.RESTClient
+        The REST client to fetch entities with.
+    """
+
+    __slots__: typing.Sequence[str] = ("_cache", "_in_flight", "_rest")
+
+    def __init__(self, cache: cache_.MutableCache, rest: rest_.RESTClient) -> None:
+        self._cache = cache
+        self._in_flight: typing.Dict[_KeyT, asyncio.Task[typing.Any]] = {}
+        self._rest = rest
+
+    async def channel(self, channel: snowflakes.SnowflakeishOr[channels.PartialChannel], /) -> channels.PartialChannel:
+        channel_id = snowflakes.Snowflake(channel)
+        if (cached_channel := self._cache.get_guild_channel(channel_id)) is not None:
+            return cached_channel
+
+        return await self._fetch(("channel", channel_id), self._fetch_channel, channel_id)
+
+    async def emoji(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        emoji: snowflakes.SnowflakeishOr[emojis.CustomEmoji],
+        /,
+    ) -> emojis.KnownCustomEmoji:
+        emoji_id = snowflakes.Snowflake(emoji)
+        if (cached_emoji := self._cache.get_emoji(emoji_id)) is not None:
+            return cached_emoji
+
+        return await self._fetch(("emoji", emoji_id), self._fetch_emoji, snowflakes.Snowflake(guild), emoji_id)
+
+    async def guild(self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /) -> guilds.Guild:
+        guild_id = snowflakes.Snowflake(guild)
+        if (cached_guild := self._cache.get_guild(guild_id)) is not None:
+            return cached_guild
+
+        return await self._fetch(("guild", guild_id), self._rest.fetch_guild, guild_id)
+
+    async def member(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        user: snowflakes.SnowflakeishOr[users_.PartialUser],
+        /,
+    ) -> guilds.Member:
+        guild_id = snowflakes.Snowflake(guild)
+        user_id = snowflakes.Snowflake(user)
+        if (cached_member := self._cache.get_member(guild_id, user_id)) is not None:
+            return cached_member
+
+        return await self._fetch(("member", guild_id, user_id), self._fetch_member, guild_id, user_id)
+
+    async def members(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        users: typing.Iterable[snowflakes.SnowflakeishOr[users_.PartialUser]],
+        /,
+        *,
+        max_concurrency: int = 10,
+    ) -> typing.Mapping[snowflakes.Snowflake, guilds.Member]:
+        guild_id = snowflakes.Snowflake(guild)
+        return await self._resolve_many(
+            users,
+            lambda user_id: self._cache.get_member(guild_id, user_id),
+            lambda user_id: self.member(guild_id, user_id),
+            max_concurrency=max_concurrency,
+        )
+
+    async def user(self, user: snowflakes.SnowflakeishOr[users_.PartialUser], /) -> users_.User:
+        user_id = snowflakes.Snowflake(user)
+        if (cached_user := self._cache.get_user(user_id)) is not None:
+            return cached_user
+
+        return await self._fetch(("user", user_id), self._rest.fetch_user, user_id)
+
+    async def users(
+        self,
+        users: typing.Iterable[snowflakes.SnowflakeishOr[users_.PartialUser]],
+        /,
+        *,
+        max_concurrency: int = 10,
+    ) -> typing.Mapping[snowflakes.Snowflake, users_.User]:
+        return await self._resolve_many(users, self._cache.get_user, self.user, max_concurrency=max_concurrency)
+
+    async def _fetch(
+        self,
+        key: _KeyT,
+        fetcher: typing.Callable[..., typing.Coroutine[typing.Any, typing.Any, _T]],
+        *args: snowflakes.Snowflake,
+    ) -> _T:
+        # Concurrent calls for the same entity share a single fetch. It is shielded so one caller being
+        # cancelled doesn't cancel it for the others.
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(fetcher(*args))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    async def _fetch_channel(self, channel_id: snowflakes.Snowflake, /) -> channels.PartialChannel:
+        channel = await self._rest.fetch_channel(channel_id)
+        if isinstance(channel, channels.GuildChannel):
+            self._cache.set_guild_channel(channel)
+
+        return channel
+
+    async def _fetch_emoji(
+        self, guild_id: snowflakes.Snowflake, emoji_id: snowflakes.Snowflake, /
+    ) -> emojis.KnownCustomEmoji:
+        emoji = await self._rest.fetch_emoji(guild_id, emoji_id)
+        self._cache.set_emoji(emoji)
+        return emoji
+
+    async def _fetch_member(self, guild_id: snowflakes.Snowflake, user_id: snowflakes.Snowflake, /) -> guilds.Member:
+        member = await self._rest.fetch_member(guild_id, user_id)
+        self._cache.set_member(member)
+        return member
+
+    @staticmethod
+    async def _resolve_many(
+        entities: typing.Iterable[snowflakes.SnowflakeishOr[typing.Any]],
+        get_cached: typing.Callable[[snowflakes.Snowflake], typing.Optional[_T]],
+        resolve: typing.Callable[[snowflakes.Snowflake], typing.Awaitable[_T]],
+        /,
+        *,
+        max_concurrency: int,
+    ) -> typing.Dict[snowflakes.Snowflake, _T]:
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be a POSITIVE integer")
+
+        resolved: typing.Dict[snowflakes.Snowflake, _T] = {}
+        missing: typing.Dict[snowflakes.Snowflake, None] = {}
+        for entity in entities:
+            entity_id = snowflakes.Snowflake(entity)
+            if (cached_entity := get_cached(entity_id)) is not None:
+                resolved[entity_id] = cached_entity
+            else:
+                missing[entity_id] = None
+
+        if not missing:
+            return resolved
+
+        # A fixed number of workers share the missing IDs, rather than starting a task for every ID.
+        pending = iter(missing)
+
+        async def worker() -> None:
+            for entity_id in pending:
+                try:
+                    resolved[entity_id] = await resolve(entity_id)
+                except errors.NotFoundError:
+                    pass
+
+        await aio.all_of(*(worker() for _ in range(min(max_concurrency, len(missing)))))
+        return resolved
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Basic implementation of a REST response cache."""
+
+from __future__ import annotations
+
+__all__: typing.List[str] = ["LRUResponseCache"]
+
+import typing
+
+from hikari.api import response_cache
+from hikari.internal import collections
+from hikari.internal import time
+
+if typing.TYPE_CHECKING:
+    from hikari import config
+    from hikari.internal import data_binding
+    from hikari.internal import routes
+
+    _QueryT = typing.Tuple[typing.Tuple[str, str], ...]
+    _KeyT = typing.Tuple[routes.CompiledRoute, _QueryT]
+    _ResponseT = typing.Union[data_binding.JSONObject, data_binding.JSONArray]
+    # (key, expires at, response)
+    _EntryT = typing.Tuple[_KeyT, float, _ResponseT]
+
+
+class LRUResponseCache(response_cache.ResponseCache):
+    """An in-memory REST response cache with per-route expiry times.
+
+    Once `hikari.config.ResponseCacheSettings.max_entries` responses are
+    cached, the least recently used ones are removed to make space.
+
+    Parameters
+    ----------
+    settings : hikari.config.ResponseCacheSettings
+        The settings to use.
+    """
+
+    __slots__: typing.Sequence[str] = ("_entries", "_invalidated_at", "_queries", "_settings")
+
+    def __init__(self, settings: config.ResponseCacheSettings, /) -> None:
+        self._settings = settings
+        self._entries: collections.LimitedCapacityCacheMap[_KeyT, _EntryT] = collections.LimitedCapacityCacheMap(
+            limit=settings.max_entries, on_expire=self._forget_entry
+        )
+        # When each route was last invalidated, so a response to a request made before then isn't cached.
+        self._invalidated_at: collections.LimitedCapacityCacheMap[
+            routes.CompiledRoute, float
+        ] = collections.LimitedCapacityCacheMap(limit=settings.max_entries)
+        self._queries: typing.Dict[routes.CompiledRoute, typing.Set[_QueryT]] = {}
+
+    @property
+    def settings(self) -> config.ResponseCacheSettings:
+        """Return the settings this cache uses."""
+        return self._settings
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def is_cacheable(self, route: routes.CompiledRoute, /) -> bool:
+        return route.route in self._settings.ttls
+
+    def get_response(self, route: routes.CompiledRoute, query: _QueryT, /) -> typing.Optional[_ResponseT]:
+        key = (route, query)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        del self._entries[key]
+        if entry[1] <= time.monotonic():
+            self._forget_entry(entry)
+            return None
+
+        # Re-inserting moves the entry to the end, so the least recently used entries get evicted first.
+        self._entries[key] = entry
+        return entry[2]
+
+    def set_response(
+        self, route: routes.CompiledRoute, query: _QueryT, response: _ResponseT, /, *, requested_at: float
+    ) -> None:
+        ttl = self._settings.ttls.get(route.route)
+        if ttl is None:
+            return
+
+        invalidated_at = self._invalidated_at.get(route)
+        if invalidated_at is not None and invalidated_at >= requested_at:
+            return
+
+        key = (route, query)
+        self._entries.pop(key, None)
+        self._queries.setdefault(route, set()).add(query)
+        self._entries[key] = (key, time.monotonic() + ttl, response)
+
+    def invalidate(self, route: routes.CompiledRoute, /) -> None:
+        self._invalidated_at.pop(route, None)
+        self._invalidated_at[route] = time.monotonic()
+
+        for query in self._queries.pop(route, ()):
+            del self._entries[(route, query)]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._queries.clear()
+
+    def _forget_entry(self, entry: _EntryT, /) -> None:
+        route, query = entry[0]
+        queries = self._queries.get(route)
+        if queries is not None:
+            queries.discard(query)
+            if not queries:
+                del self._queries[route]
@@ -28,7 +28,7 @@ RESTful functionality.
 
 from __future__ import annotations
 
-__all__: typing.List[str] = ["ClientCredentialsStrategy", "RESTApp", "RESTClientImpl"]
+__all__: typing.List[str] = ["ClientCredentialsStrategy", "RESTApp", "RESTClientImpl", "RESTRequestStatistics"]
 
 import asyncio
 import base64
@@ -68,6 +68,7 @@ from hikari.api import rest as rest_api
 from hikari.impl import buckets as buckets_
 from hikari.impl import entity_factory as entity_factory_impl
 from hikari.impl import rate_limits
+from hikari.impl import response_cache as response_cache_impl
 from hikari.impl import special_endpoints as special_endpoints_impl
 from hikari.internal import data_binding
 from hikari.internal import mentions
@@ -91,6 +92,8 @@ if typing.TYPE_CHECKING:
     from hikari import webhooks
     from hikari.api import cache as cache_api
     from hikari.api import entity_factory as entity_factory_
+    from hikari.api import rate_limit_store as rate_limit_store_
+    from hikari.api import response_cache as response_cache_
     from hikari.api import special_endpoints
     from hikari.interactions import base_interactions
 
@@ -113,6 +116,14 @@ _X_RATELIMIT_RESET_AFTER_HEADER: typing.Final[str] = sys.intern("X-RateLimit-Res
 _RETRY_ERROR_CODES: typing.Final[typing.Set[int]] = {500, 502, 503, 504}
 _MAX_BACKOFF_DURATION: typing.Final[int] = 16
 
+_CoalescedRequestKeyT = typing.Tuple[
+    routes.CompiledRoute,
+    typing.Tuple[typing.Tuple[str, str], ...],
+    undefined.UndefinedOr[str],
+    bool,
+    typing.Optional[str],
+]
+
 
 class ClientCredentialsStrategy(rest_api.TokenStrategy):
     """Strategy class for handling client credential OAuth2 authorization.
@@ -274,9 +285,17 @@ class RESTApp(traits.ExecutorAware):
         The executor to use for blocking file IO operations. If `builtins.None`
         is passed, then the default `concurrent.futures.ThreadPoolExecutor` for
         the `asyncio.AbstractEventLoop` will be used instead.
+    dumps : hikari.internal.data_binding.JSONEncoder
+        The JSON encoder the acquired clients should use. Defaults to
+        `hikari.internal.data_binding.default_json_dumps`, which will use
+        `orjson` if it is installed.
     http_settings : typing.Optional[hikari.config.HTTPSettings]
         HTTP settings to use. Sane defaults are used if this is
         `builtins.None`.
+    loads : hikari.internal.data_binding.JSONDecoder
+        The JSON decoder the acquired clients should use. Defaults to
+        `hikari.internal.data_binding.default_json_loads`, which will use
+        `orjson` if it is installed.
     max_rate_limit : builtins.float
         Maximum number of seconds to sleep for when rate limited. If a rate
         limit occurs that is longer than this value, then a
@@ -292,6 +311,14 @@ class RESTApp(traits.ExecutorAware):
     proxy_settings : typing.Optional[hikari.config.ProxySettings]
         Proxy settings to use. If `builtins.None` then no proxy configuration
         will be used.
+    rate_limit_store : typing.Optional[hikari.api.rate_limit_store.RateLimitStore]
+        The store to share rate limits with other processes through. As the
+        store is shared by all the acquired clients, this must only be used
+        if they all use the same token. Defaults to `builtins.None`.
+    response_cache_settings : typing.Optional[hikari.config.ResponseCacheSettings]
+        If provided, each acquired client caches the responses of `GET`
+        requests as configured by these settings, in a cache of its own.
+        Defaults to `builtins.None`, which disables caching responses.
     url : typing.Optional[builtins.str]
         The base URL for the API. You can generally leave this as being
         `builtins.None` and the correct default API base URL will be generated.
@@ -302,27 +329,39 @@ class RESTApp(traits.ExecutorAware):
     """
 
     __slots__: typing.Sequence[str] = (
+        "_dumps",
         "_executor",
         "_http_settings",
+        "_loads",
         "_max_rate_limit",
         "_max_retries",
         "_proxy_settings",
+        "_rate_limit_store",
+        "_response_cache_settings",
         "_url",
     )
 
     def __init__(
         self,
         *,
+        dumps: data_binding.JSONEncoder = data_binding.default_json_dumps,
         executor: typing.Optional[concurrent.futures.Executor] = None,
         http_settings: typing.Optional[config.HTTPSettings] = None,
+        loads: data_binding.JSONDecoder = data_binding.default_json_loads,
         max_rate_limit: float = 300,
         max_retries: int = 3,
         proxy_settings: typing.Optional[config.ProxySettings] = None,
+        rate_limit_store: typing.Optional[rate_limit_store_.RateLimitStore] = None,
+        response_cache_settings: typing.Optional[config.ResponseCacheSettings] = None,
         url: typing.Optional[str] = None,
     ) -> None:
         self._http_settings = config.HTTPSettings() if http_settings is None else http_settings
         self._proxy_settings = config.ProxySettings() if proxy_settings is None else proxy_settings
+        self._rate_limit_store = rate_limit_store
+        self._response_cache_settings = response_cache_settings
+        self._dumps = dumps
         self._executor = executor
+        self._loads = loads
         self._max_rate_limit = max_rate_limit
         self._max_retries = max_retries
         self._url = url
@@ -407,14 +446,22 @@ class RESTApp(traits.ExecutorAware):
         if token_type is None and isinstance(token, str):
             token_type = applications.TokenType.BEARER
 
+        response_cache: typing.Optional[response_cache_impl.LRUResponseCache] = None
+        if self._response_cache_settings is not None:
+            response_cache = response_cache_impl.LRUResponseCache(self._response_cache_settings)
+
         rest_client = RESTClientImpl(
             cache=None,
+            dumps=self._dumps,
             entity_factory=entity_factory,
             executor=self._executor,
             http_settings=self._http_settings,
+            loads=self._loads,
             max_rate_limit=self._max_rate_limit,
             max_retries=self._max_retries,
             proxy_settings=self._proxy_settings,
+            rate_limit_store=self._rate_limit_store,
+            response_cache=response_cache,
             token=token,
             token_type=token_type,
             rest_url=self._url,
@@ -437,11 +484,19 @@ class _LiveAttributes:
     # We've been told in DAPI that this is per token.
     global_rate_limit: rate_limits.ManualRateLimiter = attr.field()
     tcp_connector: aiohttp.TCPConnector = attr.field()
+    coalesced_requests: typing.Dict[
+        _CoalescedRequestKeyT, asyncio.Task[typing.Union[None, data_binding.JSONObject, data_binding.JSONArray]]
+    ] = attr.field(factory=dict, init=False)
     is_closing: bool = attr.field(default=False, init=False)
 
     @classmethod
     def build(
-        cls, max_rate_limit: float, http_settings: config.HTTPSettings, proxy_settings: config.ProxySettings
+        cls,
+        max_rate_limit: float,
+        http_settings: config.HTTPSettings,
+        proxy_settings: config.ProxySettings,
+        dumps: data_binding.JSONEncoder,
+        rate_limit_store: typing.Optional[rate_limit_store_.RateLimitStore] = None,
     ) -> _LiveAttributes:
         """Build a live attributes object.
 
@@ -461,10 +516,13 @@ class _LiveAttributes:
             http_settings=http_settings,
             raise_for_status=False,
             trust_env=proxy_settings.trust_env,
+            json_serialize=dumps,
         )
         _LOGGER.log(ux.TRACE, "acquired new aiohttp client session")
         return _LiveAttributes(
-            buckets=buckets_.RESTBucketManager(max_rate_limit),
+            buckets=buckets_.RESTBucketManager(
+                max_rate_limit, concurrent_requests=http_settings.concurrent_bucket_requests, store=rate_limit_store
+            ),
             client_session=client_session,
             closed_event=asyncio.Event(),
             global_rate_limit=rate_limits.ManualRateLimiter(),
@@ -487,6 +545,36 @@ class _LiveAttributes:
         return self
 
 
+@attr.define(kw_only=True, weakref_slot=False)
+class RESTRequestStatistics:
+    """Running counters for the requests made by a REST client.
+
+    These are kept for the lifetime of the client, including over restarts.
+    """
+
+    single_flight_requests: int = attr.field(default=0)
+    """Number of `GET` requests which went through the single-flight layer.
+
+    This is always `0` unless `hikari.config.HTTPSettings.coalesce_get_requests`
+    is enabled.
+    """
+
+    coalesced_requests: int = attr.field(default=0)
+    """Number of `GET` requests which shared an identical request already in flight.
+
+    Each of these saved sending an HTTP request and using up bucket quota.
+    """
+
+    response_cache_hits: int = attr.field(default=0)
+    """Number of `GET` requests which were answered from the response cache.
+
+    This is always `0` unless the client has a response cache.
+    """
+
+    response_cache_misses: int = attr.field(default=0)
+    """Number of cacheable `GET` requests which were not in the response cache."""
+
+
 class RESTClientImpl(rest_api.RESTClient):
     """Implementation of the V8-compatible Discord HTTP API.
 
@@ -496,11 +584,17 @@ class RESTClientImpl(rest_api.RESTClient):
 
     Parameters
     ----------
+    dumps : hikari.internal.data_binding.JSONEncoder
+        The JSON encoder to use for request bodies. Defaults to
+        `hikari.internal.data_binding.default_json_dumps`.
     entity_factory : hikari.api.entity_factory.EntityFactory
         The entity factory to use.
     executor : typing.Optional[concurrent.futures.Executor]
         The executor to use for blocking IO. Defaults to the `asyncio` thread
         pool if set to `builtins.None`.
+    loads : hikari.internal.data_binding.JSONDecoder
+        The JSON decoder to use for response bodies. Defaults to
+        `hikari.internal.data_binding.default_json_loads`.
     max_rate_limit : builtins.float
         Maximum number of seconds to sleep for when rate limited. If a rate
         limit occurs that is longer than this value, then a
@@ -511,6 +605,14 @@ class RESTClientImpl(rest_api.RESTClient):
     max_retries : typing.Optional[builtins.int]
         Maximum number of times a request will be retried if
         it fails with a `5xx` status. Defaults to 3 if set to `builtins.None`.
+    rate_limit_store : typing.Optional[hikari.api.rate_limit_store.RateLimitStore]
+        The store to share rate limits with other processes using the same
+        token through. Defaults to `builtins.None`, which only enforces the
+        rate limits this client knows about.
+    response_cache : typing.Optional[hikari.api.response_cache.ResponseCache]
+        The cache to keep the responses of `GET` requests in. This must not be
+        shared with a client using a different token. Defaults to
+        `builtins.None`, which disables caching responses.
     token : typing.Union[builtins.str, builtins.None, hikari.api.rest.TokenStrategy]
         The bot or bearer token. If no token is to be used,
         this can be undefined.
@@ -535,13 +637,18 @@ class RESTClientImpl(rest_api.RESTClient):
 
     __slots__: typing.Sequence[str] = (
         "_cache",
+        "_dumps",
         "_entity_factory",
         "_executor",
         "_http_settings",
         "_live_attributes",
+        "_loads",
         "_max_rate_limit",
         "_max_retries",
         "_proxy_settings",
+        "_rate_limit_store",
+        "_request_statistics",
+        "_response_cache",
         "_rest_url",
         "_token",
         "_token_type",
@@ -555,12 +662,16 @@ class RESTClientImpl(rest_api.RESTClient):
         self,
         *,
         cache: typing.Optional[cache_api.MutableCache],
+        dumps: data_binding.JSONEncoder = data_binding.default_json_dumps,
         entity_factory: entity_factory_.EntityFactory,
         executor: typing.Optional[concurrent.futures.Executor],
         http_settings: config.HTTPSettings,
+        loads: data_binding.JSONDecoder = data_binding.default_json_loads,
         max_rate_limit: float,
         max_retries: int = 3,
         proxy_settings: config.ProxySettings,
+        rate_limit_store: typing.Optional[rate_limit_store_.RateLimitStore] = None,
+        response_cache: typing.Optional[response_cache_.ResponseCache] = None,
         token: typing.Union[str, None, rest_api.TokenStrategy],
         token_type: typing.Union[applications.TokenType, str, None],
         rest_url: typing.Optional[str],
@@ -569,13 +680,18 @@ class RESTClientImpl(rest_api.RESTClient):
             raise ValueError("'max_retries' must be below or equal to 5")
 
         self._cache = cache
+        self._dumps = dumps
         self._entity_factory = entity_factory
         self._executor = executor
         self._http_settings = http_settings
         self._live_attributes: typing.Optional[_LiveAttributes] = None
+        self._loads = loads
         self._max_rate_limit = max_rate_limit
         self._max_retries = max_retries
         self._proxy_settings = proxy_settings
+        self._rate_limit_store = rate_limit_store
+        self._request_statistics = RESTRequestStatistics()
+        self._response_cache = response_cache
 
         self._token: typing.Union[str, rest_api.TokenStrategy, None] = None
         self._token_type: typing.Optional[str] = None
@@ -607,6 +723,17 @@ class RESTClientImpl(rest_api.RESTClient):
     def proxy_settings(self) -> config.ProxySettings:
         return self._proxy_settings
 
+    @property
+    def request_statistics(self) -> RESTRequestStatistics:
+        """Counters for the requests this client has made.
+
+        Returns
+        -------
+        RESTRequestStatistics
+            The counters, which are updated in place as requests are made.
+        """
+        return self._request_statistics
+
     @property
     def token_type(self) -> typing.Union[str, applications.TokenType, None]:
         return self._token_type
@@ -641,7 +768,13 @@ class RESTClientImpl(rest_api.RESTClient):
         if self._live_attributes:
             raise errors.ComponentStateConflictError("Cannot start a REST Client which is already alive")
 
-        self._live_attributes = _LiveAttributes.build(self._max_rate_limit, self._http_settings, self._proxy_settings)
+        self._live_attributes = _LiveAttributes.build(
+            self._max_rate_limit,
+            self._http_settings,
+            self._proxy_settings,
+            self._dumps,
+            rate_limit_store=self._rate_limit_store,
+        )
 
     def _get_live_attributes(self) -> _LiveAttributes:
         if self._live_attributes:
@@ -691,6 +824,79 @@ class RESTClientImpl(rest_api.RESTClient):
     ) -> typing.Union[None, data_binding.JSONObject, data_binding.JSONArray]:
         # Make a ratelimit-protected HTTP request to a JSON endpoint and expect some form
         # of JSON response.
+        if compiled_route.method != routes.GET or form is not None or json is not None:
+            return await self._perform_request(
+                compiled_route, query=query, form=form, json=json, reason=reason, no_auth=no_auth, auth=auth
+            )
+
+        # Only requests made with our own token may be cached, as the cache isn't keyed by who made them.
+        response_cache = self._response_cache
+        if response_cache is None or no_auth or auth is not None or not response_cache.is_cacheable(compiled_route):
+            return await self._perform_get_request(
+                compiled_route, query=query, reason=reason, no_auth=no_auth, auth=auth
+            )
+
+        query_key = tuple(query.items()) if query else ()
+        response = response_cache.get_response(compiled_route, query_key)
+        if response is not None:
+            self._request_statistics.response_cache_hits += 1
+            return response
+
+        self._request_statistics.response_cache_misses += 1
+        requested_at = time.monotonic()
+        response = await self._perform_get_request(
+            compiled_route, query=query, reason=reason, no_auth=no_auth, auth=auth
+        )
+
+        if response is not None:
+            response_cache.set_response(compiled_route, query_key, response, requested_at=requested_at)
+
+        return response
+
+    @typing.final
+    async def _perform_get_request(
+        self,
+        compiled_route: routes.CompiledRoute,
+        *,
+        query: typing.Optional[data_binding.StringMapBuilder],
+        reason: undefined.UndefinedOr[str],
+        no_auth: bool,
+        auth: typing.Optional[str],
+    ) -> typing.Union[None, data_binding.JSONObject, data_binding.JSONArray]:
+        if not self._http_settings.coalesce_get_requests:
+            return await self._perform_request(compiled_route, query=query, reason=reason, no_auth=no_auth, auth=auth)
+
+        # Identical GET requests share a single request which is in flight and its decoded response. This
+        # runs in its own task so that cancelling the caller which started it doesn't cancel it for everyone
+        # else waiting on it.
+        live_attributes = self._get_live_attributes()
+        key = (compiled_route, tuple(query.items()) if query else (), reason, no_auth, auth)
+        self._request_statistics.single_flight_requests += 1
+
+        if (task := live_attributes.coalesced_requests.get(key)) is not None:
+            self._request_statistics.coalesced_requests += 1
+
+        else:
+            task = asyncio.create_task(
+                self._perform_request(compiled_route, query=query, reason=reason, no_auth=no_auth, auth=auth)
+            )
+            live_attributes.coalesced_requests[key] = task
+            task.add_done_callback(lambda _: live_attributes.coalesced_requests.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    @typing.final
+    async def _perform_request(
+        self,
+        compiled_route: routes.CompiledRoute,
+        *,
+        query: typing.Optional[data_binding.StringMapBuilder] = None,
+        form: typing.Optional[aiohttp.FormData] = None,
+        json: typing.Union[data_binding.JSONObjectBuilder, data_binding.JSONArray, None] = None,
+        reason: undefined.UndefinedOr[str] = undefined.UNDEFINED,
+        no_auth: bool = False,
+        auth: typing.Optional[str] = None,
+    ) -> typing.Union[None, data_binding.JSONObject, data_binding.JSONArray]:
         live_attributes = self._get_live_attributes()
         headers = data_binding.StringMapBuilder()
         headers.setdefault(_USER_AGENT_HEADER, _HTTP_USER_AGENT)
@@ -719,7 +925,9 @@ class RESTClientImpl(rest_api.RESTClient):
         while True:
             try:
                 uuid = time.uuid()
-                async with live_attributes.still_alive().buckets.acquire(compiled_route):
+                async with live_attributes.still_alive().buckets.acquire(
+                    compiled_route, use_global_rate_limit=not no_auth
+                ):
                     # Buckets not using authentication still have a global
                     # rate limit, but it is different from the token one.
                     if not no_auth:
@@ -774,7 +982,7 @@ class RESTClientImpl(rest_api.RESTClient):
                 if 200 <= response.status < 300:
                     if response.content_type == _APPLICATION_JSON:
                         # Only deserializing here stops Cloudflare shenanigans messing us around.
-                        return data_binding.load_json(await response.read())
+                        return self._loads(await response.read())
 
                     real_url = str(response.real_url)
                     raise errors.HTTPError(f"Expected JSON [{response.content_type=}, {real_url=}]")
@@ -892,7 +1100,7 @@ class RESTClientImpl(rest_api.RESTClient):
                 f"received rate limited response with unexpected response type {response.content_type}",
             )
 
-        body = await response.json()
+        body = await response.json(loads=self._loads)
         body_retry_after = float(body["retry_after"])
 
         if body.get("global", False) is True:
@@ -901,6 +1109,7 @@ class RESTClientImpl(rest_api.RESTClient):
                 "contacting Discord to raise this limit. Backing off and retrying request..."
             )
             live_attributes.still_alive().global_rate_limit.throttle(body_retry_after)
+            live_attributes.still_alive().buckets.throttle_global(body_retry_after)
             raise self._RetryRequest
 
         # If the values are within 20% of each other by relativistic tolerance, it is probably
@@ -1296,7 +1505,7 @@ class RESTClientImpl(rest_api.RESTClient):
 
         if final_attachments:
             form = data_binding.URLEncodedForm()
-            form.add_field("payload_json", data_binding.dump_json(body), content_type=_APPLICATION_JSON)
+            form.add_field("payload_json", self._dumps(body), content_type=_APPLICATION_JSON)
 
             stack = contextlib.AsyncExitStack()
 
@@ -1488,7 +1697,7 @@ class RESTClientImpl(rest_api.RESTClient):
 
         if final_attachments:
             form = data_binding.URLEncodedForm()
-            form.add_field("payload_json", data_binding.dump_json(body), content_type=_APPLICATION_JSON)
+            form.add_field("payload_json", self._dumps(body), content_type=_APPLICATION_JSON)
 
             stack = contextlib.AsyncExitStack()
             try:
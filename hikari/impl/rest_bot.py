@@ -38,6 +38,7 @@ from hikari.impl import entity_factory as entity_factory_impl
 from hikari.impl import interaction_server as interaction_server_impl
 from hikari.impl import rest as rest_impl
 from hikari.internal import aio
+from hikari.internal import data_binding
 from hikari.internal import ux
 
 if typing.TYPE_CHECKING:
@@ -47,6 +48,7 @@ if typing.TYPE_CHECKING:
 
     from hikari import applications
     from hikari.api import entity_factory as entity_factory_api
+    from hikari.api import rate_limit_store as rate_limit_store_
     from hikari.api import rest as rest_api
     from hikari.api import special_endpoints
     from hikari.interactions import base_interactions
@@ -112,11 +114,19 @@ class RESTBot(traits.RESTBotAware, interaction_server_.InteractionServer):
         will __force__ colour to be used in console-based output. Specifying a
         `"CLICOLOR_FORCE"` environment variable with a non-`"0"` value will
         override this setting.
+    dumps : hikari.internal.data_binding.JSONEncoder
+        The JSON encoder to use for REST and interaction payloads. Defaults to
+        `hikari.internal.data_binding.default_json_dumps`, which will use
+        `orjson` if it is installed.
     http_settings : typing.Optional[hikari.config.HTTPSettings]
         Optional custom HTTP configuration settings to use. Allows you to
         customise functionality such as whether SSL-verification is enabled,
         what timeouts `aiohttp` should expect to use for requests, and behavior
         regarding HTTP-redirects.
+    loads : hikari.internal.data_binding.JSONDecoder
+        The JSON decoder to use for REST and interaction payloads. Defaults to
+        `hikari.internal.data_binding.default_json_loads`, which will use
+        `orjson` if it is installed.
     logs : typing.Union[builtins.None, LoggerLevel, typing.Dict[str, typing.Any]]
         Defaults to `"INFO"`.
 
@@ -164,6 +174,10 @@ class RESTBot(traits.RESTBotAware, interaction_server_.InteractionServer):
         This may be a hex encoded `builtins.str` or the raw `builtins.bytes`.
         If left as `builtins.None` then the client will try to work this value
         out based on `token`.
+    rate_limit_store : typing.Optional[hikari.api.rate_limit_store.RateLimitStore]
+        If provided, the REST rate limits are shared through this store with
+        other processes using the same token, such as other clusters or a
+        separate interaction server. Defaults to `builtins.None`.
     rest_url : typing.Optional[builtins.str]
         Defaults to the Discord REST API URL if `builtins.None`. Can be
         overridden if you are attempting to point to an unofficial endpoint, or
@@ -201,11 +215,14 @@ class RESTBot(traits.RESTBotAware, interaction_server_.InteractionServer):
         banner: typing.Optional[str] = "hikari",
         executor: typing.Optional[concurrent.futures.Executor] = None,
         force_color: bool = False,
+        dumps: data_binding.JSONEncoder = data_binding.default_json_dumps,
         http_settings: typing.Optional[config.HTTPSettings] = None,
+        loads: data_binding.JSONDecoder = data_binding.default_json_loads,
         logs: typing.Union[None, int, str, typing.Dict[str, typing.Any]] = "INFO",
         max_rate_limit: float = 300.0,
         max_retries: int = 3,
         proxy_settings: typing.Optional[config.ProxySettings] = None,
+        rate_limit_store: typing.Optional[rate_limit_store_.RateLimitStore] = None,
         rest_url: typing.Optional[str] = None,
     ) -> None:
         ...
@@ -221,11 +238,14 @@ class RESTBot(traits.RESTBotAware, interaction_server_.InteractionServer):
         banner: typing.Optional[str] = "hikari",
         executor: typing.Optional[concurrent.futures.Executor] = None,
         force_color: bool = False,
+        dumps: data_binding.JSONEncoder = data_binding.default_json_dumps,
         http_settings: typing.Optional[config.HTTPSettings] = None,
+        loads: data_binding.JSONDecoder = data_binding.default_json_loads,
         logs: typing.Union[None, int, str, typing.Dict[str, typing.Any]] = "INFO",
         max_rate_limit: float = 300.0,
         max_retries: int = 3,
         proxy_settings: typing.Optional[config.ProxySettings] = None,
+        rate_limit_store: typing.Optional[rate_limit_store_.RateLimitStore] = None,
         rest_url: typing.Optional[str] = None,
     ) -> None:
         ...
@@ -240,11 +260,14 @@ class RESTBot(traits.RESTBotAware, interaction_server_.InteractionServer):
         banner: typing.Optional[str] = "hikari",
         executor: typing.Optional[concurrent.futures.Executor] = None,
         force_color: bool = False,
+        dumps: data_binding.JSONEncoder = data_binding.default_json_dumps,
         http_settings: typing.Optional[config.HTTPSettings] = None,
+        loads: data_binding.JSONDecoder = data_binding.default_json_loads,
         logs: typing.Union[None, int, str, typing.Dict[str, typing.Any]] = "INFO",
         max_rate_limit: float = 300.0,
         max_retries: int = 3,
         proxy_settings: typing.Optional[config.ProxySettings] = None,
+        rate_limit_store: typing.Optional[rate_limit_store_.RateLimitStore] = None,
         rest_url: typing.Optional[str] = None,
     ) -> None:
         if isinstance(public_key, str):
@@ -267,12 +290,15 @@ class RESTBot(traits.RESTBotAware, interaction_server_.InteractionServer):
         # RESTful API.
         self._rest = rest_impl.RESTClientImpl(
             cache=None,
+            dumps=dumps,
             entity_factory=self._entity_factory,
             executor=self._executor,
             http_settings=self._http_settings,
+            loads=loads,
             max_rate_limit=max_rate_limit,
             max_retries=max_retries,
             proxy_settings=self._proxy_settings,
+            rate_limit_store=rate_limit_store,
             rest_url=rest_url,
             token=token,
             token_type=token_type,
@@ -280,7 +306,9 @@ class RESTBot(traits.RESTBotAware, interaction_server_.InteractionServer):
 
         # IntegrationServer
         self._server = interaction_server_impl.InteractionServer(
+            dumps=dumps,
             entity_factory=self._entity_factory,
+            loads=loads,
             public_key=public_key,
             rest_client=self._rest,
         )
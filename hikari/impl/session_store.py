@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Basic implementation of a gateway session store."""
+
+from __future__ import annotations
+
+__all__: typing.List[str] = ["FileSessionStore"]
+
+import asyncio
+import os
+import pathlib
+import typing
+
+from hikari import snowflakes
+from hikari.api import session_store
+from hikari.internal import data_binding
+
+if typing.TYPE_CHECKING:
+    import concurrent.futures
+
+
+class FileSessionStore(session_store.SessionStore):
+    """A session store which keeps each shard's session in a file in a local directory.
+
+    Each shard gets its own file, so multiple processes running different
+    shards may safely share the same directory.
+
+    Parameters
+    ----------
+    path : typing.Union[builtins.str, os.PathLike[builtins.str]]
+        The directory to store the sessions in. This will be created if it
+        does not exist.
+
+    Other Parameters
+    ----------------
+    executor : typing.Optional[concurrent.futures.Executor]
+        The executor to run file IO in. Defaults to `builtins.None`, which
+        uses the default executor of the running event loop.
+    """
+
+    __slots__: typing.Sequence[str] = ("_executor", "_path")
+
+    def __init__(
+        self,
+        path: typing.Union[str, os.PathLike[str]],
+        /,
+        *,
+        executor: typing.Optional[concurrent.futures.Executor] = None,
+    ) -> None:
+        self._executor = executor
+        self._path = pathlib.Path(path)
+
+    @property
+    def path(self) -> pathlib.Path:
+        """Directory the sessions are stored in."""
+        return self._path
+
+    async def load_session(self, shard_id: int, shard_count: int, /) -> typing.Optional[session_store.GatewaySession]:
+        loop = asyncio.get_running_loop()
+        session = await loop.run_in_executor(self._executor, self._read, shard_id)
+
+        # A session file which was moved or renamed may belong to another shard.
+        if session is None or session.shard_id != shard_id or session.shard_count != shard_count:
+            return None
+
+        return session
+
+    async def save_session(self, session: session_store.GatewaySession, /) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._write, session)
+
+    async def delete_session(self, shard_id: int, /) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._delete, shard_id)
+
+    def _file(self, shard_id: int, /) -> pathlib.Path:
+        return self._path / f"shard-{shard_id}.json"
+
+    def _read(self, shard_id: int, /) -> typing.Optional[session_store.GatewaySession]:
+        try:
+            payload = data_binding.default_json_loads(self._file(shard_id).read_bytes())
+            if not isinstance(payload, dict):
+                return None
+
+            return session_store.GatewaySession(
+                shard_id=int(payload["shard_id"]),
+                shard_count=int(payload["shard_count"]),
+                session_id=payload["session_id"],
+                seq=int(payload["seq"]),
+                user_id=snowflakes.Snowflake(payload["user_id"]),
+            )
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError):
+            # A corrupt session file is no worse than a missing one; the shard will identify instead.
+            return None
+
+    def _write(self, session: session_store.GatewaySession, /) -> None:
+        payload = {
+            "shard_id": session.shard_id,
+            "shard_count": session.shard_count,
+            "session_id": session.session_id,
+            "seq": session.seq,
+            "user_id": str(session.user_id),
+        }
+        self._path.mkdir(parents=True, exist_ok=True)
+        file = self._file(session.shard_id)
+        # Write to a temporary file first so that a crash never leaves a partially written session behind.
+        temp_file = file.with_suffix(".tmp")
+        temp_file.write_text(data_binding.default_json_dumps(payload), encoding="utf-8")
+        os.replace(temp_file, file)
+
+    def _delete(self, shard_id: int, /) -> None:
+        try:
+            self._file(shard_id).unlink()
+        except FileNotFoundError:
+            pass
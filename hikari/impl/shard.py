@@ -24,7 +24,7 @@
 
 from __future__ import annotations
 
-__all__: typing.List[str] = ["GatewayShardImpl"]
+__all__: typing.List[str] = ["GatewayShardImpl", "GatewayTransportStatistics"]
 
 import asyncio
 import contextlib
@@ -36,6 +36,7 @@ import urllib.parse
 import zlib
 
 import aiohttp
+import attr
 
 from hikari import _about as about
 from hikari import errors
@@ -43,9 +44,11 @@ from hikari import intents as intents_
 from hikari import presences
 from hikari import snowflakes
 from hikari import undefined
+from hikari.api import session_store
 from hikari.api import shard
 from hikari.impl import rate_limits
 from hikari.internal import data_binding
+from hikari.internal import etf
 from hikari.internal import net
 from hikari.internal import time
 from hikari.internal import ux
@@ -54,7 +57,6 @@ if typing.TYPE_CHECKING:
     import datetime
 
     import aiohttp.http_websocket
-    import aiohttp.typedefs
 
     from hikari import channels
     from hikari import config
@@ -98,6 +100,10 @@ _TOTAL_RATELIMIT: typing.Final[typing.Tuple[float, int]] = (60.0, 120)
 _CHUNKING_RATELIMIT: typing.Final[typing.Tuple[float, int]] = (60.0, 60)
 # Supported gateway version
 _VERSION: int = 8
+# Suffix which marks the end of a zlib-stream payload
+_ZLIB_SUFFIX: typing.Final[bytes] = b"\x00\x00\xff\xff"
+# Size the zlib-stream buffer is trimmed back down to after an oversized payload
+_ZLIB_BUFFER_RETAIN_SIZE: typing.Final[int] = 64 * 1024
 
 
 def _log_filterer(token: str) -> typing.Callable[[str], str]:
@@ -107,11 +113,54 @@ def _log_filterer(token: str) -> typing.Callable[[str], str]:
     return filterer
 
 
+def _payload_to_str(payload: typing.Union[str, bytes], /) -> str:
+    if isinstance(payload, str):
+        return payload
+
+    try:
+        return payload.decode("utf-8")
+    except UnicodeDecodeError:
+        # ETF payloads always start with a byte which is invalid UTF-8.
+        return repr(payload)
+
+
 if typing.TYPE_CHECKING:
     # noinspection PyProtectedMember,PyUnresolvedReferences
     _ZlibDecompressor = zlib._Decompress
 
 
+@attr.define(kw_only=True, weakref_slot=False)
+class GatewayTransportStatistics:
+    """Running counters for the compressed payloads received by a shard.
+
+    These are kept for the lifetime of the shard, including over reconnects.
+    """
+
+    inflated_payloads: int = attr.field(default=0)
+    """Number of zlib-stream payloads which have been inflated."""
+
+    compressed_bytes: int = attr.field(default=0)
+    """Total size of the payloads received before inflating them."""
+
+    inflated_bytes: int = attr.field(default=0)
+    """Total size of the payloads after inflating them."""
+
+    inflate_time_ns: int = attr.field(default=0)
+    """Total time spent inflating payloads, in nanoseconds."""
+
+    @property
+    def inflate_time(self) -> float:
+        """Total time spent inflating payloads, in seconds."""
+        return self.inflate_time_ns / 1_000_000_000
+
+    def record(self, compressed_size: int, inflated_size: int, time_taken_ns: int) -> None:
+        """Add an inflated payload to the counters."""
+        self.inflated_payloads += 1
+        self.compressed_bytes += compressed_size
+        self.inflated_bytes += inflated_size
+        self.inflate_time_ns += time_taken_ns
+
+
 @typing.final
 class _GatewayTransport(aiohttp.ClientWebSocketResponse):
     """Internal component to handle lower-level communication logic.
@@ -123,18 +172,32 @@ class _GatewayTransport(aiohttp.ClientWebSocketResponse):
     Payload logging is also performed here.
     """
 
-    __slots__: typing.Sequence[str] = ("zlib", "logger", "log_filterer", "sent_close")
+    __slots__: typing.Sequence[str] = (
+        "zlib",
+        "zlib_buffer",
+        "logger",
+        "log_filterer",
+        "sent_close",
+        "statistics",
+        "transport_compression",
+    )
 
     # Initialized from `connect'
     zlib: _ZlibDecompressor
+    zlib_buffer: bytearray
     logger: logging.Logger
     log_filterer: typing.Callable[[str], str]
     sent_close: bool
+    statistics: GatewayTransportStatistics
+    transport_compression: bool
 
     def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None:
         super().__init__(*args, **kwargs)
         self.zlib = zlib.decompressobj()
+        self.zlib_buffer = bytearray()
         self.sent_close = False
+        self.statistics = GatewayTransportStatistics()
+        self.transport_compression = True
 
     async def send_close(self, *, code: int = 1000, message: bytes = b"") -> bool:
         # aiohttp may close the socket by invoking close() internally. By giving
@@ -152,16 +215,22 @@ class _GatewayTransport(aiohttp.ClientWebSocketResponse):
                 self.logger.debug("failed to send close frame in time, probably connection issues")
         return False
 
-    async def receive_json(
+    async def receive_payload(
         self,
         *,
-        loads: aiohttp.typedefs.JSONDecoder = data_binding.load_json,
+        loads: typing.Union[data_binding.JSONDecoder, etf.ETFDecoder] = data_binding.default_json_loads,
         timeout: typing.Optional[float] = None,
     ) -> typing.Any:
         pl = await self._receive_and_check(timeout)
         if self.logger.isEnabledFor(ux.TRACE):
-            filtered = self.log_filterer(pl)  # type: ignore
+            filtered = self.log_filterer(_payload_to_str(pl))  # type: ignore
             self.logger.log(ux.TRACE, "received payload with size %s\n    %s", len(pl), filtered)
+
+        if isinstance(pl, str):
+            # Text frames are only sent when transport compression is disabled. Both the JSON and ETF
+            # decoders accept bytes, while the ETF decoder can't handle a str.
+            pl = pl.encode("utf-8")
+
         return loads(pl)
 
     async def send_json(
@@ -169,16 +238,23 @@ class _GatewayTransport(aiohttp.ClientWebSocketResponse):
         data: data_binding.JSONObject,
         compress: typing.Optional[int] = None,
         *,
-        dumps: aiohttp.typedefs.JSONEncoder = data_binding.dump_json,
+        dumps: typing.Union[data_binding.JSONEncoder, etf.ETFEncoder] = data_binding.default_json_dumps,
     ) -> None:
         pl = dumps(data)
         if self.logger.isEnabledFor(ux.TRACE):
-            filtered = self.log_filterer(pl)  # type: ignore
+            filtered = self.log_filterer(_payload_to_str(pl))  # type: ignore
             self.logger.log(ux.TRACE, "sending payload with size %s\n    %s", len(pl), filtered)
-        await self.send_str(pl, compress)
 
-    async def _receive_and_check(self, timeout: typing.Optional[float], /) -> str:
-        buff = bytearray()
+        if isinstance(pl, bytes):
+            await self.send_bytes(pl, compress)
+        else:
+            await self.send_str(pl, compress)
+
+    async def _receive_and_check(self, timeout: typing.Optional[float], /) -> typing.Union[str, bytes]:
+        # The buffer is reused between payloads and only the amount of it in use is tracked, which
+        # avoids reallocating it for every payload that is split over multiple frames.
+        buff = self.zlib_buffer
+        buff_size = 0
 
         while True:
             message = await self.receive(timeout)
@@ -204,14 +280,35 @@ class _GatewayTransport(aiohttp.ClientWebSocketResponse):
                 # network drivers appear to do this.
                 raise errors.GatewayConnectionError("Socket has closed")
 
-            elif len(buff) != 0 and message.type != aiohttp.WSMsgType.BINARY:
+            elif buff_size != 0 and message.type != aiohttp.WSMsgType.BINARY:
                 raise errors.GatewayError(f"Unexpected message type received {message.type.name}, expected BINARY")
 
             elif message.type == aiohttp.WSMsgType.BINARY:
-                buff.extend(message.data)
+                data: bytes = message.data
+
+                if not self.transport_compression:
+                    # Uncompressed binary frames only occur when using ETF.
+                    return data
+
+                if buff_size == 0 and data.endswith(_ZLIB_SUFFIX):
+                    # Most payloads fit in a single frame, in which case there is no need to
+                    # copy them into the buffer first.
+                    return self._inflate(data)
+
+                end = buff_size + len(data)
+                buff[buff_size:end] = data
+                buff_size = end
 
-                if buff.endswith(b"\x00\x00\xff\xff"):
-                    return self.zlib.decompress(buff).decode("utf-8")
+                if buff.endswith(_ZLIB_SUFFIX, 0, buff_size):
+                    with memoryview(buff) as view, view[:buff_size] as payload:
+                        result = self._inflate(payload)
+
+                    if len(buff) > _ZLIB_BUFFER_RETAIN_SIZE:
+                        # Don't keep the memory used by an unusually large payload (e.g. a big
+                        # GUILD_CREATE) around for the rest of the connection.
+                        del buff[_ZLIB_BUFFER_RETAIN_SIZE:]
+
+                    return result
 
             elif message.type == aiohttp.WSMsgType.TEXT:
                 return message.data  # type: ignore
@@ -226,6 +323,13 @@ class _GatewayTransport(aiohttp.ClientWebSocketResponse):
                 )
                 raise errors.GatewayError("Unexpected websocket exception from gateway") from ex
 
+    def _inflate(self, payload: typing.Union[bytes, memoryview], /) -> bytes:
+        # The inflated bytes are handed straight to the JSON decoder, so we never decode them to a str.
+        start = time.monotonic_ns()
+        result = self.zlib.decompress(payload)
+        self.statistics.record(len(payload), len(result), time.monotonic_ns() - start)
+        return result
+
     @classmethod
     @contextlib.asynccontextmanager
     async def connect(
@@ -235,6 +339,8 @@ class _GatewayTransport(aiohttp.ClientWebSocketResponse):
         logger: logging.Logger,
         proxy_settings: config.ProxySettings,
         log_filterer: typing.Callable[[str], str],
+        statistics: GatewayTransportStatistics,
+        transport_compression: bool,
         url: str,
     ) -> typing.AsyncGenerator[_GatewayTransport, None]:
         """Generate a single-use websocket connection.
@@ -272,6 +378,8 @@ class _GatewayTransport(aiohttp.ClientWebSocketResponse):
                 # which enables people to send me logs in issues safely.
                 # Also MyPy raises a false positive about this...
                 web_socket.log_filterer = log_filterer  # type: ignore
+                web_socket.statistics = statistics
+                web_socket.transport_compression = transport_compression
 
                 yield web_socket
             except errors.GatewayError:
@@ -368,8 +476,20 @@ class GatewayShardImpl(shard.GatewayShard):
     proxy_settings : hikari.config.ProxySettings
         The proxy settings to use while negotiating a websocket.
     data_format : builtins.str
-        Data format to use for inbound data. Only supported format is
-        `"json"`.
+        Data format to use for gateway payloads. Supported formats are
+        `"json"` and `"etf"`. Defaults to `"json"`.
+    dumps : hikari.internal.data_binding.JSONEncoder
+        The JSON encoder to use for outbound payloads. Defaults to
+        `hikari.internal.data_binding.default_json_dumps`. This is ignored
+        when `data_format` is `"etf"`.
+    loads : hikari.internal.data_binding.JSONDecoder
+        The JSON decoder to use for inbound payloads. Defaults to
+        `hikari.internal.data_binding.default_json_loads`. This is ignored
+        when `data_format` is `"etf"`.
+    session : typing.Optional[hikari.api.session_store.GatewaySession]
+        A previous session to resume instead of identifying with a new
+        session. If the session can no longer be resumed, the shard will
+        identify as normal. Defaults to `builtins.None`.
 
     !!! note
         If all four of `initial_activity`, `initial_idle_since`,
@@ -385,9 +505,11 @@ class GatewayShardImpl(shard.GatewayShard):
 
     __slots__: typing.Sequence[str] = (
         "_activity",
+        "_close_code",
         "_closed_event",
         "_closing_event",
         "_chunking_rate_limit",
+        "_dumps",
         "_event_manager",
         "_event_factory",
         "_handshake_completed",
@@ -399,6 +521,7 @@ class GatewayShardImpl(shard.GatewayShard):
         "_large_threshold",
         "_last_heartbeat_ack_received",
         "_last_heartbeat_sent",
+        "_loads",
         "_logger",
         "_proxy_settings",
         "_run_task",
@@ -409,6 +532,8 @@ class GatewayShardImpl(shard.GatewayShard):
         "_status",
         "_token",
         "_total_rate_limit",
+        "_transport_compression",
+        "_transport_statistics",
         "_url",
         "_user_id",
         "_ws",
@@ -429,13 +554,24 @@ class GatewayShardImpl(shard.GatewayShard):
         http_settings: config.HTTPSettings,
         proxy_settings: config.ProxySettings,
         data_format: str = shard.GatewayDataFormat.JSON,
+        dumps: data_binding.JSONEncoder = data_binding.default_json_dumps,
+        loads: data_binding.JSONDecoder = data_binding.default_json_loads,
+        session: typing.Optional[session_store.GatewaySession] = None,
         event_manager: event_manager_.EventManager,
         event_factory: event_factory_.EventFactory,
         token: str,
         url: str,
     ) -> None:
-
-        if data_format != shard.GatewayDataFormat.JSON:
+        self._dumps: typing.Union[data_binding.JSONEncoder, etf.ETFEncoder]
+        self._loads: typing.Union[data_binding.JSONDecoder, etf.ETFDecoder]
+
+        if data_format == shard.GatewayDataFormat.JSON:
+            self._dumps = dumps
+            self._loads = loads
+        elif data_format == shard.GatewayDataFormat.ETF:
+            self._dumps = etf.default_etf_dumps
+            self._loads = etf.default_etf_loads
+        else:
             raise NotImplementedError(f"Unsupported gateway data format: {data_format}")
 
         query = {"v": _VERSION, "encoding": str(data_format)}
@@ -450,6 +586,7 @@ class GatewayShardImpl(shard.GatewayShard):
         new_query = urllib.parse.urlencode(query)
 
         self._activity = initial_activity
+        self._close_code: int = errors.ShardCloseCode.GOING_AWAY
         self._closing_event = asyncio.Event()
         self._closed_event = asyncio.Event()
         self._chunking_rate_limit = rate_limits.WindowedBurstRateLimiter(
@@ -480,10 +617,23 @@ class GatewayShardImpl(shard.GatewayShard):
             f"shard {shard_id} total rate limit",
             *_TOTAL_RATELIMIT,
         )
+        self._transport_compression = compression is not None
+        self._transport_statistics = GatewayTransportStatistics()
         self._url = urllib.parse.urlunparse((scheme, netloc, path, params, new_query, ""))
         self._user_id: typing.Optional[snowflakes.Snowflake] = None
         self._ws: typing.Optional[_GatewayTransport] = None
 
+        if session is not None:
+            if session.shard_id != shard_id or session.shard_count != shard_count:
+                raise ValueError(
+                    f"Session for shard {session.shard_id}/{session.shard_count} "
+                    f"cannot be used for shard {shard_id}/{shard_count}"
+                )
+
+            self._seq = session.seq
+            self._session_id = session.session_id
+            self._user_id = session.user_id
+
     @property
     def heartbeat_latency(self) -> float:
         return self._heartbeat_latency
@@ -500,19 +650,64 @@ class GatewayShardImpl(shard.GatewayShard):
     def is_alive(self) -> bool:
         return self._run_task is not None and not self._run_task.done()
 
+    @property
+    def session(self) -> typing.Optional[session_store.GatewaySession]:
+        """Return the current gateway session of this shard.
+
+        Returns
+        -------
+        typing.Optional[hikari.api.session_store.GatewaySession]
+            The state needed to resume the current session, or `builtins.None`
+            if the shard does not have a session which can be resumed.
+        """
+        if self._session_id is None or self._seq is None or self._user_id is None:
+            return None
+
+        return session_store.GatewaySession(
+            shard_id=self._shard_id,
+            shard_count=self._shard_count,
+            session_id=self._session_id,
+            seq=self._seq,
+            user_id=self._user_id,
+        )
+
     @property
     def shard_count(self) -> int:
         return self._shard_count
 
-    async def close(self) -> None:
+    @property
+    def transport_statistics(self) -> GatewayTransportStatistics:
+        """Counters for the compressed payloads this shard has received.
+
+        Returns
+        -------
+        GatewayTransportStatistics
+            The counters, which are updated in place as payloads are received.
+        """
+        return self._transport_statistics
+
+    async def close(self, *, resumable: bool = False) -> None:
+        """Close the websocket if it is connected, otherwise do nothing.
+
+        Other Parameters
+        ----------------
+        resumable : builtins.bool
+            If `builtins.True`, then the shard will disconnect in a way which
+            lets the current `session` be resumed later, such as after a
+            restart. Defaults to `builtins.False`, which ends the session.
+        """
         if not self._closing_event.is_set():
             try:
+                if resumable:
+                    self._close_code = _RESUME_CLOSE_CODE
+
                 if self._ws is not None:
                     self._logger.debug(
                         "shard.close() was called and the websocket was still alive -- "
-                        "disconnecting immediately with GOING AWAY"
+                        "disconnecting immediately with code %s",
+                        self._close_code,
                     )
-                    await self._ws.send_close(code=errors.ShardCloseCode.GOING_AWAY, message=b"shard disconnecting")
+                    await self._ws.send_close(code=self._close_code, message=b"shard disconnecting")
                 self._closing_event.set()
             finally:
                 self._chunking_rate_limit.close()
@@ -541,12 +736,10 @@ class GatewayShardImpl(shard.GatewayShard):
         self,
         data: data_binding.JSONObject,
         compress: typing.Optional[int] = None,
-        *,
-        dumps: aiohttp.typedefs.JSONEncoder = data_binding.dump_json,
     ) -> None:
         await self._total_rate_limit.acquire()
 
-        await self._get_ws().send_json(data=data, compress=compress, dumps=dumps)
+        await self._get_ws().send_json(data=data, compress=compress, dumps=self._dumps)
 
     def _check_if_alive(self) -> None:
         if not self.is_alive:
@@ -649,7 +842,7 @@ class GatewayShardImpl(shard.GatewayShard):
 
         await self._send_json({_OP: _VOICE_STATE_UPDATE, _D: payload})
 
-    def _dispatch(self, name: str, seq: int, data: data_binding.JSONObject) -> None:
+    def _dispatch(self, name: str, seq: int, data: data_binding.JSONObject) -> typing.Optional[typing.Awaitable[None]]:
         # This is invoked a lot, and we don't need to explicitly await anything, so it should
         # not be a coroutine. Makes event dispatches much much faster under significant load.
 
@@ -673,14 +866,15 @@ class GatewayShardImpl(shard.GatewayShard):
             )
             self._handshake_completed.set()
 
-        elif name == "RESUME":
+        elif name == "RESUMED":
             self._logger.info("shard has resumed [session:%s, seq:%s]", self._session_id, self._seq)
             self._handshake_completed.set()
 
         try:
-            self._event_manager.consume_raw_event(name, self, data)
+            return self._event_manager.consume_raw_event(name, self, data)
         except LookupError:
             self._logger.debug("ignoring unknown event %s:\n    %r", name, data)
+            return None
 
     async def _identify(self) -> None:
         payload: data_binding.JSONObject = {
@@ -738,7 +932,7 @@ class GatewayShardImpl(shard.GatewayShard):
         return False
 
     async def _poll_events(self) -> typing.Optional[bool]:
-        payload = await self._get_ws().receive_json(timeout=5)
+        payload = await self._get_ws().receive_payload(loads=self._loads, timeout=5)
 
         op = payload[_OP]  # opcode int
         d = payload[_D]  # data/payload. Usually a dict or a bool for INVALID_SESSION
@@ -747,7 +941,10 @@ class GatewayShardImpl(shard.GatewayShard):
             t = payload[_T]  # event name str
             s = payload[_S]  # seq int
             self._logger.log(ux.TRACE, "dispatching %s with seq %s", t, s)
-            self._dispatch(t, s, d)
+            backpressure = self._dispatch(t, s, d)
+            if backpressure is not None:
+                # The event manager is full, so stop reading until it has space again.
+                await backpressure
         elif op == _HEARTBEAT:
             await self._send_heartbeat()
             self._logger.log(ux.TRACE, "sent HEARTBEAT")
@@ -862,6 +1059,8 @@ class GatewayShardImpl(shard.GatewayShard):
                 log_filterer=_log_filterer(self._token),
                 logger=self._logger,
                 proxy_settings=self._proxy_settings,
+                statistics=self._transport_statistics,
+                transport_compression=self._transport_compression,
                 url=self._url,
             )
         )
@@ -886,9 +1085,7 @@ class GatewayShardImpl(shard.GatewayShard):
                         "closing flag was set during handshake, disconnecting with GOING AWAY "
                         "(_run_once => do not reconnect)"
                     )
-                    await self._get_ws().send_close(
-                        code=errors.ShardCloseCode.GOING_AWAY, message=b"shard disconnecting"
-                    )
+                    await self._get_ws().send_close(code=self._close_code, message=b"shard disconnecting")
                     return False
 
                 # Event polling.
@@ -919,7 +1116,7 @@ class GatewayShardImpl(shard.GatewayShard):
                     "(_run_once => do not reconnect)"
                 )
                 await self._get_ws().send_close(
-                    code=errors.ShardCloseCode.GOING_AWAY,
+                    code=self._close_code,
                     message=b"shard disconnecting",
                 )
                 return False
@@ -1009,7 +1206,7 @@ class GatewayShardImpl(shard.GatewayShard):
 
     async def _wait_for_hello(self) -> asyncio.Task[bool]:
         # Expect HELLO.
-        payload = await self._get_ws().receive_json()
+        payload = await self._get_ws().receive_payload(loads=self._loads)
         if payload[_OP] != _HELLO:
             self._logger.debug(
                 "expected HELLO opcode, received %s which makes no sense, closing with PROTOCOL ERROR ",
@@ -1028,7 +1225,7 @@ class GatewayShardImpl(shard.GatewayShard):
                 "(_run_once => do not reconnect)"
             )
             await self._get_ws().send_close(
-                code=errors.ShardCloseCode.GOING_AWAY,
+                code=self._close_code,
                 message=b"shard disconnecting",
             )
             raise asyncio.CancelledError("closing flag was set before we could handshake")
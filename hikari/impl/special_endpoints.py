@@ -512,7 +512,8 @@ class MessageIterator(iterators.BufferedLazyIterator["messages.Message"]):
         if not chunk:
             return None
         if self._direction == "after":
-            chunk.reverse()
+            # The response may be shared with other identical requests, so don't reverse it in place.
+            chunk = chunk[::-1]
 
         self._first_id = chunk[-1]["id"]
         return (self._entity_factory.deserialize_message(m) for m in chunk)
@@ -37,8 +37,12 @@ __all__: typing.List[str] = [
     "MessageInteractionData",
     "MessageData",
     "VoiceStateData",
+    "BaseRefCell",
     "RefCell",
     "unwrap_ref_cell",
+    "ColumnarMemberCell",
+    "ColumnarMemberStore",
+    "LazyMemberCell",
     "copy_guild_channel",
     "Cache3DMappingView",
     "DataT",
@@ -47,9 +51,12 @@ __all__: typing.List[str] = [
 ]
 
 import abc
+import array
 import copy
 import datetime
+import sys
 import typing
+import weakref
 
 import attr
 
@@ -66,6 +73,7 @@ from hikari import voices
 from hikari.api import cache
 from hikari.internal import attr_extensions
 from hikari.internal import collections
+from hikari.internal import time
 
 if typing.TYPE_CHECKING:
     from hikari import applications
@@ -74,6 +82,7 @@ if typing.TYPE_CHECKING:
     from hikari import traits
     from hikari import users as users_
     from hikari.interactions import base_interactions
+    from hikari.internal import data_binding
 
 ChannelT = typing.TypeVar("ChannelT", bound="channels_.GuildChannel")
 DataT = typing.TypeVar("DataT", bound="BaseData[typing.Any]")
@@ -83,6 +92,23 @@ KeyT = typing.TypeVar("KeyT", bound=typing.Hashable)
 ValueT = typing.TypeVar("ValueT")
 """Type-hint for mapping values."""
 
+_UNSIGNED_CHAR: typing.Final[str] = sys.intern("B")
+_SIGNED_INT: typing.Final[str] = sys.intern("i")
+_SIGNED_LONG_LONG: typing.Final[str] = sys.intern("q")
+_UNSIGNED_LONG_LONG: typing.Final[str] = sys.intern("Q")
+_EPOCH: typing.Final[datetime.datetime] = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_MICROSECOND: typing.Final[datetime.timedelta] = datetime.timedelta(microseconds=1)
+_NO_DATETIME: typing.Final[int] = -(2 ** 63)
+# Bits of the packed member flags column, each of the undefined-or-bool fields takes a bit for whether it is defined
+# and a bit for its value.
+_DEAF_SET: typing.Final[int] = 1 << 0
+_DEAF: typing.Final[int] = 1 << 1
+_MUTE_SET: typing.Final[int] = 1 << 2
+_MUTE: typing.Final[int] = 1 << 3
+_PENDING_SET: typing.Final[int] = 1 << 4
+_PENDING: typing.Final[int] = 1 << 5
+_DELETED: typing.Final[int] = 1 << 6
+
 
 class CacheMappingView(cache.CacheView[KeyT, ValueT]):
     """A cache mapping view implementation used for representing cached data.
@@ -229,12 +255,26 @@ class GuildRecord:
     """
 
     members: typing.Optional[
-        collections.ExtendedMutableMapping[snowflakes.Snowflake, RefCell[MemberData]]
+        collections.ExtendedMutableMapping[snowflakes.Snowflake, BaseRefCell[MemberData]]
     ] = attr.field(default=None)
     """A mapping of user IDs to the objects of members cached for this guild.
 
     This will be `builtins.None` if no members are cached for this guild else
     `hikari.internal.collections.ExtendedMutableMapping[hikari.snowflakes.Snowflake, MemberData]`.
+
+    This may be a `ColumnarMemberStore` if columnar member storage is enabled.
+    """
+
+    evicted_members: typing.Optional[typing.Dict[snowflakes.Snowflake, BaseRefCell[MemberData]]] = attr.field(
+        default=None
+    )
+    """A mapping of user IDs to the members evicted from `GuildRecord.members` while still referenced.
+
+    These are moved back into `GuildRecord.members` if the member is cached
+    again, so that every reference to the member shares the same cell.
+
+    This will be `builtins.None` if no evicted members are still referenced
+    else `typing.Dict[hikari.snowflakes.Snowflake, BaseRefCell[MemberData]]`.
     """
 
     presences: typing.Optional[
@@ -262,6 +302,29 @@ class GuildRecord:
     `hikari.internal.collections.ExtendedMutableMapping[hikari.snowflakes.Snowflake, VoiceStateData]`.
     """
 
+    invite_channel_index: typing.Dict[snowflakes.Snowflake, typing.Set[str]] = attr.field(factory=dict)
+    """A mapping of channel IDs to the codes of the invites cached for them.
+
+    This is an index over `GuildRecord.invites` which is kept in sync with it
+    and therefore isn't considered by `GuildRecord.empty`.
+    """
+
+    member_role_index: typing.Dict[snowflakes.Snowflake, typing.Set[snowflakes.Snowflake]] = attr.field(factory=dict)
+    """A mapping of role IDs to the user IDs of the members cached with them.
+
+    This is an index over `GuildRecord.members` which is kept in sync with it
+    and therefore isn't considered by `GuildRecord.empty`.
+    """
+
+    voice_state_channel_index: typing.Dict[snowflakes.Snowflake, typing.Set[snowflakes.Snowflake]] = attr.field(
+        factory=dict
+    )
+    """A mapping of channel IDs to the user IDs of the voice states cached for them.
+
+    This is an index over `GuildRecord.voice_states` which is kept in sync with
+    it and therefore isn't considered by `GuildRecord.empty`.
+    """
+
     def empty(self) -> bool:
         """Check whether this guild record has any resources attached to it.
 
@@ -275,6 +338,7 @@ class GuildRecord:
             (
                 self.channels,
                 self.emojis,
+                self.evicted_members,
                 self.guild,
                 self.invites,
                 self.members,
@@ -598,15 +662,25 @@ class MemberPresenceData(BaseData[presences.MemberPresence]):
     client_status: presences.ClientStatus = attr.field()
 
     @classmethod
-    def build_from_entity(cls, presence: presences.MemberPresence, /) -> MemberPresenceData:
+    def build_from_entity(
+        cls,
+        presence: presences.MemberPresence,
+        /,
+        *,
+        activities: typing.Optional[typing.Tuple[RichActivityData, ...]] = None,
+        client_status: typing.Optional[presences.ClientStatus] = None,
+    ) -> MemberPresenceData:
         # role_ids and activities are special cases as may be mutable sequences, therefore we want to ensure they're
         # stored in immutable sequences (tuples). Plus activities need to be converted to Data objects.
+        if activities is None:
+            activities = tuple(RichActivityData.build_from_entity(activity) for activity in presence.activities)
+
         return cls(
             user_id=presence.user_id,
             guild_id=presence.guild_id,
             visible_status=presence.visible_status,
-            activities=tuple(RichActivityData.build_from_entity(activity) for activity in presence.activities),
-            client_status=copy.copy(presence.client_status),
+            activities=activities,
+            client_status=client_status or copy.copy(presence.client_status),
         )
 
     def build_entity(self, app: traits.RESTAware, /) -> presences.MemberPresence:
@@ -751,7 +825,7 @@ class MessageData(BaseData[messages.Message]):
     channel_id: snowflakes.Snowflake = attr.field()
     guild_id: typing.Optional[snowflakes.Snowflake] = attr.field()
     author: RefCell[users_.User] = attr.field()
-    member: typing.Optional[RefCell[MemberData]] = attr.field()
+    member: typing.Optional[BaseRefCell[MemberData]] = attr.field()
     content: typing.Optional[str] = attr.field()
     timestamp: datetime.datetime = attr.field()
     edited_timestamp: typing.Optional[datetime.datetime] = attr.field()
@@ -781,7 +855,7 @@ class MessageData(BaseData[messages.Message]):
         /,
         *,
         author: typing.Optional[RefCell[users_.User]] = None,
-        member: typing.Optional[RefCell[MemberData]] = None,
+        member: typing.Optional[BaseRefCell[MemberData]] = None,
         mention_users: undefined.UndefinedOr[
             typing.Mapping[snowflakes.Snowflake, RefCell[users_.User]]
         ] = undefined.UNDEFINED,
@@ -908,7 +982,7 @@ class VoiceStateData(BaseData[voices.VoiceState]):
     is_streaming: bool = attr.field()
     is_suppressed: bool = attr.field()
     is_video_enabled: bool = attr.field()
-    member: RefCell[MemberData] = attr.field()
+    member: BaseRefCell[MemberData] = attr.field()
     session_id: str = attr.field()
     requested_to_speak_at: typing.Optional[datetime.datetime] = attr.field()
 
@@ -937,7 +1011,7 @@ class VoiceStateData(BaseData[voices.VoiceState]):
         voice_state: voices.VoiceState,
         /,
         *,
-        member: typing.Optional[RefCell[MemberData]] = None,
+        member: typing.Optional[BaseRefCell[MemberData]] = None,
     ) -> VoiceStateData:
         return cls(
             channel_id=voice_state.channel_id,
@@ -973,19 +1047,54 @@ class Cell(typing.Generic[ValueT]):
         return copy.copy(self.object)
 
 
-@attr_extensions.with_copy
-@attr.define(repr=False, hash=False, weakref_slot=False)
-class RefCell(typing.Generic[ValueT]):
-    """Object used to track mutable references to a value in multiple places.
+class BaseRefCell(abc.ABC, typing.Generic[ValueT]):
+    """Interface shared by the reference cells which track a value's references.
 
-    This is intended to enable reference counting for entities that are only kept
-    alive by reference (e.g. the unknown emoji objects attached to presence
-    activities and user objects) without the use of a "Data" object which lowers
-    the time spent building these entities for the objects that reference them.
+    This allows cells which keep their value in a different form (e.g. in the
+    columns of a `ColumnarMemberStore`) to be used wherever a `RefCell` is.
     """
 
-    object: ValueT = attr.field(repr=True)
-    ref_count: int = attr.field(default=0, kw_only=True)
+    __slots__: typing.Sequence[str] = ()
+
+    if typing.TYPE_CHECKING:
+        # mypy doesn't support abstract property setters, so it only sees the properties' signatures.
+        @property
+        def object(self) -> ValueT:  # noqa: A001 - Shadowing a builtin
+            ...
+
+        @object.setter
+        def object(self, value: ValueT) -> None:  # noqa: A001 - Shadowing a builtin
+            ...
+
+        @property
+        def ref_count(self) -> int:
+            ...
+
+        @ref_count.setter
+        def ref_count(self, value: int) -> None:
+            ...
+
+    else:
+
+        @property
+        @abc.abstractmethod
+        def object(self) -> ValueT:  # noqa: A001 - Shadowing a builtin
+            """Return the value held by this cell."""
+
+        @object.setter
+        @abc.abstractmethod
+        def object(self, value: ValueT) -> None:  # noqa: A001 - Shadowing a builtin
+            """Set the value held by this cell."""
+
+        @property
+        @abc.abstractmethod
+        def ref_count(self) -> int:
+            """Return the number of references to this cell's value."""
+
+        @ref_count.setter
+        @abc.abstractmethod
+        def ref_count(self, value: int) -> None:
+            """Set the number of references to this cell's value."""
 
     def copy(self) -> ValueT:
         """Get a copy of the contents of this cell.
@@ -998,7 +1107,22 @@ class RefCell(typing.Generic[ValueT]):
         return copy.copy(self.object)
 
 
-def unwrap_ref_cell(cell: RefCell[ValueT]) -> ValueT:
+@attr_extensions.with_copy
+@attr.define(repr=False, hash=False, weakref_slot=False)
+class RefCell(BaseRefCell[ValueT]):
+    """Object used to track mutable references to a value in multiple places.
+
+    This is intended to enable reference counting for entities that are only kept
+    alive by reference (e.g. the unknown emoji objects attached to presence
+    activities and user objects) without the use of a "Data" object which lowers
+    the time spent building these entities for the objects that reference them.
+    """
+
+    object: ValueT = attr.field(repr=True)
+    ref_count: int = attr.field(default=0, kw_only=True)
+
+
+def unwrap_ref_cell(cell: BaseRefCell[ValueT]) -> ValueT:
     """Unwrap a `RefCell` instance to it's contents.
 
     Parameters
@@ -1014,6 +1138,517 @@ def unwrap_ref_cell(cell: RefCell[ValueT]) -> ValueT:
     return cell.copy()
 
 
+class ColumnarMemberCell(BaseRefCell[MemberData]):
+    """A reference cell for a member stored in a `ColumnarMemberStore`.
+
+    The member's data object is built from the store's columns each time it is
+    accessed, and setting it writes it back to them. If the member is removed
+    from the store then the cell is detached and keeps the member's last state.
+    """
+
+    __slots__: typing.Sequence[str] = ("__weakref__", "_detached", "_detached_ref_count", "_store", "_user_id")
+
+    def __init__(self, store: ColumnarMemberStore, user_id: int, /) -> None:
+        self._detached: typing.Optional[MemberData] = None
+        self._detached_ref_count = 0
+        self._store: typing.Optional[ColumnarMemberStore] = store
+        self._user_id = user_id
+
+    @property
+    def object(self) -> MemberData:
+        if self._store is None:
+            assert self._detached is not None
+            return self._detached
+
+        return self._store._get_data(self._user_id)
+
+    @object.setter
+    def object(self, value: MemberData) -> None:
+        if self._store is None:
+            self._detached = value
+        else:
+            self._store._set_data(self._user_id, value, None)
+
+    @property
+    def ref_count(self) -> int:
+        if self._store is None:
+            return self._detached_ref_count
+
+        return self._store._ref_counts[self._store._index[self._user_id]]
+
+    @ref_count.setter
+    def ref_count(self, value: int) -> None:
+        if self._store is None:
+            self._detached_ref_count = value
+        else:
+            self._store._ref_counts[self._store._index[self._user_id]] = value
+
+    def _detach(self, data: MemberData, ref_count: int, /) -> None:
+        self._detached = data
+        self._detached_ref_count = ref_count
+        self._store = None
+
+    def __copy__(self) -> RefCell[MemberData]:
+        return RefCell(self.object, ref_count=self.ref_count)
+
+    def __deepcopy__(self, memo: typing.Dict[int, typing.Any]) -> RefCell[MemberData]:
+        return RefCell(copy.deepcopy(self.object, memo), ref_count=self.ref_count)
+
+    def __reduce__(self) -> typing.Tuple[typing.Any, ...]:
+        if self._store is None:
+            return _make_ref_cell, (self._detached, self._detached_ref_count)
+
+        # The cell has to be registered with the unpickled store so that it is detached if the member is removed.
+        return _get_columnar_member_cell, (self._store, self._user_id)
+
+
+def _get_columnar_member_cell(store: ColumnarMemberStore, user_id: int, /) -> BaseRefCell[MemberData]:
+    return store[snowflakes.Snowflake(user_id)]
+
+
+def _make_ref_cell(value: ValueT, ref_count: int, /) -> RefCell[ValueT]:
+    return RefCell(value, ref_count=ref_count)
+
+
+def _pack_flag(value: undefined.UndefinedOr[bool], set_bit: int, value_bit: int, /) -> int:
+    if value is undefined.UNDEFINED:
+        return 0
+
+    return set_bit | value_bit if value else set_bit
+
+
+def _unpack_flag(flags: int, set_bit: int, value_bit: int, /) -> undefined.UndefinedOr[bool]:
+    if not flags & set_bit:
+        return undefined.UNDEFINED
+
+    return bool(flags & value_bit)
+
+
+def _datetime_to_epoch(value: typing.Optional[datetime.datetime], /) -> int:
+    if value is None:
+        return _NO_DATETIME
+
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _epoch_to_datetime(value: int, /) -> typing.Optional[datetime.datetime]:
+    if value == _NO_DATETIME:
+        return None
+
+    return _EPOCH + value * _MICROSECOND
+
+
+class ColumnarMemberStore(collections.ExtendedMutableMapping[snowflakes.Snowflake, BaseRefCell[MemberData]]):
+    """A mapping of user IDs to the cached members of a guild, stored in columns.
+
+    Rather than keeping a `MemberData` object and the objects it references
+    alive for every member, each field is stored in a column shared by all the
+    members of the guild:
+
+    * User IDs, reference counts and flags are stored in arrays of integers.
+    * Datetimes are stored as integer microseconds since the epoch.
+    * Nicknames are interned.
+    * Role ID tuples are shared between all the members which have the same roles.
+
+    `MemberData` objects are only built when a member is accessed. The
+    `ColumnarMemberCell` objects returned by this mapping remain valid while
+    they are referenced elsewhere, such as by a cached voice state or message.
+
+    !!! warning
+        This is not thread-safe and must not be iterated across whilst being
+        concurrently modified.
+
+    Parameters
+    ----------
+    guild_id : hikari.snowflakes.Snowflake
+        The ID of the guild the stored members belong to.
+    users : typing.Mapping[hikari.snowflakes.Snowflake, RefCell[hikari.users.User]]
+        The mapping of cached users to look up the user of each member in.
+        A member's user must stay in this mapping while the member is stored.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_cells",
+        "_flags",
+        "_guild_id",
+        "_index",
+        "_joined_at",
+        "_nicknames",
+        "_premium_since",
+        "_ref_counts",
+        "_role_ids",
+        "_role_sets",
+        "_user_ids",
+        "_users",
+    )
+
+    def __init__(
+        self,
+        guild_id: snowflakes.Snowflake,
+        users: typing.Mapping[snowflakes.Snowflake, RefCell[users_.User]],
+        /,
+    ) -> None:
+        self._cells: weakref.WeakValueDictionary[int, ColumnarMemberCell] = weakref.WeakValueDictionary()
+        self._flags = array.array(_UNSIGNED_CHAR)
+        self._guild_id = guild_id
+        self._index: typing.Dict[int, int] = {}
+        self._joined_at = array.array(_SIGNED_LONG_LONG)
+        self._nicknames: typing.List[typing.Optional[str]] = []
+        self._premium_since = array.array(_SIGNED_LONG_LONG)
+        self._ref_counts = array.array(_SIGNED_INT)
+        self._role_ids: typing.List[typing.Tuple[snowflakes.Snowflake, ...]] = []
+        self._role_sets: typing.Dict[
+            typing.Tuple[snowflakes.Snowflake, ...], RefCell[typing.Tuple[snowflakes.Snowflake, ...]]
+        ] = {}
+        self._user_ids = array.array(_UNSIGNED_LONG_LONG)
+        self._users = users
+
+    def _columns(self) -> typing.Tuple[typing.MutableSequence[typing.Any], ...]:
+        return (
+            self._flags,
+            self._joined_at,
+            self._nicknames,
+            self._premium_since,
+            self._ref_counts,
+            self._role_ids,
+            self._user_ids,
+        )
+
+    def _get_data(self, user_id: int, /) -> MemberData:
+        row = self._index[user_id]
+        flags = self._flags[row]
+        return MemberData(
+            # Snowflakes hash and compare the same as the integers they wrap.
+            user=self._users[user_id],  # type: ignore[index]
+            guild_id=self._guild_id,
+            nickname=self._nicknames[row],
+            role_ids=self._role_ids[row],
+            joined_at=_EPOCH + self._joined_at[row] * _MICROSECOND,
+            premium_since=_epoch_to_datetime(self._premium_since[row]),
+            is_deaf=_unpack_flag(flags, _DEAF_SET, _DEAF),
+            is_mute=_unpack_flag(flags, _MUTE_SET, _MUTE),
+            is_pending=_unpack_flag(flags, _PENDING_SET, _PENDING),
+            has_been_deleted=bool(flags & _DELETED),
+        )
+
+    def _set_data(self, user_id: int, data: MemberData, ref_count: typing.Optional[int], /) -> None:
+        flags = (
+            _pack_flag(data.is_deaf, _DEAF_SET, _DEAF)
+            | _pack_flag(data.is_mute, _MUTE_SET, _MUTE)
+            | _pack_flag(data.is_pending, _PENDING_SET, _PENDING)
+            | (_DELETED if data.has_been_deleted else 0)
+        )
+        joined_at = _datetime_to_epoch(data.joined_at)
+        nickname = sys.intern(data.nickname) if data.nickname is not None else None
+        premium_since = _datetime_to_epoch(data.premium_since)
+        role_ids = self._acquire_role_ids(data.role_ids)
+
+        row = self._index.get(user_id)
+        if row is None:
+            self._index[user_id] = len(self._user_ids)
+            self._flags.append(flags)
+            self._joined_at.append(joined_at)
+            self._nicknames.append(nickname)
+            self._premium_since.append(premium_since)
+            self._ref_counts.append(ref_count or 0)
+            self._role_ids.append(role_ids)
+            self._user_ids.append(user_id)
+            return
+
+        self._release_role_ids(self._role_ids[row])
+        self._flags[row] = flags
+        self._joined_at[row] = joined_at
+        self._nicknames[row] = nickname
+        self._premium_since[row] = premium_since
+        self._role_ids[row] = role_ids
+        if ref_count is not None:
+            self._ref_counts[row] = ref_count
+
+    def _acquire_role_ids(
+        self, role_ids: typing.Tuple[snowflakes.Snowflake, ...], /
+    ) -> typing.Tuple[snowflakes.Snowflake, ...]:
+        try:
+            role_set = self._role_sets[role_ids]
+        except KeyError:
+            role_set = self._role_sets[role_ids] = RefCell(role_ids)
+
+        role_set.ref_count += 1
+        return role_set.object
+
+    def _release_role_ids(self, role_ids: typing.Tuple[snowflakes.Snowflake, ...], /) -> None:
+        role_set = self._role_sets[role_ids]
+        role_set.ref_count -= 1
+        if role_set.ref_count < 1:
+            del self._role_sets[role_ids]
+
+    def clear(self) -> None:
+        for user_id, cell in tuple(self._cells.items()):
+            cell._detach(self._get_data(user_id), self._ref_counts[self._index[user_id]])
+
+        self._cells.clear()
+        self._index.clear()
+        self._role_sets.clear()
+        for column in self._columns():
+            del column[:]
+
+    def copy(self) -> ColumnarMemberStore:
+        store = ColumnarMemberStore(self._guild_id, self._users)
+        store._flags = array.array(_UNSIGNED_CHAR, self._flags)
+        store._index = self._index.copy()
+        store._joined_at = array.array(_SIGNED_LONG_LONG, self._joined_at)
+        store._nicknames = self._nicknames.copy()
+        store._premium_since = array.array(_SIGNED_LONG_LONG, self._premium_since)
+        store._ref_counts = array.array(_SIGNED_INT, self._ref_counts)
+        store._role_ids = self._role_ids.copy()
+        store._role_sets = {
+            role_ids: RefCell(role_set.object, ref_count=role_set.ref_count)
+            for role_ids, role_set in self._role_sets.items()
+        }
+        store._user_ids = array.array(_UNSIGNED_LONG_LONG, self._user_ids)
+        return store
+
+    def freeze(self) -> typing.Dict[snowflakes.Snowflake, BaseRefCell[MemberData]]:
+        return {user_id: self[user_id] for user_id in self}
+
+    def __getstate__(self) -> typing.Dict[str, typing.Any]:
+        # Cells can't be pickled in a weak mapping; any that are still referenced re-register themselves on unpickle.
+        return {name: getattr(self, name) for name in self.__slots__ if name != "_cells"}
+
+    def __setstate__(self, state: typing.Dict[str, typing.Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
+        self._cells = weakref.WeakValueDictionary()
+
+    def view(self) -> typing.Mapping[snowflakes.Snowflake, BaseRefCell[MemberData]]:
+        # The columns can't be shared with a view without copying them, so this is no cheaper than freeze.
+        return self.freeze()
+
+    def __contains__(self, key: typing.Any) -> bool:
+        return key in self._index
+
+    def __delitem__(self, key: snowflakes.Snowflake) -> None:
+        row = self._index[key]
+        cell = self._cells.pop(key, None)
+        if cell is not None:
+            # Anything which still references this cell should keep seeing the member's last state.
+            cell._detach(self._get_data(key), self._ref_counts[row])
+
+        del self._index[key]
+        self._release_role_ids(self._role_ids[row])
+
+        # Move the last row into the removed row's place so that the columns don't have to be shifted.
+        last_row = len(self._user_ids) - 1
+        if row != last_row:
+            for column in self._columns():
+                column[row] = column[last_row]
+
+            self._index[self._user_ids[row]] = row
+
+        for column in self._columns():
+            column.pop()
+
+    def __getitem__(self, key: snowflakes.Snowflake) -> BaseRefCell[MemberData]:
+        if key not in self._index:
+            raise KeyError(key)
+
+        cell = self._cells.get(key)
+        if cell is None:
+            cell = self._cells[key] = ColumnarMemberCell(self, key)
+
+        return cell
+
+    def __iter__(self) -> typing.Iterator[snowflakes.Snowflake]:
+        return map(snowflakes.Snowflake, self._user_ids)
+
+    def __len__(self) -> int:
+        return len(self._user_ids)
+
+    def __setitem__(self, key: snowflakes.Snowflake, value: BaseRefCell[MemberData]) -> None:
+        if isinstance(value, ColumnarMemberCell) and value._store is self and value._user_id == key:
+            return
+
+        self._set_data(key, value.object, value.ref_count)
+
+    def __sizeof__(self) -> int:
+        return (
+            super().__sizeof__()
+            + sum(sys.getsizeof(column) for column in self._columns())
+            + sys.getsizeof(self._index)
+            + sys.getsizeof(self._role_sets)
+        )
+
+
+class LazyMemberCell(BaseRefCell[MemberData]):
+    """A reference cell for a member cached from a raw gateway payload.
+
+    Only the member's user and role IDs are deserialized when it is cached.
+    The rest of the payload's fields are kept as they were sent and the
+    member's `MemberData` object is only built when it is accessed, unless
+    the cell has been materialized. Setting the cell's object replaces the
+    payload fields for good.
+
+    Parameters
+    ----------
+    payload : hikari.internal.data_binding.JSONObject
+        The member's payload.
+    user : RefCell[hikari.users.User]
+        The cell of the member's cached user.
+    guild_id : hikari.snowflakes.Snowflake
+        The ID of the guild the member belongs to.
+    role_ids : typing.Tuple[hikari.snowflakes.Snowflake, ...]
+        The IDs of the member's roles.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_data",
+        "_flags",
+        "_guild_id",
+        "_joined_at",
+        "_nickname",
+        "_premium_since",
+        "_ref_count",
+        "_role_ids",
+        "_user",
+    )
+
+    def __init__(
+        self,
+        payload: data_binding.JSONObject,
+        user: RefCell[users_.User],
+        guild_id: snowflakes.Snowflake,
+        role_ids: typing.Tuple[snowflakes.Snowflake, ...],
+        /,
+    ) -> None:
+        self._data: typing.Optional[MemberData] = None
+        self._joined_at: typing.Optional[str] = None
+        self._nickname: typing.Optional[str] = None
+        self._premium_since: typing.Optional[str] = None
+        self._ref_count = 0
+        self.set_payload(payload, user, guild_id, role_ids)
+
+    @property
+    def object(self) -> MemberData:
+        if self._data is not None:
+            return self._data
+
+        return self._build_data()
+
+    @object.setter
+    def object(self, value: MemberData) -> None:
+        self._data = value
+        # The cell's data is now the only copy of the member's state, so it mustn't be dematerialized.
+        self._joined_at = None
+        self._nickname = None
+        self._premium_since = None
+
+    @property
+    def ref_count(self) -> int:
+        return self._ref_count
+
+    @ref_count.setter
+    def ref_count(self, value: int) -> None:
+        self._ref_count = value
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether the member's data object is currently kept by the cell."""
+        return self._data is not None
+
+    def set_payload(
+        self,
+        payload: data_binding.JSONObject,
+        user: RefCell[users_.User],
+        guild_id: snowflakes.Snowflake,
+        role_ids: typing.Tuple[snowflakes.Snowflake, ...],
+        /,
+    ) -> None:
+        """Replace the member's state with the fields of a new payload.
+
+        This takes the same arguments as the cell's constructor.
+        """
+        self._data = None
+        self._flags = (
+            _pack_flag(payload.get("deaf", undefined.UNDEFINED), _DEAF_SET, _DEAF)
+            | _pack_flag(payload.get("mute", undefined.UNDEFINED), _MUTE_SET, _MUTE)
+            | _pack_flag(payload.get("pending", undefined.UNDEFINED), _PENDING_SET, _PENDING)
+        )
+        self._guild_id = guild_id
+        self._joined_at = payload["joined_at"]
+        self._nickname = payload.get("nick")
+        self._premium_since = payload.get("premium_since")
+        self._role_ids = role_ids
+        self._user = user
+
+    def materialize(self) -> MemberData:
+        """Build the member's data object and keep it until `LazyMemberCell.dematerialize` is called.
+
+        Returns
+        -------
+        MemberData
+            The member's data object.
+        """
+        if self._data is None:
+            self._data = self._build_data()
+
+        return self._data
+
+    def dematerialize(self) -> None:
+        """Drop the member's data object if it can be built again from the payload fields."""
+        if self._joined_at is not None:
+            self._data = None
+
+    def _build_data(self) -> MemberData:
+        assert self._joined_at is not None
+        flags = self._flags
+        premium_since = self._premium_since
+        return MemberData(
+            user=self._user,
+            guild_id=self._guild_id,
+            nickname=self._nickname,
+            role_ids=self._role_ids,
+            joined_at=time.iso8601_datetime_string_to_datetime(self._joined_at),
+            premium_since=time.iso8601_datetime_string_to_datetime(premium_since) if premium_since else None,
+            is_deaf=_unpack_flag(flags, _DEAF_SET, _DEAF),
+            is_mute=_unpack_flag(flags, _MUTE_SET, _MUTE),
+            is_pending=_unpack_flag(flags, _PENDING_SET, _PENDING),
+        )
+
+    def __copy__(self) -> RefCell[MemberData]:
+        return RefCell(self.object, ref_count=self.ref_count)
+
+    def __deepcopy__(self, memo: typing.Dict[int, typing.Any]) -> RefCell[MemberData]:
+        return RefCell(copy.deepcopy(self.object, memo), ref_count=self.ref_count)
+
+    def __getstate__(self) -> typing.Tuple[typing.Any, ...]:
+        # A materialized data object is only kept while the cache tracks it, so it's rebuilt after unpickling instead.
+        data = self._data if self._joined_at is None else None
+        return (
+            self._ref_count,
+            data,
+            self._flags,
+            self._guild_id,
+            self._joined_at,
+            self._nickname,
+            self._premium_since,
+            self._role_ids,
+            self._user,
+        )
+
+    def __setstate__(self, state: typing.Tuple[typing.Any, ...]) -> None:
+        (
+            self._ref_count,
+            self._data,
+            self._flags,
+            self._guild_id,
+            self._joined_at,
+            self._nickname,
+            self._premium_since,
+            self._role_ids,
+            self._user,
+        ) = state
+
+
 def copy_guild_channel(channel: ChannelT) -> ChannelT:
     """Logic for handling the copying of guild channel objects.
 
@@ -42,6 +42,7 @@ import datetime
 import itertools
 import sys
 import time
+import types
 import typing
 
 from hikari import snowflakes
@@ -102,17 +103,44 @@ class ExtendedMutableMapping(typing.MutableMapping[KeyT, ValueT], abc.ABC):
             A frozen mapping view of the items in this mapped collection.
         """
 
+    @abc.abstractmethod
+    def view(self) -> typing.Mapping[KeyT, ValueT]:
+        """Return a read-only snapshot of the items in this mapped collection.
+
+        Unlike `ExtendedMutableMapping.freeze`, this may share storage with
+        this mapped collection until it is next modified, which makes creating
+        a view cheap when it is likely to be discarded before then.
+
+        !!! note
+            The returned mapping will not reflect any changes made to this
+            mapped collection after it was created.
+
+        Returns
+        -------
+        typing.Mapping[KeyT, ValueT]
+            A read-only snapshot of the items in this mapped collection.
+        """
+
 
 class FreezableDict(ExtendedMutableMapping[KeyT, ValueT]):
-    """A mapping that wraps a dict, but can also be frozen."""
+    """A mapping that wraps a dict, but can also be frozen.
+
+    Views returned by `FreezableDict.view` share the wrapped dict, which is
+    only copied the next time this mapping is modified.
+    """
 
-    __slots__: typing.Sequence[str] = ("_data",)
+    __slots__: typing.Sequence[str] = ("_data", "_shared")
 
     def __init__(self, source: typing.Optional[typing.Dict[KeyT, ValueT]] = None, /) -> None:
         self._data = source or {}
+        self._shared = False
 
     def clear(self) -> None:
-        self._data.clear()
+        if self._shared:
+            self._data = {}
+            self._shared = False
+        else:
+            self._data.clear()
 
     def copy(self) -> FreezableDict[KeyT, ValueT]:
         return FreezableDict(self._data.copy())
@@ -121,7 +149,18 @@ class FreezableDict(ExtendedMutableMapping[KeyT, ValueT]):
     def freeze(self) -> typing.Dict[KeyT, ValueT]:
         return self._data.copy()
 
+    def view(self) -> typing.Mapping[KeyT, ValueT]:
+        self._shared = True
+        return types.MappingProxyType(self._data)
+
+    def _unshare(self) -> None:
+        self._data = self._data.copy()
+        self._shared = False
+
     def __delitem__(self, key: KeyT) -> None:
+        if self._shared:
+            self._unshare()
+
         del self._data[key]
 
     def __getitem__(self, key: KeyT) -> ValueT:
@@ -133,10 +172,32 @@ class FreezableDict(ExtendedMutableMapping[KeyT, ValueT]):
     def __len__(self) -> int:
         return len(self._data)
 
+    def __sizeof__(self) -> int:
+        return super().__sizeof__() + sys.getsizeof(self._data)
+
     def __setitem__(self, key: KeyT, value: ValueT) -> None:
+        if self._shared:
+            self._unshare()
+
         self._data[key] = value
 
 
+class _TimedView(typing.Mapping[KeyT, ValueT]):
+    __slots__: typing.Sequence[str] = ("_source",)
+
+    def __init__(self, source: typing.Mapping[KeyT, typing.Tuple[float, ValueT]], /) -> None:
+        self._source = source
+
+    def __getitem__(self, key: KeyT) -> ValueT:
+        return self._source[key][1]
+
+    def __iter__(self) -> typing.Iterator[KeyT]:
+        return iter(self._source)
+
+    def __len__(self) -> int:
+        return len(self._source)
+
+
 class _FrozenDict(typing.MutableMapping[KeyT, ValueT]):
     __slots__: typing.Sequence[str] = ("_source",)
 
@@ -174,6 +235,9 @@ class TimedCacheMap(ExtendedMutableMapping[KeyT, ValueT]):
     source : typing.Optional[typing.Dict[KeyT, typing.Tuple[builtins.float, ValueT]]
         A source dictionary of keys to tuples of float timestamps and values to
         create this from.
+    limit : typing.Optional[builtins.int]
+        If provided, the maximum number of entries to store. The entries which
+        were inserted the longest ago are removed first once this is exceeded.
     on_expire : typing.Optional[typing.Callable[[ValueT], None]]
         A function to call each time an item is garbage collected from this
         map. This should take one positional argument of the same type stored
@@ -182,7 +246,7 @@ class TimedCacheMap(ExtendedMutableMapping[KeyT, ValueT]):
         This will always be called after the entry has been removed.
     """
 
-    __slots__: typing.Sequence[str] = ("_data", "_expiry", "_on_expire")
+    __slots__: typing.Sequence[str] = ("_data", "_expiry", "_limit", "_on_expire", "_shared")
 
     def __init__(
         self,
@@ -190,6 +254,7 @@ class TimedCacheMap(ExtendedMutableMapping[KeyT, ValueT]):
         /,
         *,
         expiry: datetime.timedelta,
+        limit: typing.Optional[int] = None,
         on_expire: typing.Optional[typing.Callable[[ValueT], None]] = None,
     ) -> None:
         if expiry <= datetime.timedelta():
@@ -197,32 +262,79 @@ class TimedCacheMap(ExtendedMutableMapping[KeyT, ValueT]):
 
         self._expiry: float = expiry.total_seconds()
         self._data = source or {}
+        self._limit = limit
         self._on_expire = on_expire
+        self._shared = False
         self._garbage_collect()
 
     def clear(self) -> None:
-        self._data.clear()
+        if self._shared:
+            self._data = {}
+            self._shared = False
+        else:
+            self._data.clear()
 
     def copy(self) -> TimedCacheMap[KeyT, ValueT]:
         return TimedCacheMap(
-            self._data.copy(), expiry=datetime.timedelta(seconds=self._expiry), on_expire=self._on_expire
+            self._data.copy(),
+            expiry=datetime.timedelta(seconds=self._expiry),
+            limit=self._limit,
+            on_expire=self._on_expire,
         )
 
     def freeze(self) -> typing.MutableMapping[KeyT, ValueT]:
         return _FrozenDict(self._data.copy())
 
+    def view(self) -> typing.Mapping[KeyT, ValueT]:
+        self._shared = True
+        return _TimedView(types.MappingProxyType(self._data))
+
+    def _unshare(self) -> None:
+        self._data = self._data.copy()
+        self._shared = False
+
     def _garbage_collect(self) -> None:
         current_time = time.perf_counter()
         for key, value in tuple(self._data.items()):
             if current_time - value[0] < self._expiry:
                 break
 
+            if self._shared:
+                self._unshare()
+
             del self._data[key]
 
             if self._on_expire:
                 self._on_expire(value[1])
 
+        while self._limit is not None and len(self._data) > self._limit:
+            if self._shared:
+                self._unshare()
+
+            value = self._data.pop(next(iter(self._data)))
+
+            if self._on_expire:
+                self._on_expire(value[1])
+
+    def __getstate__(self) -> typing.Dict[str, typing.Any]:
+        # Timestamps are only meaningful to the current process, so entries are stored with their ages instead.
+        current_time = time.perf_counter()
+        state = {name: getattr(self, name) for name in self.__slots__}
+        state["_data"] = {key: (current_time - timestamp, value) for key, (timestamp, value) in self._data.items()}
+        state["_shared"] = False
+        return state
+
+    def __setstate__(self, state: typing.Dict[str, typing.Any]) -> None:
+        current_time = time.perf_counter()
+        for name, value in state.items():
+            setattr(self, name, value)
+
+        self._data = {key: (current_time - age, value) for key, (age, value) in self._data.items()}
+
     def __delitem__(self, key: KeyT) -> None:
+        if self._shared:
+            self._unshare()
+
         del self._data[key]
         self._garbage_collect()
 
@@ -235,12 +347,18 @@ class TimedCacheMap(ExtendedMutableMapping[KeyT, ValueT]):
     def __len__(self) -> int:
         return len(self._data)
 
+    def __sizeof__(self) -> int:
+        return super().__sizeof__() + sys.getsizeof(self._data)
+
     def __setitem__(self, key: KeyT, value: ValueT) -> None:
         #  Seeing as we rely on insertion order in _garbage_collect, we have to make sure that each item is added to
         #  the end of the dict.
         if key in self:
             del self[key]
 
+        elif self._shared:
+            self._unshare()
+
         self._data[key] = (time.perf_counter(), value)
         self._garbage_collect()
 
@@ -269,7 +387,7 @@ class LimitedCapacityCacheMap(ExtendedMutableMapping[KeyT, ValueT]):
         This will always be called after the entry has been removed.
     """
 
-    __slots__: typing.Sequence[str] = ("_data", "_limit", "_on_expire")
+    __slots__: typing.Sequence[str] = ("_data", "_limit", "_on_expire", "_shared")
 
     def __init__(
         self,
@@ -282,10 +400,15 @@ class LimitedCapacityCacheMap(ExtendedMutableMapping[KeyT, ValueT]):
         self._data: typing.Dict[KeyT, ValueT] = source or {}
         self._limit = limit
         self._on_expire = on_expire
+        self._shared = False
         self._garbage_collect()
 
     def clear(self) -> None:
-        self._data.clear()
+        if self._shared:
+            self._data = {}
+            self._shared = False
+        else:
+            self._data.clear()
 
     def copy(self) -> LimitedCapacityCacheMap[KeyT, ValueT]:
         return LimitedCapacityCacheMap(self._data.copy(), limit=self._limit, on_expire=self._on_expire)
@@ -293,6 +416,14 @@ class LimitedCapacityCacheMap(ExtendedMutableMapping[KeyT, ValueT]):
     def freeze(self) -> typing.Dict[KeyT, ValueT]:
         return self._data.copy()
 
+    def view(self) -> typing.Mapping[KeyT, ValueT]:
+        self._shared = True
+        return types.MappingProxyType(self._data)
+
+    def _unshare(self) -> None:
+        self._data = self._data.copy()
+        self._shared = False
+
     def _garbage_collect(self) -> None:
         while len(self._data) > self._limit:
             value = self._data.pop(next(iter(self._data)))
@@ -301,6 +432,9 @@ class LimitedCapacityCacheMap(ExtendedMutableMapping[KeyT, ValueT]):
                 self._on_expire(value)
 
     def __delitem__(self, key: KeyT) -> None:
+        if self._shared:
+            self._unshare()
+
         del self._data[key]
 
     def __getitem__(self, key: KeyT) -> ValueT:
@@ -312,7 +446,13 @@ class LimitedCapacityCacheMap(ExtendedMutableMapping[KeyT, ValueT]):
     def __len__(self) -> int:
         return len(self._data)
 
+    def __sizeof__(self) -> int:
+        return super().__sizeof__() + sys.getsizeof(self._data)
+
     def __setitem__(self, key: KeyT, value: ValueT) -> None:
+        if self._shared:
+            self._unshare()
+
         self._data[key] = value
         self._garbage_collect()
 
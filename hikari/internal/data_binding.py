@@ -29,14 +29,23 @@ __all__: typing.List[str] = [
     "JSONObject",
     "JSONArray",
     "JSONish",
+    "JSONEncoder",
+    "JSONDecoder",
     "URLEncodedForm",
     "dump_json",
     "load_json",
+    "slow_json_dumps",
+    "slow_json_loads",
+    "fast_json_dumps",
+    "fast_json_loads",
+    "default_json_dumps",
+    "default_json_loads",
     "JSONDecodeError",
     "JSONObjectBuilder",
     "cast_json_array",
 ]
 
+import json
 import typing
 
 import aiohttp
@@ -69,6 +78,17 @@ JSONArray = typing.List[typing.Any]
 JSONish = typing.Union[str, int, float, bool, None, JSONArray, JSONObject]
 """Type hint for any valid JSON-decoded type."""
 
+JSONEncoder = typing.Callable[[typing.Union[JSONArray, JSONObject]], str]
+"""Type hint for a callable used to serialize a JSON object or array to a string."""
+
+JSONDecoder = typing.Callable[[typing.Union[str, bytes]], typing.Union[JSONArray, JSONObject]]
+"""Type hint for a callable used to deserialize a JSON string or UTF-8 encoded bytes.
+
+Implementations must accept both `builtins.str` and `builtins.bytes`, which
+allows decoders which can work on the raw bytes to skip decoding the payload
+to a string first.
+"""
+
 Stringish = typing.Union[str, int, bool, undefined.UndefinedType, None, snowflakes.Unique]
 """Type hint for any valid that can be put in a StringMapBuilder"""
 
@@ -91,8 +111,6 @@ if typing.TYPE_CHECKING:
 
 
 else:
-    import json
-
     dump_json = json.dumps
     """Convert a Python type to a JSON string."""
 
@@ -102,6 +120,58 @@ else:
     JSONDecodeError = json.JSONDecodeError
     """Exception raised when loading an invalid JSON string"""
 
+_JSON_SEPARATORS: typing.Final[typing.Tuple[str, str]] = (",", ":")
+
+
+def slow_json_dumps(obj: typing.Union[JSONArray, JSONObject], /) -> str:
+    """`JSONEncoder` implementation which will always be present.
+
+    This uses the standard library `json` module and produces compact output.
+    """
+    return json.dumps(obj, separators=_JSON_SEPARATORS)
+
+
+def slow_json_loads(string: typing.Union[str, bytes], /) -> typing.Union[JSONArray, JSONObject]:
+    """`JSONDecoder` implementation which will always be present.
+
+    This uses the standard library `json` module.
+    """
+    return typing.cast("typing.Union[JSONArray, JSONObject]", json.loads(string))
+
+
+fast_json_dumps: typing.Optional[JSONEncoder]
+"""`JSONEncoder` implementation which relies on a speedup requirement."""
+
+fast_json_loads: typing.Optional[JSONDecoder]
+"""`JSONDecoder` implementation which relies on a speedup requirement."""
+
+try:
+    import orjson  # type: ignore[import]
+
+    def _fast_json_dumps(obj: typing.Union[JSONArray, JSONObject], /) -> str:
+        # orjson always produces compact UTF-8 encoded bytes.
+        return typing.cast(bytes, orjson.dumps(obj)).decode("utf-8")
+
+    fast_json_dumps = _fast_json_dumps
+    fast_json_loads = orjson.loads
+
+except ImportError:
+    try:
+        import ujson  # type: ignore[import]
+
+        fast_json_dumps = ujson.dumps
+        fast_json_loads = ujson.loads
+
+    except ImportError:
+        fast_json_dumps = None
+        fast_json_loads = None
+
+default_json_dumps: typing.Final[JSONEncoder] = fast_json_dumps or slow_json_dumps
+"""Main implementation of `JSONEncoder` used within Hikari."""
+
+default_json_loads: typing.Final[JSONDecoder] = fast_json_loads or slow_json_loads
+"""Main implementation of `JSONDecoder` used within Hikari."""
+
 
 @typing.final
 class StringMapBuilder(multidict.MultiDict[str]):
@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Erlang external term format (ETF) encoding and decoding.
+
+Only the subset of terms which Discord uses on the gateway is supported.
+Decoded payloads have the same shape as their JSON counterparts, with
+the exception that snowflakes and other large numbers are returned as
+`builtins.int` rather than `builtins.str`.
+"""
+from __future__ import annotations
+
+__all__: typing.List[str] = [
+    "ETFEncoder",
+    "ETFDecoder",
+    "slow_etf_dumps",
+    "slow_etf_loads",
+    "fast_etf_dumps",
+    "default_etf_dumps",
+    "default_etf_loads",
+]
+
+import struct
+import typing
+import zlib
+
+ETFEncoder = typing.Callable[[typing.Any], bytes]
+"""Type hint for ETF encoders."""
+
+ETFDecoder = typing.Callable[[bytes], typing.Any]
+"""Type hint for ETF decoders."""
+
+_FORMAT_VERSION: typing.Final[int] = 131
+_COMPRESSED: typing.Final[int] = 80
+_NEW_FLOAT_EXT: typing.Final[int] = 70
+_SMALL_INTEGER_EXT: typing.Final[int] = 97
+_INTEGER_EXT: typing.Final[int] = 98
+_FLOAT_EXT: typing.Final[int] = 99
+_ATOM_EXT: typing.Final[int] = 100
+_SMALL_TUPLE_EXT: typing.Final[int] = 104
+_LARGE_TUPLE_EXT: typing.Final[int] = 105
+_NIL_EXT: typing.Final[int] = 106
+_STRING_EXT: typing.Final[int] = 107
+_LIST_EXT: typing.Final[int] = 108
+_BINARY_EXT: typing.Final[int] = 109
+_SMALL_BIG_EXT: typing.Final[int] = 110
+_LARGE_BIG_EXT: typing.Final[int] = 111
+_SMALL_ATOM_EXT: typing.Final[int] = 115
+_MAP_EXT: typing.Final[int] = 116
+_ATOM_UTF8_EXT: typing.Final[int] = 118
+_SMALL_ATOM_UTF8_EXT: typing.Final[int] = 119
+
+_INT32_MIN: typing.Final[int] = -(2 ** 31)
+_INT32_MAX: typing.Final[int] = 2 ** 31 - 1
+
+_UINT16: typing.Final[struct.Struct] = struct.Struct(">H")
+_UINT32: typing.Final[struct.Struct] = struct.Struct(">I")
+_INT32: typing.Final[struct.Struct] = struct.Struct(">i")
+_DOUBLE: typing.Final[struct.Struct] = struct.Struct(">d")
+
+_ATOMS: typing.Final[typing.Mapping[str, typing.Any]] = {"nil": None, "true": True, "false": False}
+
+_NIL: typing.Final[bytes] = bytes((_SMALL_ATOM_EXT, 3)) + b"nil"
+_TRUE: typing.Final[bytes] = bytes((_SMALL_ATOM_EXT, 4)) + b"true"
+_FALSE: typing.Final[bytes] = bytes((_SMALL_ATOM_EXT, 5)) + b"false"
+
+
+def _encode(obj: typing.Any, buff: bytearray, /) -> None:
+    # bool is a subclass of int, so it has to be checked first.
+    if obj is None:
+        buff += _NIL
+    elif obj is True:
+        buff += _TRUE
+    elif obj is False:
+        buff += _FALSE
+    elif isinstance(obj, str):
+        data = obj.encode("utf-8")
+        buff.append(_BINARY_EXT)
+        buff += _UINT32.pack(len(data))
+        buff += data
+    elif isinstance(obj, int):
+        if 0 <= obj <= 255:
+            buff.append(_SMALL_INTEGER_EXT)
+            buff.append(obj)
+        elif _INT32_MIN <= obj <= _INT32_MAX:
+            buff.append(_INTEGER_EXT)
+            buff += _INT32.pack(obj)
+        else:
+            sign = 1 if obj < 0 else 0
+            magnitude = abs(obj)
+            data = magnitude.to_bytes((magnitude.bit_length() + 7) // 8, "little")
+            if len(data) > 255:
+                buff.append(_LARGE_BIG_EXT)
+                buff += _UINT32.pack(len(data))
+            else:
+                buff.append(_SMALL_BIG_EXT)
+                buff.append(len(data))
+            buff.append(sign)
+            buff += data
+    elif isinstance(obj, float):
+        buff.append(_NEW_FLOAT_EXT)
+        buff += _DOUBLE.pack(obj)
+    elif isinstance(obj, typing.Mapping):
+        buff.append(_MAP_EXT)
+        buff += _UINT32.pack(len(obj))
+        for key, value in obj.items():
+            _encode(key, buff)
+            _encode(value, buff)
+    elif isinstance(obj, (list, tuple)):
+        if not obj:
+            buff.append(_NIL_EXT)
+            return
+        buff.append(_LIST_EXT)
+        buff += _UINT32.pack(len(obj))
+        for value in obj:
+            _encode(value, buff)
+        buff.append(_NIL_EXT)
+    else:
+        raise TypeError(f"Cannot encode object of type {type(obj).__name__} to ETF")
+
+
+def slow_etf_dumps(obj: typing.Any, /) -> bytes:
+    """`ETFEncoder` implementation which will always be present.
+
+    Strings are encoded as binaries, `builtins.None`, `builtins.True` and
+    `builtins.False` as the `nil`, `true` and `false` atoms, and mappings
+    and sequences as maps and lists.
+    """
+    buff = bytearray((_FORMAT_VERSION,))
+    _encode(obj, buff)
+    return bytes(buff)
+
+
+_Decoded = typing.Tuple[typing.Any, int]
+
+
+def _decode_small_integer(data: bytes, offset: int, /) -> _Decoded:
+    return data[offset], offset + 1
+
+
+def _decode_integer(data: bytes, offset: int, /) -> _Decoded:
+    return _INT32.unpack_from(data, offset)[0], offset + 4
+
+
+def _decode_new_float(data: bytes, offset: int, /) -> _Decoded:
+    return _DOUBLE.unpack_from(data, offset)[0], offset + 8
+
+
+def _decode_float(data: bytes, offset: int, /) -> _Decoded:
+    # Deprecated 31 byte string representation of a float.
+    return float(data[offset : offset + 31].rstrip(b"\x00")), offset + 31  # noqa: E203 - Whitespace before ":"
+
+
+def _atom(name: bytes, /) -> typing.Any:
+    string = name.decode("utf-8")
+    return _ATOMS.get(string, string)
+
+
+def _decode_atom(data: bytes, offset: int, /) -> _Decoded:
+    end = offset + 2 + _UINT16.unpack_from(data, offset)[0]
+    return _atom(data[offset + 2 : end]), end  # noqa: E203 - Whitespace before ":"
+
+
+def _decode_small_atom(data: bytes, offset: int, /) -> _Decoded:
+    end = offset + 1 + data[offset]
+    return _atom(data[offset + 1 : end]), end  # noqa: E203 - Whitespace before ":"
+
+
+def _decode_items(data: bytes, offset: int, count: int, /) -> typing.Tuple[typing.List[typing.Any], int]:
+    items = []
+    for _ in range(count):
+        tag = data[offset]
+        item, offset = _DECODERS[tag](data, offset + 1)
+        items.append(item)
+    return items, offset
+
+
+def _decode_small_tuple(data: bytes, offset: int, /) -> _Decoded:
+    items, offset = _decode_items(data, offset + 1, data[offset])
+    return tuple(items), offset
+
+
+def _decode_large_tuple(data: bytes, offset: int, /) -> _Decoded:
+    items, offset = _decode_items(data, offset + 4, _UINT32.unpack_from(data, offset)[0])
+    return tuple(items), offset
+
+
+def _decode_nil(_: bytes, offset: int, /) -> _Decoded:
+    return [], offset
+
+
+def _decode_string(data: bytes, offset: int, /) -> _Decoded:
+    # Erlang encodes lists of small integers as a "string", Discord does not use these for actual strings.
+    end = offset + 2 + _UINT16.unpack_from(data, offset)[0]
+    return list(data[offset + 2 : end]), end  # noqa: E203 - Whitespace before ":"
+
+
+def _decode_list(data: bytes, offset: int, /) -> _Decoded:
+    items, offset = _decode_items(data, offset + 4, _UINT32.unpack_from(data, offset)[0])
+    # Proper lists are terminated by an empty list, which we do not want to include.
+    if data[offset] == _NIL_EXT:
+        return items, offset + 1
+    tail, offset = _DECODERS[data[offset]](data, offset + 1)
+    items.append(tail)
+    return items, offset
+
+
+def _decode_binary(data: bytes, offset: int, /) -> _Decoded:
+    end = offset + 4 + _UINT32.unpack_from(data, offset)[0]
+    return data[offset + 4 : end].decode("utf-8"), end  # noqa: E203 - Whitespace before ":"
+
+
+def _decode_small_big(data: bytes, offset: int, /) -> _Decoded:
+    end = offset + 2 + data[offset]
+    value = int.from_bytes(data[offset + 2 : end], "little")  # noqa: E203 - Whitespace before ":"
+    return (-value if data[offset + 1] else value), end
+
+
+def _decode_large_big(data: bytes, offset: int, /) -> _Decoded:
+    end = offset + 5 + _UINT32.unpack_from(data, offset)[0]
+    value = int.from_bytes(data[offset + 5 : end], "little")  # noqa: E203 - Whitespace before ":"
+    return (-value if data[offset + 4] else value), end
+
+
+def _decode_map(data: bytes, offset: int, /) -> _Decoded:
+    count = _UINT32.unpack_from(data, offset)[0]
+    offset += 4
+    result = {}
+    for _ in range(count):
+        key, offset = _DECODERS[data[offset]](data, offset + 1)
+        result[key], offset = _DECODERS[data[offset]](data, offset + 1)
+    return result, offset
+
+
+def _decode_compressed(data: bytes, offset: int, /) -> _Decoded:
+    size = _UINT32.unpack_from(data, offset)[0]
+    decompressor = zlib.decompressobj()
+    inflated = decompressor.decompress(data[offset + 4 :], size)  # noqa: E203 - Whitespace before ":"
+    if len(inflated) != size:
+        raise ValueError("Compressed ETF term has an invalid size")
+    value, _ = _DECODERS[inflated[0]](inflated, 1)
+    return value, len(data) - len(decompressor.unused_data)
+
+
+_DECODERS: typing.Final[typing.Mapping[int, typing.Callable[[bytes, int], _Decoded]]] = {
+    _COMPRESSED: _decode_compressed,
+    _NEW_FLOAT_EXT: _decode_new_float,
+    _SMALL_INTEGER_EXT: _decode_small_integer,
+    _INTEGER_EXT: _decode_integer,
+    _FLOAT_EXT: _decode_float,
+    _ATOM_EXT: _decode_atom,
+    _SMALL_TUPLE_EXT: _decode_small_tuple,
+    _LARGE_TUPLE_EXT: _decode_large_tuple,
+    _NIL_EXT: _decode_nil,
+    _STRING_EXT: _decode_string,
+    _LIST_EXT: _decode_list,
+    _BINARY_EXT: _decode_binary,
+    _SMALL_BIG_EXT: _decode_small_big,
+    _LARGE_BIG_EXT: _decode_large_big,
+    _SMALL_ATOM_EXT: _decode_small_atom,
+    _MAP_EXT: _decode_map,
+    _ATOM_UTF8_EXT: _decode_atom,
+    _SMALL_ATOM_UTF8_EXT: _decode_small_atom,
+}
+
+
+def slow_etf_loads(data: bytes, /) -> typing.Any:
+    """`ETFDecoder` implementation which will always be present.
+
+    Binaries and atoms are decoded to `builtins.str`, except for the `nil`,
+    `true` and `false` atoms which are decoded to `builtins.None`,
+    `builtins.True` and `builtins.False`.
+
+    Raises
+    ------
+    builtins.ValueError
+        If the data is not a valid ETF term.
+    """
+    try:
+        if data[0] != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported ETF version {data[0]}")
+
+        value, offset = _DECODERS[data[1]](data, 2)
+    except (IndexError, KeyError, struct.error) as ex:
+        raise ValueError("Malformed ETF term") from ex
+
+    if offset != len(data):
+        raise ValueError("Unexpected trailing data after ETF term")
+
+    return value
+
+
+fast_etf_dumps: typing.Optional[ETFEncoder]
+"""`ETFEncoder` implementation which relies on a speedup requirement."""
+
+try:
+    import erlpack  # type: ignore[import]
+
+    fast_etf_dumps = erlpack.pack
+
+except ImportError:
+    fast_etf_dumps = None
+
+default_etf_dumps: typing.Final[ETFEncoder] = fast_etf_dumps or slow_etf_dumps
+"""Main implementation of `ETFEncoder` used within Hikari."""
+
+# erlpack's decoder creates an Atom object for every atom and is slower than
+# `slow_etf_loads` for gateway payloads, so it is not used here.
+default_etf_loads: typing.Final[ETFDecoder] = slow_etf_loads
+"""Main implementation of `ETFDecoder` used within Hikari."""
@@ -32,10 +32,10 @@ import typing
 import aiohttp
 
 from hikari import errors
+from hikari.internal import data_binding
 
 if typing.TYPE_CHECKING:
     from hikari import config
-    from hikari.internal import data_binding
 
 
 async def generate_error_response(response: aiohttp.ClientResponse) -> errors.HTTPError:
@@ -117,6 +117,7 @@ def create_client_session(
     raise_for_status: bool,
     trust_env: bool,
     ws_response_cls: typing.Type[aiohttp.ClientWebSocketResponse] = aiohttp.ClientWebSocketResponse,
+    json_serialize: data_binding.JSONEncoder = data_binding.default_json_dumps,
 ) -> aiohttp.ClientSession:
     """Generate a client session using the given settings.
 
@@ -148,6 +149,10 @@ def create_client_session(
         The websocket response class to use.
 
         Defaults to `aiohttp.ClientWebSocketResponse`.
+    json_serialize : hikari.internal.data_binding.JSONEncoder
+        The JSON encoder to use for request bodies passed as `json`.
+
+        Defaults to `hikari.internal.data_binding.default_json_dumps`.
 
     Returns
     -------
@@ -157,6 +162,7 @@ def create_client_session(
     return aiohttp.ClientSession(
         connector=connector,
         connector_owner=connector_owner,
+        json_serialize=json_serialize,
         raise_for_status=raise_for_status,
         timeout=aiohttp.ClientTimeout(
             connect=http_settings.timeouts.acquire_and_connect,
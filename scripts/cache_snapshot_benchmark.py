@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import gc
+import os
+import tempfile
+import time
+
+from hikari import config
+from hikari.impl import cache
+from hikari.impl import entity_factory
+
+guild_count = 20
+member_count = 10_000
+role_count = 100
+channel_count = 100
+repeat = 3
+
+
+def make_guild_payload(guild_id):
+    return {
+        "id": str(guild_id),
+        "name": f"Benchmark guild {guild_id}",
+        "icon": None,
+        "splash": None,
+        "discovery_splash": None,
+        "owner_id": "1",
+        "afk_channel_id": None,
+        "afk_timeout": 300,
+        "verification_level": 0,
+        "default_message_notifications": 0,
+        "explicit_content_filter": 0,
+        "features": [],
+        "mfa_level": 0,
+        "application_id": None,
+        "system_channel_id": None,
+        "system_channel_flags": 0,
+        "rules_channel_id": None,
+        "vanity_url_code": None,
+        "description": None,
+        "banner": None,
+        "premium_tier": 0,
+        "preferred_locale": "en-GB",
+        "public_updates_channel_id": None,
+        "nsfw_level": 0,
+        "large": True,
+        "member_count": member_count,
+        "joined_at": "2021-01-01T00:00:00.000000+00:00",
+        "emojis": [],
+        "roles": [
+            {
+                "id": str(guild_id + i),
+                "name": f"role {i}",
+                "color": 0,
+                "hoist": False,
+                "position": i,
+                "permissions": "0",
+                "managed": False,
+                "mentionable": False,
+            }
+            for i in range(role_count)
+        ],
+        "channels": [
+            {
+                "id": str(guild_id + 10_000 + i),
+                "type": 0,
+                "name": f"channel-{i}",
+                "position": i,
+                "permission_overwrites": [],
+                "nsfw": False,
+                "parent_id": None,
+                "topic": None,
+                "last_message_id": None,
+                "rate_limit_per_user": 0,
+            }
+            for i in range(channel_count)
+        ],
+        "members": [
+            {
+                # Half of the users are shared between every guild.
+                "user": {
+                    "id": str(1_000_000 + (i if i % 2 else guild_id + i)),
+                    "username": f"user {i}",
+                    "discriminator": "0001",
+                    "avatar": None,
+                },
+                "nick": None,
+                "roles": [str(guild_id + i % role_count)],
+                "joined_at": "2021-01-01T00:00:00.000000+00:00",
+                "premium_since": None,
+                "deaf": False,
+                "mute": False,
+            }
+            for i in range(member_count)
+        ],
+        "presences": [],
+        "voice_states": [],
+    }
+
+
+def make_cache(app, settings):
+    factory = entity_factory.EntityFactoryImpl(app)
+    cache_impl = cache.CacheImpl(app, settings)
+    for i in range(guild_count):
+        definition = factory.deserialize_gateway_guild(make_guild_payload(574921006817476608 + i * 100_000))
+        cache_impl.replace_guild_contents(
+            definition.guild,
+            channels=definition.channels.values(),
+            roles=definition.roles.values(),
+            members=definition.members.values(),
+        )
+
+    return cache_impl
+
+
+def time_snapshot(name, settings):
+    app = object()
+    start = time.perf_counter()
+    cache_impl = make_cache(app, settings)
+    # Building the cache from payloads stands in for waiting for every GUILD_CREATE after identifying.
+    build = time.perf_counter() - start
+    best_save = best_load = float("inf")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "cache.snapshot")
+        # The garbage collector is a large source of noise for this many allocations.
+        gc.disable()
+        for _ in range(repeat):
+            start = time.perf_counter()
+            cache_impl.save_snapshot(path)
+            best_save = min(best_save, time.perf_counter() - start)
+
+            new_cache_impl = cache.CacheImpl(app, settings)
+            start = time.perf_counter()
+            assert new_cache_impl.load_snapshot(path)
+            best_load = min(best_load, time.perf_counter() - start)
+            del new_cache_impl
+            gc.collect()
+
+        gc.enable()
+        size = os.path.getsize(path)
+
+    print(
+        f"{name}: built from payloads in {build * 1_000:.1f} ms,",
+        f"save {best_save * 1_000:.1f} ms, load {best_load * 1_000:.1f} ms, {size / 1_000_000:.1f} MB",
+    )
+
+
+def main():
+    print(
+        f"{guild_count} guilds with {member_count} members, {role_count} roles and {channel_count} channels each",
+    )
+    time_snapshot("default member store", config.CacheSettings())
+    time_snapshot("columnar member store", config.CacheSettings(columnar_members=True))
+
+
+main()
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import time
+
+from hikari import intents
+from hikari.events import base_events
+from hikari.events import channel_events
+from hikari.events import guild_events
+from hikari.events import member_events
+from hikari.events import message_events
+from hikari.events import reaction_events
+from hikari.events import typing_events
+from hikari.impl import event_manager_base
+from hikari.internal import aio
+
+
+class CachedEventManager(event_manager_base.EventManagerBase):
+    pass
+
+
+class MROEventManager(event_manager_base.EventManagerBase):
+    # The dispatch implementation from before dispatch tables were introduced.
+    def dispatch(self, event):
+        if not isinstance(event, base_events.Event):
+            raise TypeError(f"Events must be subclasses of {base_events.Event.__name__}, not {type(event).__name__}")
+
+        mro = type(event).mro()
+
+        tasks = []
+
+        for cls in mro[: mro.index(base_events.Event) + 1]:
+            if cls in self._listeners:
+                for callback in self._listeners[cls]:
+                    tasks.append(self._invoke_callback(callback, event))
+
+            if cls not in self._waiters:
+                continue
+
+            waiter_set = self._waiters[cls]
+            for waiter in tuple(waiter_set):
+                predicate, future = waiter
+                if not future.done():
+                    try:
+                        result = predicate(event)
+                        if not result:
+                            continue
+                    except Exception as ex:
+                        future.set_exception(ex)
+                    else:
+                        future.set_result(event)
+
+                waiter_set.remove(waiter)
+
+        return asyncio.gather(*tasks) if tasks else aio.completed_future()
+
+
+async def noop(_):
+    pass
+
+
+subscribed_types = (
+    channel_events.GuildChannelCreateEvent,
+    channel_events.GuildChannelDeleteEvent,
+    guild_events.GuildAvailableEvent,
+    guild_events.GuildLeaveEvent,
+    member_events.MemberCreateEvent,
+    member_events.MemberDeleteEvent,
+    message_events.GuildMessageCreateEvent,
+    message_events.MessageCreateEvent,
+    reaction_events.GuildReactionAddEvent,
+    reaction_events.ReactionDeleteEvent,
+)
+
+events = {
+    "GuildMessageCreateEvent (2 listeners)": message_events.GuildMessageCreateEvent,
+    "GuildTypingEvent (no listeners)": typing_events.GuildTypingEvent,
+}
+
+number = 200_000
+batch = 1_000
+
+
+async def time_dispatch(manager, event):
+    # Warm up any caches first.
+    await manager.dispatch(event)
+
+    # Only the call to dispatch is timed, the listeners are awaited in batches outside of the timed section.
+    elapsed = 0.0
+    for _ in range(number // batch):
+        start = time.perf_counter()
+        futures = [manager.dispatch(event) for _ in range(batch)]
+        elapsed += time.perf_counter() - start
+        await asyncio.gather(*futures)
+
+    return elapsed / number
+
+
+async def main():
+    for name, event_type in events.items():
+        # Dispatch only looks at the type of the event, so we skip running the initializer.
+        event = object.__new__(event_type)
+        print(name)
+
+        for manager_type in (MROEventManager, CachedEventManager):
+            manager = manager_type(object(), intents.Intents.ALL)
+            for subscribed_type in subscribed_types:
+                manager.subscribe(subscribed_type, noop)
+
+            elapsed = await time_dispatch(manager, event)
+            print(f"    {manager_type.__name__}.dispatch", elapsed * 1_000_000, "µs")
+
+
+asyncio.run(main())
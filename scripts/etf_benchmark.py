@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import timeit
+import zlib
+
+from hikari.internal import data_binding
+from hikari.internal import etf
+
+
+def make_guild_create(member_count, snowflake):
+    # Discord sends snowflakes as strings over JSON, but as integers over ETF.
+    return {
+        "op": 0,
+        "s": 42,
+        "t": "GUILD_CREATE",
+        "d": {
+            "id": snowflake(290926798626357999),
+            "name": "Some big guild",
+            "owner_id": snowflake(115590097100865541),
+            "member_count": member_count,
+            "large": True,
+            "features": ["COMMUNITY", "NEWS", "ANIMATED_ICON", "INVITE_SPLASH"],
+            "roles": [
+                {
+                    "id": snowflake(345678912345678901 + r),
+                    "name": f"role {r}",
+                    "permissions": "104324673",
+                    "position": r,
+                }
+                for r in range(150)
+            ],
+            "members": [
+                {
+                    "user": {
+                        "id": snowflake(115590097100865541 + i),
+                        "username": f"user number {i}",
+                        "discriminator": f"{i % 10_000:04}",
+                        "avatar": "b3b24c6d7cbcdec129d5d537067061a8",
+                        "bot": False,
+                        "public_flags": 131072,
+                    },
+                    "nick": f"nick {i}" if i % 3 else None,
+                    "roles": [snowflake(345678912345678901 + r) for r in range(i % 8)],
+                    "joined_at": "2015-04-26T06:26:56.936000+00:00",
+                    "premium_since": None,
+                    "deaf": False,
+                    "mute": False,
+                }
+                for i in range(member_count)
+            ],
+        },
+    }
+
+
+codecs = {
+    "json": (data_binding.default_json_dumps, data_binding.default_json_loads, str),
+    "etf": (etf.slow_etf_dumps, etf.slow_etf_loads, int),
+}
+if etf.fast_etf_dumps is not None:
+    codecs["etf (erlpack dumps)"] = (etf.fast_etf_dumps, etf.slow_etf_loads, int)
+else:
+    print("erlpack is not installed, only the pure python ETF encoder will be benchmarked")
+
+number = 20
+
+for member_count in (250, 5_000, 25_000):
+    print(f"GUILD_CREATE with {member_count} members")
+
+    for name, (dumps, loads, snowflake) in codecs.items():
+        obj = make_guild_create(member_count, snowflake)
+        payload = dumps(obj)
+        payload = payload.encode("utf-8") if isinstance(payload, str) else payload
+
+        loads_time = timeit.timeit(lambda: loads(payload), number=number) / number
+        dumps_time = timeit.timeit(lambda: dumps(obj), number=number) / number
+
+        print(
+            f"    {name} size", f"{len(payload) / 1_024:.0f} KiB ({len(zlib.compress(payload)) / 1_024:.0f} KiB zlib)"
+        )
+        print(f"    {name} loads", loads_time * 1_000, "ms")
+        print(f"    {name} dumps", dumps_time * 1_000, "ms")
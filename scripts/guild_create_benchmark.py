@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import gc
+import time
+
+from hikari import config
+from hikari.impl import cache
+from hikari.impl import entity_factory
+
+guild_id = 574921006817476608
+member_count = 50_000
+role_count = 250
+channel_count = 500
+repeat = 5
+
+
+def make_guild_payload():
+    return {
+        "id": str(guild_id),
+        "name": "Benchmark guild",
+        "icon": None,
+        "splash": None,
+        "discovery_splash": None,
+        "owner_id": "1",
+        "afk_channel_id": None,
+        "afk_timeout": 300,
+        "verification_level": 0,
+        "default_message_notifications": 0,
+        "explicit_content_filter": 0,
+        "features": [],
+        "mfa_level": 0,
+        "application_id": None,
+        "system_channel_id": None,
+        "system_channel_flags": 0,
+        "rules_channel_id": None,
+        "vanity_url_code": None,
+        "description": None,
+        "banner": None,
+        "premium_tier": 0,
+        "preferred_locale": "en-GB",
+        "public_updates_channel_id": None,
+        "nsfw_level": 0,
+        "large": True,
+        "member_count": member_count,
+        "joined_at": "2021-01-01T00:00:00.000000+00:00",
+        "emojis": [],
+        "roles": [
+            {
+                "id": str(guild_id + i),
+                "name": f"role {i}",
+                "color": 0,
+                "hoist": False,
+                "position": i,
+                "permissions": "0",
+                "managed": False,
+                "mentionable": False,
+            }
+            for i in range(role_count)
+        ],
+        "channels": [
+            {
+                "id": str(guild_id + 10_000 + i),
+                "type": 0,
+                "name": f"channel-{i}",
+                "position": i,
+                "permission_overwrites": [],
+                "nsfw": False,
+                "parent_id": None,
+                "topic": None,
+                "last_message_id": None,
+                "rate_limit_per_user": 0,
+            }
+            for i in range(channel_count)
+        ],
+        "members": [
+            {
+                "user": {"id": str(1_000_000 + i), "username": f"user {i}", "discriminator": "0001", "avatar": None},
+                "nick": None,
+                "roles": [str(guild_id + i % role_count)],
+                "joined_at": "2021-01-01T00:00:00.000000+00:00",
+                "premium_since": None,
+                "deaf": False,
+                "mute": False,
+            }
+            for i in range(member_count)
+        ],
+        "presences": [
+            {
+                "user": {"id": str(1_000_000 + i)},
+                "status": "online",
+                "activities": [],
+                "client_status": {"desktop": "online"},
+            }
+            for i in range(0, member_count, 10)
+        ],
+        "voice_states": [],
+    }
+
+
+def per_item(cache_impl, definition):
+    # The ingestion path used by the guild create handler before the bulk methods were added.
+    guild_id_ = definition.guild.id
+    cache_impl.update_guild(definition.guild)
+    cache_impl.clear_guild_channels_for_guild(guild_id_)
+    for channel in definition.channels.values():
+        cache_impl.set_guild_channel(channel)
+
+    cache_impl.clear_emojis_for_guild(guild_id_)
+    for emoji in definition.emojis.values():
+        cache_impl.set_emoji(emoji)
+
+    cache_impl.clear_roles_for_guild(guild_id_)
+    for role in definition.roles.values():
+        cache_impl.set_role(role)
+
+    cache_impl.clear_members_for_guild(guild_id_)
+    for member in definition.members.values():
+        cache_impl.set_member(member)
+
+    cache_impl.clear_presences_for_guild(guild_id_)
+    for presence in definition.presences.values():
+        cache_impl.set_presence(presence)
+
+    cache_impl.clear_voice_states_for_guild(guild_id_)
+    for voice_state in definition.voice_states.values():
+        cache_impl.set_voice_state(voice_state)
+
+
+def bulk(cache_impl, definition):
+    cache_impl.replace_guild_contents(
+        definition.guild,
+        channels=definition.channels.values(),
+        emojis=definition.emojis.values(),
+        roles=definition.roles.values(),
+        members=definition.members.values(),
+        presences=definition.presences.values(),
+        voice_states=definition.voice_states.values(),
+    )
+
+
+def time_ingestion(name, function, definition):
+    best = float("inf")
+    # The garbage collector is a large source of noise for this many allocations.
+    gc.disable()
+    for _ in range(repeat):
+        cache_impl = cache.CacheImpl(object(), config.CacheSettings())
+        start = time.perf_counter()
+        function(cache_impl, definition)
+        best = min(best, time.perf_counter() - start)
+
+        # Replacing the contents of an already populated guild goes through the clear path too.
+        start = time.perf_counter()
+        function(cache_impl, definition)
+        replace = time.perf_counter() - start
+        gc.collect()
+
+    gc.enable()
+    print(f"{name}: {best * 1_000:.1f} ms into an empty cache, {replace * 1_000:.1f} ms replacing a populated guild")
+
+
+def main():
+    factory = entity_factory.EntityFactoryImpl(object())
+    definition = factory.deserialize_gateway_guild(make_guild_payload())
+    print(
+        f"GUILD_CREATE with {member_count} members, {len(definition.presences)} presences,",
+        f"{role_count} roles and {channel_count} channels",
+    )
+    time_ingestion("per item set_* calls", per_item, definition)
+    time_ingestion("replace_guild_contents", bulk, definition)
+
+
+main()
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import timeit
+
+from hikari.internal import data_binding
+
+
+def make_member(i):
+    return {
+        "user": {
+            "id": str(115590097100865541 + i),
+            "username": f"user number {i}",
+            "discriminator": f"{i % 10_000:04}",
+            "avatar": "b3b24c6d7cbcdec129d5d537067061a8",
+            "bot": False,
+            "public_flags": 131072,
+        },
+        "nick": f"nick {i}" if i % 3 else None,
+        "roles": [str(345678912345678901 + r) for r in range(i % 8)],
+        "joined_at": "2015-04-26T06:26:56.936000+00:00",
+        "premium_since": None,
+        "deaf": False,
+        "mute": False,
+        "pending": False,
+    }
+
+
+def make_presence(i):
+    return {
+        "user": {"id": str(115590097100865541 + i)},
+        "status": "online",
+        "client_status": {"desktop": "online"},
+        "activities": [
+            {
+                "name": "Rocket League",
+                "type": 0,
+                "created_at": 1620054323221,
+                "application_id": "379286085710381999",
+                "timestamps": {"start": 1620054322000},
+            }
+        ],
+    }
+
+
+def make_guild_create(member_count):
+    return {
+        "op": 0,
+        "s": 42,
+        "t": "GUILD_CREATE",
+        "d": {
+            "id": "290926798626357999",
+            "name": "Some big guild",
+            "icon": "1a2b3c4d",
+            "owner_id": "115590097100865541",
+            "member_count": member_count,
+            "large": True,
+            "features": ["COMMUNITY", "NEWS", "ANIMATED_ICON", "INVITE_SPLASH"],
+            "roles": [
+                {"id": str(345678912345678901 + r), "name": f"role {r}", "permissions": "104324673", "position": r}
+                for r in range(150)
+            ],
+            "channels": [
+                {
+                    "id": str(481221322491002881 + c),
+                    "type": 0,
+                    "name": f"channel-{c}",
+                    "position": c,
+                    "permission_overwrites": [
+                        {"id": "290926798626357999", "type": 0, "allow": "0", "deny": "1024"},
+                    ],
+                    "topic": "A topic which is not particularly short, because they never are",
+                }
+                for c in range(300)
+            ],
+            "members": [make_member(i) for i in range(member_count)],
+            "presences": [make_presence(i) for i in range(member_count // 2)],
+            "voice_states": [],
+        },
+    }
+
+
+codecs = {"stdlib": (data_binding.slow_json_dumps, data_binding.slow_json_loads)}
+if data_binding.fast_json_dumps is not None and data_binding.fast_json_loads is not None:
+    codecs[data_binding.fast_json_loads.__module__] = (data_binding.fast_json_dumps, data_binding.fast_json_loads)
+else:
+    print("No speedup JSON library is installed, only the standard library will be benchmarked")
+
+number = 20
+
+for member_count in (250, 5_000, 25_000):
+    payload_str = data_binding.slow_json_dumps(make_guild_create(member_count))
+    payload_bytes = payload_str.encode("utf-8")
+    obj = data_binding.slow_json_loads(payload_bytes)
+    print(f"GUILD_CREATE with {member_count} members ({len(payload_bytes) / 1_024:.0f} KiB)")
+
+    for name, (dumps, loads) in codecs.items():
+        loads_str_time = timeit.timeit(lambda: loads(payload_str), number=number) / number
+        loads_bytes_time = timeit.timeit(lambda: loads(payload_bytes), number=number) / number
+        dumps_time = timeit.timeit(lambda: dumps(obj), number=number) / number
+
+        print(f"    {name} loads(str)", loads_str_time * 1_000, "ms")
+        print(f"    {name} loads(bytes)", loads_bytes_time * 1_000, "ms")
+        print(f"    {name} dumps", dumps_time * 1_000, "ms")
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import gc
+import time
+import tracemalloc
+
+from hikari import config
+from hikari import snowflakes
+from hikari.impl import cache
+from hikari.impl import entity_factory
+
+guild_id = snowflakes.Snowflake(574921006817476608)
+member_count = 100_000
+chunk_size = 1_000
+role_count = 250
+repeat = 5
+
+
+class App:
+    def __init__(self):
+        self.entity_factory = entity_factory.EntityFactoryImpl(self)
+
+
+def make_chunks():
+    members = [
+        {
+            "user": {"id": str(1_000_000 + i), "username": f"user {i}", "discriminator": "0001", "avatar": None},
+            "nick": None,
+            "roles": [str(guild_id + i % role_count)],
+            "joined_at": "2021-01-01T00:00:00.000000+00:00",
+            "premium_since": None,
+            "deaf": False,
+            "mute": False,
+        }
+        for i in range(member_count)
+    ]
+    return [members[i : i + chunk_size] for i in range(0, member_count, chunk_size)]
+
+
+def eager_events(cache_impl, app, chunks):
+    # What the member chunk handler does when something listens for the chunk events.
+    for chunk in chunks:
+        members = {
+            snowflakes.Snowflake(m["user"]["id"]): app.entity_factory.deserialize_member(m, guild_id=guild_id)
+            for m in chunk
+        }
+        cache_impl.set_members_bulk(members.values())
+
+
+def payloads(cache_impl, app, chunks):
+    for chunk in chunks:
+        cache_impl.set_member_payloads(guild_id, chunk)
+
+
+def read_all(cache_impl):
+    for user_id in range(1_000_000, 1_000_000 + member_count):
+        cache_impl.get_member(guild_id, user_id)
+
+
+def run(name, ingest, settings, chunks):
+    app = App()
+    best = float("inf")
+    # The garbage collector is a large source of noise for this many allocations.
+    gc.disable()
+    for _ in range(repeat):
+        cache_impl = cache.CacheImpl(app, settings)
+        start = time.perf_counter()
+        ingest(cache_impl, app, chunks)
+        best = min(best, time.perf_counter() - start)
+        del cache_impl
+        gc.collect()
+
+    tracemalloc.start()
+    cache_impl = cache.CacheImpl(app, settings)
+    ingest(cache_impl, app, chunks)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    read_all(cache_impl)
+    first_read = time.perf_counter() - start
+    start = time.perf_counter()
+    read_all(cache_impl)
+    second_read = time.perf_counter() - start
+    gc.enable()
+
+    print(
+        f"{name}: ingest {best * 1_000:.0f} ms ({member_count / best / 1_000:.0f}k members/s),",
+        f"{size / 1024 / 1024:.1f} MiB, read all {first_read * 1_000:.0f} ms then {second_read * 1_000:.0f} ms",
+    )
+
+
+def main():
+    chunks = make_chunks()
+    print(f"{member_count} members in chunks of {chunk_size}")
+    run("eager, chunk events", eager_events, config.CacheSettings(), chunks)
+    run("eager, payloads", payloads, config.CacheSettings(), chunks)
+    run("lazy", payloads, config.CacheSettings(lazy_members=True), chunks)
+    run(
+        f"lazy, {member_count} materialized",
+        payloads,
+        config.CacheSettings(lazy_members=True, max_materialized_members=member_count),
+        chunks,
+    )
+
+
+main()
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import datetime
+import gc
+import random
+import time
+import tracemalloc
+
+from hikari import config
+from hikari import guilds
+from hikari import snowflakes
+from hikari import users
+from hikari.impl import cache as cache_impl
+
+guild_count = 10
+members_per_guild = 20_000
+lookups = 200_000
+
+random.seed(1234)
+role_sets = [tuple(snowflakes.Snowflake(role_id) for role_id in random.sample(range(1, 50), k)) for k in range(8)]
+joined_at = datetime.datetime(2020, 7, 15, 23, 30, 59, 501602, tzinfo=datetime.timezone.utc)
+
+
+def make_members():
+    for guild_id in range(1, guild_count + 1):
+        for user_id in range(members_per_guild):
+            user_id = snowflakes.Snowflake(10_000_000_000_000 + user_id)
+            user = users.UserImpl(
+                id=user_id,
+                app=None,
+                discriminator="0001",
+                username=f"user{user_id}",
+                avatar_hash=None,
+                is_bot=False,
+                is_system=False,
+                flags=users.UserFlag.NONE,
+            )
+            yield guilds.Member(
+                guild_id=snowflakes.Snowflake(guild_id),
+                user=user,
+                nickname=random.choice((None, None, "nick", f"nick{user_id}")),
+                role_ids=list(random.choice(role_sets)),
+                joined_at=joined_at + datetime.timedelta(seconds=user_id % 100_000),
+                premium_since=None,
+                is_deaf=False,
+                is_mute=False,
+                is_pending=False,
+            )
+
+
+def main():
+    members = list(make_members())
+    keys = [(random.randint(1, guild_count), random.choice(members).user.id) for _ in range(lookups)]
+
+    for name, columnar in (("dict of RefCell[MemberData]", False), ("ColumnarMemberStore", True)):
+        cache = cache_impl.CacheImpl(None, config.CacheSettings(columnar_members=columnar))
+
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        for member in members:
+            cache.set_member(member)
+
+        set_elapsed = time.perf_counter() - start
+        gc.collect()
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        for guild_id, user_id in keys:
+            cache.get_member(guild_id, user_id)
+
+        get_elapsed = time.perf_counter() - start
+
+        print(name)
+        print(f"    memory: {memory / len(members):.0f} bytes per member ({memory / 1024 / 1024:.1f} MiB total)")
+        print(f"    set_member: {set_elapsed / len(members) * 1_000_000:.2f} µs")
+        print(f"    get_member: {get_elapsed / lookups * 1_000_000:.2f} µs")
+
+
+main()
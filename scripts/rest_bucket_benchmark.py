@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark requests to a single REST bucket against a local stub server.
+
+The stub server simulates network latency and a fixed-window rate limit with
+the same headers Discord sends, so this shows how long a fan-out to one route
+takes with and without concurrent requests per bucket.
+"""
+import asyncio
+import time
+
+from aiohttp import web
+
+from hikari import config
+from hikari.impl import rest
+
+guild_id = 574921006817476608
+role_id = 574921006817476609
+request_count = 300
+latency = 0.05
+window = 1.0
+limit = 100
+
+
+class StubServer:
+    def __init__(self):
+        self.reset_at = 0.0
+        self.remaining = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.rate_limited = 0
+
+    async def handle(self, request):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # Half of the latency before the rate limit is counted and half after it, like a real round trip.
+            await asyncio.sleep(latency / 2)
+            now = time.perf_counter()
+            if self.reset_at <= now:
+                self.reset_at = now + window
+                self.remaining = limit
+
+            headers = {
+                "X-RateLimit-Bucket": "stub-bucket",
+                "X-RateLimit-Limit": str(limit),
+                "X-RateLimit-Reset-After": f"{self.reset_at - now:.3f}",
+            }
+            if self.remaining <= 0:
+                self.rate_limited += 1
+                headers["X-RateLimit-Remaining"] = "0"
+                await asyncio.sleep(latency / 2)
+                return web.json_response(
+                    {"retry_after": self.reset_at - now, "global": False}, status=429, headers=headers
+                )
+
+            self.remaining -= 1
+            headers["X-RateLimit-Remaining"] = str(self.remaining)
+            await asyncio.sleep(latency / 2)
+            return web.Response(status=204, headers=headers)
+        finally:
+            self.in_flight -= 1
+
+
+async def run(concurrent_bucket_requests):
+    stub = StubServer()
+    app = web.Application()
+    app.router.add_put("/guilds/{guild}/members/{user}/roles/{role}", stub.handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    rest_app = rest.RESTApp(
+        http_settings=config.HTTPSettings(concurrent_bucket_requests=concurrent_bucket_requests),
+        url=f"http://127.0.0.1:{port}",
+    )
+    try:
+        async with rest_app.acquire("token", "Bot") as client:
+            # Unknown buckets are keyed by the whole compiled route, so make one request to learn the bucket first.
+            await client.add_role_to_member(guild_id, 1, role_id)
+            await asyncio.sleep(window)
+
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(client.add_role_to_member(guild_id, 1_000_000 + i, role_id) for i in range(request_count))
+            )
+            elapsed = time.perf_counter() - start
+    finally:
+        await runner.cleanup()
+
+    mode = "concurrent" if concurrent_bucket_requests else "serialized"
+    print(
+        f"{mode}: {request_count} requests in {elapsed:.2f}s ({request_count / elapsed:.0f} req/s), "
+        f"max {stub.max_in_flight} in flight, {stub.rate_limited} rate limited"
+    )
+
+
+async def main():
+    print(f"{request_count} requests to one bucket, {latency * 1_000:.0f}ms latency, {limit} requests per {window}s")
+    await run(False)
+    await run(True)
+
+
+asyncio.run(main())
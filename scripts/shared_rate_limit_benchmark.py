@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark several processes making requests to one REST bucket against a local stub server.
+
+Each worker process has its own REST client. Without a shared rate limit
+store they only know about their own requests, so between them they run
+into the stub server's rate limit. With a store they share the bucket's
+state through a rate limit coordinator.
+"""
+import asyncio
+import multiprocessing
+import os
+import tempfile
+import time
+
+from aiohttp import web
+
+from hikari import config
+from hikari.impl import rate_limit_store
+from hikari.impl import rest
+
+guild_id = 574921006817476608
+role_id = 574921006817476609
+process_count = 4
+requests_per_process = 50
+latency = 0.05
+window = 1.0
+limit = 50
+
+
+class StubServer:
+    def __init__(self):
+        self.reset_at = 0.0
+        self.remaining = 0
+        self.rate_limited = 0
+        self.requests = 0
+
+    async def handle(self, request):
+        self.requests += 1
+        await asyncio.sleep(latency / 2)
+        now = time.perf_counter()
+        if self.reset_at <= now:
+            self.reset_at = now + window
+            self.remaining = limit
+
+        headers = {
+            "X-RateLimit-Bucket": "stub-bucket",
+            "X-RateLimit-Limit": str(limit),
+            "X-RateLimit-Reset-After": f"{self.reset_at - now:.3f}",
+        }
+        if self.remaining <= 0:
+            self.rate_limited += 1
+            headers["X-RateLimit-Remaining"] = "0"
+            await asyncio.sleep(latency / 2)
+            return web.json_response({"retry_after": self.reset_at - now, "global": False}, status=429, headers=headers)
+
+        self.remaining -= 1
+        headers["X-RateLimit-Remaining"] = str(self.remaining)
+        await asyncio.sleep(latency / 2)
+        return web.Response(status=204, headers=headers)
+
+
+async def work(index, port, socket_path):
+    store = None if socket_path is None else rate_limit_store.UnixSocketRateLimitStore(socket_path)
+    rest_app = rest.RESTApp(
+        http_settings=config.HTTPSettings(concurrent_bucket_requests=True),
+        rate_limit_store=store,
+        url=f"http://127.0.0.1:{port}",
+    )
+    try:
+        async with rest_app.acquire("token", "Bot") as client:
+            # Unknown buckets are keyed by the whole compiled route, so make one request to learn the bucket first.
+            await client.add_role_to_member(guild_id, index, role_id)
+            await asyncio.sleep(window)
+            await asyncio.gather(
+                *(
+                    client.add_role_to_member(guild_id, 1_000_000 * (index + 1) + i, role_id)
+                    for i in range(requests_per_process)
+                )
+            )
+    finally:
+        if store is not None:
+            await store.close()
+
+
+def worker(index, port, socket_path):
+    asyncio.run(work(index, port, socket_path))
+
+
+async def run(socket_path):
+    stub = StubServer()
+    app = web.Application()
+    app.router.add_put("/guilds/{guild}/members/{user}/roles/{role}", stub.handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    coordinator = None
+    if socket_path is not None:
+        coordinator = rate_limit_store.RateLimitCoordinator(socket_path)
+        await coordinator.start()
+
+    context = multiprocessing.get_context("spawn")
+    processes = [context.Process(target=worker, args=(i, port, socket_path)) for i in range(process_count)]
+    try:
+        start = time.perf_counter()
+        for process in processes:
+            process.start()
+
+        while any(process.is_alive() for process in processes):
+            await asyncio.sleep(0.05)
+
+        elapsed = time.perf_counter() - start
+    finally:
+        if coordinator is not None:
+            await coordinator.close()
+
+        await runner.cleanup()
+
+    mode = "shared store" if socket_path is not None else "local only"
+    print(
+        f"{mode}: {stub.requests} HTTP requests in {elapsed:.2f}s, {stub.rate_limited} rate limited "
+        f"({', '.join(str(process.exitcode) for process in processes)} exit codes)"
+    )
+
+
+async def main():
+    print(
+        f"{process_count} processes x {requests_per_process} requests to one bucket, {latency * 1_000:.0f}ms latency, "
+        f"{limit} requests per {window}s"
+    )
+    await run(None)
+    with tempfile.TemporaryDirectory() as directory:
+        await run(os.path.join(directory, "rate-limits.sock"))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
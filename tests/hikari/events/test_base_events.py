@@ -143,3 +143,11 @@ class TestExceptionEvent:
     async def test_retry(self, event):
         await event.retry()
         event.failed_callback.assert_awaited_once_with(event.failed_event)
+
+    @pytest.mark.asyncio()
+    async def test_retry_when_callback_is_not_coroutine_function(self, event):
+        event.failed_callback = mock.Mock(return_value=None)
+
+        await event.retry()
+
+        event.failed_callback.assert_called_once_with(event.failed_event)
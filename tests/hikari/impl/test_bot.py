@@ -39,6 +39,8 @@ from hikari.impl import cache as cache_impl
 from hikari.impl import entity_factory as entity_factory_impl
 from hikari.impl import event_factory as event_factory_impl
 from hikari.impl import event_manager as event_manager_impl
+from hikari.impl import resolver as resolver_impl
+from hikari.impl import response_cache as response_cache_impl
 from hikari.impl import rest as rest_impl
 from hikari.impl import shard as shard_impl
 from hikari.impl import voice as voice_impl
@@ -67,6 +69,10 @@ class TestGatewayBot:
     def rest(self):
         return mock.Mock()
 
+    @pytest.fixture()
+    def resolver(self):
+        return mock.Mock()
+
     @pytest.fixture()
     def voice(self):
         return mock.Mock()
@@ -95,6 +101,7 @@ class TestGatewayBot:
         event_factory,
         event_manager,
         rest,
+        resolver,
         voice,
         executor,
         intents,
@@ -108,6 +115,7 @@ class TestGatewayBot:
         stack.enter_context(mock.patch.object(event_manager_impl, "EventManagerImpl", return_value=event_manager))
         stack.enter_context(mock.patch.object(voice_impl, "VoiceComponentImpl", return_value=voice))
         stack.enter_context(mock.patch.object(rest_impl, "RESTClientImpl", return_value=rest))
+        stack.enter_context(mock.patch.object(resolver_impl, "ResolverImpl", return_value=resolver))
         stack.enter_context(mock.patch.object(ux, "init_logging"))
         stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "print_banner"))
 
@@ -129,13 +137,19 @@ class TestGatewayBot:
         event_manager = stack.enter_context(mock.patch.object(event_manager_impl, "EventManagerImpl"))
         voice = stack.enter_context(mock.patch.object(voice_impl, "VoiceComponentImpl"))
         rest = stack.enter_context(mock.patch.object(rest_impl, "RESTClientImpl"))
+        resolver = stack.enter_context(mock.patch.object(resolver_impl, "ResolverImpl"))
         init_logging = stack.enter_context(mock.patch.object(ux, "init_logging"))
         print_banner = stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "print_banner"))
         executor = object()
-        cache_settings = object()
+        cache_settings = mock.Mock()
+        data_format = object()
+        dispatch_settings = object()
+        dumps = object()
         http_settings = object()
+        loads = object()
         proxy_settings = object()
         intents = object()
+        rate_limit_store = object()
 
         with stack:
             bot = bot_impl.GatewayBot(
@@ -145,21 +159,36 @@ class TestGatewayBot:
                 executor=executor,
                 force_color=True,
                 cache_settings=cache_settings,
+                data_format=data_format,
+                dispatch_settings=dispatch_settings,
+                dumps=dumps,
                 http_settings=http_settings,
                 intents=intents,
+                loads=loads,
                 logs="DEBUG",
                 max_rate_limit=200,
                 max_retries=0,
                 proxy_settings=proxy_settings,
+                rate_limit_store=rate_limit_store,
                 rest_url="somewhere.com",
             )
 
+        assert bot._data_format is data_format
+        assert bot._dumps is dumps
         assert bot._http_settings is http_settings
+        assert bot._loads is loads
         assert bot._proxy_settings is proxy_settings
         assert bot._cache is cache.return_value
         cache.assert_called_once_with(bot, cache_settings)
         assert bot._event_manager is event_manager.return_value
-        event_manager.assert_called_once_with(event_factory.return_value, intents, cache=cache.return_value)
+        event_manager.assert_called_once_with(
+            event_factory.return_value,
+            intents,
+            cache=cache.return_value,
+            cache_components=cache_settings.components,
+            dispatch_settings=dispatch_settings,
+            response_cache=None,
+        )
         assert bot._entity_factory is entity_factory.return_value
         entity_factory.assert_called_once_with(bot)
         assert bot._event_factory is event_factory.return_value
@@ -169,16 +198,22 @@ class TestGatewayBot:
         assert bot._rest is rest.return_value
         rest.assert_called_once_with(
             cache=bot._cache,
+            dumps=dumps,
             entity_factory=bot._entity_factory,
             executor=executor,
             http_settings=bot._http_settings,
+            loads=loads,
             max_rate_limit=200,
             max_retries=0,
             proxy_settings=bot._proxy_settings,
+            rate_limit_store=rate_limit_store,
+            response_cache=None,
             rest_url="somewhere.com",
             token="token",
             token_type=applications.TokenType.BOT,
         )
+        assert bot._resolve is resolver.return_value
+        resolver.assert_called_once_with(bot._cache, bot._rest)
 
         init_logging.assert_called_once_with("DEBUG", False, True)
         print_banner.assert_called_once_with("testing", False, True)
@@ -207,6 +242,28 @@ class TestGatewayBot:
         cache.assert_called_once_with(bot, cache_settings.return_value)
         cache_settings.assert_called_once_with()
 
+    @pytest.mark.parametrize("invalidate_on_events", [True, False])
+    def test_init_when_response_cache_settings(self, invalidate_on_events):
+        stack = contextlib.ExitStack()
+        stack.enter_context(mock.patch.object(cache_impl, "CacheImpl"))
+        stack.enter_context(mock.patch.object(entity_factory_impl, "EntityFactoryImpl"))
+        stack.enter_context(mock.patch.object(event_factory_impl, "EventFactoryImpl"))
+        event_manager = stack.enter_context(mock.patch.object(event_manager_impl, "EventManagerImpl"))
+        stack.enter_context(mock.patch.object(voice_impl, "VoiceComponentImpl"))
+        rest = stack.enter_context(mock.patch.object(rest_impl, "RESTClientImpl"))
+        stack.enter_context(mock.patch.object(ux, "init_logging"))
+        stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "print_banner"))
+        response_cache = stack.enter_context(mock.patch.object(response_cache_impl, "LRUResponseCache"))
+        response_cache_settings = config.ResponseCacheSettings(invalidate_on_events=invalidate_on_events)
+
+        with stack:
+            bot_impl.GatewayBot("token", response_cache_settings=response_cache_settings)
+
+        response_cache.assert_called_once_with(response_cache_settings)
+        assert rest.call_args.kwargs["response_cache"] is response_cache.return_value
+        expected_invalidated_cache = response_cache.return_value if invalidate_on_events else None
+        assert event_manager.call_args.kwargs["response_cache"] is expected_invalidated_cache
+
     def test_cache(self, bot, cache):
         assert bot.cache is cache
 
@@ -268,6 +325,9 @@ class TestGatewayBot:
     def test_rest(self, bot, rest):
         assert bot.rest is rest
 
+    def test_resolve(self, bot, resolver):
+        assert bot.resolve is resolver
+
     def test_is_alive(self, bot):
         bot._is_alive = True
 
@@ -333,7 +393,7 @@ class TestGatewayBot:
                 if self._error:
                     raise self._error
 
-            def __call__(self):
+            def __call__(self, **kwargs):
                 return self
 
             def assert_awaited_once(self):
@@ -348,6 +408,7 @@ class TestGatewayBot:
         get_running_loop.return_value.create_future.return_value = mock_future
 
         event_manager.dispatch = mock.AsyncMock()
+        event_manager.close_dispatch_queues = mock.AsyncMock()
         rest.close = AwaitableMock()
         voice.close = AwaitableMock()
         bot._closing_event = closing_event = mock.Mock(is_set=mock.Mock(return_value=False))
@@ -400,6 +461,7 @@ class TestGatewayBot:
         # Clear out maps
         assert bot._shards == {}
         cache.clear.assert_called_once_with()
+        event_manager.close_dispatch_queues.assert_awaited_once_with()
 
         # Dispatching events in the right order
         event_manager.dispatch.assert_has_calls(
@@ -410,6 +472,44 @@ class TestGatewayBot:
             any_order=False,
         )
 
+    @pytest.mark.asyncio()
+    async def test__close_when_session_store(self, bot, event_manager, rest, voice):
+        event_manager.dispatch = mock.AsyncMock()
+        event_manager.close_dispatch_queues = mock.AsyncMock()
+        rest.close = mock.AsyncMock()
+        voice.close = mock.AsyncMock()
+        bot._closing_event = mock.Mock()
+        bot._closed_event = None
+        bot._session_store = mock.Mock(save_session=mock.AsyncMock())
+        shard0 = mock.Mock(id=0, close=mock.AsyncMock(), session=mock.Mock(shard_id=0))
+        shard1 = mock.Mock(id=1, close=mock.AsyncMock(), session=None)
+        bot._shards = {0: shard0, 1: shard1}
+
+        await bot._close()
+
+        shard0.close.assert_awaited_once_with(resumable=True)
+        shard1.close.assert_awaited_once_with(resumable=True)
+        bot._session_store.save_session.assert_awaited_once_with(shard0.session)
+
+    @pytest.mark.asyncio()
+    async def test__close_when_cache_snapshot_path(self, bot, event_manager, rest, voice, cache):
+        event_manager.dispatch = mock.AsyncMock()
+        event_manager.close_dispatch_queues = mock.AsyncMock()
+        rest.close = mock.AsyncMock()
+        voice.close = mock.AsyncMock()
+        bot._closing_event = mock.Mock()
+        bot._closed_event = None
+        bot._cache_snapshot_path = "cache.snapshot"
+        bot._executor = None
+        bot._shards = {}
+        cache.settings.components = config.CacheComponents.ALL
+        cache.save_snapshot.side_effect = lambda _: cache.clear.assert_not_called()
+
+        await bot._close()
+
+        cache.save_snapshot.assert_called_once_with("cache.snapshot")
+        cache.clear.assert_called_once_with()
+
     def test_dispatch(self, bot, event_manager):
         event = object()
 
@@ -465,9 +565,9 @@ class TestGatewayBot:
     def test_listen(self, bot, event_manager):
         event = object()
 
-        assert bot.listen(event) is event_manager.listen.return_value
+        assert bot.listen(event, serial_key="guild_id") is event_manager.listen.return_value
 
-        event_manager.listen.assert_called_once_with(event)
+        event_manager.listen.assert_called_once_with(event, serial_key="guild_id")
 
     def test_print_banner(self, bot):
         with mock.patch.object(ux, "print_banner") as print_banner:
@@ -667,9 +767,9 @@ class TestGatewayBot:
         event_type = object()
         callback = object()
 
-        bot.subscribe(event_type, callback)
+        bot.subscribe(event_type, callback, serial_key="guild_id")
 
-        bot._event_manager.subscribe.assert_called_once_with(event_type, callback)
+        bot._event_manager.subscribe.assert_called_once_with(event_type, callback, serial_key="guild_id")
 
     def test_unsubscribe(self, bot):
         event_type = object()
@@ -686,10 +786,12 @@ class TestGatewayBot:
         bot._event_manager.wait_for = mock.AsyncMock()
 
         with mock.patch.object(bot_impl.GatewayBot, "_check_if_alive") as check_if_alive:
-            await bot.wait_for(event_type, timeout=100, predicate=predicate)
+            await bot.wait_for(event_type, timeout=100, predicate=predicate, key=("id", 123))
 
         check_if_alive.assert_called_once_with()
-        bot._event_manager.wait_for.assert_awaited_once_with(event_type, timeout=100, predicate=predicate)
+        bot._event_manager.wait_for.assert_awaited_once_with(
+            event_type, timeout=100, predicate=predicate, key=("id", 123)
+        )
 
     def test_get_shard_when_not_present(self, bot):
         shard = mock.Mock(shard_count=96)
@@ -816,6 +918,8 @@ class TestGatewayBot:
                 assert returned is shard_obj
 
         shard.assert_called_once_with(
+            data_format=bot._data_format,
+            dumps=bot._dumps,
             http_settings=bot._http_settings,
             proxy_settings=bot._proxy_settings,
             event_manager=bot._event_manager,
@@ -826,6 +930,8 @@ class TestGatewayBot:
             initial_idle_since=None,
             initial_status=status,
             large_threshold=1000,
+            loads=bot._loads,
+            session=None,
             shard_id=1,
             shard_count=3,
             token=bot._token,
@@ -858,6 +964,99 @@ class TestGatewayBot:
                         closing_event=bot._closing_event,
                     )
 
+    def test__check_session_start_limit(self, bot):
+        bot._check_session_start_limit(mock.Mock(remaining=2), 2)
+
+    def test__check_session_start_limit_when_exceeded(self, bot):
+        with pytest.raises(errors.GatewayError, match="Attempted to start more sessions than were allowed"):
+            bot._check_session_start_limit(mock.Mock(remaining=1), 2)
+
+    @pytest.mark.asyncio()
+    async def test__load_stored_state(self, bot):
+        with mock.patch.object(bot_impl.GatewayBot, "_load_cache_snapshot", new=mock.AsyncMock()) as load_snapshot:
+            with mock.patch.object(bot_impl.GatewayBot, "_load_sessions", new=mock.AsyncMock()) as load_sessions:
+                assert await bot._load_stored_state({0, 1}, 2) is load_sessions.return_value
+
+        load_snapshot.assert_awaited_once_with()
+        load_sessions.assert_awaited_once_with({0, 1}, 2, load_snapshot.return_value)
+
+    @pytest.mark.asyncio()
+    async def test__load_sessions_when_no_session_store(self, bot):
+        assert await bot._load_sessions({0, 1}, 2, False) == {}
+
+    @pytest.mark.asyncio()
+    async def test__load_sessions(self, bot, cache):
+        session = object()
+        cache.settings.components = config.CacheComponents.NONE
+        bot._session_store = mock.Mock(
+            load_session=mock.AsyncMock(side_effect=[session, None]), delete_session=mock.AsyncMock()
+        )
+
+        assert await bot._load_sessions([0, 1], 2, False) == {0: session}
+
+        bot._session_store.load_session.assert_has_awaits([mock.call(0, 2), mock.call(1, 2)])
+        bot._session_store.delete_session.assert_has_awaits([mock.call(0), mock.call(1)])
+
+    @pytest.mark.asyncio()
+    async def test__load_sessions_when_cache_enabled(self, bot, cache):
+        cache.settings.components = config.CacheComponents.GUILDS
+        bot._session_store = mock.Mock(
+            load_session=mock.AsyncMock(return_value=object()), delete_session=mock.AsyncMock()
+        )
+
+        assert await bot._load_sessions([0], 1, False) == {}
+
+        bot._session_store.delete_session.assert_awaited_once_with(0)
+
+    @pytest.mark.asyncio()
+    async def test__load_sessions_when_cache_restored(self, bot, cache):
+        session = object()
+        cache.settings.components = config.CacheComponents.GUILDS
+        bot._session_store = mock.Mock(
+            load_session=mock.AsyncMock(return_value=session), delete_session=mock.AsyncMock()
+        )
+
+        assert await bot._load_sessions([0], 1, True) == {0: session}
+
+    @pytest.mark.asyncio()
+    async def test__load_cache_snapshot_when_no_path(self, bot, cache):
+        assert await bot._load_cache_snapshot() is False
+
+        cache.load_snapshot.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test__load_cache_snapshot_when_cache_disabled(self, bot, cache, tmp_path):
+        bot._cache_snapshot_path = tmp_path / "cache.snapshot"
+        cache.settings.components = config.CacheComponents.NONE
+
+        assert await bot._load_cache_snapshot() is False
+
+        cache.load_snapshot.assert_not_called()
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize("restored", [True, False])
+    async def test__load_cache_snapshot(self, bot, cache, tmp_path, restored):
+        path = tmp_path / "cache.snapshot"
+        path.write_bytes(b"snapshot")
+        bot._cache_snapshot_path = path
+        bot._executor = None
+        cache.settings.components = config.CacheComponents.ALL
+        cache.load_snapshot.return_value = restored
+
+        assert await bot._load_cache_snapshot() is restored
+
+        cache.load_snapshot.assert_called_once_with(path)
+        assert not path.exists()
+
+    @pytest.mark.asyncio()
+    async def test__load_cache_snapshot_when_file_missing(self, bot, cache, tmp_path):
+        bot._cache_snapshot_path = tmp_path / "cache.snapshot"
+        bot._executor = None
+        cache.settings.components = config.CacheComponents.ALL
+        cache.load_snapshot.return_value = False
+
+        assert await bot._load_cache_snapshot() is False
+
     @pytest.mark.parametrize("activity", [undefined.UNDEFINED, None])
     def test_validate_activity_when_no_activity(self, bot, activity):
         with mock.patch.object(warnings, "warn") as warn:
@@ -26,6 +26,7 @@ import mock
 import pytest
 
 from hikari import errors
+from hikari.api import rate_limit_store
 from hikari.impl import buckets
 from hikari.impl import rate_limits
 from hikari.internal import routes
@@ -108,6 +109,103 @@ class TestRESTBucket:
                 super_acquire.assert_awaited_once_with()
                 rl._lock.acquire.assert_awaited_once_with()
 
+    @pytest.mark.asyncio()
+    async def test_acquire_when_concurrent_requests_releases_lock_after_reserving(self, compiled_route):
+        with buckets.RESTBucket("spaghetti", compiled_route, float("inf"), concurrent_requests=True) as rl:
+            rl._lock = mock.Mock(acquire=mock.AsyncMock())
+            with mock.patch.object(rate_limits.WindowedBurstRateLimiter, "acquire") as super_acquire:
+                await rl.acquire()
+
+            super_acquire.assert_awaited_once_with()
+            rl._lock.release.assert_called_once_with()
+            assert rl.in_flight == 1
+
+            await rl.__aexit__(None, None, None)
+
+            rl._lock.release.assert_called_once_with()
+            assert rl.in_flight == 0
+
+    @pytest.mark.asyncio()
+    async def test_acquire_when_concurrent_requests_and_unknown_bucket_keeps_lock(self, compiled_route):
+        with buckets.RESTBucket(buckets.UNKNOWN_HASH, compiled_route, float("inf"), concurrent_requests=True) as rl:
+            rl._lock = mock.Mock(acquire=mock.AsyncMock())
+            await rl.acquire()
+
+            rl._lock.release.assert_not_called()
+            assert rl.in_flight == 0
+
+            await rl.__aexit__(None, None, None)
+
+            rl._lock.release.assert_called_once_with()
+
+    @pytest.mark.asyncio()
+    async def test_acquire_when_concurrent_requests_and_too_long_ratelimit_releases_lock(self, compiled_route):
+        with buckets.RESTBucket("spaghetti", compiled_route, 60, concurrent_requests=True) as rl:
+            rl.reset_at = time.perf_counter() + 999999999999999999999999999
+            with mock.patch.object(buckets.RESTBucket, "is_rate_limited", return_value=True):
+                with pytest.raises(errors.RateLimitTooLongError):
+                    await rl.acquire()
+
+            assert not rl._lock.locked()
+            assert rl.in_flight == 0
+
+    @pytest.mark.asyncio()
+    async def test_concurrent_requests_admits_up_to_remaining(self, compiled_route):
+        with buckets.RESTBucket("spaghetti", compiled_route, float("inf"), concurrent_requests=True) as rl:
+            rl.update_rate_limit(3, 5, hikari_date.monotonic() + 60)
+            entered = []
+            release = asyncio.Event()
+
+            async def request(i):
+                async with rl:
+                    entered.append(i)
+                    await release.wait()
+
+            tasks = [asyncio.create_task(request(i)) for i in range(5)]
+            await hikari_test_helpers.idle()
+
+            assert entered == [0, 1, 2]
+            assert rl.in_flight == 3
+            assert rl.remaining == 0
+
+            release.set()
+            await hikari_test_helpers.idle()
+            assert entered == [0, 1, 2]
+            assert rl.in_flight == 0
+
+            for task in tasks:
+                task.cancel()
+
+    def test_update_rate_limit_when_concurrent_requests_accounts_for_other_requests_in_flight(self, compiled_route):
+        with buckets.RESTBucket(__name__, compiled_route, float("inf"), concurrent_requests=True) as rl:
+            rl._in_flight = 4
+            rl.remaining = 0
+            rl.reset_at = 3
+
+            with mock.patch.object(hikari_date, "monotonic", return_value=4.20):
+                rl.update_rate_limit(9, 18, 27)
+
+            assert rl.remaining == 6
+            assert rl.limit == 18
+            assert rl.reset_at == 27
+            assert rl.period == 27 - 4.20
+
+    @pytest.mark.parametrize(("remaining", "expected"), [(9, 3), (4, 2)])
+    def test_update_rate_limit_when_concurrent_requests_in_same_window_only_restricts(
+        self, compiled_route, remaining, expected
+    ):
+        with buckets.RESTBucket(__name__, compiled_route, float("inf"), concurrent_requests=True) as rl:
+            rl._in_flight = 3
+            rl.remaining = 3
+            rl.reset_at = 30
+
+            with mock.patch.object(hikari_date, "monotonic", return_value=4.20):
+                rl.update_rate_limit(remaining, 18, 27)
+
+            assert rl.remaining == expected
+            assert rl.reset_at == 30
+            assert rl.period == 30 - 4.20
+
     def test_resolve_when_not_unknown(self, compiled_route):
         with buckets.RESTBucket("spaghetti", compiled_route, float("inf")) as rl:
             with pytest.raises(RuntimeError, match=r"Cannot resolve known bucket"):
@@ -374,8 +472,149 @@ class TestRESTBucketManager:
                 mgr.update_rate_limits(route, "123", 22, 23, 5.32)
                 bucket.update_rate_limit.assert_called_once_with(22, 23, 27 + 5.32)
 
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize("concurrent_requests", [True, False])
+    async def test_acquire_route_passes_concurrent_requests_to_bucket(self, concurrent_requests):
+        with buckets.RESTBucketManager(max_rate_limit=float("inf"), concurrent_requests=concurrent_requests) as mgr:
+            route = mock.Mock()
+            route.create_real_bucket_hash = mock.Mock(return_value="eat pant;1234")
+
+            bucket = mgr.acquire(route)
+
+            assert bucket._concurrent_requests is concurrent_requests
+
     @pytest.mark.parametrize(("gc_task", "is_started"), [(None, False), (mock.Mock(spec_set=asyncio.Task), True)])
     def test_is_started(self, gc_task, is_started):
         with buckets.RESTBucketManager(max_rate_limit=float("inf")) as mgr:
             mgr.gc_task = gc_task
             assert mgr.is_started is is_started
+
+
+class TestRESTBucketManagerWithStore:
+    @pytest.fixture()
+    def compiled_route(self):
+        return routes.Route("GET", "/channels/{channel}/messages").compile(channel=123)
+
+    @pytest.fixture()
+    def store(self):
+        store = mock.AsyncMock(spec=rate_limit_store.RateLimitStore)
+        store.get_bucket_hash.return_value = None
+        store.reserve.return_value = 0.0
+        return store
+
+    @pytest.fixture()
+    def manager(self, store):
+        with buckets.RESTBucketManager(max_rate_limit=10, store=store) as mgr:
+            yield mgr
+
+    @pytest.mark.asyncio()
+    async def test_acquire_when_route_known_to_store(self, manager, store, compiled_route):
+        store.get_bucket_hash.return_value = "abc"
+
+        async with manager.acquire(compiled_route, use_global_rate_limit=False):
+            bucket = manager.real_hashes_to_buckets["abc;123"]
+            assert bucket._lock.locked()
+
+        assert not bucket._lock.locked()
+        assert manager.routes_to_hashes[compiled_route.route] == "abc"
+        store.get_bucket_hash.assert_awaited_once_with("GET /channels/{channel}/messages")
+        store.reserve.assert_awaited_once_with("abc;123", use_global_rate_limit=False)
+
+    @pytest.mark.asyncio()
+    async def test_acquire_when_route_unknown(self, manager, store, compiled_route):
+        async with manager.acquire(compiled_route):
+            pass
+
+        assert compiled_route.route not in manager.routes_to_hashes
+        store.reserve.assert_awaited_once_with(None, use_global_rate_limit=True)
+
+    @pytest.mark.asyncio()
+    async def test_acquire_when_route_known_locally_does_not_ask_store(self, manager, store, compiled_route):
+        manager.routes_to_hashes[compiled_route.route] = "abc"
+
+        async with manager.acquire(compiled_route):
+            pass
+
+        store.get_bucket_hash.assert_not_called()
+        store.reserve.assert_awaited_once_with("abc;123", use_global_rate_limit=True)
+
+    @pytest.mark.asyncio()
+    async def test_acquire_waits_until_store_reserves(self, manager, store, compiled_route):
+        store.reserve.side_effect = [2.5, 0.0]
+
+        with mock.patch.object(asyncio, "sleep") as sleep:
+            async with manager.acquire(compiled_route):
+                pass
+
+        sleep.assert_awaited_once_with(2.5)
+        assert store.reserve.await_count == 2
+
+    @pytest.mark.asyncio()
+    async def test_acquire_when_store_wait_too_long(self, manager, store, compiled_route):
+        manager.routes_to_hashes[compiled_route.route] = "abc"
+        store.reserve.return_value = 11
+
+        context = manager.acquire(compiled_route)
+
+        with pytest.raises(errors.RateLimitTooLongError):
+            await context.__aenter__()
+
+        assert not manager.real_hashes_to_buckets["abc;123"]._lock.locked()
+
+    @pytest.mark.asyncio()
+    async def test_acquire_when_store_unavailable_uses_local_rate_limits(self, manager, store, compiled_route):
+        store.get_bucket_hash.side_effect = ConnectionRefusedError
+        store.reserve.side_effect = ConnectionRefusedError
+
+        with mock.patch.object(buckets, "_LOGGER") as logger:
+            for _ in range(2):
+                async with manager.acquire(compiled_route):
+                    pass
+
+            logger.warning.assert_called_once()
+
+            store.get_bucket_hash.side_effect = None
+            store.reserve.side_effect = None
+            async with manager.acquire(compiled_route):
+                pass
+
+            logger.info.assert_called_once_with("rate limit store is available again")
+
+    @pytest.mark.asyncio()
+    async def test_release_publishes_rate_limits(self, manager, store, compiled_route):
+        with mock.patch.object(hikari_date, "monotonic", return_value=10):
+            async with manager.acquire(compiled_route):
+                manager.update_rate_limits(compiled_route, "abc", 4, 5, 2.5)
+                manager.throttle_global(3.0)
+                store.set_bucket_hash.assert_not_called()
+
+        store.set_bucket_hash.assert_awaited_once_with("GET /channels/{channel}/messages", "abc")
+        store.update_bucket.assert_awaited_once_with("abc;123", remaining=4, limit=5, reset_after=2.5)
+        store.throttle_global.assert_awaited_once_with(3.0)
+
+    @pytest.mark.asyncio()
+    async def test_release_only_publishes_bucket_hash_when_changed(self, manager, store, compiled_route):
+        manager.routes_to_hashes[compiled_route.route] = "abc"
+
+        async with manager.acquire(compiled_route):
+            manager.update_rate_limits(compiled_route, "abc", 4, 5, 2.5)
+
+        store.set_bucket_hash.assert_not_called()
+        store.update_bucket.assert_awaited_once()
+        store.throttle_global.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_release_when_publish_fails(self, manager, store, compiled_route):
+        store.update_bucket.side_effect = ConnectionResetError
+
+        async with manager.acquire(compiled_route):
+            manager.update_rate_limits(compiled_route, "abc", 4, 5, 2.5)
+
+        assert not manager.real_hashes_to_buckets["abc;123"]._lock.locked()
+        assert manager._unpublished_buckets == {}
+
+    def test_throttle_global_when_no_store(self):
+        with buckets.RESTBucketManager(max_rate_limit=float("inf")) as mgr:
+            mgr.throttle_global(5)
+
+            assert mgr._unpublished_global_retry_after == 0
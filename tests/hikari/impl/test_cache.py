@@ -20,22 +20,30 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 import datetime
+import io
+import os
+import pickle  # noqa: S403 - Consider possible security implications associated with pickle module
+import sys
 
 import mock
 import pytest
 
+from hikari import channels
 from hikari import config
 from hikari import embeds
 from hikari import emojis
 from hikari import guilds
 from hikari import invites
 from hikari import messages
+from hikari import permissions
+from hikari import presences
 from hikari import snowflakes
 from hikari import stickers
 from hikari import undefined
 from hikari import users
 from hikari import voices
 from hikari.impl import cache as cache_impl_
+from hikari.impl import entity_factory
 from hikari.internal import cache as cache_utilities
 from hikari.internal import collections
 from tests.hikari import hikari_test_helpers
@@ -84,6 +92,150 @@ class TestCacheImpl:
 
         cache_impl._create_cache.assert_called_once_with()
 
+    @pytest.mark.parametrize("columnar_members", [True, False])
+    def test_save_snapshot_and_load_snapshot(self, app_impl, tmp_path, columnar_members):
+        settings = config.CacheSettings(columnar_members=columnar_members)
+        cache_impl = cache_impl_.CacheImpl(app_impl, settings)
+        cache_impl.set_voice_state(self._make_voice_state(app_impl, 1, 100))
+        cache_impl.set_member(self._make_member(app_impl, 2, [10]))
+        cache_impl.set_dm_channel_id(StubModel(2), StubModel(543))
+        path = tmp_path / "cache.snapshot"
+
+        cache_impl.save_snapshot(path)
+        new_app = mock.Mock()
+        new_cache_impl = cache_impl_.CacheImpl(new_app, settings)
+
+        assert new_cache_impl.load_snapshot(path) is True
+
+        member = new_cache_impl.get_member(42334, 2)
+        assert member == cache_impl.get_member(42334, 2)
+        assert member.app is new_app
+        assert set(new_cache_impl.get_members_view_for_role(42334, 10)) == {2}
+        assert set(new_cache_impl.get_voice_states_view_for_channel(42334, 100)) == {1}
+        assert new_cache_impl.get_dm_channel_id(2) == 543
+        assert new_cache_impl._dm_channel_entries._limit == settings.max_dm_channel_ids
+        assert new_cache_impl._message_entries._on_expire == new_cache_impl._on_message_expire
+
+        # The voice state's member should stay cached after the member is removed, just like in the original cache.
+        new_cache_impl.delete_member(42334, 1)
+        assert new_cache_impl.get_voice_state(42334, 1).member.user.id == 1
+
+    def test_load_snapshot_when_file_missing(self, cache_impl, tmp_path):
+        assert cache_impl.load_snapshot(tmp_path / "cache.snapshot") is False
+
+    def test_load_snapshot_when_file_corrupt(self, cache_impl, tmp_path):
+        path = tmp_path / "cache.snapshot"
+        path.write_bytes(b"not a snapshot")
+        cache_impl._guild_entries = {snowflakes.Snowflake(123): object()}
+
+        assert cache_impl.load_snapshot(path) is False
+
+        assert 123 in cache_impl._guild_entries
+
+    def test_load_snapshot_when_snapshot_loads_disallowed_global(self, cache_impl, tmp_path):
+        path = tmp_path / "cache.snapshot"
+        path.write_bytes(pickle.dumps((1, 0, False, os.getpid)))
+
+        assert cache_impl.load_snapshot(path) is False
+
+    def test_load_snapshot_when_snapshot_loads_dotted_global(self, cache_impl, tmp_path):
+        path = tmp_path / "cache.snapshot"
+        # Protocol 4 looks dotted names up attribute by attribute, so this would reach the os module cache.py imports.
+        path.write_bytes(b"\x80\x04\x8c\x11hikari.impl.cache\x8c\nos.getppid\x93)R.")
+
+        with mock.patch.object(os, "getppid") as getppid:
+            assert cache_impl.load_snapshot(path) is False
+
+        getppid.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("module", "name"),
+        [
+            ("os", "system"),
+            ("builtins", "eval"),
+            ("subprocess", "Popen"),
+            ("hikari.impl.cache", "os.system"),
+            ("hikari.impl.cache", "pickle"),
+            ("hikari.internal.cache", "copy_guild_channel"),
+            ("hikari.impl.bot", "GatewayBot"),
+            ("hikari.impl.cache", "typing"),
+        ],
+    )
+    def test__SnapshotUnpickler_find_class_when_not_allowed(self, app_impl, cache_impl, module, name):
+        unpickler = cache_impl_._SnapshotUnpickler(io.BytesIO(), app_impl, cache_impl)
+
+        with pytest.raises(pickle.UnpicklingError):
+            unpickler.find_class(module, name)
+
+    def test__SnapshotUnpickler_find_class(self, app_impl, cache_impl):
+        unpickler = cache_impl_._SnapshotUnpickler(io.BytesIO(), app_impl, cache_impl)
+
+        assert unpickler.find_class("hikari.internal.cache", "MemberData") is cache_utilities.MemberData
+        assert unpickler.find_class("datetime", "datetime") is datetime.datetime
+        assert unpickler.find_class("hikari.internal.cache", "_make_ref_cell") is cache_utilities._make_ref_cell
+        assert unpickler.find_class("hikari.undefined", "UNDEFINED") is undefined.UNDEFINED
+        assert unpickler.find_class("hikari.impl.cache", "_snapshot_app")() is app_impl
+        assert unpickler.find_class("hikari.impl.cache", "_snapshot_cache")() is cache_impl
+
+    def test_load_snapshot_when_settings_differ(self, app_impl, tmp_path):
+        cache_impl = cache_impl_.CacheImpl(app_impl, config.CacheSettings())
+        cache_impl.set_member(self._make_member(app_impl, 2, [10]))
+        path = tmp_path / "cache.snapshot"
+        cache_impl.save_snapshot(path)
+        new_cache_impl = cache_impl_.CacheImpl(
+            app_impl, config.CacheSettings(components=config.CacheComponents.MEMBERS)
+        )
+
+        assert new_cache_impl.load_snapshot(path) is False
+
+        assert new_cache_impl.get_member(42334, 2) is None
+
+    @pytest.mark.parametrize("columnar_members", [True, False])
+    def test_memory_report(self, app_impl, columnar_members):
+        cache_impl = cache_impl_.CacheImpl(app_impl, config.CacheSettings(columnar_members=columnar_members))
+        for user_id in range(1, 4):
+            cache_impl.set_member(self._make_member(app_impl, user_id, [10]))
+
+        cache_impl.set_member(self._make_member(app_impl, 1, [], guild_id=54321))
+        cache_impl.set_voice_state(self._make_voice_state(app_impl, 1, 100))
+
+        report = cache_impl.memory_report()
+
+        assert report.components.keys() == {
+            component for component in config.CacheComponents if component and component is not component.ALL
+        }
+        assert report.components[config.CacheComponents.MEMBERS].entries == 4
+        assert report.components[config.CacheComponents.VOICE_STATES].entries == 1
+        assert report.components[config.CacheComponents.ROLES].entries == 0
+        assert report.users.entries == 3
+        assert report.users.size > 0
+        assert report.guilds.keys() == {42334, 54321}
+        assert report.guilds[snowflakes.Snowflake(42334)].components[config.CacheComponents.MEMBERS].entries == 3
+        assert report.guilds[snowflakes.Snowflake(54321)].components[config.CacheComponents.MEMBERS].entries == 1
+        assert [guild.guild_id for guild in report.heaviest_guilds(1)] == [42334]
+        assert report.size == sum(usage.size for usage in report.components.values()) + report.users.size
+        assert report.components[config.CacheComponents.MEMBERS].size == sum(
+            guild.components[config.CacheComponents.MEMBERS].size for guild in report.guilds.values()
+        )
+
+    def test_memory_report_omits_disabled_components(self, app_impl):
+        settings = config.CacheSettings(components=config.CacheComponents.MEMBERS)
+        cache_impl = cache_impl_.CacheImpl(app_impl, settings)
+        cache_impl.set_member(self._make_member(app_impl, 1, [10]))
+
+        report = cache_impl.memory_report()
+
+        assert report.components.keys() == {config.CacheComponents.MEMBERS}
+        assert report.guilds[snowflakes.Snowflake(42334)].components.keys() == {config.CacheComponents.MEMBERS}
+
+    def test_memory_report_when_empty(self, cache_impl):
+        report = cache_impl.memory_report()
+
+        assert report.guilds == {}
+        assert report.users == cache_impl_.MemoryUsage(entries=0, size=sys.getsizeof(cache_impl._user_entries))
+        assert report.heaviest_guilds() == []
+        assert all(usage.entries == 0 for usage in report.components.values())
+
     def test_clear_dm_channel_ids(self, cache_impl):
         cache_impl._dm_channel_entries = collections.FreezableDict({123: 5423, 23123: 54123123})
 
@@ -879,6 +1031,80 @@ class TestCacheImpl:
     def test_update_guild(self, cache_impl):
         ...
 
+    def test_replace_guild_contents(self, cache_impl):
+        guild_record = cache_utilities.GuildRecord()
+        mock_guild = mock.Mock(id=snowflakes.Snowflake(123))
+        mock_channel = mock.Mock(id=snowflakes.Snowflake(321))
+        mock_emoji = mock.Mock(id=snowflakes.Snowflake(432))
+        mock_role = mock.Mock(id=snowflakes.Snowflake(543))
+        mock_member = object()
+        mock_presence = object()
+        mock_voice_state = object()
+        cache_impl.update_guild = mock.Mock()
+        cache_impl.clear_guild_channels_for_guild = mock.Mock()
+        cache_impl.clear_emojis_for_guild = mock.Mock()
+        cache_impl.clear_roles_for_guild = mock.Mock()
+        cache_impl.clear_members_for_guild = mock.Mock()
+        cache_impl.clear_presences_for_guild = mock.Mock()
+        cache_impl.clear_voice_states_for_guild = mock.Mock()
+        cache_impl._get_or_create_guild_record = mock.Mock(return_value=guild_record)
+        cache_impl._remove_guild_record_if_empty = mock.Mock()
+        cache_impl._set_emoji = mock.Mock()
+        cache_impl._set_member_in_record = mock.Mock()
+        cache_impl._set_presence_in_record = mock.Mock()
+        cache_impl._set_voice_state_in_record = mock.Mock()
+
+        with mock.patch.object(cache_utilities, "copy_guild_channel") as copy_guild_channel:
+            cache_impl.replace_guild_contents(
+                mock_guild,
+                channels=[mock_channel],
+                emojis=[mock_emoji],
+                roles=[mock_role],
+                members=[mock_member],
+                presences=[mock_presence],
+                voice_states=[mock_voice_state],
+            )
+
+        cache_impl.update_guild.assert_called_once_with(mock_guild)
+        cache_impl.clear_guild_channels_for_guild.assert_called_once_with(123)
+        cache_impl.clear_emojis_for_guild.assert_called_once_with(123)
+        cache_impl.clear_roles_for_guild.assert_called_once_with(123)
+        cache_impl.clear_members_for_guild.assert_called_once_with(123)
+        cache_impl.clear_presences_for_guild.assert_called_once_with(123)
+        cache_impl.clear_voice_states_for_guild.assert_called_once_with(123)
+        cache_impl._get_or_create_guild_record.assert_called_once_with(123)
+        copy_guild_channel.assert_called_once_with(mock_channel)
+        assert cache_impl._guild_channel_entries[321] is copy_guild_channel.return_value
+        assert guild_record.channels == {321}
+        cache_impl._set_emoji.assert_called_once_with(mock_emoji)
+        assert guild_record.emojis == {432}
+        assert cache_impl._role_entries[543] is mock_role
+        assert guild_record.roles == {543}
+        cache_impl._set_member_in_record.assert_called_once_with(guild_record, mock_member, is_reference=False)
+        cache_impl._set_presence_in_record.assert_called_once_with(guild_record, mock_presence)
+        cache_impl._set_voice_state_in_record.assert_called_once_with(guild_record, mock_voice_state)
+        cache_impl._remove_guild_record_if_empty.assert_called_once_with(123, guild_record)
+
+    def test_replace_guild_contents_when_components_disabled(self, cache_impl):
+        guild_record = cache_utilities.GuildRecord()
+        cache_impl._settings.components = config.CacheComponents.GUILDS
+        cache_impl.update_guild = mock.Mock()
+        cache_impl._get_or_create_guild_record = mock.Mock(return_value=guild_record)
+        cache_impl._set_member_in_record = mock.Mock()
+
+        cache_impl.replace_guild_contents(
+            mock.Mock(id=snowflakes.Snowflake(123)),
+            channels=[mock.Mock()],
+            roles=[mock.Mock()],
+            members=[object()],
+        )
+
+        assert guild_record.channels is None
+        assert guild_record.roles is None
+        assert not cache_impl._guild_channel_entries
+        assert not cache_impl._role_entries
+        cache_impl._set_member_in_record.assert_not_called()
+
     @pytest.mark.skip(reason="TODO")
     def test_clear_guild_channels(self, cache_impl):
         ...
@@ -1092,11 +1318,17 @@ class TestCacheImpl:
             {
                 snowflakes.Snowflake(54123): mock.Mock(cache_utilities.GuildRecord),
                 snowflakes.Snowflake(999888777): cache_utilities.GuildRecord(
-                    invites=["oeoeoeoeooe", "owowowowoowowow", "oeoeoeoeoeoeoe"]
+                    invites=["oeoeoeoeooe", "owowowowoowowow", "oeoeoeoeoeoeoe"],
+                    invite_channel_index={
+                        snowflakes.Snowflake(34123123): {"oeoeoeoeooe", "owowowowoowowow"},
+                        snowflakes.Snowflake(9484732): {"oeoeoeoeoeoeoe"},
+                    },
                 ),
             }
         )
-        cache_impl._build_invite = mock.Mock(side_effect=[mock_invite_1, mock_invite_2])
+        cache_impl._build_invite = mock.Mock(
+            side_effect={mock_invite_data_1: mock_invite_1, mock_invite_data_2: mock_invite_2}.get
+        )
         cache_impl._garbage_collect_user = mock.Mock()
 
         result = cache_impl.clear_invites_for_channel(StubModel(999888777), StubModel(34123123))
@@ -1111,7 +1343,9 @@ class TestCacheImpl:
         assert cache_impl._guild_entries[snowflakes.Snowflake(999888777)].invites == ["oeoeoeoeoeoeoe"]
         assert cache_impl._invite_entries == {"oeoeoeoeoeoeoe": mock_other_invite_data, "oeo": mock_other_invite_data_2}
 
-        cache_impl._build_invite.assert_has_calls([mock.call(mock_invite_data_1), mock.call(mock_invite_data_2)])
+        cache_impl._build_invite.assert_has_calls(
+            [mock.call(mock_invite_data_1), mock.call(mock_invite_data_2)], any_order=True
+        )
 
     def test_clear_invites_for_channel_unknown_invite_cache(self, cache_impl):
         mock_other_invite_data = mock.Mock(cache_utilities.InviteData)
@@ -1382,15 +1616,25 @@ class TestCacheImpl:
         cache_impl._guild_entries = collections.FreezableDict(
             {
                 snowflakes.Snowflake(31423): mock.Mock(cache_utilities.GuildRecord),
-                snowflakes.Snowflake(83452134): cache_utilities.GuildRecord(invites=["blamBang", "bingBong", "Pop"]),
+                snowflakes.Snowflake(83452134): cache_utilities.GuildRecord(
+                    invites=["blamBang", "bingBong", "Pop"],
+                    invite_channel_index={
+                        snowflakes.Snowflake(987987): {"blamBang", "bingBong"},
+                        snowflakes.Snowflake(94934923): {"Pop"},
+                    },
+                ),
             }
         )
-        cache_impl._build_invite = mock.Mock(side_effect=[mock_invite_1, mock_invite_2])
+        cache_impl._build_invite = mock.Mock(
+            side_effect={mock_invite_data_1: mock_invite_1, mock_invite_data_2: mock_invite_2}.get
+        )
 
         result = cache_impl.get_invites_view_for_channel(StubModel(83452134), StubModel(987987))
 
         assert result == {"blamBang": mock_invite_1, "bingBong": mock_invite_2}
-        cache_impl._build_invite.assert_has_calls([mock.call(mock_invite_data_1), mock.call(mock_invite_data_2)])
+        cache_impl._build_invite.assert_has_calls(
+            [mock.call(mock_invite_data_1), mock.call(mock_invite_data_2)], any_order=True
+        )
 
     def test_get_invites_view_for_channel_unknown_emoji_cache(self, cache_impl):
         cache_impl._invite_entries = collections.FreezableDict(
@@ -1528,6 +1772,7 @@ class TestCacheImpl:
                 user=mock_user_1,
                 guild_id=snowflakes.Snowflake(43123123),
                 has_been_deleted=False,
+                role_ids=(),
             )
         )
         mock_data_member_2 = cache_utilities.RefCell(
@@ -1536,6 +1781,7 @@ class TestCacheImpl:
                 user=mock_user_2,
                 guild_id=snowflakes.Snowflake(43123123),
                 has_been_deleted=False,
+                role_ids=(),
             )
         )
         mock_data_member_3 = cache_utilities.RefCell(
@@ -1544,6 +1790,7 @@ class TestCacheImpl:
                 user=mock_user_3,
                 guild_id=snowflakes.Snowflake(65234),
                 has_been_deleted=False,
+                role_ids=(),
             )
         )
         mock_data_member_4 = cache_utilities.RefCell(
@@ -1552,6 +1799,7 @@ class TestCacheImpl:
                 user=mock_user_4,
                 guild_id=snowflakes.Snowflake(65234),
                 has_been_deleted=False,
+                role_ids=(),
             )
         )
         mock_data_member_5 = cache_utilities.RefCell(
@@ -1560,6 +1808,7 @@ class TestCacheImpl:
                 user=mock_user_5,
                 guild_id=snowflakes.Snowflake(65234),
                 has_been_deleted=False,
+                role_ids=(),
             )
         )
         mock_member_1 = object()
@@ -1653,7 +1902,11 @@ class TestCacheImpl:
         mock_member = mock.Mock(guilds.Member)
         mock_user = cache_utilities.RefCell(mock.Mock(id=snowflakes.Snowflake(67876)))
         mock_member_data = mock.Mock(
-            cache_utilities.MemberData, user=mock_user, guild_id=snowflakes.Snowflake(42123), has_been_deleted=False
+            cache_utilities.MemberData,
+            user=mock_user,
+            guild_id=snowflakes.Snowflake(42123),
+            has_been_deleted=False,
+            role_ids=(),
         )
         mock_reffed_member = cache_utilities.RefCell(mock_member_data)
         guild_record = cache_utilities.GuildRecord(members={snowflakes.Snowflake(67876): mock_reffed_member})
@@ -1834,6 +2087,512 @@ class TestCacheImpl:
         }
         cache_impl._build_member.assert_has_calls([mock.call(mock_member_data_1), mock.call(mock_member_data_2)])
 
+    @staticmethod
+    def _make_member(app, user_id, role_ids, guild_id=42334):
+        return guilds.Member(
+            guild_id=snowflakes.Snowflake(guild_id),
+            user=users.UserImpl(
+                id=snowflakes.Snowflake(user_id),
+                app=app,
+                discriminator="0001",
+                username="nyaa",
+                avatar_hash=None,
+                is_bot=False,
+                is_system=False,
+                flags=users.UserFlag.NONE,
+            ),
+            nickname=None,
+            role_ids=[snowflakes.Snowflake(role_id) for role_id in role_ids],
+            joined_at=datetime.datetime(2020, 7, 15, 23, 30, 59, 501602, tzinfo=datetime.timezone.utc),
+            premium_since=None,
+            is_deaf=False,
+            is_mute=False,
+            is_pending=False,
+        )
+
+    def test_get_members_view_for_role(self, cache_impl, app_impl):
+        cache_impl.set_member(self._make_member(app_impl, 1, [10, 20]))
+        cache_impl.set_member(self._make_member(app_impl, 2, [20]))
+        cache_impl.set_member(self._make_member(app_impl, 3, []))
+
+        assert set(cache_impl.get_members_view_for_role(42334, 10)) == {1}
+        assert set(cache_impl.get_members_view_for_role(42334, 20)) == {1, 2}
+        assert cache_impl.get_members_view_for_role(42334, 20)[snowflakes.Snowflake(2)].role_ids == (20,)
+        assert cache_impl.get_members_view_for_role(42334, 30) == {}
+        assert cache_impl.get_members_view_for_role(54321, 20) == {}
+
+    def test_get_members_view_for_role_after_roles_change(self, cache_impl, app_impl):
+        cache_impl.set_member(self._make_member(app_impl, 1, [10, 20]))
+        cache_impl.set_member(self._make_member(app_impl, 2, [20]))
+
+        cache_impl.set_member(self._make_member(app_impl, 1, [30]))
+        cache_impl.delete_member(42334, 2)
+
+        assert cache_impl.get_members_view_for_role(42334, 10) == {}
+        assert cache_impl.get_members_view_for_role(42334, 20) == {}
+        assert set(cache_impl.get_members_view_for_role(42334, 30)) == {1}
+        assert cache_impl._guild_entries[snowflakes.Snowflake(42334)].member_role_index == {30: {1}}
+
+    def test_set_member_evicts_least_recently_updated_over_limit(self, app_impl):
+        cache_impl = cache_impl_.CacheImpl(app_impl, config.CacheSettings(max_members_per_guild=2))
+        cache_impl.set_member(self._make_member(app_impl, 1, [10]))
+        cache_impl.set_member(self._make_member(app_impl, 2, [10]))
+        cache_impl.set_member(self._make_member(app_impl, 1, [10]))
+
+        cache_impl.set_member(self._make_member(app_impl, 3, [10]))
+
+        assert set(cache_impl.get_members_view_for_guild(42334)) == {1, 3}
+        assert set(cache_impl.get_members_view_for_role(42334, 10)) == {1, 3}
+        assert cache_impl.get_user(2) is None
+        assert cache_impl.get_user(1) is not None
+
+    def test_set_member_eviction_keeps_user_referenced_by_other_guild(self, app_impl):
+        cache_impl = cache_impl_.CacheImpl(app_impl, config.CacheSettings(max_members_per_guild=1))
+        cache_impl.set_member(self._make_member(app_impl, 1, []))
+        cache_impl.set_member(self._make_member(app_impl, 1, [], guild_id=54321))
+
+        cache_impl.set_member(self._make_member(app_impl, 2, []))
+
+        assert cache_impl.get_member(42334, 1) is None
+        assert cache_impl.get_member(54321, 1) is not None
+        assert cache_impl.get_user(1) is not None
+
+    def test_set_member_eviction_keeps_member_referenced_by_voice_state(self, app_impl):
+        cache_impl = cache_impl_.CacheImpl(app_impl, config.CacheSettings(max_members_per_guild=1))
+        cache_impl.set_voice_state(self._make_voice_state(app_impl, 1, 100))
+
+        cache_impl.set_member(self._make_member(app_impl, 2, []))
+
+        assert cache_impl.get_member(42334, 1) is None
+        assert cache_impl.get_voice_state(42334, 1).member.id == 1
+
+        cache_impl.delete_voice_state(42334, 1)
+
+        assert cache_impl.get_user(1) is None
+        assert cache_impl.get_user(2) is not None
+
+    def test_set_member_reuses_evicted_member_referenced_by_voice_state(self, app_impl):
+        cache_impl = cache_impl_.CacheImpl(app_impl, config.CacheSettings(max_members_per_guild=1))
+        cache_impl.set_voice_state(self._make_voice_state(app_impl, 1, 100))
+        cell = cache_impl._guild_entries[snowflakes.Snowflake(42334)].members[snowflakes.Snowflake(1)]
+        cache_impl.set_member(self._make_member(app_impl, 2, []))
+
+        cache_impl.set_member(self._make_member(app_impl, 1, []))
+
+        guild_record = cache_impl._guild_entries[snowflakes.Snowflake(42334)]
+        assert guild_record.members[snowflakes.Snowflake(1)] is cell
+        assert guild_record.evicted_members is None
+
+        cache_impl.delete_voice_state(42334, 1)
+
+        assert cell.ref_count == 0
+        assert cache_impl.get_member(42334, 1) is not None
+        assert cache_impl.get_user(1) is not None
+
+    def test_set_voice_state_keeps_reference_count_of_evicted_member(self, app_impl):
+        cache_impl = cache_impl_.CacheImpl(app_impl, config.CacheSettings(max_members_per_guild=1))
+        cache_impl.set_voice_state(self._make_voice_state(app_impl, 1, 100))
+        cache_impl.set_member(self._make_member(app_impl, 2, []))
+
+        cache_impl.set_voice_state(self._make_voice_state(app_impl, 1, 100))
+
+        cell = cache_impl._guild_entries[snowflakes.Snowflake(42334)].members[snowflakes.Snowflake(1)]
+        assert cell.ref_count == 1
+
+        cache_impl.delete_voice_state(42334, 1)
+
+        assert cell.ref_count == 0
+        assert cache_impl.get_member(42334, 1) is None
+        assert cache_impl.get_user(1) is None
+
+    def test__garbage_collect_member_when_cell_is_not_cached_one(self, app_impl):
+        cache_impl = cache_impl_.CacheImpl(app_impl, config.CacheSettings(max_members_per_guild=1))
+        cache_impl.set_voice_state(self._make_voice_state(app_impl, 1, 100))
+        guild_record = cache_impl._guild_entries[snowflakes.Snowflake(42334)]
+        stale_cell = guild_record.members[snowflakes.Snowflake(1)]
+        cache_impl.set_member(self._make_member(app_impl, 2, []))
+        guild_record.evicted_members = None
+        cache_impl.set_voice_state(self._make_voice_state(app_impl, 3, 100))
+        cache_impl.set_member(self._make_member(app_impl, 1, []))
+        cell = guild_record.members[snowflakes.Snowflake(1)]
+        cell.ref_count = 1
+
+        cache_impl._garbage_collect_member(guild_record, stale_cell, decrement=1)
+
+        assert guild_record.members[snowflakes.Snowflake(1)] is cell
+        assert cache_impl.get_user(1) is not None
+
+    def test_evicted_member_is_released_with_its_last_reference(self, app_impl):
+        cache_impl = cache_impl_.CacheImpl(app_impl, config.CacheSettings(max_members_per_guild=1))
+        cache_impl.set_voice_state(self._make_voice_state(app_impl, 1, 100))
+        cache_impl.set_member(self._make_member(app_impl, 2, []))
+        guild_record = cache_impl._guild_entries[snowflakes.Snowflake(42334)]
+        assert set(guild_record.evicted_members) == {1}
+
+        cache_impl.delete_voice_state(42334, 1)
+
+        assert guild_record.evicted_members is None
+
+    def test_set_member_evicts_expired(self, app_impl):
+        cache_impl = cache_impl_.CacheImpl(app_impl, config.CacheSettings(member_expiry=datetime.timedelta(minutes=10)))
+        cache_impl.set_member(self._make_member(app_impl, 1, [10]))
+        members = cache_impl._guild_entries[snowflakes.Snowflake(42334)].members
+        timestamp, cell = members._data[snowflakes.Snowflake(1)]
+        members._data[snowflakes.Snowflake(1)] = (timestamp - 601, cell)
+
+        cache_impl.set_member(self._make_member(app_impl, 2, [10]))
+
+        assert set(cache_impl.get_members_view_for_guild(42334)) == {2}
+        assert set(cache_impl.get_members_view_for_role(42334, 10)) == {2}
+        assert cache_impl.get_user(1) is None
+
+    def test_snapshot_with_member_limit(self, app_impl, tmp_path):
+        settings = config.CacheSettings(max_members_per_guild=2)
+        cache_impl = cache_impl_.CacheImpl(app_impl, settings)
+        cache_impl.set_member(self._make_member(app_impl, 1, []))
+        cache_impl.set_member(self._make_member(app_impl, 2, []))
+        path = tmp_path / "cache.snapshot"
+        cache_impl.save_snapshot(path)
+        new_cache_impl = cache_impl_.CacheImpl(app_impl, settings)
+
+        assert new_cache_impl.load_snapshot(path) is True
+        new_cache_impl.set_member(self._make_member(app_impl, 3, []))
+
+        assert set(new_cache_impl.get_members_view_for_guild(42334)) == {2, 3}
+        assert new_cache_impl.get_user(1) is None
+        assert cache_impl.get_user(1) is not None
+
+    def test_snapshot_uses_loading_member_limit(self, app_impl, tmp_path):
+        cache_impl = cache_impl_.CacheImpl(app_impl, config.CacheSettings(max_members_per_guild=2))
+        cache_impl.set_member(self._make_member(app_impl, 1, []))
+        cache_impl.set_member(self._make_member(app_impl, 2, []))
+        path = tmp_path / "cache.snapshot"
+        cache_impl.save_snapshot(path)
+        new_cache_impl = cache_impl_.CacheImpl(app_impl, config.CacheSettings())
+
+        assert new_cache_impl.load_snapshot(path) is True
+        new_cache_impl.set_member(self._make_member(app_impl, 3, []))
+
+        assert set(new_cache_impl.get_members_view_for_guild(42334)) == {1, 2, 3}
+
+    def test_snapshot_evicts_members_over_loading_member_limit(self, app_impl, tmp_path):
+        cache_impl = cache_impl_.CacheImpl(app_impl, config.CacheSettings())
+        cache_impl.set_member(self._make_member(app_impl, 1, [10]))
+        cache_impl.set_member(self._make_member(app_impl, 2, [10]))
+        cache_impl.set_member(self._make_member(app_impl, 3, [10]))
+        path = tmp_path / "cache.snapshot"
+        cache_impl.save_snapshot(path)
+        new_cache_impl = cache_impl_.CacheImpl(app_impl, config.CacheSettings(max_members_per_guild=2))
+
+        assert new_cache_impl.load_snapshot(path) is True
+
+        assert set(new_cache_impl.get_members_view_for_guild(42334)) == {2, 3}
+        assert set(new_cache_impl.get_members_view_for_role(42334, 10)) == {2, 3}
+        assert new_cache_impl.get_user(1) is None
+
+    @staticmethod
+    def _make_member_payload(user_id, role_ids, nick=None):
+        return {
+            "user": {"id": str(user_id), "username": "nyaa", "discriminator": "0001", "avatar": None},
+            "nick": nick,
+            "roles": [str(role_id) for role_id in role_ids],
+            "joined_at": "2020-07-15T23:30:59.501602+00:00",
+            "premium_since": None,
+            "deaf": False,
+            "mute": False,
+            "pending": False,
+        }
+
+    @pytest.fixture()
+    def lazy_cache_impl(self, app_impl):
+        app_impl.entity_factory = entity_factory.EntityFactoryImpl(app_impl)
+        return cache_impl_.CacheImpl(app_impl, config.CacheSettings(lazy_members=True, max_materialized_members=1))
+
+    def test_set_member_payloads(self, lazy_cache_impl, app_impl):
+        lazy_cache_impl.set_member_payloads(
+            42334, [self._make_member_payload(1, [10], nick="nick"), self._make_member_payload(2, [])]
+        )
+
+        cell = lazy_cache_impl._guild_entries[snowflakes.Snowflake(42334)].members[snowflakes.Snowflake(1)]
+        assert isinstance(cell, cache_utilities.LazyMemberCell)
+        assert cell.is_materialized is False
+        expected = app_impl.entity_factory.deserialize_member(
+            self._make_member_payload(1, [10], nick="nick"), guild_id=snowflakes.Snowflake(42334)
+        )
+        result = lazy_cache_impl.get_member(42334, 1)
+        assert result == expected
+        assert result.nickname == "nick"
+        assert result.role_ids == tuple(expected.role_ids)
+        assert result.joined_at == expected.joined_at
+        assert set(lazy_cache_impl.get_members_view_for_role(42334, 42334)) == {1, 2}
+        assert set(lazy_cache_impl.get_members_view_for_role(42334, 10)) == {1}
+        assert lazy_cache_impl.get_user(2).username == "nyaa"
+
+    def test_set_member_payloads_updates_existing_member(self, lazy_cache_impl, app_impl):
+        lazy_cache_impl.set_member(self._make_member(app_impl, 1, [10]))
+        lazy_cache_impl.set_member_payloads(42334, [self._make_member_payload(2, [10])])
+
+        lazy_cache_impl.set_member_payloads(
+            42334, [self._make_member_payload(1, [20], nick="one"), self._make_member_payload(2, [20], nick="two")]
+        )
+
+        assert lazy_cache_impl.get_member(42334, 1).nickname == "one"
+        assert lazy_cache_impl.get_member(42334, 2).nickname == "two"
+        assert lazy_cache_impl.get_members_view_for_role(42334, 10) == {}
+        assert set(lazy_cache_impl.get_members_view_for_role(42334, 20)) == {1, 2}
+        assert lazy_cache_impl._user_entries[snowflakes.Snowflake(1)].ref_count == 1
+
+    def test_set_member_payloads_when_not_lazy(self, app_impl):
+        app_impl.entity_factory = entity_factory.EntityFactoryImpl(app_impl)
+        cache_impl = cache_impl_.CacheImpl(app_impl, config.CacheSettings())
+
+        cache_impl.set_member_payloads(
+            42334,
+            [self._make_member_payload(1, [10])],
+            presence_payloads=[
+                {"user": {"id": "1"}, "status": "online", "activities": [], "client_status": {"desktop": "online"}}
+            ],
+        )
+
+        cell = cache_impl._guild_entries[snowflakes.Snowflake(42334)].members[snowflakes.Snowflake(1)]
+        assert type(cell) is cache_utilities.RefCell
+        assert cache_impl.get_member(42334, 1).role_ids == (10, 42334)
+        assert cache_impl.get_presence(42334, 1).visible_status == "online"
+
+    def test_set_member_payloads_when_members_disabled(self, app_impl):
+        cache_impl = cache_impl_.CacheImpl(
+            app_impl, config.CacheSettings(components=config.CacheComponents.NONE, lazy_members=True)
+        )
+
+        cache_impl.set_member_payloads(42334, [self._make_member_payload(1, [10])], presence_payloads=[{}])
+
+        assert cache_impl._guild_entries == {}
+        app_impl.entity_factory.deserialize_member_presence.assert_not_called()
+
+    def test_get_member_materializes_most_recently_read(self, lazy_cache_impl):
+        lazy_cache_impl.set_member_payloads(42334, [self._make_member_payload(1, []), self._make_member_payload(2, [])])
+        members = lazy_cache_impl._guild_entries[snowflakes.Snowflake(42334)].members
+
+        lazy_cache_impl.get_member(42334, 1)
+        assert members[snowflakes.Snowflake(1)].is_materialized is True
+
+        lazy_cache_impl.get_member(42334, 2)
+        assert members[snowflakes.Snowflake(1)].is_materialized is False
+        assert members[snowflakes.Snowflake(2)].is_materialized is True
+
+    def test_delete_lazy_member(self, lazy_cache_impl):
+        lazy_cache_impl.set_member_payloads(42334, [self._make_member_payload(1, [10])])
+
+        result = lazy_cache_impl.delete_member(42334, 1)
+
+        assert result.id == 1
+        assert lazy_cache_impl.get_member(42334, 1) is None
+        assert lazy_cache_impl.get_user(1) is None
+        assert lazy_cache_impl.get_members_view_for_role(42334, 10) == {}
+
+    def test_snapshot_with_lazy_members(self, lazy_cache_impl, app_impl, tmp_path):
+        lazy_cache_impl.set_member_payloads(42334, [self._make_member_payload(1, [10], nick="nick")])
+        lazy_cache_impl.get_member(42334, 1)
+        path = tmp_path / "cache.snapshot"
+        lazy_cache_impl.save_snapshot(path)
+        new_cache_impl = cache_impl_.CacheImpl(app_impl, lazy_cache_impl.settings)
+
+        assert new_cache_impl.load_snapshot(path) is True
+
+        cell = new_cache_impl._guild_entries[snowflakes.Snowflake(42334)].members[snowflakes.Snowflake(1)]
+        assert isinstance(cell, cache_utilities.LazyMemberCell)
+        assert cell.is_materialized is False
+        assert new_cache_impl.get_member(42334, 1).nickname == "nick"
+        assert cell.object.user is new_cache_impl._user_entries[snowflakes.Snowflake(1)]
+
+    @pytest.fixture()
+    def permissions_cache_impl(self, cache_impl):
+        # Guild 123 owned by user 1, with a moderator role 456 and a text channel 789.
+        guild_id = snowflakes.Snowflake(123)
+        cache_impl._guild_entries = collections.FreezableDict(
+            {
+                guild_id: cache_utilities.GuildRecord(
+                    guild=mock.Mock(guilds.GatewayGuild, id=guild_id, owner_id=snowflakes.Snowflake(1)),
+                    members=collections.FreezableDict(
+                        {
+                            snowflakes.Snowflake(user_id): cache_utilities.RefCell(
+                                mock.Mock(cache_utilities.MemberData, role_ids=role_ids, has_been_deleted=False)
+                            )
+                            for user_id, role_ids in ((1, ()), (2, ()), (3, (snowflakes.Snowflake(456),)), (4, ()))
+                        }
+                    ),
+                )
+            }
+        )
+        cache_impl._role_entries = collections.FreezableDict(
+            {
+                guild_id: mock.Mock(
+                    guilds.Role,
+                    id=guild_id,
+                    guild_id=guild_id,
+                    permissions=permissions.Permissions.VIEW_CHANNEL | permissions.Permissions.SEND_MESSAGES,
+                ),
+                snowflakes.Snowflake(456): mock.Mock(
+                    guilds.Role,
+                    id=snowflakes.Snowflake(456),
+                    guild_id=guild_id,
+                    permissions=permissions.Permissions.MANAGE_MESSAGES,
+                ),
+            }
+        )
+        cache_impl._guild_channel_entries = collections.FreezableDict(
+            {
+                snowflakes.Snowflake(789): mock.Mock(
+                    channels.GuildTextChannel,
+                    id=snowflakes.Snowflake(789),
+                    guild_id=guild_id,
+                    permission_overwrites={
+                        guild_id: channels.PermissionOverwrite(
+                            id=guild_id,
+                            type=channels.PermissionOverwriteType.ROLE,
+                            deny=permissions.Permissions.VIEW_CHANNEL,
+                        ),
+                        snowflakes.Snowflake(456): channels.PermissionOverwrite(
+                            id=snowflakes.Snowflake(456),
+                            type=channels.PermissionOverwriteType.ROLE,
+                            allow=permissions.Permissions.VIEW_CHANNEL,
+                        ),
+                        snowflakes.Snowflake(4): channels.PermissionOverwrite(
+                            id=snowflakes.Snowflake(4),
+                            type=channels.PermissionOverwriteType.MEMBER,
+                            allow=permissions.Permissions.VIEW_CHANNEL,
+                            deny=permissions.Permissions.SEND_MESSAGES,
+                        ),
+                    },
+                )
+            }
+        )
+        return cache_impl
+
+    def test_get_member_permissions_for_guild(self, permissions_cache_impl):
+        assert permissions_cache_impl.get_member_permissions(123, 2) == (
+            permissions.Permissions.VIEW_CHANNEL | permissions.Permissions.SEND_MESSAGES
+        )
+        assert permissions_cache_impl.get_member_permissions(123, 3) == (
+            permissions.Permissions.VIEW_CHANNEL
+            | permissions.Permissions.SEND_MESSAGES
+            | permissions.Permissions.MANAGE_MESSAGES
+        )
+
+    def test_get_member_permissions_for_owner(self, permissions_cache_impl):
+        assert permissions_cache_impl.get_member_permissions(123, 1, 789) == permissions.Permissions.all_permissions()
+
+    def test_get_member_permissions_for_administrator(self, permissions_cache_impl):
+        permissions_cache_impl._role_entries[
+            snowflakes.Snowflake(456)
+        ].permissions = permissions.Permissions.ADMINISTRATOR
+
+        assert permissions_cache_impl.get_member_permissions(123, 3, 789) == permissions.Permissions.all_permissions()
+
+    def test_get_member_permissions_in_channel(self, permissions_cache_impl):
+        assert permissions_cache_impl.get_member_permissions(123, 2, 789) == permissions.Permissions.SEND_MESSAGES
+        assert permissions_cache_impl.get_member_permissions(123, 3, 789) == (
+            permissions.Permissions.VIEW_CHANNEL
+            | permissions.Permissions.SEND_MESSAGES
+            | permissions.Permissions.MANAGE_MESSAGES
+        )
+        assert permissions_cache_impl.get_member_permissions(123, 4, 789) == permissions.Permissions.VIEW_CHANNEL
+
+    def test_get_member_permissions_in_channel_when_role_denies_what_everyone_allows(self, permissions_cache_impl):
+        guild_id = snowflakes.Snowflake(123)
+        role_id = snowflakes.Snowflake(456)
+        member = permissions_cache_impl._guild_entries[guild_id].members[snowflakes.Snowflake(3)]
+        # Member role IDs from the gateway include the @everyone role.
+        member.object.role_ids = (guild_id, role_id)
+        overwrites = permissions_cache_impl._guild_channel_entries[snowflakes.Snowflake(789)].permission_overwrites
+        overwrites[guild_id] = channels.PermissionOverwrite(
+            id=guild_id, type=channels.PermissionOverwriteType.ROLE, allow=permissions.Permissions.SEND_MESSAGES
+        )
+        overwrites[role_id] = channels.PermissionOverwrite(
+            id=role_id, type=channels.PermissionOverwriteType.ROLE, deny=permissions.Permissions.SEND_MESSAGES
+        )
+
+        assert permissions_cache_impl.get_member_permissions(123, 3, 789) == (
+            permissions.Permissions.VIEW_CHANNEL | permissions.Permissions.MANAGE_MESSAGES
+        )
+
+    @pytest.mark.parametrize(("guild_id", "user_id", "channel_id"), [(321, 2, None), (123, 5, None), (123, 2, 987)])
+    def test_get_member_permissions_when_not_cached(self, permissions_cache_impl, guild_id, user_id, channel_id):
+        assert permissions_cache_impl.get_member_permissions(guild_id, user_id, channel_id) is None
+        assert not permissions_cache_impl._permission_entries
+
+    def test_get_member_permissions_when_member_has_been_deleted(self, permissions_cache_impl):
+        member = permissions_cache_impl._guild_entries[snowflakes.Snowflake(123)].members[snowflakes.Snowflake(2)]
+        member.object.has_been_deleted = True
+
+        assert permissions_cache_impl.get_member_permissions(123, 2) is None
+
+    def test_get_member_permissions_is_memoized_until_role_is_set(self, permissions_cache_impl):
+        moderator_role = permissions_cache_impl._role_entries[snowflakes.Snowflake(456)]
+        assert permissions_cache_impl.get_member_permissions(123, 3, 789) == (
+            permissions.Permissions.VIEW_CHANNEL
+            | permissions.Permissions.SEND_MESSAGES
+            | permissions.Permissions.MANAGE_MESSAGES
+        )
+        moderator_role.permissions = permissions.Permissions.NONE
+
+        assert permissions_cache_impl.get_member_permissions(123, 3, 789) == (
+            permissions.Permissions.VIEW_CHANNEL
+            | permissions.Permissions.SEND_MESSAGES
+            | permissions.Permissions.MANAGE_MESSAGES
+        )
+
+        permissions_cache_impl.set_role(moderator_role)
+
+        assert permissions_cache_impl.get_member_permissions(123, 3, 789) == (
+            permissions.Permissions.VIEW_CHANNEL | permissions.Permissions.SEND_MESSAGES
+        )
+
+    def test_get_member_permissions_memo_is_bounded(self, permissions_cache_impl):
+        with mock.patch.object(cache_impl_, "_MAX_PERMISSION_MEMBERS_PER_GUILD", new=2):
+            for user_id in (1, 2, 3):
+                permissions_cache_impl.get_member_permissions(123, user_id, 789)
+
+        assert permissions_cache_impl._permission_entries[123].keys() == {2, 3}
+
+    def test__invalidate_permissions_for_channel(self, cache_impl):
+        cache_impl._permission_entries = {123: {1: {None: object(), 789: object(), 987: object()}, 2: {789: object()}}}
+
+        cache_impl._invalidate_permissions(snowflakes.Snowflake(123), channel_id=snowflakes.Snowflake(789))
+
+        assert cache_impl._permission_entries[123].keys() == {1, 2}
+        assert cache_impl._permission_entries[123][1].keys() == {None, 987}
+        assert cache_impl._permission_entries[123][2] == {}
+
+    def test__invalidate_permissions_for_user(self, cache_impl):
+        cache_impl._permission_entries = {123: {1: {None: object(), 789: object()}, 2: {None: object()}}}
+
+        cache_impl._invalidate_permissions(snowflakes.Snowflake(123), user_id=snowflakes.Snowflake(1))
+
+        assert cache_impl._permission_entries[123].keys() == {2}
+
+    def test__invalidate_permissions_for_guild(self, cache_impl):
+        cache_impl._permission_entries = {123: {1: {None: object()}}, 321: {1: {None: object()}}}
+
+        cache_impl._invalidate_permissions(snowflakes.Snowflake(123))
+
+        assert cache_impl._permission_entries.keys() == {321}
+
+    def test_get_members_with_permissions(self, permissions_cache_impl):
+        result = permissions_cache_impl.get_members_with_permissions(789, permissions.Permissions.VIEW_CHANNEL)
+
+        assert result == [1, 3, 4]
+
+    def test_get_members_with_permissions_for_specific_members(self, permissions_cache_impl):
+        result = permissions_cache_impl.get_members_with_permissions(
+            789, permissions.Permissions.VIEW_CHANNEL | permissions.Permissions.SEND_MESSAGES, [4, 3, 2, 5]
+        )
+
+        assert result == [3]
+
+    def test_get_members_with_permissions_for_unknown_channel(self, permissions_cache_impl):
+        assert permissions_cache_impl.get_members_with_permissions(987, permissions.Permissions.VIEW_CHANNEL) == []
+
     def test_set_member(self, cache_impl):
         mock_user = mock.Mock(users.User, id=snowflakes.Snowflake(645234123))
         mock_user_ref = cache_utilities.RefCell(mock_user)
@@ -1876,6 +2635,112 @@ class TestCacheImpl:
         assert member_entry.object.is_mute is False
         assert member_entry.object.is_pending is True
 
+    def test_set_members_bulk(self, cache_impl):
+        guild_record_1 = object()
+        guild_record_2 = object()
+        mock_member_1 = mock.Mock(guild_id=snowflakes.Snowflake(123))
+        mock_member_2 = mock.Mock(guild_id=snowflakes.Snowflake(123))
+        mock_member_3 = mock.Mock(guild_id=snowflakes.Snowflake(456))
+        cache_impl._get_or_create_guild_record = mock.Mock(side_effect=[guild_record_1, guild_record_2])
+        cache_impl._set_member_in_record = mock.Mock()
+
+        cache_impl.set_members_bulk([mock_member_1, mock_member_2, mock_member_3])
+
+        cache_impl._get_or_create_guild_record.assert_has_calls([mock.call(123), mock.call(456)])
+        cache_impl._set_member_in_record.assert_has_calls(
+            [
+                mock.call(guild_record_1, mock_member_1, is_reference=False),
+                mock.call(guild_record_1, mock_member_2, is_reference=False),
+                mock.call(guild_record_2, mock_member_3, is_reference=False),
+            ]
+        )
+
+    def test_set_members_bulk_when_members_disabled(self, cache_impl):
+        cache_impl._settings.components = config.CacheComponents.NONE
+        cache_impl._set_member_in_record = mock.Mock()
+
+        cache_impl.set_members_bulk([mock.Mock()])
+
+        cache_impl._set_member_in_record.assert_not_called()
+
+    def test_set_members_bulk_matches_set_member(self, app_impl):
+        bulk_cache = cache_impl_.CacheImpl(app_impl, config.CacheSettings())
+        single_cache = cache_impl_.CacheImpl(app_impl, config.CacheSettings())
+        members = [
+            guilds.Member(
+                guild_id=snowflakes.Snowflake(67345234),
+                user=users.UserImpl(
+                    id=snowflakes.Snowflake(user_id),
+                    app=app_impl,
+                    discriminator="0001",
+                    username="nyaa",
+                    avatar_hash=None,
+                    is_bot=False,
+                    is_system=False,
+                    flags=users.UserFlag.NONE,
+                ),
+                nickname=None,
+                role_ids=[snowflakes.Snowflake(65345234)],
+                joined_at=datetime.datetime(2020, 7, 15, 23, 30, 59, 501602, tzinfo=datetime.timezone.utc),
+                premium_since=None,
+                is_deaf=False,
+                is_mute=False,
+                is_pending=False,
+            )
+            for user_id in (645234123, 645234124)
+        ]
+
+        bulk_cache.set_members_bulk(members)
+        for member in members:
+            single_cache.set_member(member)
+
+        assert bulk_cache.get_members_view() == single_cache.get_members_view()
+        assert bulk_cache.get_users_view() == single_cache.get_users_view()
+
+    def test_set_member_when_columnar_members(self, app_impl):
+        cache_impl = cache_impl_.CacheImpl(app_impl, config.CacheSettings(columnar_members=True))
+        user = users.UserImpl(
+            id=snowflakes.Snowflake(645234123),
+            app=app_impl,
+            discriminator="0001",
+            username="nyaa",
+            avatar_hash=None,
+            is_bot=False,
+            is_system=False,
+            flags=users.UserFlag.NONE,
+        )
+        member_model = guilds.Member(
+            guild_id=snowflakes.Snowflake(67345234),
+            user=user,
+            nickname="A NICK LOL",
+            role_ids=[snowflakes.Snowflake(65345234), snowflakes.Snowflake(123123)],
+            joined_at=datetime.datetime(2020, 7, 15, 23, 30, 59, 501602, tzinfo=datetime.timezone.utc),
+            premium_since=None,
+            is_deaf=True,
+            is_mute=False,
+            is_pending=undefined.UNDEFINED,
+        )
+
+        cache_impl.set_member(member_model)
+
+        members = cache_impl._guild_entries[snowflakes.Snowflake(67345234)].members
+        assert isinstance(members, cache_utilities.ColumnarMemberStore)
+        result = cache_impl.get_member(67345234, 645234123)
+        assert result == member_model
+        assert result.nickname == "A NICK LOL"
+        assert result.role_ids == (65345234, 123123)
+        assert result.joined_at == member_model.joined_at
+        assert result.premium_since is None
+        assert result.is_deaf is True
+        assert result.is_mute is False
+        assert result.is_pending is undefined.UNDEFINED
+        assert list(cache_impl.get_members_view_for_guild(67345234)) == [645234123]
+
+        assert cache_impl.delete_member(67345234, 645234123) == member_model
+        assert cache_impl.get_member(67345234, 645234123) is None
+        assert 67345234 not in cache_impl._guild_entries
+        assert 645234123 not in cache_impl._user_entries
+
     def test_set_member_doesnt_increment_user_ref_count_for_pre_cached_member(self, cache_impl):
         mock_user = mock.Mock(users.User, id=snowflakes.Snowflake(645234123))
         member_model = mock.MagicMock(guilds.Member, user=mock_user, guild_id=snowflakes.Snowflake(67345234))
@@ -1885,7 +2750,11 @@ class TestCacheImpl:
             {
                 snowflakes.Snowflake(67345234): cache_utilities.GuildRecord(
                     members=collections.FreezableDict(
-                        {snowflakes.Snowflake(645234123): mock.Mock(cache_utilities.MemberData)}
+                        {
+                            snowflakes.Snowflake(645234123): cache_utilities.RefCell(
+                                mock.Mock(cache_utilities.MemberData, role_ids=(), has_been_deleted=False)
+                            )
+                        }
                     )
                 )
             }
@@ -1941,6 +2810,132 @@ class TestCacheImpl:
     def test_set_presence(self, cache_impl):
         ...
 
+    @staticmethod
+    def _make_presence(app, user_id, guild_id=42334, activity_name=None):
+        activities = []
+        if activity_name is not None:
+            activities.append(
+                presences.RichActivity(
+                    name=activity_name,
+                    created_at=datetime.datetime(2020, 7, 15, 23, 30, 59, 501602, tzinfo=datetime.timezone.utc),
+                    timestamps=presences.ActivityTimestamps(start=None, end=None),
+                    application_id=None,
+                    details="details",
+                    state=None,
+                    emoji=emojis.CustomEmoji(id=snowflakes.Snowflake(777), name="emoji", is_animated=False),
+                    party=None,
+                    assets=presences.ActivityAssets(
+                        large_image="large", large_text=None, small_image=None, small_text=None
+                    ),
+                    secrets=None,
+                    is_instance=None,
+                    flags=None,
+                    buttons=["button"],
+                )
+            )
+
+        return presences.MemberPresence(
+            app=app,
+            user_id=snowflakes.Snowflake(user_id),
+            guild_id=snowflakes.Snowflake(guild_id),
+            visible_status=presences.Status.ONLINE,
+            activities=activities,
+            client_status=presences.ClientStatus(
+                desktop=presences.Status.ONLINE, mobile=presences.Status.OFFLINE, web=presences.Status.OFFLINE
+            ),
+        )
+
+    def test_set_presence_interns_activities_and_client_status(self, cache_impl, app_impl):
+        cache_impl.set_presence(self._make_presence(app_impl, 1, activity_name="game"))
+        cache_impl.set_presence(self._make_presence(app_impl, 1, guild_id=54321, activity_name="game"))
+
+        first = cache_impl._guild_entries[snowflakes.Snowflake(42334)].presences[snowflakes.Snowflake(1)]
+        second = cache_impl._guild_entries[snowflakes.Snowflake(54321)].presences[snowflakes.Snowflake(1)]
+        assert first.activities is second.activities
+        assert first.client_status is second.client_status
+        assert len(cache_impl._activity_entries) == 1
+        assert next(iter(cache_impl._activity_entries.values())).ref_count == 2
+        assert cache_impl._unknown_custom_emoji_entries[snowflakes.Snowflake(777)].ref_count == 1
+        activity = cache_impl.get_presence(54321, 1).activities[0]
+        assert activity.name == "game"
+        assert activity.emoji.id == 777
+        assert activity.assets.large_image == "large"
+        assert activity.buttons == ("button",)
+
+    def test_delete_presence_releases_interned_activities(self, cache_impl, app_impl):
+        cache_impl.set_presence(self._make_presence(app_impl, 1, activity_name="game"))
+        cache_impl.set_presence(self._make_presence(app_impl, 1, guild_id=54321, activity_name="game"))
+
+        cache_impl.delete_presence(42334, 1)
+
+        assert len(cache_impl._activity_entries) == 1
+        assert snowflakes.Snowflake(777) in cache_impl._unknown_custom_emoji_entries
+
+        cache_impl.delete_presence(54321, 1)
+
+        assert cache_impl._activity_entries == {}
+        assert cache_impl._unknown_custom_emoji_entries == {}
+
+    def test_set_presence_releases_replaced_activities(self, cache_impl, app_impl):
+        cache_impl.set_presence(self._make_presence(app_impl, 1, activity_name="game"))
+
+        cache_impl.set_presence(self._make_presence(app_impl, 1, activity_name="other game"))
+
+        assert len(cache_impl._activity_entries) == 1
+        assert next(iter(cache_impl._activity_entries.values())).object[0].name == "other game"
+        assert cache_impl._unknown_custom_emoji_entries[snowflakes.Snowflake(777)].ref_count == 1
+
+    def test_set_presence_without_activities(self, cache_impl, app_impl):
+        cache_impl.set_presence(self._make_presence(app_impl, 1))
+
+        cache_impl.delete_presence(42334, 1)
+
+        assert cache_impl._activity_entries == {}
+
+    def test_set_presence_evicts_least_recently_updated_over_limit(self, app_impl):
+        cache_impl = cache_impl_.CacheImpl(app_impl, config.CacheSettings(max_presences_per_guild=2))
+
+        with mock.patch.object(cache_impl_.CacheImpl, "_remove_presence_assets") as remove_presence_assets:
+            cache_impl.set_presence(self._make_presence(app_impl, 1))
+            cache_impl.set_presence(self._make_presence(app_impl, 2))
+            cache_impl.set_presence(self._make_presence(app_impl, 1))
+            old_presence_data = remove_presence_assets.call_args.args[0]
+
+            cache_impl.set_presence(self._make_presence(app_impl, 3))
+
+        assert set(cache_impl.get_presences_view_for_guild(42334)) == {1, 3}
+        assert old_presence_data.user_id == 1
+        assert remove_presence_assets.call_count == 2
+        assert remove_presence_assets.call_args.args[0].user_id == 2
+
+    def test_set_presences_bulk(self, cache_impl):
+        guild_record_1 = object()
+        guild_record_2 = object()
+        mock_presence_1 = mock.Mock(guild_id=snowflakes.Snowflake(123))
+        mock_presence_2 = mock.Mock(guild_id=snowflakes.Snowflake(456))
+        mock_presence_3 = mock.Mock(guild_id=snowflakes.Snowflake(456))
+        cache_impl._get_or_create_guild_record = mock.Mock(side_effect=[guild_record_1, guild_record_2])
+        cache_impl._set_presence_in_record = mock.Mock()
+
+        cache_impl.set_presences_bulk([mock_presence_1, mock_presence_2, mock_presence_3])
+
+        cache_impl._get_or_create_guild_record.assert_has_calls([mock.call(123), mock.call(456)])
+        cache_impl._set_presence_in_record.assert_has_calls(
+            [
+                mock.call(guild_record_1, mock_presence_1),
+                mock.call(guild_record_2, mock_presence_2),
+                mock.call(guild_record_2, mock_presence_3),
+            ]
+        )
+
+    def test_set_presences_bulk_when_presences_disabled(self, cache_impl):
+        cache_impl._settings.components = config.CacheComponents.NONE
+        cache_impl._set_presence_in_record = mock.Mock()
+
+        cache_impl.set_presences_bulk([mock.Mock()])
+
+        cache_impl._set_presence_in_record.assert_not_called()
+
     @pytest.mark.skip(reason="TODO")
     def test_update_presence(self, cache_impl):
         ...
@@ -2061,6 +3056,19 @@ class TestCacheImpl:
             snowflakes.Snowflake(76345): mock_user_2,
         }
 
+    def test_get_users_view_is_not_changed_by_later_modifications(self, cache_impl):
+        mock_user_1 = mock.MagicMock(users.User)
+        mock_user_2 = mock.MagicMock(users.User)
+        cache_impl._user_entries = collections.FreezableDict(
+            {snowflakes.Snowflake(54123): cache_utilities.RefCell(mock_user_1)}
+        )
+
+        result = cache_impl.get_users_view()
+        cache_impl._user_entries[snowflakes.Snowflake(76345)] = cache_utilities.RefCell(mock_user_2)
+        del cache_impl._user_entries[snowflakes.Snowflake(54123)]
+
+        assert result == {snowflakes.Snowflake(54123): mock_user_1}
+
     def test_get_users_view_for_empty_user_cache(self, cache_impl):
         assert cache_impl.get_users_view() == {}
 
@@ -2135,9 +3143,17 @@ class TestCacheImpl:
     def test_clear_voice_states(self, cache_impl):
         ...
 
-    @pytest.mark.skip(reason="TODO")
-    def test_clear_voice_states_for_channel(self, cache_impl):
-        ...
+    def test_clear_voice_states_for_channel(self, cache_impl, app_impl):
+        cache_impl.set_voice_state(self._make_voice_state(app_impl, 1, 100))
+        cache_impl.set_voice_state(self._make_voice_state(app_impl, 2, 100))
+        cache_impl.set_voice_state(self._make_voice_state(app_impl, 3, 200))
+
+        result = cache_impl.clear_voice_states_for_channel(42334, 100)
+
+        assert set(result) == {1, 2}
+        assert cache_impl.get_voice_states_view_for_channel(42334, 100) == {}
+        assert set(cache_impl.get_voice_states_view_for_guild(42334)) == {3}
+        assert cache_impl.get_voice_state(42334, 1) is None
 
     def test_clear_voice_states_for_guild(self, cache_impl):
         mock_member_data_1 = object()
@@ -2329,9 +3345,42 @@ class TestCacheImpl:
     def test_get_voice_state_view(self, cache_impl):
         ...
 
-    @pytest.mark.skip(reason="TODO")
-    def test_get_voice_states_view_for_channel(self, cache_impl):
-        ...
+    def _make_voice_state(self, app, user_id, channel_id):
+        return voices.VoiceState(
+            app=app,
+            channel_id=snowflakes.Snowflake(channel_id),
+            guild_id=snowflakes.Snowflake(42334),
+            is_guild_muted=False,
+            is_guild_deafened=False,
+            is_self_muted=False,
+            is_self_deafened=False,
+            is_suppressed=False,
+            is_video_enabled=False,
+            is_streaming=False,
+            user_id=snowflakes.Snowflake(user_id),
+            member=self._make_member(app, user_id, []),
+            session_id="kodfsoijkased9i8uos9i8uawe",
+            requested_to_speak_at=None,
+        )
+
+    def test_get_voice_states_view_for_channel(self, cache_impl, app_impl):
+        cache_impl.set_voice_state(self._make_voice_state(app_impl, 1, 100))
+        cache_impl.set_voice_state(self._make_voice_state(app_impl, 2, 100))
+        cache_impl.set_voice_state(self._make_voice_state(app_impl, 3, 200))
+
+        cache_impl.set_voice_state(self._make_voice_state(app_impl, 2, 200))
+
+        assert set(cache_impl.get_voice_states_view_for_channel(42334, 100)) == {1}
+        assert set(cache_impl.get_voice_states_view_for_channel(42334, 200)) == {2, 3}
+        assert cache_impl.get_voice_states_view_for_channel(42334, 300) == {}
+
+    def test_get_voice_states_view_for_channel_after_delete(self, cache_impl, app_impl):
+        cache_impl.set_voice_state(self._make_voice_state(app_impl, 1, 100))
+        cache_impl.set_voice_state(self._make_voice_state(app_impl, 2, 100))
+
+        cache_impl.delete_voice_state(42334, 1)
+
+        assert set(cache_impl.get_voice_states_view_for_channel(42334, 100)) == {2}
 
     @pytest.mark.skip(reason="TODO")
     def test_get_voice_states_view_for_guild(self, cache_impl):
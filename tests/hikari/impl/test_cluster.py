@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import contextlib
+
+import mock
+import pytest
+
+from hikari import errors
+from hikari.impl import cluster
+from hikari.impl import rest as rest_impl
+
+
+@pytest.mark.parametrize(
+    ("shard_ids", "worker_count", "max_concurrency", "expected"),
+    [
+        ({0, 1, 2, 3, 4}, 2, 1, [[{0, 1, 2}, {3, 4}]]),
+        ({0, 1, 2, 3}, 2, 1, [[{0, 1}, {2, 3}]]),
+        ({5, 1, 3}, 1, 1, [[{1, 3, 5}]]),
+        ({0, 1}, 4, 1, [[{0}, {1}]]),
+        ({0, 1, 2, 3}, 2, 2, [[{0, 2}], [{1, 3}]]),
+        ({0, 1, 2, 3, 4, 5, 6, 7}, 4, 2, [[{0, 2}, {4, 6}], [{1, 3}, {5, 7}]]),
+        ({0, 1, 2, 3, 4, 5, 6, 7}, 2, 4, [[{0, 2, 4, 6}], [{1, 3, 5, 7}]]),
+        ({0, 2, 4}, 3, 2, [[{0}, {2}, {4}]]),
+    ],
+)
+def test__split_shard_ids(shard_ids, worker_count, max_concurrency, expected):
+    assert cluster._split_shard_ids(shard_ids, worker_count, max_concurrency) == expected
+
+
+class StubConnection:
+    def __init__(self, *messages):
+        self.messages = list(messages)
+        self.sent = []
+        self.closed = False
+
+    def recv(self):
+        if not self.messages:
+            raise EOFError
+
+        message = self.messages.pop(0)
+        if isinstance(message, asyncio.Future):
+            # Block the executor thread until the test allows it to continue
+            message.result()
+            return (cluster._CLOSE, None)
+
+        return message
+
+    def send(self, message):
+        self.sent.append(message)
+
+    def close(self):
+        self.closed = True
+
+
+class StubBot:
+    def __init__(self):
+        self.started_with = None
+        self.is_alive = False
+        self.closed = asyncio.Event()
+        self.heartbeat_latencies = {1: 0.5}
+        self.rest = mock.Mock(is_alive=True, close=mock.AsyncMock())
+
+    async def start(self, **kwargs):
+        self.started_with = kwargs
+        self.is_alive = True
+
+    async def join(self):
+        await self.closed.wait()
+
+    async def close(self):
+        if not self.is_alive:
+            raise errors.ComponentStateConflictError("bot is not running so it cannot be interacted with")
+
+        self.is_alive = False
+        self.closed.set()
+
+
+@pytest.mark.asyncio()
+async def test__work():
+    bot = StubBot()
+    connection = StubConnection((cluster._CLOSE, None))
+
+    await cluster._work(lambda: bot, frozenset((1,)), 2, {"afk": True}, connection)
+
+    assert bot.started_with == {"shard_ids": frozenset((1,)), "shard_count": 2, "afk": True}
+    assert bot.closed.is_set()
+    bot.rest.close.assert_not_awaited()
+    assert connection.sent[0] == (cluster._STATE, cluster.ClusterWorkerState.STARTED)
+    assert connection.sent[-1] == (cluster._STATE, cluster.ClusterWorkerState.STOPPED)
+
+
+@pytest.mark.asyncio()
+async def test__work_when_start_fails():
+    bot = StubBot()
+    bot.start = mock.AsyncMock(side_effect=RuntimeError("blep"))
+    connection = StubConnection((cluster._CLOSE, None))
+
+    with pytest.raises(RuntimeError, match="blep"):
+        await cluster._work(lambda: bot, frozenset((1,)), 2, {}, connection)
+
+    assert not bot.closed.is_set()
+    bot.rest.close.assert_awaited_once_with()
+    assert connection.sent == [(cluster._STATE, cluster.ClusterWorkerState.STOPPED)]
+
+
+@pytest.mark.asyncio()
+async def test__work_when_close_fails():
+    bot = StubBot()
+    bot.close = mock.AsyncMock(side_effect=RuntimeError("blep"))
+    connection = StubConnection((cluster._CLOSE, None))
+
+    with pytest.raises(RuntimeError, match="blep"):
+        await cluster._work(lambda: bot, frozenset((1,)), 2, {}, connection)
+
+    assert connection.sent[-1] == (cluster._STATE, cluster.ClusterWorkerState.STOPPED)
+
+
+class TestGatewayCluster:
+    @pytest.fixture()
+    def gateway_cluster(self):
+        return cluster.GatewayCluster(mock.Mock(), "token", workers=2)
+
+    def test_heartbeat_latencies(self, gateway_cluster):
+        gateway_cluster._workers = [
+            cluster.ClusterWorker(id=0, shard_ids=frozenset((0, 1)), heartbeat_latencies={0: 0.1, 1: float("nan")}),
+            cluster.ClusterWorker(id=1, shard_ids=frozenset((2,)), heartbeat_latencies={2: 0.3}),
+        ]
+
+        assert list(gateway_cluster.heartbeat_latencies) == [0, 1, 2]
+        assert gateway_cluster.heartbeat_latency == pytest.approx(0.2)
+
+    def test_heartbeat_latency_when_no_latencies(self, gateway_cluster):
+        assert str(gateway_cluster.heartbeat_latency) == "nan"
+
+    def test_is_alive(self, gateway_cluster):
+        gateway_cluster._workers = [
+            cluster.ClusterWorker(id=0, shard_ids=frozenset((0,)), state=cluster.ClusterWorkerState.STOPPED),
+            cluster.ClusterWorker(id=1, shard_ids=frozenset((1,)), state=cluster.ClusterWorkerState.STARTED),
+        ]
+
+        assert gateway_cluster.is_alive is True
+
+        gateway_cluster._workers[1].state = cluster.ClusterWorkerState.STOPPED
+
+        assert gateway_cluster.is_alive is False
+
+    def test_remove_state_listener(self, gateway_cluster):
+        callback = mock.Mock()
+        gateway_cluster.add_state_listener(callback)
+
+        gateway_cluster.remove_state_listener(callback)
+
+        assert gateway_cluster._listeners == []
+
+    @pytest.mark.asyncio()
+    async def test__poll(self, gateway_cluster):
+        worker = cluster.ClusterWorker(id=0, shard_ids=frozenset((0,)))
+        connection = StubConnection(
+            (cluster._STATE, cluster.ClusterWorkerState.STARTED),
+            (cluster._LATENCIES, {0: 0.2}),
+            (cluster._STATE, cluster.ClusterWorkerState.STOPPED),
+        )
+        gateway_cluster._condition = asyncio.Condition()
+        states = []
+        gateway_cluster.add_state_listener(lambda w: states.append(w.state))
+
+        await gateway_cluster._poll(worker, connection)
+
+        assert states == [cluster.ClusterWorkerState.STARTED, cluster.ClusterWorkerState.STOPPED]
+        assert worker.heartbeat_latencies == {}
+        assert connection.closed is True
+
+    @pytest.mark.asyncio()
+    async def test__poll_when_worker_dies(self, gateway_cluster):
+        worker = cluster.ClusterWorker(id=0, shard_ids=frozenset((0,)), heartbeat_latencies={0: 0.2})
+        connection = StubConnection((cluster._STATE, cluster.ClusterWorkerState.STARTED))
+        gateway_cluster._condition = asyncio.Condition()
+
+        await gateway_cluster._poll(worker, connection)
+
+        assert worker.state is cluster.ClusterWorkerState.STOPPED
+        assert connection.closed is True
+
+    @pytest.mark.asyncio()
+    async def test__set_state_when_listener_raises(self, gateway_cluster):
+        worker = cluster.ClusterWorker(id=0, shard_ids=frozenset((0,)))
+        gateway_cluster._condition = asyncio.Condition()
+        gateway_cluster.add_state_listener(mock.Mock(side_effect=RuntimeError))
+        other_listener = mock.Mock()
+        gateway_cluster.add_state_listener(other_listener)
+
+        await gateway_cluster._set_state(worker, cluster.ClusterWorkerState.STARTED)
+
+        other_listener.assert_called_once_with(worker)
+
+    @pytest.fixture()
+    def rest_client(self):
+        rest_client = mock.Mock(fetch_gateway_bot_info=mock.AsyncMock())
+        rest_client.fetch_gateway_bot_info.return_value.shard_count = 5
+        rest_client.fetch_gateway_bot_info.return_value.session_start_limit.remaining = 1000
+        rest_client.fetch_gateway_bot_info.return_value.session_start_limit.max_concurrency = 1
+
+        @contextlib.asynccontextmanager
+        async def acquire(*args):
+            yield rest_client
+
+        with mock.patch.object(rest_impl, "RESTApp") as rest_app:
+            rest_app.return_value.acquire = acquire
+            yield rest_client
+
+    @pytest.mark.asyncio()
+    async def test_start(self, gateway_cluster, rest_client):
+        spawned = []
+
+        def spawn(worker, shard_count, start_kwargs):
+            spawned.append((worker.id, worker.shard_ids, shard_count, start_kwargs["check_for_updates"]))
+            asyncio.create_task(gateway_cluster._set_state(worker, cluster.ClusterWorkerState.STARTED))
+
+        with mock.patch.object(cluster.GatewayCluster, "_spawn", side_effect=spawn):
+            with mock.patch.object(asyncio, "sleep", new=mock.AsyncMock()) as sleep:
+                await gateway_cluster.start()
+
+        assert spawned == [(0, frozenset((0, 1, 2)), 5, True), (1, frozenset((3, 4)), 5, False)]
+        sleep.assert_awaited_once_with(cluster._WINDOW)
+
+    @pytest.mark.asyncio()
+    async def test_start_with_concurrent_lanes(self, gateway_cluster, rest_client):
+        rest_client.fetch_gateway_bot_info.return_value.session_start_limit.max_concurrency = 16
+        spawned = []
+
+        def spawn(worker, shard_count, start_kwargs):
+            spawned.append(worker.id)
+            asyncio.create_task(gateway_cluster._set_state(worker, cluster.ClusterWorkerState.STARTED))
+
+        with mock.patch.object(cluster.GatewayCluster, "_spawn", side_effect=spawn):
+            with mock.patch.object(asyncio, "sleep", new=mock.AsyncMock()) as sleep:
+                await gateway_cluster.start()
+
+        # Both workers are spawned before either of them has started
+        assert spawned == [0, 1]
+        assert [worker.shard_ids for worker in gateway_cluster.workers] == [{0, 2, 4}, {1, 3}]
+        sleep.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_start_when_worker_stops_before_starting(self, gateway_cluster, rest_client):
+        def spawn(worker, shard_count, start_kwargs):
+            asyncio.create_task(gateway_cluster._set_state(worker, cluster.ClusterWorkerState.STOPPED))
+
+        with mock.patch.object(cluster.GatewayCluster, "_spawn", side_effect=spawn):
+            with pytest.raises(
+                errors.GatewayError, match="cluster worker 0 shut down before all of its shards started"
+            ):
+                await gateway_cluster.start()
+
+        assert len(gateway_cluster.workers) == 2
+        assert not gateway_cluster.is_alive
+
+    @pytest.mark.asyncio()
+    async def test_start_when_session_start_limit_exceeded(self, gateway_cluster, rest_client):
+        rest_client.fetch_gateway_bot_info.return_value.session_start_limit.remaining = 1
+
+        with mock.patch.object(cluster.GatewayCluster, "_spawn") as spawn:
+            with pytest.raises(errors.GatewayError, match="Attempted to start more sessions than were allowed"):
+                await gateway_cluster.start(shard_ids={0, 1}, shard_count=2)
+
+        spawn.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_start_when_shard_ids_without_shard_count(self, gateway_cluster):
+        with pytest.raises(TypeError, match="'shard_ids' must be passed with 'shard_count'"):
+            await gateway_cluster.start(shard_ids={0})
+
+    @pytest.mark.asyncio()
+    async def test_start_when_already_alive(self, gateway_cluster):
+        gateway_cluster._workers = [cluster.ClusterWorker(id=0, shard_ids=frozenset((0,)))]
+
+        with pytest.raises(errors.ComponentStateConflictError):
+            await gateway_cluster.start()
+
+    @pytest.mark.asyncio()
+    async def test_close(self, gateway_cluster):
+        gateway_cluster._condition = asyncio.Condition()
+        worker0 = cluster.ClusterWorker(id=0, shard_ids=frozenset((0,)), state=cluster.ClusterWorkerState.STARTED)
+        worker1 = cluster.ClusterWorker(id=1, shard_ids=frozenset((1,)), state=cluster.ClusterWorkerState.STOPPED)
+        connection0 = StubConnection()
+        connection1 = StubConnection()
+        process = mock.Mock()
+        gateway_cluster._workers = [worker0, worker1]
+        gateway_cluster._connections = {0: connection0, 1: connection1}
+        gateway_cluster._processes = [process]
+
+        async def stop_worker0():
+            await asyncio.sleep(0)
+            await gateway_cluster._set_state(worker0, cluster.ClusterWorkerState.STOPPED)
+
+        task = asyncio.create_task(stop_worker0())
+        await gateway_cluster.close()
+        await task
+
+        assert connection0.sent == [(cluster._CLOSE, None)]
+        assert connection1.sent == []
+        process.join.assert_called_once_with()
+        assert gateway_cluster._processes == []
+        assert gateway_cluster._connections == {}
@@ -29,10 +29,13 @@ import mock
 import pytest
 
 from hikari import channels
+from hikari import config
 from hikari import errors
 from hikari import intents
 from hikari import presences
+from hikari import snowflakes
 from hikari.impl import event_manager
+from hikari.internal import routes
 from hikari.internal import time
 from tests.hikari import hikari_test_helpers
 
@@ -107,10 +110,57 @@ class TestEventManagerImpl:
         obj.dispatch = mock.AsyncMock()
         return obj
 
+    def test___init___filters_consumers_by_cache_components(self, event_factory):
+        manager = event_manager.EventManagerImpl(
+            event_factory, intents.Intents.ALL, cache=mock.Mock(), cache_components=config.CacheComponents.MEMBERS
+        )
+
+        assert manager._consumers["guild_member_add"].is_enabled is True
+        assert manager._consumers["presence_update"].is_enabled is False
+        assert manager._consumers["typing_start"].is_enabled is False
+        assert manager._consumers["ready"].is_enabled is True
+
+    def test___init___when_stateless_ignores_cache_components(self, event_factory):
+        manager = event_manager.EventManagerImpl(
+            event_factory, intents.Intents.ALL, cache=None, cache_components=config.CacheComponents.ALL
+        )
+
+        assert manager._consumers["guild_member_add"].is_enabled is False
+        assert manager._consumers["guild_integrations_update"].is_enabled is False
+
+    @pytest.mark.parametrize(
+        ("event_name", "payload", "expected_routes"),
+        [
+            ("GUILD_UPDATE", {"id": "123"}, [routes.GET_GUILD.compile(guild=123)]),
+            (
+                "GUILD_ROLE_DELETE",
+                {"guild_id": "123", "role_id": "456"},
+                [routes.GET_GUILD.compile(guild=123), routes.GET_GUILD_ROLES.compile(guild=123)],
+            ),
+            (
+                "CHANNEL_UPDATE",
+                {"id": "456", "guild_id": "123"},
+                [routes.GET_CHANNEL.compile(channel=456), routes.GET_GUILD_CHANNELS.compile(guild=123)],
+            ),
+            ("CHANNEL_UPDATE", {"id": "456"}, [routes.GET_CHANNEL.compile(channel=456)]),
+            ("MESSAGE_CREATE", {"id": "456"}, []),
+        ],
+    )
+    def test_consume_raw_event_invalidates_response_cache(self, event_factory, event_name, payload, expected_routes):
+        response_cache = mock.Mock()
+        manager = event_manager.EventManagerImpl(
+            event_factory, intents.Intents.ALL, cache=None, response_cache=response_cache
+        )
+
+        manager.consume_raw_event(event_name, mock.Mock(), payload)
+
+        assert response_cache.invalidate.call_args_list == [mock.call(route) for route in expected_routes]
+
     @pytest.mark.asyncio()
     async def test_on_ready_stateful(self, event_manager, shard, event_factory):
         payload = {}
-        event = mock.Mock(my_user=mock.Mock())
+        event = mock.Mock(my_user=mock.Mock(), unavailable_guilds=[])
+        event_manager._cache.get_guilds_view.return_value = {}
 
         event_factory.deserialize_ready_event.return_value = event
 
@@ -120,6 +170,23 @@ class TestEventManagerImpl:
         event_factory.deserialize_ready_event.assert_called_once_with(shard, payload)
         event_manager.dispatch.assert_awaited_once_with(event)
 
+    @pytest.mark.asyncio()
+    async def test_on_ready_stateful_removes_guilds_no_longer_in(self, event_manager, shard, event_factory):
+        shard.id = 1
+        shard.shard_count = 2
+        # The first two guilds are on shard 1 and the last is on shard 0.
+        guild_ids = [snowflakes.Snowflake(1 << 22), snowflakes.Snowflake(3 << 22), snowflakes.Snowflake(2 << 22)]
+        event = mock.Mock(unavailable_guilds=[guild_ids[0]])
+        event_manager._cache.get_guilds_view.return_value = dict.fromkeys(guild_ids)
+        event_factory.deserialize_ready_event.return_value = event
+
+        await event_manager.on_ready(shard, {})
+
+        event_manager._cache.delete_guild.assert_called_once_with(guild_ids[1])
+        event_manager._cache.clear_members_for_guild.assert_called_once_with(guild_ids[1])
+        event_manager._cache.clear_roles_for_guild.assert_called_once_with(guild_ids[1])
+        event_manager.dispatch.assert_awaited_once_with(event)
+
     @pytest.mark.asyncio()
     async def test_on_ready_stateless(self, stateless_event_manager, shard, event_factory):
         payload = {}
@@ -247,25 +314,22 @@ class TestEventManagerImpl:
         assert event.chunk_nonce is None
         shard.request_guild_members.assert_not_called()
 
-        event_manager._cache.update_guild.assert_called_once_with(event.guild)
-
-        event_manager._cache.clear_guild_channels_for_guild.assert_called_once_with(123)
-        event_manager._cache.set_guild_channel.assert_called_once_with(456)
-
-        event_manager._cache.clear_emojis_for_guild.assert_called_once_with(123)
-        event_manager._cache.set_emoji.assert_called_once_with(789)
-
-        event_manager._cache.clear_roles_for_guild.assert_called_once_with(123)
-        event_manager._cache.set_role.assert_called_once_with(1234)
-
-        event_manager._cache.clear_members_for_guild.assert_called_once_with(123)
-        event_manager._cache.set_member.assert_called_once_with(5678)
-
-        event_manager._cache.clear_presences_for_guild.assert_called_once_with(123)
-        event_manager._cache.set_presence.assert_called_once_with(9012)
-
-        event_manager._cache.clear_voice_states_for_guild.assert_called_once_with(123)
-        event_manager._cache.set_voice_state.assert_called_once_with(345)
+        event_manager._cache.replace_guild_contents.assert_called_once_with(
+            event.guild,
+            channels=mock.ANY,
+            emojis=mock.ANY,
+            roles=mock.ANY,
+            members=mock.ANY,
+            presences=mock.ANY,
+            voice_states=mock.ANY,
+        )
+        kwargs = event_manager._cache.replace_guild_contents.call_args.kwargs
+        assert list(kwargs["channels"]) == [456]
+        assert list(kwargs["emojis"]) == [789]
+        assert list(kwargs["roles"]) == [1234]
+        assert list(kwargs["members"]) == [5678]
+        assert list(kwargs["presences"]) == [9012]
+        assert list(kwargs["voice_states"]) == [345]
 
         event_factory.deserialize_guild_create_event.assert_called_once_with(shard, payload)
         event_manager.dispatch.assert_awaited_once_with(event)
@@ -305,25 +369,22 @@ class TestEventManagerImpl:
             _request_guild_members.return_value, name="987:123 guild create members request"
         )
 
-        event_manager._cache.update_guild.assert_called_once_with(event.guild)
-
-        event_manager._cache.clear_guild_channels_for_guild.assert_called_once_with(123)
-        event_manager._cache.set_guild_channel.assert_called_once_with(456)
-
-        event_manager._cache.clear_emojis_for_guild.assert_called_once_with(123)
-        event_manager._cache.set_emoji.assert_called_once_with(789)
-
-        event_manager._cache.clear_roles_for_guild.assert_called_once_with(123)
-        event_manager._cache.set_role.assert_called_once_with(1234)
-
-        event_manager._cache.clear_members_for_guild.assert_called_once_with(123)
-        event_manager._cache.set_member.assert_called_once_with(5678)
-
-        event_manager._cache.clear_presences_for_guild.assert_called_once_with(123)
-        event_manager._cache.set_presence.assert_called_once_with(9012)
-
-        event_manager._cache.clear_voice_states_for_guild.assert_called_once_with(123)
-        event_manager._cache.set_voice_state.assert_called_once_with(345)
+        event_manager._cache.replace_guild_contents.assert_called_once_with(
+            event.guild,
+            channels=mock.ANY,
+            emojis=mock.ANY,
+            roles=mock.ANY,
+            members=mock.ANY,
+            presences=mock.ANY,
+            voice_states=mock.ANY,
+        )
+        kwargs = event_manager._cache.replace_guild_contents.call_args.kwargs
+        assert list(kwargs["channels"]) == [456]
+        assert list(kwargs["emojis"]) == [789]
+        assert list(kwargs["roles"]) == [1234]
+        assert list(kwargs["members"]) == [5678]
+        assert list(kwargs["presences"]) == [9012]
+        assert list(kwargs["voice_states"]) == [345]
 
         event_factory.deserialize_guild_create_event.assert_called_once_with(shard, payload)
         event_manager.dispatch.assert_awaited_once_with(event)
@@ -606,14 +667,36 @@ class TestEventManagerImpl:
         payload = {}
         event = mock.Mock(members={"TestMember": 123}, presences={"TestPresences": 456})
         event_factory.deserialize_guild_member_chunk_event.return_value = event
+        event_manager._consumers["guild_members_chunk"].is_dispatching = True
 
         await event_manager.on_guild_members_chunk(shard, payload)
 
-        event_manager._cache.set_member.assert_called_once_with(123)
-        event_manager._cache.set_presence.assert_called_once_with(456)
+        event_manager._cache.set_members_bulk.assert_called_once_with(mock.ANY)
+        assert list(event_manager._cache.set_members_bulk.call_args.args[0]) == [123]
+        event_manager._cache.set_presences_bulk.assert_called_once_with(mock.ANY)
+        assert list(event_manager._cache.set_presences_bulk.call_args.args[0]) == [456]
         event_factory.deserialize_guild_member_chunk_event.assert_called_once_with(shard, payload)
         event_manager.dispatch.assert_awaited_once_with(event)
 
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize("presences", [[{"presence": 1}], None])
+    async def test_on_guild_members_chunk_stateful_when_not_dispatching(
+        self, event_manager, shard, event_factory, presences
+    ):
+        payload = {"guild_id": "123", "members": [{"member": 1}]}
+        if presences is not None:
+            payload["presences"] = presences
+
+        event_manager._consumers["guild_members_chunk"].is_dispatching = False
+
+        await event_manager.on_guild_members_chunk(shard, payload)
+
+        event_manager._cache.set_member_payloads.assert_called_once_with(
+            123, [{"member": 1}], presence_payloads=presences or ()
+        )
+        event_factory.deserialize_guild_member_chunk_event.assert_not_called()
+        event_manager.dispatch.assert_not_called()
+
     @pytest.mark.asyncio()
     async def test_on_guild_members_chunk_stateless(self, stateless_event_manager, shard, event_factory):
         payload = {}
@@ -29,6 +29,7 @@ import weakref
 import mock
 import pytest
 
+from hikari import config
 from hikari import errors
 from hikari import intents
 from hikari import iterators
@@ -383,6 +384,55 @@ class TestEventStream:
         stream._active = False
 
 
+class TestAttributeIndex:
+    def test_add_and_discard_unkeyed(self):
+        index = event_manager_base._AttributeIndex()
+        item = object()
+
+        index.add(item, None)
+        assert index.unkeyed == {item}
+        assert index
+
+        index.discard(item, None)
+        assert not index
+
+    def test_add_and_discard_keyed_cleans_up_empty_buckets(self):
+        index = event_manager_base._AttributeIndex()
+        item_1 = object()
+        item_2 = object()
+
+        index.add(item_1, ("id", 123))
+        index.add(item_2, ("id", 123))
+        assert index.keyed["id"][1] == {123: {item_1, item_2}}
+
+        index.discard(item_1, ("id", 123))
+        assert index.keyed["id"][1] == {123: {item_2}}
+
+        index.discard(item_2, ("id", 123))
+        assert index.keyed == {}
+        assert not index
+
+    def test_discard_when_not_present(self):
+        index = event_manager_base._AttributeIndex()
+
+        index.discard(object(), ("id", 123))
+
+        assert not index
+
+    def test_matching(self):
+        index = event_manager_base._AttributeIndex()
+        unkeyed = object()
+        matching = object()
+        other = object()
+        missing_attribute = object()
+        index.add(unkeyed, None)
+        index.add(matching, ("id", 123))
+        index.add(other, ("id", 456))
+        index.add(missing_attribute, ("foo.bar", 789))
+
+        assert index.matching(mock.Mock(spec_set=["id"], id=123)) == [(None, {unkeyed}), (("id", 123), {matching})]
+
+
 def test__default_predicate_returns_True():
     assert event_manager_base._default_predicate(None) is True
 
@@ -397,6 +447,7 @@ class TestEventManagerBase:
 
     def test___init___loads_consumers(self):
         class StubManager(event_manager_base.EventManagerBase):
+            @event_manager_base.filtered((member_events.MemberCreateEvent,), config.CacheComponents.MEMBERS)
             async def on_foo(self, event):
                 raise NotImplementedError
 
@@ -407,7 +458,32 @@ class TestEventManagerBase:
                 raise NotImplementedError
 
         manager = StubManager(mock.Mock(), mock.Mock(intents=42))
-        assert manager._consumers == {"foo": manager.on_foo, "bar": manager.on_bar}
+        assert manager._consumers == {
+            "foo": event_manager_base._Consumer(
+                manager.on_foo,
+                (member_events.MemberCreateEvent,),
+                config.CacheComponents.MEMBERS,
+                is_enabled=False,
+                is_dispatching=False,
+            ),
+            "bar": event_manager_base._Consumer(manager.on_bar, None, config.CacheComponents.NONE),
+        }
+
+    def test___init___when_cache_component_enabled(self):
+        class StubManager(event_manager_base.EventManagerBase):
+            @event_manager_base.filtered((member_events.MemberCreateEvent,), config.CacheComponents.MEMBERS)
+            async def on_foo(self, event):
+                raise NotImplementedError
+
+            @event_manager_base.filtered((member_events.MemberUpdateEvent,), config.CacheComponents.ROLES)
+            async def on_bar(self, event):
+                raise NotImplementedError
+
+        manager = StubManager(mock.Mock(), mock.Mock(), cache_components=config.CacheComponents.MEMBERS)
+
+        assert manager._consumers["foo"].is_enabled is True
+        assert manager._consumers["foo"].is_dispatching is False
+        assert manager._consumers["bar"].is_enabled is False
 
     @pytest.mark.asyncio()
     async def test_consume_raw_event_when_KeyError(self, event_manager):
@@ -415,6 +491,7 @@ class TestEventManagerBase:
         mock_shard = mock.Mock(id=123)
         event_manager._handle_dispatch = mock.Mock()
         event_manager.dispatch = mock.Mock()
+        event_manager._payload_events_enabled = True
 
         with pytest.raises(LookupError):
             event_manager.consume_raw_event("UNEXISTING_EVENT", mock_shard, mock_payload)
@@ -432,7 +509,10 @@ class TestEventManagerBase:
         event_manager._handle_dispatch = mock.Mock()
         event_manager.dispatch = mock.Mock()
         on_existing_event = object()
-        event_manager._consumers = {"existing_event": on_existing_event}
+        event_manager._consumers = {
+            "existing_event": event_manager_base._Consumer(on_existing_event, None, config.CacheComponents.NONE)
+        }
+        event_manager._payload_events_enabled = True
         shard = object()
         payload = {"berp": "baz"}
 
@@ -451,6 +531,283 @@ class TestEventManagerBase:
             shard, payload, name="EXISTING_EVENT"
         )
 
+    @pytest.mark.asyncio()
+    async def test_consume_raw_event_when_nothing_consumes_it(self, event_manager):
+        event_manager._handle_dispatch = mock.Mock()
+        event_manager.dispatch = mock.Mock()
+        event_manager._consumers = {
+            "existing_event": event_manager_base._Consumer(
+                object(), (member_events.MemberCreateEvent,), config.CacheComponents.NONE, is_enabled=False
+            )
+        }
+
+        with mock.patch("asyncio.create_task") as create_task:
+            event_manager.consume_raw_event("EXISTING_EVENT", object(), {"berp": "baz"})
+
+        create_task.assert_not_called()
+        event_manager._handle_dispatch.assert_not_called()
+        event_manager.dispatch.assert_not_called()
+        event_manager._event_factory.deserialize_shard_payload_event.assert_not_called()
+
+    @pytest.fixture()
+    def queued_event_manager(self):
+        class EventManagerBaseImpl(event_manager_base.EventManagerBase):
+            async def on_existing_event(self, shard, payload):
+                raise NotImplementedError
+
+        settings = config.DispatchSettings(max_queue_size=2, workers=1)
+        return EventManagerBaseImpl(mock.Mock(), mock.Mock(), dispatch_settings=settings)
+
+    @pytest.mark.asyncio()
+    async def test_consume_raw_event_with_dispatch_settings(self, queued_event_manager):
+        processed = []
+        queued_event_manager._handle_dispatch = mock.AsyncMock(side_effect=lambda *args: processed.append(args))
+        shard = mock.Mock(id=3)
+
+        with mock.patch.object(asyncio, "create_task", wraps=asyncio.create_task) as create_task:
+            assert queued_event_manager.consume_raw_event("EXISTING_EVENT", shard, {"a": 1}) is None
+            assert queued_event_manager.consume_raw_event("EXISTING_EVENT", shard, {"a": 2}) is None
+
+        # Only the single worker task should have been created
+        create_task.assert_called_once()
+        statistics = queued_event_manager.dispatch_queue_statistics[3]
+        assert statistics == event_manager_base.DispatchQueueStatistics(depth=2, max_depth=2, queued_events=2)
+
+        await queued_event_manager._dispatch_queues[3].queue.join()
+
+        callback = queued_event_manager._consumers["existing_event"].callback
+        assert processed == [(callback, shard, {"a": 1}), (callback, shard, {"a": 2})]
+        assert statistics.depth == 0
+
+        await queued_event_manager.close_dispatch_queues()
+
+    @pytest.mark.asyncio()
+    async def test_consume_raw_event_when_queue_full_and_block(self, queued_event_manager):
+        shard = mock.Mock(id=0)
+        release = asyncio.Event()
+
+        async def handle_dispatch(*args):
+            await release.wait()
+
+        queued_event_manager._handle_dispatch = handle_dispatch
+
+        for i in range(3):
+            assert queued_event_manager.consume_raw_event("EXISTING_EVENT", shard, {"i": i}) is None
+            # Let the worker take the first event
+            await asyncio.sleep(0)
+
+        backpressure = queued_event_manager.consume_raw_event("EXISTING_EVENT", shard, {"i": 3})
+        assert backpressure is not None
+
+        statistics = queued_event_manager.dispatch_queue_statistics[0]
+        assert statistics.blocked_events == 1
+        assert statistics.queued_events == 3
+
+        release.set()
+        await asyncio.wait_for(backpressure, timeout=1)
+
+        assert statistics.queued_events == 4
+        assert statistics.dropped_events == 0
+
+        await queued_event_manager.close_dispatch_queues()
+
+    @pytest.mark.asyncio()
+    async def test_consume_raw_event_when_queue_full_and_drop_oldest(self, queued_event_manager):
+        queued_event_manager._dispatch_settings.overflow_policy = config.DispatchOverflowPolicy.DROP_OLDEST
+        queued_event_manager._handle_dispatch = mock.AsyncMock()
+        shard = mock.Mock(id=0)
+
+        for i in range(4):
+            assert queued_event_manager.consume_raw_event("EXISTING_EVENT", shard, {"i": i}) is None
+
+        queue = queued_event_manager._dispatch_queues[0].queue
+        assert [item[2] for item in queue._queue] == [{"i": 2}, {"i": 3}]
+        assert queued_event_manager.dispatch_queue_statistics[0].dropped_events == 2
+
+        await queued_event_manager.close_dispatch_queues()
+
+    @pytest.mark.asyncio()
+    async def test_consume_raw_event_when_queue_full_and_drop_by_type(self, queued_event_manager):
+        queued_event_manager._dispatch_settings.overflow_policy = config.DispatchOverflowPolicy.DROP_BY_TYPE
+        queued_event_manager._dispatch_settings.droppable_events = frozenset(("EXISTING_EVENT",))
+        queued_event_manager._consumers["other_event"] = queued_event_manager._consumers["existing_event"]
+        queued_event_manager._handle_dispatch = mock.AsyncMock()
+        shard = mock.Mock(id=0)
+
+        for i in range(3):
+            assert queued_event_manager.consume_raw_event("EXISTING_EVENT", shard, {"i": i}) is None
+
+        backpressure = queued_event_manager.consume_raw_event("OTHER_EVENT", shard, {})
+
+        assert backpressure is not None
+        statistics = queued_event_manager.dispatch_queue_statistics[0]
+        assert statistics.dropped_events == 1
+        assert statistics.blocked_events == 1
+
+        await asyncio.wait_for(backpressure, timeout=1)
+        await queued_event_manager.close_dispatch_queues()
+
+    @pytest.mark.asyncio()
+    async def test_close_dispatch_queues(self, queued_event_manager):
+        async def handle_dispatch(*args):
+            await asyncio.sleep(10)
+
+        queued_event_manager._handle_dispatch = handle_dispatch
+        queued_event_manager.consume_raw_event("EXISTING_EVENT", mock.Mock(id=0), {})
+        await asyncio.sleep(0)
+        workers = queued_event_manager._dispatch_queues[0].workers
+
+        await asyncio.wait_for(queued_event_manager.close_dispatch_queues(), timeout=1)
+
+        assert all(worker.done() for worker in workers)
+        assert queued_event_manager.dispatch_queue_statistics == {}
+
+    def test__update_consumers(self, event_manager):
+        event_manager._consumers = {
+            "create": event_manager_base._Consumer(
+                object(), (member_events.MemberCreateEvent,), config.CacheComponents.NONE
+            ),
+            "update": event_manager_base._Consumer(
+                object(), (member_events.MemberUpdateEvent,), config.CacheComponents.NONE
+            ),
+            "never": event_manager_base._Consumer(object(), (), config.CacheComponents.NONE),
+            "always": event_manager_base._Consumer(object(), None, config.CacheComponents.NONE, is_enabled=False),
+        }
+        event_manager._listeners = {member_events.MemberEvent: []}
+        event_manager._waiters = {member_events.MemberCreateEvent: set()}
+
+        event_manager._update_consumers()
+
+        assert event_manager._consumers["create"].is_enabled is True
+        assert event_manager._consumers["update"].is_enabled is True
+        assert event_manager._consumers["never"].is_enabled is False
+        assert event_manager._consumers["always"].is_enabled is True
+        assert event_manager._payload_events_enabled is False
+
+    def test__update_consumers_when_listening_to_payload_events(self, event_manager):
+        event_manager._consumers = {
+            "create": event_manager_base._Consumer(
+                object(), (member_events.MemberCreateEvent,), config.CacheComponents.NONE
+            ),
+        }
+        event_manager._listeners = {base_events.Event: []}
+
+        event_manager._update_consumers()
+
+        assert event_manager._consumers["create"].is_enabled is True
+        assert event_manager._payload_events_enabled is True
+
+    def test_subscribe_and_unsubscribe_update_consumers(self, event_manager):
+        event_manager._check_intents = mock.Mock()
+        event_manager._consumers = {
+            "create": event_manager_base._Consumer(
+                object(), (member_events.MemberCreateEvent,), config.CacheComponents.NONE, is_enabled=False
+            ),
+        }
+
+        async def test():
+            ...
+
+        event_manager.subscribe(member_events.MemberCreateEvent, test)
+        assert event_manager._consumers["create"].is_enabled is True
+
+        event_manager.unsubscribe(member_events.MemberCreateEvent, test)
+        assert event_manager._consumers["create"].is_enabled is False
+
+    @pytest.mark.asyncio()
+    async def test_wait_for_updates_consumers(self, event_manager):
+        event_manager._check_intents = mock.Mock()
+        event_manager._consumers = {
+            "create": event_manager_base._Consumer(
+                object(), (member_events.MemberCreateEvent,), config.CacheComponents.NONE, is_enabled=False
+            ),
+        }
+
+        with pytest.raises(asyncio.TimeoutError):
+            await event_manager.wait_for(member_events.MemberCreateEvent, timeout=0)
+
+        assert event_manager._waiters == {}
+        assert event_manager._consumers["create"].is_enabled is False
+
+    @pytest.mark.asyncio()
+    async def test_wait_for_enables_consumers_until_dispatched(self, event_manager):
+        event_manager._check_intents = mock.Mock()
+        event_manager._consumers = {
+            "create": event_manager_base._Consumer(
+                object(), (member_events.MemberCreateEvent,), config.CacheComponents.NONE, is_enabled=False
+            ),
+        }
+        event = hikari_test_helpers.mock_class_namespace(member_events.MemberCreateEvent, init_=False)()
+
+        task = asyncio.create_task(event_manager.wait_for(member_events.MemberCreateEvent, timeout=None))
+        await asyncio.sleep(0)
+        assert event_manager._consumers["create"].is_enabled is True
+
+        await event_manager.dispatch(event)
+
+        assert await task is event
+        assert event_manager._waiters == {}
+        assert event_manager._consumers["create"].is_enabled is False
+
+    @pytest.mark.asyncio()
+    async def test_wait_for_with_key_only_checks_matching_events(self, event_manager):
+        event_manager._check_intents = mock.Mock()
+        predicate = mock.Mock(return_value=True)
+        other_event = hikari_test_helpers.mock_class_namespace(
+            member_events.MemberCreateEvent, init_=False, user_id=456
+        )()
+        event = hikari_test_helpers.mock_class_namespace(member_events.MemberCreateEvent, init_=False, user_id=123)()
+
+        task = asyncio.create_task(
+            event_manager.wait_for(
+                member_events.MemberCreateEvent, timeout=None, predicate=predicate, key=("user_id", 123)
+            )
+        )
+        await asyncio.sleep(0)
+
+        await event_manager.dispatch(other_event)
+        predicate.assert_not_called()
+        assert not task.done()
+
+        await event_manager.dispatch(event)
+
+        assert await task is event
+        predicate.assert_called_once_with(event)
+        assert event_manager._waiters == {}
+
+    @pytest.mark.asyncio()
+    async def test_wait_for_with_key_cleans_up_on_timeout(self, event_manager):
+        event_manager._check_intents = mock.Mock()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await event_manager.wait_for(member_events.MemberCreateEvent, timeout=0, key=("user_id", 123))
+
+        assert event_manager._waiters == {}
+
+    @pytest.mark.asyncio()
+    async def test_indexed_stream_is_fed_by_dispatch(self, event_manager):
+        event_manager._check_intents = mock.Mock()
+        event_manager.subscribe = mock.Mock()
+        other_event = hikari_test_helpers.mock_class_namespace(
+            member_events.MemberCreateEvent, init_=False, user_id=456
+        )()
+        event = hikari_test_helpers.mock_class_namespace(member_events.MemberCreateEvent, init_=False, user_id=123)()
+
+        stream = event_manager.stream(member_events.MemberCreateEvent, timeout=None).filter(user_id=123)
+        assert stream._index_key == ("user_id", 123)
+
+        async with stream:
+            event_manager.subscribe.assert_not_called()
+            assert member_events.MemberCreateEvent in event_manager._streams
+
+            await event_manager.dispatch(other_event)
+            await event_manager.dispatch(event)
+
+            assert stream._queue.get_nowait() is event
+            assert stream._queue.empty()
+
+        assert event_manager._streams == {}
+
     @pytest.mark.asyncio()
     async def test_handle_dispatch_invokes_callback(self, event_manager, event_loop):
         callback = mock.AsyncMock()
@@ -497,12 +854,32 @@ class TestEventManagerBase:
             },
         )
 
-    def test_subscribe_when_callback_is_not_coroutine(self, event_manager):
-        def test():
+    def test_subscribe_when_callback_is_not_callable(self, event_manager):
+        with pytest.raises(TypeError):
+            event_manager.subscribe(member_events.MemberCreateEvent, object())
+
+    def test_subscribe_when_serial_key_for_non_coroutine_callback(self, event_manager):
+        def test(event):
             ...
 
         with pytest.raises(TypeError):
-            event_manager.subscribe(member_events.MemberCreateEvent, test)
+            event_manager.subscribe(member_events.MemberCreateEvent, test, serial_key="guild_id")
+
+    def test_subscribe_with_serial_key(self, event_manager):
+        event_manager._check_intents = mock.Mock()
+
+        async def test(event):
+            ...
+
+        event_manager.subscribe(member_events.MemberCreateEvent, test, serial_key="guild_id")
+
+        assert event_manager._listeners == {member_events.MemberCreateEvent: [test]}
+        serial_listener = event_manager._serial_listeners[(member_events.MemberCreateEvent, test)]
+        assert serial_listener.callback is test
+
+        event_manager.unsubscribe(member_events.MemberCreateEvent, test)
+
+        assert event_manager._serial_listeners == {}
 
     def test_subscribe_when_event_type_does_not_subclass_Event(self, event_manager):
         async def test():
@@ -575,6 +952,112 @@ class TestEventManagerBase:
             stacklevel=3,
         )
 
+    @pytest.mark.asyncio()
+    async def test_dispatch(self, event_manager):
+        event_manager._check_intents = mock.Mock()
+        listener0 = mock.AsyncMock()
+        listener1 = mock.AsyncMock()
+        listener2 = mock.AsyncMock()
+        event_manager.subscribe(base_events.Event, listener0)
+        event_manager.subscribe(member_events.MemberCreateEvent, listener1)
+        event_manager.subscribe(member_events.MemberUpdateEvent, listener2)
+        event = hikari_test_helpers.mock_class_namespace(member_events.MemberCreateEvent, init_=False)()
+
+        await event_manager.dispatch(event)
+
+        listener0.assert_awaited_once_with(event)
+        listener1.assert_awaited_once_with(event)
+        listener2.assert_not_called()
+        assert event_manager._dispatch_tables == {type(event): ((), (listener1, listener0), (), (), ())}
+
+    @pytest.mark.asyncio()
+    async def test_dispatch_calls_sync_listeners_inline(self, event_manager):
+        event_manager._check_intents = mock.Mock()
+        listener = mock.Mock()
+        event_manager.subscribe(member_events.MemberCreateEvent, listener)
+        event = hikari_test_helpers.mock_class_namespace(member_events.MemberCreateEvent, init_=False)()
+
+        future = event_manager.dispatch(event)
+
+        listener.assert_called_once_with(event)
+        assert event_manager._dispatch_tables == {type(event): ((listener,), (), (), (), ())}
+        await future
+
+    @pytest.mark.asyncio()
+    async def test_dispatch_when_sync_listener_raises(self, event_manager):
+        event_manager._check_intents = mock.Mock()
+        error = RuntimeError("bork")
+        listener = mock.Mock(side_effect=error)
+        exception_listener = mock.AsyncMock()
+        event_manager.subscribe(member_events.MemberCreateEvent, listener)
+        event_manager.subscribe(base_events.ExceptionEvent, exception_listener)
+        event = hikari_test_helpers.mock_class_namespace(member_events.MemberCreateEvent, init_=False)()
+
+        await event_manager.dispatch(event)
+
+        exception_listener.assert_awaited_once_with(
+            base_events.ExceptionEvent(exception=error, failed_event=event, failed_callback=listener)
+        )
+
+    @pytest.mark.asyncio()
+    async def test_dispatch_serializes_listeners_by_key(self, event_manager):
+        event_manager._check_intents = mock.Mock()
+        calls = []
+        release = asyncio.Event()
+
+        async def listener(event):
+            calls.append(("start", event.guild_id))
+            await release.wait()
+            calls.append(("end", event.guild_id))
+
+        event_manager.subscribe(member_events.MemberCreateEvent, listener, serial_key="guild_id")
+        event_1 = hikari_test_helpers.mock_class_namespace(member_events.MemberCreateEvent, init_=False, guild_id=1)()
+        event_2 = hikari_test_helpers.mock_class_namespace(member_events.MemberCreateEvent, init_=False, guild_id=1)()
+        event_3 = hikari_test_helpers.mock_class_namespace(member_events.MemberCreateEvent, init_=False, guild_id=2)()
+
+        futures = [event_manager.dispatch(event) for event in (event_1, event_2, event_3)]
+        await asyncio.sleep(0)
+
+        # The second event for guild 1 has to wait for the first one, but guild 2 is handled concurrently.
+        assert calls == [("start", 1), ("start", 2)]
+
+        release.set()
+        await asyncio.gather(*futures)
+
+        assert [call for call in calls if call[1] == 1] == [("start", 1), ("end", 1), ("start", 1), ("end", 1)]
+        assert [call for call in calls if call[1] == 2] == [("start", 2), ("end", 2)]
+        assert event_manager._serial_listeners[(member_events.MemberCreateEvent, listener)].queues == {}
+
+    @pytest.mark.asyncio()
+    async def test_dispatch_uses_cached_dispatch_table(self, event_manager):
+        listener = mock.AsyncMock()
+        event = hikari_test_helpers.mock_class_namespace(member_events.MemberCreateEvent, init_=False)()
+        event_manager._dispatch_tables = {type(event): ((), (listener,), (), (), ())}
+
+        await event_manager.dispatch(event)
+
+        listener.assert_awaited_once_with(event)
+
+    def test_subscribe_and_unsubscribe_invalidate_dispatch_tables(self, event_manager):
+        event_manager._check_intents = mock.Mock()
+
+        async def test():
+            ...
+
+        event_manager._dispatch_tables = {member_events.MemberCreateEvent: ((), ())}
+        event_manager._subtype_listeners = {member_events.MemberEvent: ()}
+        event_manager.subscribe(member_events.MemberCreateEvent, test)
+
+        assert event_manager._dispatch_tables == {}
+        assert event_manager._subtype_listeners == {}
+
+        event_manager._dispatch_tables = {member_events.MemberCreateEvent: ((test,), ())}
+        event_manager._subtype_listeners = {member_events.MemberEvent: (test,)}
+        event_manager.unsubscribe(member_events.MemberCreateEvent, test)
+
+        assert event_manager._dispatch_tables == {}
+        assert event_manager._subtype_listeners == {}
+
     def test_get_listeners_when_not_event(self, event_manager):
         assert len(event_manager.get_listeners("test")) == 0
 
@@ -596,6 +1079,18 @@ class TestEventManagerBase:
             "coroutine5",
         ]
 
+    def test_get_listeners_polimorphic_uses_cached_result(self, event_manager):
+        event_manager._listeners = {member_events.MemberCreateEvent: ["coroutine1"]}
+        event_manager._subtype_listeners = {member_events.MemberEvent: ("coroutine0",)}
+
+        assert event_manager.get_listeners(member_events.MemberEvent) == ["coroutine0"]
+
+    def test_get_listeners_polimorphic_caches_result(self, event_manager):
+        event_manager._listeners = {member_events.MemberCreateEvent: ["coroutine1"]}
+
+        assert event_manager.get_listeners(member_events.MemberEvent) == ["coroutine1"]
+        assert event_manager._subtype_listeners == {member_events.MemberEvent: ("coroutine1",)}
+
     def test_get_listeners_no_polimorphic_and_no_results(self, event_manager):
         event_manager._listeners = {
             member_events.MemberCreateEvent: ["coroutine1", "coroutine2"],
@@ -696,7 +1191,7 @@ class TestEventManagerBase:
                 ...
 
         resolve_signature.assert_not_called()
-        subscribe.assert_called_once_with(member_events.MemberCreateEvent, test, _nested=1)
+        subscribe.assert_called_once_with(member_events.MemberCreateEvent, test, serial_key=None, _nested=1)
 
     def test_listen_when_param_provided_in_typehint(self, event_manager):
         with mock.patch.object(event_manager_base.EventManagerBase, "subscribe") as subscribe:
@@ -705,4 +1200,4 @@ class TestEventManagerBase:
             async def test(event: member_events.MemberCreateEvent):
                 ...
 
-        subscribe.assert_called_once_with(member_events.MemberCreateEvent, test, _nested=1)
+        subscribe.assert_called_once_with(member_events.MemberCreateEvent, test, serial_key=None, _nested=1)
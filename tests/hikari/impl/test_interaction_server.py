@@ -341,7 +341,7 @@ class TestInteractionServer:
         mock_listener.assert_awaited_once_with(mock_entity_factory.deserialize_interaction.return_value)
         mock_builder.build.assert_called_once_with(mock_entity_factory)
         assert result.headers == {"Content-Type": "application/json; charset=UTF-8"}
-        assert result.payload == b'{"ok": "No boomer"}'
+        assert result.payload == b'{"ok":"No boomer"}'
         assert result.status_code == 200
 
     @pytest.mark.asyncio()
@@ -370,7 +370,7 @@ class TestInteractionServer:
         assert result.payload == b"Invalid request signature"
         assert result.status_code == 400
 
-    @pytest.mark.parametrize("body", [b"not a json", b"\x80abc"])
+    @pytest.mark.parametrize("body", [b"not a json", b"\x80abc", b"[1, 2]"])
     @pytest.mark.asyncio()
     async def test_on_interaction_when_bad_body(self, mock_interaction_server, body):
         mock_interaction_server._verify = mock.Mock(return_value=True)
@@ -394,9 +394,11 @@ class TestInteractionServer:
     @pytest.mark.asyncio()
     async def test_on_interaction_on_ping(self, mock_interaction_server):
         mock_interaction_server._verify = mock.Mock(return_value=True)
+        mock_interaction_server._dumps = mock.Mock(return_value='{"type": 1}')
 
         result = await mock_interaction_server.on_interaction(b'{"type": 1}', b"signature", b"timestamp")
 
+        mock_interaction_server._dumps.assert_called_once_with({"type": 1})
         assert result.headers == {"Content-Type": "application/json; charset=UTF-8"}
         assert result.payload == b'{"type": 1}'
         assert result.status_code == 200
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import os
+import socket
+import sys
+
+import mock
+import pytest
+
+from hikari import errors
+from hikari.impl import rate_limit_store
+from hikari.internal import time
+
+requires_unix_sockets = pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets are not available")
+
+
+class TestRateLimitCoordinator:
+    @pytest.fixture()
+    def coordinator(self, tmp_path):
+        return rate_limit_store.RateLimitCoordinator(tmp_path / "rate-limits.sock")
+
+    def test_bucket_hashes(self, coordinator):
+        assert coordinator.get_bucket_hash("GET /users/{user}") is None
+
+        coordinator.set_bucket_hash("GET /users/{user}", "abc")
+
+        assert coordinator.get_bucket_hash("GET /users/{user}") == "abc"
+
+    def test_reserve_when_bucket_unknown(self, coordinator):
+        assert coordinator.reserve("abc;-", use_global_rate_limit=True) == 0
+        assert coordinator.reserve(None, use_global_rate_limit=True) == 0
+
+    def test_reserve_counts_down_remaining(self, coordinator):
+        with mock.patch.object(time, "monotonic", return_value=100):
+            coordinator.update_bucket("abc;-", remaining=2, limit=5, reset_after=3)
+
+            assert coordinator.reserve("abc;-", use_global_rate_limit=False) == 0
+            assert coordinator.reserve("abc;-", use_global_rate_limit=False) == 0
+            assert coordinator.reserve("abc;-", use_global_rate_limit=False) == 3
+
+    def test_reserve_when_window_reset(self, coordinator):
+        with mock.patch.object(time, "monotonic", return_value=100):
+            coordinator.update_bucket("abc;-", remaining=0, limit=2, reset_after=3)
+
+        with mock.patch.object(time, "monotonic", return_value=104):
+            assert coordinator.reserve("abc;-", use_global_rate_limit=False) == 0
+            assert coordinator.reserve("abc;-", use_global_rate_limit=False) == 0
+            assert coordinator.reserve("abc;-", use_global_rate_limit=False) == 3
+
+    def test_reserve_when_globally_rate_limited(self, coordinator):
+        with mock.patch.object(time, "monotonic", return_value=100):
+            coordinator.throttle_global(5)
+
+            assert coordinator.reserve(None, use_global_rate_limit=True) == 5
+            assert coordinator.reserve(None, use_global_rate_limit=False) == 0
+
+    def test_throttle_global_keeps_latest_reset(self, coordinator):
+        with mock.patch.object(time, "monotonic", return_value=100):
+            coordinator.throttle_global(5)
+            coordinator.throttle_global(2)
+
+            assert coordinator.reserve(None, use_global_rate_limit=True) == 5
+
+    def test_update_bucket_within_window_only_makes_it_more_restrictive(self, coordinator):
+        with mock.patch.object(time, "monotonic", return_value=100):
+            coordinator.update_bucket("abc;-", remaining=1, limit=5, reset_after=3)
+            coordinator.update_bucket("abc;-", remaining=4, limit=5, reset_after=1)
+
+            assert coordinator.reserve("abc;-", use_global_rate_limit=False) == 0
+            assert coordinator.reserve("abc;-", use_global_rate_limit=False) == 3
+
+    def test_update_bucket_after_window(self, coordinator):
+        with mock.patch.object(time, "monotonic", return_value=100):
+            coordinator.update_bucket("abc;-", remaining=0, limit=5, reset_after=3)
+
+        with mock.patch.object(time, "monotonic", return_value=104):
+            coordinator.update_bucket("abc;-", remaining=1, limit=5, reset_after=2)
+
+            assert coordinator.reserve("abc;-", use_global_rate_limit=False) == 0
+            assert coordinator.reserve("abc;-", use_global_rate_limit=False) == 2
+
+    def test_do_gc_pass(self, coordinator):
+        with mock.patch.object(time, "monotonic", return_value=100):
+            coordinator.update_bucket("old;-", remaining=0, limit=5, reset_after=1)
+            coordinator.update_bucket("new;-", remaining=0, limit=5, reset_after=5)
+
+        with mock.patch.object(time, "monotonic", return_value=112):
+            coordinator.do_gc_pass()
+
+        assert coordinator._buckets.keys() == {"new;-"}
+
+    def test_handle_request_when_unknown_operation(self, coordinator):
+        with pytest.raises(ValueError, match=r"unknown operation 'nope'"):
+            coordinator._handle_request(["nope"])
+
+    @pytest.mark.asyncio()
+    async def test_close_when_not_running(self, coordinator):
+        with pytest.raises(errors.ComponentStateConflictError):
+            await coordinator.close()
+
+    @pytest.mark.asyncio()
+    async def test_join_when_not_running(self, coordinator):
+        with pytest.raises(errors.ComponentStateConflictError):
+            await coordinator.join()
+
+
+@requires_unix_sockets
+class TestUnixSocketRateLimitStore:
+    @pytest.fixture()
+    async def coordinator(self, tmp_path):
+        coordinator = rate_limit_store.RateLimitCoordinator(tmp_path / "rate-limits.sock")
+        await coordinator.start()
+        yield coordinator
+        if coordinator.is_alive:
+            await coordinator.close()
+
+    @pytest.mark.asyncio()
+    async def test_start(self, coordinator):
+        assert coordinator.is_alive
+        assert os.stat(coordinator.path).st_mode & 0o777 == 0o600
+
+        with pytest.raises(errors.ComponentStateConflictError):
+            await coordinator.start()
+
+    @pytest.mark.asyncio()
+    async def test_start_restores_umask_before_yielding(self, tmp_path):
+        coordinator = rate_limit_store.RateLimitCoordinator(tmp_path / "rate-limits.sock")
+        umasks = []
+
+        async def start_unix_server(*args, **kwargs):
+            umask = os.umask(0o022)
+            os.umask(umask)
+            umasks.append(umask)
+            kwargs["sock"].close()
+            return mock.Mock(wait_closed=mock.AsyncMock())
+
+        old_umask = os.umask(0o022)
+        try:
+            with mock.patch.object(asyncio, "start_unix_server", new=start_unix_server):
+                await coordinator.start()
+
+            assert os.umask(0o022) == 0o022
+        finally:
+            os.umask(old_umask)
+
+        try:
+            assert umasks == [0o022]
+            assert os.stat(coordinator.path).st_mode & 0o777 == 0o600
+        finally:
+            await coordinator.close()
+
+    @pytest.mark.asyncio()
+    async def test_start_replaces_stale_socket(self, tmp_path):
+        path = tmp_path / "rate-limits.sock"
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.bind(os.fspath(path))
+
+        coordinator = rate_limit_store.RateLimitCoordinator(path)
+        await coordinator.start()
+
+        try:
+            assert coordinator.is_alive
+        finally:
+            await coordinator.close()
+
+    @pytest.mark.asyncio()
+    async def test_close(self, coordinator):
+        join_task = asyncio.ensure_future(coordinator.join())
+        await asyncio.sleep(0)
+        await coordinator.close()
+
+        await asyncio.wait_for(join_task, timeout=1)
+        assert not coordinator.is_alive
+        assert not os.path.exists(coordinator.path)
+
+    @pytest.mark.asyncio()
+    async def test_state_is_shared_between_stores(self, coordinator):
+        first = rate_limit_store.UnixSocketRateLimitStore(coordinator.path)
+        second = rate_limit_store.UnixSocketRateLimitStore(coordinator.path)
+
+        try:
+            await first.set_bucket_hash("GET /users/{user}", "abc")
+            await first.update_bucket("abc;-", remaining=1, limit=5, reset_after=30)
+
+            assert await second.get_bucket_hash("GET /users/{user}") == "abc"
+            assert await second.reserve("abc;-", use_global_rate_limit=False) == 0
+            assert 0 < await first.reserve("abc;-", use_global_rate_limit=False) <= 30
+
+            await second.throttle_global(30)
+            assert 0 < await first.reserve(None, use_global_rate_limit=True) <= 30
+
+        finally:
+            await first.close()
+            await second.close()
+
+    @pytest.mark.asyncio()
+    async def test_reconnects_after_coordinator_restart(self, coordinator):
+        store = rate_limit_store.UnixSocketRateLimitStore(coordinator.path)
+
+        try:
+            await store.set_bucket_hash("GET /users/{user}", "abc")
+            await coordinator.close()
+
+            with pytest.raises(ConnectionError):
+                await store.get_bucket_hash("GET /users/{user}")
+
+            await coordinator.start()
+            assert await store.get_bucket_hash("GET /users/{user}") is None
+
+        finally:
+            await store.close()
+
+    @pytest.mark.asyncio()
+    async def test_when_coordinator_not_running(self, tmp_path):
+        store = rate_limit_store.UnixSocketRateLimitStore(tmp_path / "missing.sock")
+
+        with pytest.raises(OSError, match="No such file or directory"):
+            await store.reserve(None, use_global_rate_limit=True)
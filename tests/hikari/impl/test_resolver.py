@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+
+import mock
+import pytest
+
+from hikari import channels
+from hikari import errors
+from hikari import snowflakes
+from hikari.api import cache as cache_api
+from hikari.api import rest as rest_api
+from hikari.impl import resolver as resolver_impl
+
+
+def _not_found():
+    return errors.NotFoundError(url="", headers={}, raw_body="")
+
+
+class TestResolverImpl:
+    @pytest.fixture()
+    def cache(self):
+        return mock.Mock(spec=cache_api.MutableCache)
+
+    @pytest.fixture()
+    def rest(self):
+        return mock.AsyncMock(spec=rest_api.RESTClient)
+
+    @pytest.fixture()
+    def resolver(self, cache, rest):
+        return resolver_impl.ResolverImpl(cache, rest)
+
+    @pytest.mark.asyncio()
+    async def test_channel_when_cached(self, resolver, cache, rest):
+        assert await resolver.channel(123) is cache.get_guild_channel.return_value
+
+        cache.get_guild_channel.assert_called_once_with(123)
+        rest.fetch_channel.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_channel_when_guild_channel_not_cached(self, resolver, cache, rest):
+        cache.get_guild_channel.return_value = None
+        rest.fetch_channel.return_value = mock.Mock(channels.GuildTextChannel)
+
+        assert await resolver.channel(123) is rest.fetch_channel.return_value
+
+        rest.fetch_channel.assert_awaited_once_with(123)
+        cache.set_guild_channel.assert_called_once_with(rest.fetch_channel.return_value)
+
+    @pytest.mark.asyncio()
+    async def test_channel_when_dm_channel_not_cached(self, resolver, cache, rest):
+        cache.get_guild_channel.return_value = None
+        rest.fetch_channel.return_value = mock.Mock(channels.DMChannel)
+
+        assert await resolver.channel(123) is rest.fetch_channel.return_value
+
+        cache.set_guild_channel.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_emoji_when_cached(self, resolver, cache, rest):
+        assert await resolver.emoji(123, 456) is cache.get_emoji.return_value
+
+        cache.get_emoji.assert_called_once_with(456)
+        rest.fetch_emoji.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_emoji_when_not_cached(self, resolver, cache, rest):
+        cache.get_emoji.return_value = None
+
+        assert await resolver.emoji(123, 456) is rest.fetch_emoji.return_value
+
+        rest.fetch_emoji.assert_awaited_once_with(123, 456)
+        cache.set_emoji.assert_called_once_with(rest.fetch_emoji.return_value)
+
+    @pytest.mark.asyncio()
+    async def test_guild_when_cached(self, resolver, cache, rest):
+        assert await resolver.guild(123) is cache.get_guild.return_value
+
+        cache.get_guild.assert_called_once_with(123)
+        rest.fetch_guild.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_guild_when_not_cached(self, resolver, cache, rest):
+        cache.get_guild.return_value = None
+
+        assert await resolver.guild(123) is rest.fetch_guild.return_value
+
+        rest.fetch_guild.assert_awaited_once_with(123)
+
+    @pytest.mark.asyncio()
+    async def test_member_when_cached(self, resolver, cache, rest):
+        assert await resolver.member(123, 456) is cache.get_member.return_value
+
+        cache.get_member.assert_called_once_with(123, 456)
+        rest.fetch_member.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_member_when_not_cached(self, resolver, cache, rest):
+        cache.get_member.return_value = None
+
+        assert await resolver.member(123, 456) is rest.fetch_member.return_value
+
+        rest.fetch_member.assert_awaited_once_with(123, 456)
+        cache.set_member.assert_called_once_with(rest.fetch_member.return_value)
+
+    @pytest.mark.asyncio()
+    async def test_member_shares_fetch_between_concurrent_calls(self, resolver, cache, rest):
+        cache.get_member.return_value = None
+        event = asyncio.Event()
+
+        async def fetch_member(guild, user):
+            await event.wait()
+            return mock.Mock(guild_id=guild, user_id=user)
+
+        rest.fetch_member.side_effect = fetch_member
+        calls = [asyncio.ensure_future(resolver.member(123, 456)) for _ in range(5)]
+        await asyncio.sleep(0)
+        event.set()
+        results = await asyncio.gather(*calls)
+
+        assert len({id(result) for result in results}) == 1
+        rest.fetch_member.assert_awaited_once_with(123, 456)
+        cache.set_member.assert_called_once_with(results[0])
+        assert resolver._in_flight == {}
+
+    @pytest.mark.asyncio()
+    async def test_member_when_shared_fetch_fails(self, resolver, cache, rest):
+        cache.get_member.return_value = None
+        rest.fetch_member.side_effect = _not_found()
+
+        results = await asyncio.gather(resolver.member(123, 456), resolver.member(123, 456), return_exceptions=True)
+
+        assert all(isinstance(result, errors.NotFoundError) for result in results)
+        rest.fetch_member.assert_awaited_once_with(123, 456)
+        cache.set_member.assert_not_called()
+        assert resolver._in_flight == {}
+
+    @pytest.mark.asyncio()
+    async def test_member_when_caller_cancelled_does_not_cancel_shared_fetch(self, resolver, cache, rest):
+        cache.get_member.return_value = None
+        event = asyncio.Event()
+
+        async def fetch_member(guild, user):
+            await event.wait()
+            return mock.Mock()
+
+        rest.fetch_member.side_effect = fetch_member
+        cancelled = asyncio.ensure_future(resolver.member(123, 456))
+        remaining = asyncio.ensure_future(resolver.member(123, 456))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        event.set()
+
+        assert await remaining is cache.set_member.call_args.args[0]
+        assert cancelled.cancelled()
+        rest.fetch_member.assert_awaited_once_with(123, 456)
+
+    @pytest.mark.asyncio()
+    async def test_members(self, resolver, cache, rest):
+        cached_member = object()
+        cache.get_member.side_effect = lambda guild, user: cached_member if user == 1 else None
+
+        async def fetch_member(guild, user):
+            if user == 3:
+                error = _not_found()
+                raise error
+
+            return mock.Mock(user_id=user)
+
+        rest.fetch_member.side_effect = fetch_member
+
+        result = await resolver.members(123, [1, 2, 3, 2, 4])
+
+        assert result.keys() == {1, 2, 4}
+        assert result[1] is cached_member
+        assert result[2].user_id == 2
+        assert result[4].user_id == 4
+        assert all(isinstance(key, snowflakes.Snowflake) for key in result)
+        assert rest.fetch_member.await_args_list == [mock.call(123, 2), mock.call(123, 3), mock.call(123, 4)]
+
+    @pytest.mark.asyncio()
+    async def test_members_limits_concurrency(self, resolver, cache, rest):
+        cache.get_member.return_value = None
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fetch_member(guild, user):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return mock.Mock()
+
+        rest.fetch_member.side_effect = fetch_member
+
+        result = await resolver.members(123, range(1, 21), max_concurrency=3)
+
+        assert len(result) == 20
+        assert max_in_flight == 3
+
+    @pytest.mark.asyncio()
+    async def test_members_when_fetch_fails(self, resolver, cache, rest):
+        cache.get_member.return_value = None
+        rest.fetch_member.side_effect = errors.InternalServerError(
+            url="", status=500, headers={}, raw_body="", message=""
+        )
+
+        with pytest.raises(errors.InternalServerError):
+            await resolver.members(123, [1, 2, 3])
+
+    @pytest.mark.asyncio()
+    async def test_members_when_all_cached(self, resolver, cache, rest):
+        result = await resolver.members(123, [1, 2])
+
+        assert result == {1: cache.get_member.return_value, 2: cache.get_member.return_value}
+        rest.fetch_member.assert_not_called()
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize("max_concurrency", [0, -1])
+    async def test_members_when_max_concurrency_not_positive(self, resolver, max_concurrency):
+        with pytest.raises(ValueError, match=r"max_concurrency must be a POSITIVE integer"):
+            await resolver.members(123, [1], max_concurrency=max_concurrency)
+
+    @pytest.mark.asyncio()
+    async def test_user_when_cached(self, resolver, cache, rest):
+        assert await resolver.user(123) is cache.get_user.return_value
+
+        cache.get_user.assert_called_once_with(123)
+        rest.fetch_user.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_user_when_not_cached(self, resolver, cache, rest):
+        cache.get_user.return_value = None
+
+        assert await resolver.user(123) is rest.fetch_user.return_value
+
+        rest.fetch_user.assert_awaited_once_with(123)
+
+    @pytest.mark.asyncio()
+    async def test_users(self, resolver, cache, rest):
+        cache.get_user.side_effect = lambda user: None if user == 2 else mock.Mock(id=user)
+
+        result = await resolver.users([1, 2])
+
+        assert result.keys() == {1, 2}
+        assert result[1].id == 1
+        assert result[2] is rest.fetch_user.return_value
+        rest.fetch_user.assert_awaited_once_with(2)
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import mock
+import pytest
+
+from hikari import config
+from hikari.impl import response_cache as response_cache_impl
+from hikari.internal import routes
+from hikari.internal import time
+
+
+class TestLRUResponseCache:
+    @pytest.fixture()
+    def settings(self):
+        return config.ResponseCacheSettings(max_entries=3, ttls={routes.GET_GUILD: 60, routes.GET_GUILD_ROLES: 10})
+
+    @pytest.fixture()
+    def cache(self, settings):
+        return response_cache_impl.LRUResponseCache(settings)
+
+    def test_settings_property(self, cache, settings):
+        assert cache.settings is settings
+
+    def test_is_cacheable(self, cache):
+        assert cache.is_cacheable(routes.GET_GUILD.compile(guild=123)) is True
+        assert cache.is_cacheable(routes.GET_CHANNEL.compile(channel=123)) is False
+
+    def test_set_and_get_response(self, cache):
+        route = routes.GET_GUILD.compile(guild=123)
+        response = {"id": "123"}
+
+        cache.set_response(route, (("with_counts", "true"),), response, requested_at=time.monotonic())
+
+        assert cache.get_response(route, (("with_counts", "true"),)) is response
+        assert cache.get_response(route, ()) is None
+        assert cache.get_response(routes.GET_GUILD.compile(guild=456), (("with_counts", "true"),)) is None
+
+    def test_set_response_when_route_not_cacheable(self, cache):
+        route = routes.GET_CHANNEL.compile(channel=123)
+
+        cache.set_response(route, (), {"id": "123"}, requested_at=time.monotonic())
+
+        assert cache.get_response(route, ()) is None
+        assert len(cache) == 0
+
+    def test_get_response_when_expired(self, cache):
+        route = routes.GET_GUILD_ROLES.compile(guild=123)
+
+        with mock.patch.object(time, "monotonic", return_value=100.0):
+            cache.set_response(route, (), [], requested_at=100.0)
+
+        with mock.patch.object(time, "monotonic", return_value=109.9):
+            assert cache.get_response(route, ()) == []
+
+        with mock.patch.object(time, "monotonic", return_value=110.0):
+            assert cache.get_response(route, ()) is None
+
+        assert len(cache) == 0
+        assert cache._queries == {}
+
+    def test_evicts_least_recently_used(self, cache):
+        now = time.monotonic()
+        guild_routes = [routes.GET_GUILD.compile(guild=i) for i in range(4)]
+        for route in guild_routes[:3]:
+            cache.set_response(route, (), {"id": route.compiled_path}, requested_at=now)
+
+        assert cache.get_response(guild_routes[0], ()) is not None
+        cache.set_response(guild_routes[3], (), {}, requested_at=now)
+
+        assert len(cache) == 3
+        assert cache.get_response(guild_routes[1], ()) is None
+        assert cache.get_response(guild_routes[0], ()) is not None
+        assert guild_routes[1] not in cache._queries
+
+    def test_invalidate(self, cache):
+        route = routes.GET_GUILD.compile(guild=123)
+        other_route = routes.GET_GUILD.compile(guild=456)
+        now = time.monotonic()
+        cache.set_response(route, (), {}, requested_at=now)
+        cache.set_response(route, (("with_counts", "true"),), {}, requested_at=now)
+        cache.set_response(other_route, (), {}, requested_at=now)
+
+        cache.invalidate(route)
+
+        assert cache.get_response(route, ()) is None
+        assert cache.get_response(route, (("with_counts", "true"),)) is None
+        assert cache.get_response(other_route, ()) is not None
+        assert len(cache) == 1
+
+    def test_set_response_when_invalidated_after_request(self, cache):
+        route = routes.GET_GUILD.compile(guild=123)
+
+        with mock.patch.object(time, "monotonic", return_value=100.0):
+            cache.invalidate(route)
+
+        cache.set_response(route, (), {"stale": True}, requested_at=99.0)
+        assert cache.get_response(route, ()) is None
+
+        cache.set_response(route, (), {"stale": False}, requested_at=101.0)
+        assert cache.get_response(route, ()) == {"stale": False}
+
+    def test_clear(self, cache):
+        cache.set_response(routes.GET_GUILD.compile(guild=123), (), {}, requested_at=time.monotonic())
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache._queries == {}
@@ -47,6 +47,7 @@ from hikari.api import rest as rest_api
 from hikari.impl import buckets
 from hikari.impl import entity_factory
 from hikari.impl import rate_limits
+from hikari.impl import response_cache
 from hikari.impl import rest
 from hikari.impl import special_endpoints
 from hikari.internal import data_binding
@@ -258,11 +259,15 @@ class Test_LiveAttributes:
         bucket_manager = stack.enter_context(mock.patch.object(buckets, "RESTBucketManager"))
         manual_rate_limiter = stack.enter_context(mock.patch.object(rate_limits, "ManualRateLimiter"))
         stack.enter_context(mock.patch.object(asyncio, "get_running_loop"))
-        mock_settings = object()
+        mock_settings = mock.Mock()
         mock_proxy_settings = mock.Mock()
+        mock_dumps = object()
+        mock_rate_limit_store = object()
 
         with stack:
-            attributes = rest._LiveAttributes.build(123.321, mock_settings, mock_proxy_settings)
+            attributes = rest._LiveAttributes.build(
+                123.321, mock_settings, mock_proxy_settings, mock_dumps, rate_limit_store=mock_rate_limit_store
+            )
 
         assert isinstance(attributes, rest._LiveAttributes)
         assert attributes.is_closing is False
@@ -272,7 +277,9 @@ class Test_LiveAttributes:
         assert attributes.global_rate_limit is manual_rate_limiter.return_value
         assert attributes.tcp_connector is create_tcp_connector.return_value
 
-        bucket_manager.assert_called_once_with(123.321)
+        bucket_manager.assert_called_once_with(
+            123.321, concurrent_requests=mock_settings.concurrent_bucket_requests, store=mock_rate_limit_store
+        )
         create_tcp_connector.assert_called_once_with(mock_settings)
         create_client_session.assert_called_once_with(
             connector=create_tcp_connector.return_value,
@@ -280,12 +287,13 @@ class Test_LiveAttributes:
             http_settings=mock_settings,
             raise_for_status=False,
             trust_env=mock_proxy_settings.trust_env,
+            json_serialize=mock_dumps,
         )
         manual_rate_limiter.assert_called_once_with()
 
     def test_build_when_no_running_loop(self):
         with pytest.raises(RuntimeError):
-            rest._LiveAttributes.build(123.321, object(), object())
+            rest._LiveAttributes.build(123.321, object(), object(), object())
 
     @pytest.mark.asyncio()
     async def test_close(self):
@@ -328,11 +336,14 @@ class Test_LiveAttributes:
 @pytest.fixture()
 def rest_app():
     return hikari_test_helpers.mock_class_namespace(rest.RESTApp, slots_=False)(
+        dumps=mock.Mock(),
         executor=None,
         http_settings=mock.Mock(spec_set=config.HTTPSettings),
+        loads=mock.Mock(),
         max_rate_limit=float("inf"),
         max_retries=0,
         proxy_settings=mock.Mock(spec_set=config.ProxySettings),
+        response_cache_settings=None,
         url="https://some.url",
     )
 
@@ -367,17 +378,34 @@ class TestRESTApp:
 
         mock_client.assert_called_once_with(
             cache=None,
+            dumps=rest_app._dumps,
             entity_factory=_entity_factory(),
             executor=rest_app._executor,
             http_settings=rest_app._http_settings,
+            loads=rest_app._loads,
             max_rate_limit=float("inf"),
             max_retries=0,
             proxy_settings=rest_app._proxy_settings,
+            rate_limit_store=None,
+            response_cache=None,
             token="token",
             token_type="Type",
             rest_url=rest_app._url,
         )
 
+    def test_acquire_when_response_cache_settings(self, rest_app):
+        rest_app._response_cache_settings = config.ResponseCacheSettings()
+
+        with mock.patch.object(rest, rest.RESTClientImpl.__qualname__) as mock_client:
+            rest_app.acquire(token="token", token_type="Type")
+            rest_app.acquire(token="token", token_type="Type")
+
+        first_cache = mock_client.call_args_list[0].kwargs["response_cache"]
+        second_cache = mock_client.call_args_list[1].kwargs["response_cache"]
+        assert isinstance(first_cache, response_cache.LRUResponseCache)
+        assert first_cache.settings is rest_app._response_cache_settings
+        assert first_cache is not second_cache
+
     def test_acquire_defaults_to_bearer_for_a_string_token(self, rest_app):
         mock_event_loop = object()
         rest_app._event_loop = mock_event_loop
@@ -392,12 +420,16 @@ class TestRESTApp:
 
         mock_client.assert_called_once_with(
             cache=None,
+            dumps=rest_app._dumps,
             entity_factory=_entity_factory(),
             executor=rest_app._executor,
             http_settings=rest_app._http_settings,
+            loads=rest_app._loads,
             max_rate_limit=float("inf"),
             max_retries=0,
             proxy_settings=rest_app._proxy_settings,
+            rate_limit_store=None,
+            response_cache=None,
             token="token",
             token_type=applications.TokenType.BEARER,
             rest_url=rest_app._url,
@@ -434,7 +466,7 @@ def mock_cache():
 def rest_client(rest_client_class, live_attributes, mock_cache):
     obj = rest_client_class(
         cache=mock_cache,
-        http_settings=mock.Mock(spec=config.HTTPSettings),
+        http_settings=mock.Mock(spec=config.HTTPSettings, coalesce_get_requests=False),
         max_rate_limit=float("inf"),
         proxy_settings=mock.Mock(spec=config.ProxySettings),
         token="some_token",
@@ -631,6 +663,10 @@ class TestRESTClientImpl:
         rest_client._token_type = mock_type
         assert rest_client.token_type is mock_type
 
+    def test_request_statistics_property(self, rest_client):
+        assert rest_client.request_statistics == rest.RESTRequestStatistics()
+        assert rest_client.request_statistics is rest_client._request_statistics
+
     @pytest.mark.asyncio()
     async def test_close(self, rest_client):
         rest_client._live_attributes = mock_live_attributes = mock.AsyncMock()
@@ -647,7 +683,11 @@ class TestRESTClientImpl:
             rest_client.start()
 
             build.assert_called_once_with(
-                rest_client._max_rate_limit, rest_client.http_settings, rest_client.proxy_settings
+                rest_client._max_rate_limit,
+                rest_client.http_settings,
+                rest_client.proxy_settings,
+                rest_client._dumps,
+                rate_limit_store=None,
             )
             assert rest_client._live_attributes is build.return_value
 
@@ -1103,7 +1143,7 @@ class TestRESTClientImplAsync:
 
         _, kwargs = mock_session.request.call_args_list[0]
         assert rest._AUTHORIZATION_HEADER not in kwargs["headers"]
-        live_attributes.buckets.acquire.assert_called_once_with(route)
+        live_attributes.buckets.acquire.assert_called_once_with(route, use_global_rate_limit=False)
         live_attributes.buckets.acquire.return_value.assert_used_once()
         live_attributes.global_rate_limit.acquire.assert_not_called()
         assert live_attributes.still_alive.call_count == 2
@@ -1121,7 +1161,7 @@ class TestRESTClientImplAsync:
 
         _, kwargs = mock_session.request.call_args_list[0]
         assert kwargs["headers"][rest._AUTHORIZATION_HEADER] == "ooga booga"
-        live_attributes.buckets.acquire.assert_called_once_with(route)
+        live_attributes.buckets.acquire.assert_called_once_with(route, use_global_rate_limit=True)
         live_attributes.buckets.acquire.return_value.assert_used_once()
         live_attributes.global_rate_limit.acquire.assert_awaited_once_with()
         assert live_attributes.still_alive.call_count == 3
@@ -1161,6 +1201,26 @@ class TestRESTClientImplAsync:
         assert (await rest_client._request(route)) == {"something": None}
         assert live_attributes.still_alive.call_count == 3
 
+    @hikari_test_helpers.timeout()
+    async def test__request_uses_loads_to_deserialize_response(self, rest_client, live_attributes):
+        class StubResponse:
+            status = http.HTTPStatus.OK
+            content_type = rest._APPLICATION_JSON
+            reason = "cause why not"
+            headers = {}
+
+            async def read(self):
+                return b'{"something": null}'
+
+        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
+        live_attributes.client_session = mock.AsyncMock(request=mock.AsyncMock(return_value=StubResponse()))
+        rest_client._parse_ratelimits = mock.AsyncMock()
+        rest_client._loads = mock.Mock()
+
+        assert await rest_client._request(route) is rest_client._loads.return_value
+
+        rest_client._loads.assert_called_once_with(b'{"something": null}')
+
     @hikari_test_helpers.timeout()
     async def test__request_when_response_is_not_JSON(self, rest_client, live_attributes):
         class StubResponse:
@@ -1241,6 +1301,167 @@ class TestRESTClientImplAsync:
 
         assert live_attributes.still_alive.call_count == 3
 
+    @hikari_test_helpers.timeout()
+    async def test__request_when_coalescing_disabled(self, rest_client):
+        route = routes.GET_USER.compile(user=123)
+        rest_client._perform_request = mock.AsyncMock(return_value={"id": "123"})
+
+        assert await rest_client._request(route, reason="ok") == {"id": "123"}
+
+        rest_client._perform_request.assert_awaited_once_with(route, query=None, reason="ok", no_auth=False, auth=None)
+        assert rest_client.request_statistics.single_flight_requests == 0
+
+    @hikari_test_helpers.timeout()
+    async def test__request_when_coalescing_enabled_and_not_get_request(self, rest_client):
+        rest_client._http_settings.coalesce_get_requests = True
+        route = routes.DELETE_CHANNEL.compile(channel=123)
+        rest_client._perform_request = mock.AsyncMock()
+
+        await asyncio.gather(rest_client._request(route), rest_client._request(route))
+
+        assert rest_client._perform_request.await_count == 2
+        assert rest_client.request_statistics.single_flight_requests == 0
+
+    @hikari_test_helpers.timeout()
+    async def test__request_when_coalescing_enabled_shares_identical_requests(self, rest_client, live_attributes):
+        rest_client._http_settings.coalesce_get_requests = True
+        live_attributes.coalesced_requests = {}
+        route = routes.GET_USER.compile(user=123)
+        other_route = routes.GET_USER.compile(user=456)
+        response = {"id": "123"}
+        event = asyncio.Event()
+
+        async def perform_request(*args, **kwargs):
+            await event.wait()
+            return response
+
+        rest_client._perform_request = mock.Mock(side_effect=perform_request)
+
+        tasks = [asyncio.create_task(rest_client._request(route)) for _ in range(3)]
+        other_task = asyncio.create_task(rest_client._request(other_route))
+        await hikari_test_helpers.idle()
+        event.set()
+
+        assert await asyncio.gather(*tasks) == [response, response, response]
+        assert all(task.result() is response for task in tasks)
+        await other_task
+        assert rest_client._perform_request.call_count == 2
+        rest_client._perform_request.assert_any_call(
+            route, query=None, reason=undefined.UNDEFINED, no_auth=False, auth=None
+        )
+        assert rest_client.request_statistics == rest.RESTRequestStatistics(
+            single_flight_requests=4, coalesced_requests=2
+        )
+        assert live_attributes.coalesced_requests == {}
+
+    @hikari_test_helpers.timeout()
+    async def test__request_when_coalescing_enabled_keys_on_query(self, rest_client, live_attributes):
+        rest_client._http_settings.coalesce_get_requests = True
+        live_attributes.coalesced_requests = {}
+        route = routes.GET_MY_GUILDS.compile()
+        rest_client._perform_request = mock.AsyncMock()
+        query_1 = data_binding.StringMapBuilder()
+        query_1.put("after", 1)
+        query_2 = data_binding.StringMapBuilder()
+        query_2.put("after", 2)
+
+        await asyncio.gather(rest_client._request(route, query=query_1), rest_client._request(route, query=query_2))
+
+        assert rest_client._perform_request.await_count == 2
+        assert rest_client.request_statistics.coalesced_requests == 0
+
+    @hikari_test_helpers.timeout()
+    async def test__request_when_coalescing_enabled_propagates_errors_to_all(self, rest_client, live_attributes):
+        rest_client._http_settings.coalesce_get_requests = True
+        live_attributes.coalesced_requests = {}
+        route = routes.GET_USER.compile(user=123)
+        rest_client._perform_request = mock.AsyncMock(side_effect=errors.NotFoundError("", {}, ""))
+
+        results = await asyncio.gather(rest_client._request(route), rest_client._request(route), return_exceptions=True)
+
+        assert results[0] is results[1]
+        assert isinstance(results[0], errors.NotFoundError)
+        rest_client._perform_request.assert_awaited_once()
+        assert live_attributes.coalesced_requests == {}
+
+    @hikari_test_helpers.timeout()
+    async def test__request_when_coalescing_enabled_and_caller_cancelled(self, rest_client, live_attributes):
+        rest_client._http_settings.coalesce_get_requests = True
+        live_attributes.coalesced_requests = {}
+        route = routes.GET_USER.compile(user=123)
+        event = asyncio.Event()
+
+        async def perform_request(*args, **kwargs):
+            await event.wait()
+            return {"id": "123"}
+
+        rest_client._perform_request = mock.Mock(side_effect=perform_request)
+        first = asyncio.create_task(rest_client._request(route))
+        second = asyncio.create_task(rest_client._request(route))
+        await hikari_test_helpers.idle()
+
+        first.cancel()
+        await hikari_test_helpers.idle()
+        event.set()
+
+        assert await second == {"id": "123"}
+        assert first.cancelled()
+        rest_client._perform_request.assert_called_once()
+
+    @hikari_test_helpers.timeout()
+    async def test__request_when_response_cache_hit(self, rest_client):
+        rest_client._response_cache = mock.Mock(get_response=mock.Mock(return_value={"id": "123"}))
+        route = routes.GET_GUILD.compile(guild=123)
+        query = data_binding.StringMapBuilder()
+        query.put("with_counts", True)
+        rest_client._perform_request = mock.AsyncMock()
+
+        assert await rest_client._request(route, query=query) == {"id": "123"}
+
+        rest_client._response_cache.get_response.assert_called_once_with(route, (("with_counts", "true"),))
+        rest_client._perform_request.assert_not_called()
+        assert rest_client.request_statistics.response_cache_hits == 1
+        assert rest_client.request_statistics.response_cache_misses == 0
+
+    @hikari_test_helpers.timeout()
+    async def test__request_when_response_cache_miss(self, rest_client):
+        rest_client._response_cache = mock.Mock(get_response=mock.Mock(return_value=None))
+        route = routes.GET_GUILD.compile(guild=123)
+        rest_client._perform_request = mock.AsyncMock(return_value={"id": "123"})
+
+        with mock.patch.object(time, "monotonic", return_value=42.0):
+            assert await rest_client._request(route) == {"id": "123"}
+
+        rest_client._perform_request.assert_awaited_once_with(
+            route, query=None, reason=undefined.UNDEFINED, no_auth=False, auth=None
+        )
+        rest_client._response_cache.set_response.assert_called_once_with(route, (), {"id": "123"}, requested_at=42.0)
+        assert rest_client.request_statistics.response_cache_hits == 0
+        assert rest_client.request_statistics.response_cache_misses == 1
+
+    @pytest.mark.parametrize(
+        ("is_cacheable", "kwargs"), [(False, {}), (True, {"auth": "Bearer other"}), (True, {"no_auth": True})]
+    )
+    @hikari_test_helpers.timeout()
+    async def test__request_when_response_not_cacheable(self, rest_client, is_cacheable, kwargs):
+        rest_client._response_cache = mock.Mock(is_cacheable=mock.Mock(return_value=is_cacheable))
+        rest_client._perform_request = mock.AsyncMock(return_value={"id": "123"})
+
+        assert await rest_client._request(routes.GET_GUILD.compile(guild=123), **kwargs) == {"id": "123"}
+
+        rest_client._response_cache.get_response.assert_not_called()
+        rest_client._response_cache.set_response.assert_not_called()
+        assert rest_client.request_statistics.response_cache_misses == 0
+
+    @hikari_test_helpers.timeout()
+    async def test__request_when_response_cache_and_not_get_request(self, rest_client):
+        rest_client._response_cache = mock.Mock()
+        rest_client._perform_request = mock.AsyncMock()
+
+        await rest_client._request(routes.PATCH_GUILD.compile(guild=123), json={})
+
+        rest_client._response_cache.is_cacheable.assert_not_called()
+
     async def test__handle_error_response(self, rest_client, exit_exception):
         mock_response = mock.Mock()
         with mock.patch.object(net, "generate_error_response", return_value=exit_exception) as generate_error_response:
@@ -1268,7 +1489,7 @@ class TestRESTClientImplAsync:
             content_type = rest._APPLICATION_JSON
             headers = {}
 
-            async def json(self):
+            async def json(self, loads):
                 raise exit_exception
 
         route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
@@ -1300,7 +1521,7 @@ class TestRESTClientImplAsync:
             headers = {}
             real_url = "https://some.url"
 
-            async def json(self):
+            async def json(self, loads):
                 return {"global": True, "retry_after": "2"}
 
         route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
@@ -1308,7 +1529,8 @@ class TestRESTClientImplAsync:
             await rest_client._parse_ratelimits(route, StubResponse(), live_attributes)
 
         live_attributes.global_rate_limit.throttle.assert_called_once_with(2.0)
-        assert live_attributes.still_alive.call_count == 1
+        live_attributes.buckets.throttle_global.assert_called_once_with(2.0)
+        assert live_attributes.still_alive.call_count == 2
 
     async def test__parse_ratelimits_when_remaining_header_under_or_equal_to_0(self, rest_client, live_attributes):
         class StubResponse:
@@ -1319,7 +1541,7 @@ class TestRESTClientImplAsync:
             }
             real_url = "https://some.url"
 
-            async def json(self):
+            async def json(self, loads):
                 return {"retry_after": "2", "global": False}
 
         route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
@@ -1337,7 +1559,7 @@ class TestRESTClientImplAsync:
             }
             real_url = "https://some.url"
 
-            async def json(self):
+            async def json(self, loads):
                 return {"retry_after": "0.002"}
 
         route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
@@ -1353,7 +1575,7 @@ class TestRESTClientImplAsync:
             headers = {}
             real_url = "https://some.url"
 
-            async def json(self):
+            async def json(self, loads):
                 return {"retry_after": "4"}
 
         route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import pytest
+
+from hikari import snowflakes
+from hikari.api import session_store
+from hikari.impl import session_store as session_store_impl
+
+
+class TestFileSessionStore:
+    @pytest.fixture()
+    def store(self, tmp_path):
+        return session_store_impl.FileSessionStore(tmp_path / "sessions")
+
+    @pytest.fixture()
+    def session(self):
+        return session_store.GatewaySession(
+            shard_id=1, shard_count=2, session_id="abc", seq=420, user_id=snowflakes.Snowflake(123)
+        )
+
+    def test_path_property(self, store, tmp_path):
+        assert store.path == tmp_path / "sessions"
+
+    @pytest.mark.asyncio()
+    async def test_save_and_load_session(self, store, session):
+        await store.save_session(session)
+
+        assert await store.load_session(1, 2) == session
+        assert (store.path / "shard-1.json").exists()
+        assert not (store.path / "shard-1.tmp").exists()
+
+    @pytest.mark.asyncio()
+    async def test_load_session_when_no_session(self, store):
+        assert await store.load_session(1, 2) is None
+
+    @pytest.mark.asyncio()
+    async def test_load_session_when_shard_count_differs(self, store, session):
+        await store.save_session(session)
+
+        assert await store.load_session(1, 3) is None
+
+    @pytest.mark.asyncio()
+    async def test_load_session_when_shard_id_differs(self, store, session):
+        await store.save_session(session)
+        (store.path / "shard-1.json").rename(store.path / "shard-0.json")
+
+        assert await store.load_session(0, 2) is None
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize("content", [b"", b"[]", b'{"shard_id": 1}', b"not json"])
+    async def test_load_session_when_file_is_corrupt(self, store, content):
+        store.path.mkdir()
+        (store.path / "shard-1.json").write_bytes(content)
+
+        assert await store.load_session(1, 2) is None
+
+    @pytest.mark.asyncio()
+    async def test_delete_session(self, store, session):
+        await store.save_session(session)
+
+        await store.delete_session(1)
+
+        assert await store.load_session(1, 2) is None
+
+    @pytest.mark.asyncio()
+    async def test_delete_session_when_no_session(self, store):
+        await store.delete_session(1)
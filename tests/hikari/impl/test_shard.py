@@ -23,6 +23,7 @@ import asyncio
 import contextlib
 import datetime
 import platform
+import zlib
 
 import aiohttp
 import mock
@@ -33,9 +34,13 @@ from hikari import config
 from hikari import errors
 from hikari import intents
 from hikari import presences
+from hikari import snowflakes
 from hikari import undefined
+from hikari.api import session_store
 from hikari.impl import shard
 from hikari.internal import aio
+from hikari.internal import data_binding
+from hikari.internal import etf
 from hikari.internal import time
 from tests.hikari import client_session_stub
 from tests.hikari import hikari_test_helpers
@@ -95,15 +100,26 @@ class TestGatewayTransport:
         close.assert_called_once_with(code=1234, message=b"some message")
 
     @pytest.mark.parametrize("trace", [True, False])
-    async def test_receive_json(self, transport_impl, trace):
+    async def test_receive_payload(self, transport_impl, trace):
         transport_impl._receive_and_check = mock.AsyncMock(return_value="{'json_response': null}")
         transport_impl.logger.isEnabledFor.return_value = trace
         mock_loads = mock.Mock(return_value={"json_response": None})
 
-        assert await transport_impl.receive_json(loads=mock_loads, timeout=69) == {"json_response": None}
+        assert await transport_impl.receive_payload(loads=mock_loads, timeout=69) == {"json_response": None}
 
         transport_impl._receive_and_check.assert_awaited_once_with(69)
-        mock_loads.assert_called_once_with("{'json_response': null}")
+        mock_loads.assert_called_once_with(b"{'json_response': null}")
+
+    async def test_receive_payload_when_trace_and_payload_is_bytes(self, transport_impl):
+        transport_impl._receive_and_check = mock.AsyncMock(return_value=b'{"json_response":null}')
+        transport_impl.logger.isEnabledFor.return_value = True
+        transport_impl.log_filterer = mock.Mock(return_value="filtered")
+        mock_loads = mock.Mock(return_value={"json_response": None})
+
+        assert await transport_impl.receive_payload(loads=mock_loads) == {"json_response": None}
+
+        transport_impl.log_filterer.assert_called_once_with('{"json_response":null}')
+        mock_loads.assert_called_once_with(b'{"json_response":null}')
 
     @pytest.mark.parametrize("trace", [True, False])
     async def test_send_json(self, transport_impl, trace):
@@ -116,6 +132,21 @@ class TestGatewayTransport:
         transport_impl.send_str.assert_awaited_once_with("{'json_send': null}", 420)
         mock_dumps.assert_called_once_with({"json_send": None})
 
+    @pytest.mark.parametrize("trace", [True, False])
+    async def test_send_json_when_dumps_returns_bytes(self, transport_impl, trace):
+        transport_impl.send_bytes = mock.AsyncMock()
+        transport_impl.send_str = mock.AsyncMock()
+        transport_impl.logger.isEnabledFor.return_value = trace
+        transport_impl.log_filterer = mock.Mock(return_value="filtered")
+        mock_dumps = mock.Mock(return_value=b"\x83j")
+
+        await transport_impl.send_json({"json_send": None}, 420, dumps=mock_dumps)
+
+        transport_impl.send_bytes.assert_awaited_once_with(b"\x83j", 420)
+        transport_impl.send_str.assert_not_called()
+        if trace:
+            transport_impl.log_filterer.assert_called_once_with("b'\\x83j'")
+
     class StubResponse:
         def __init__(
             self,
@@ -192,12 +223,101 @@ class TestGatewayTransport:
         response2 = self.StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"data")
         response3 = self.StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"\x00\x00\xff\xff")
         transport_impl.receive = mock.AsyncMock(side_effect=[response1, response2, response3])
-        transport_impl.zlib = mock.Mock(decompress=mock.Mock(return_value=b"utf-8 encoded bytes"))
+        payloads = []
 
-        assert await transport_impl._receive_and_check(10) == "utf-8 encoded bytes"
+        def decompress(payload):
+            payloads.append(bytes(payload))
+            return b"utf-8 encoded bytes"
+
+        transport_impl.zlib = mock.Mock(decompress=mock.Mock(side_effect=decompress))
+
+        assert await transport_impl._receive_and_check(10) == b"utf-8 encoded bytes"
 
         transport_impl.receive.assert_awaited_with(10)
-        transport_impl.zlib.decompress.assert_called_once_with(bytearray(b"somedata\x00\x00\xff\xff"))
+        transport_impl.zlib.decompress.assert_called_once()
+        assert payloads == [b"somedata\x00\x00\xff\xff"]
+        assert transport_impl.statistics.inflated_payloads == 1
+        assert transport_impl.statistics.compressed_bytes == 12
+        assert transport_impl.statistics.inflated_bytes == 19
+
+    async def test__receive_and_check_when_message_type_is_BINARY_in_single_frame(self, transport_impl):
+        response = self.StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"somedata\x00\x00\xff\xff")
+        transport_impl.receive = mock.AsyncMock(return_value=response)
+        transport_impl.zlib = mock.Mock(decompress=mock.Mock(return_value=b"utf-8 encoded bytes"))
+
+        assert await transport_impl._receive_and_check(10) == b"utf-8 encoded bytes"
+
+        transport_impl.zlib.decompress.assert_called_once_with(b"somedata\x00\x00\xff\xff")
+        assert transport_impl.zlib_buffer == bytearray()
+
+    async def test__receive_and_check_reuses_buffer_between_payloads(self, transport_impl):
+        transport_impl.receive = mock.AsyncMock(
+            side_effect=[
+                self.StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"a long payload"),
+                self.StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"\x00\x00\xff\xff"),
+                self.StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"short"),
+                self.StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"\x00\x00\xff\xff"),
+            ]
+        )
+        payloads = []
+
+        def decompress(payload):
+            payloads.append(bytes(payload))
+            return b"{}"
+
+        transport_impl.zlib = mock.Mock(decompress=mock.Mock(side_effect=decompress))
+        buffer = transport_impl.zlib_buffer
+
+        await transport_impl._receive_and_check(10)
+        await transport_impl._receive_and_check(10)
+
+        assert payloads == [b"a long payload\x00\x00\xff\xff", b"short\x00\x00\xff\xff"]
+        assert transport_impl.zlib_buffer is buffer
+
+    async def test__receive_and_check_trims_buffer_after_oversized_payload(self, transport_impl):
+        transport_impl.receive = mock.AsyncMock(
+            side_effect=[
+                self.StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"a very long payload"),
+                self.StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"\x00\x00\xff\xff"),
+            ]
+        )
+        transport_impl.zlib = mock.Mock(decompress=mock.Mock(return_value=b"{}"))
+        buffer = transport_impl.zlib_buffer
+
+        with mock.patch.object(shard, "_ZLIB_BUFFER_RETAIN_SIZE", new=8):
+            assert await transport_impl._receive_and_check(10) == b"{}"
+
+        transport_impl.zlib.decompress.assert_called_once()
+        assert transport_impl.zlib_buffer is buffer
+        assert len(buffer) == 8
+
+    async def test__receive_and_check_with_real_zlib_stream(self, transport_impl):
+        compressor = zlib.compressobj()
+        first = compressor.compress(b'{"op":10}') + compressor.flush(zlib.Z_SYNC_FLUSH)
+        second = compressor.compress(b'{"op":11}') + compressor.flush(zlib.Z_SYNC_FLUSH)
+        transport_impl.receive = mock.AsyncMock(
+            side_effect=[
+                self.StubResponse(type=aiohttp.WSMsgType.BINARY, data=first),
+                self.StubResponse(type=aiohttp.WSMsgType.BINARY, data=second[:3]),
+                self.StubResponse(type=aiohttp.WSMsgType.BINARY, data=second[3:]),
+            ]
+        )
+
+        assert await transport_impl._receive_and_check(10) == b'{"op":10}'
+        assert await transport_impl._receive_and_check(10) == b'{"op":11}'
+        assert transport_impl.statistics.inflated_payloads == 2
+        assert transport_impl.statistics.inflated_bytes == 18
+
+    async def test__receive_and_check_when_message_type_is_BINARY_and_no_transport_compression(self, transport_impl):
+        transport_impl.transport_compression = False
+        transport_impl.receive = mock.AsyncMock(
+            return_value=self.StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"\x83j")
+        )
+        transport_impl.zlib = mock.Mock()
+
+        assert await transport_impl._receive_and_check(10) == b"\x83j"
+
+        transport_impl.zlib.decompress.assert_not_called()
 
     async def test__receive_and_check_when_buff_but_next_is_not_BINARY(self, transport_impl):
         response1 = self.StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"some")
@@ -249,6 +369,7 @@ class TestGatewayTransport:
         client_timeout = stack.enter_context(mock.patch.object(aiohttp, "ClientTimeout"))
         logger = mock.Mock()
         log_filterer = mock.Mock()
+        statistics = shard.GatewayTransportStatistics()
 
         with stack:
             async with shard._GatewayTransport.connect(
@@ -257,8 +378,11 @@ class TestGatewayTransport:
                 logger=logger,
                 url="https://some.url",
                 log_filterer=log_filterer,
+                statistics=statistics,
+                transport_compression=True,
             ) as ws:
                 assert ws.logger is logger
+                assert ws.statistics is statistics
 
         tcp_connector.assert_called_once_with(
             limit=1,
@@ -277,6 +401,7 @@ class TestGatewayTransport:
         client_session.assert_called_once_with(
             connector=tcp_connector(),
             connector_owner=True,
+            json_serialize=data_binding.default_json_dumps,
             raise_for_status=True,
             timeout=client_timeout(),
             trust_env=proxy_settings.trust_env,
@@ -314,6 +439,7 @@ class TestGatewayTransport:
         stack.enter_context(pytest.raises(errors.GatewayError, match="some reason"))
         logger = mock.Mock()
         log_filterer = mock.Mock()
+        statistics = shard.GatewayTransportStatistics()
 
         with stack:
             async with shard._GatewayTransport.connect(
@@ -322,6 +448,8 @@ class TestGatewayTransport:
                 logger=logger,
                 url="https://some.url",
                 log_filterer=log_filterer,
+                statistics=statistics,
+                transport_compression=True,
             ):
                 raise errors.GatewayError("some reason")
 
@@ -354,6 +482,7 @@ class TestGatewayTransport:
         stack.enter_context(pytest.raises(errors.GatewayError, match="Unexpected ValueError: testing"))
         logger = mock.Mock()
         log_filterer = mock.Mock()
+        statistics = shard.GatewayTransportStatistics()
 
         with stack:
             async with shard._GatewayTransport.connect(
@@ -362,6 +491,8 @@ class TestGatewayTransport:
                 logger=logger,
                 url="https://some.url",
                 log_filterer=log_filterer,
+                statistics=statistics,
+                transport_compression=True,
             ):
                 raise ValueError("testing")
 
@@ -394,6 +525,7 @@ class TestGatewayTransport:
         stack.enter_context(mock.patch.object(aiohttp, "ClientTimeout"))
         logger = mock.Mock()
         log_filterer = mock.Mock()
+        statistics = shard.GatewayTransportStatistics()
 
         with stack:
             async with shard._GatewayTransport.connect(
@@ -402,6 +534,8 @@ class TestGatewayTransport:
                 logger=logger,
                 url="https://some.url",
                 log_filterer=log_filterer,
+                statistics=statistics,
+                transport_compression=True,
             ):
                 pass
 
@@ -433,6 +567,7 @@ class TestGatewayTransport:
         stack.enter_context(mock.patch.object(aiohttp, "ClientTimeout"))
         logger = mock.Mock()
         log_filterer = mock.Mock()
+        statistics = shard.GatewayTransportStatistics()
 
         with stack:
             async with shard._GatewayTransport.connect(
@@ -441,6 +576,8 @@ class TestGatewayTransport:
                 logger=logger,
                 url="https://some.url",
                 log_filterer=log_filterer,
+                statistics=statistics,
+                transport_compression=True,
             ):
                 pass
 
@@ -464,6 +601,7 @@ class TestGatewayTransport:
         )
         logger = mock.Mock()
         log_filterer = mock.Mock()
+        statistics = shard.GatewayTransportStatistics()
 
         with stack:
             async with shard._GatewayTransport.connect(
@@ -472,6 +610,8 @@ class TestGatewayTransport:
                 logger=logger,
                 url="https://some.url",
                 log_filterer=log_filterer,
+                statistics=statistics,
+                transport_compression=True,
             ):
                 pass
 
@@ -501,6 +641,7 @@ class TestGatewayTransport:
         )
         logger = mock.Mock()
         log_filterer = mock.Mock()
+        statistics = shard.GatewayTransportStatistics()
 
         with stack:
             async with shard._GatewayTransport.connect(
@@ -509,6 +650,8 @@ class TestGatewayTransport:
                 logger=logger,
                 url="https://some.url",
                 log_filterer=log_filterer,
+                statistics=statistics,
+                transport_compression=True,
             ):
                 pass
 
@@ -538,6 +681,7 @@ class TestGatewayTransport:
         )
         logger = mock.Mock()
         log_filterer = mock.Mock()
+        statistics = shard.GatewayTransportStatistics()
 
         with stack:
             async with shard._GatewayTransport.connect(
@@ -546,6 +690,8 @@ class TestGatewayTransport:
                 logger=logger,
                 url="https://some.url",
                 log_filterer=log_filterer,
+                statistics=statistics,
+                transport_compression=True,
             ):
                 pass
 
@@ -599,18 +745,86 @@ class TestGatewayShardImpl:
 
         assert g._url == f"wss://gaytewhuy.discord.meh?{expect}"
 
-    def test_using_etf_is_unsupported(self, http_settings, proxy_settings):
-        with pytest.raises(NotImplementedError, match="Unsupported gateway data format: etf"):
+    @pytest.mark.parametrize(
+        ("compression", "expect"),
+        [
+            (None, f"v={shard._VERSION}&encoding=etf"),
+            ("transport_zlib_stream", f"v={shard._VERSION}&encoding=etf&compress=zlib-stream"),
+        ],
+    )
+    def test__init__when_etf(self, compression, expect, http_settings, proxy_settings):
+        g = shard.GatewayShardImpl(
+            event_manager=mock.Mock(),
+            event_factory=mock.Mock(),
+            http_settings=http_settings,
+            proxy_settings=proxy_settings,
+            intents=intents.Intents.ALL,
+            url="wss://gaytewhuy.discord.meh",
+            data_format="etf",
+            dumps=mock.Mock(),
+            loads=mock.Mock(),
+            compression=compression,
+            token="12345",
+        )
+
+        assert g._url == f"wss://gaytewhuy.discord.meh?{expect}"
+        assert g._dumps is etf.default_etf_dumps
+        assert g._loads is etf.default_etf_loads
+        assert g._transport_compression is (compression is not None)
+
+    def test__init__when_session(self, http_settings, proxy_settings):
+        session = session_store.GatewaySession(
+            shard_id=1, shard_count=2, session_id="abc", seq=420, user_id=snowflakes.Snowflake(123)
+        )
+
+        g = shard.GatewayShardImpl(
+            event_manager=mock.Mock(),
+            event_factory=mock.Mock(),
+            http_settings=http_settings,
+            proxy_settings=proxy_settings,
+            intents=intents.Intents.ALL,
+            url="wss://gaytewhuy.discord.meh",
+            session=session,
+            shard_id=1,
+            shard_count=2,
+            token="12345",
+        )
+
+        assert g._session_id == "abc"
+        assert g._seq == 420
+        assert g._user_id == 123
+        assert g.session == session
+
+    def test__init__when_session_is_for_another_shard(self, http_settings, proxy_settings):
+        session = session_store.GatewaySession(
+            shard_id=1, shard_count=2, session_id="abc", seq=420, user_id=snowflakes.Snowflake(123)
+        )
+
+        with pytest.raises(ValueError, match=r"Session for shard 1/2 cannot be used for shard 1/3"):
+            shard.GatewayShardImpl(
+                event_manager=mock.Mock(),
+                event_factory=mock.Mock(),
+                http_settings=http_settings,
+                proxy_settings=proxy_settings,
+                intents=intents.Intents.ALL,
+                url="wss://gaytewhuy.discord.meh",
+                session=session,
+                shard_id=1,
+                shard_count=3,
+                token="12345",
+            )
+
+    def test__init__when_unknown_data_format(self, http_settings, proxy_settings):
+        with pytest.raises(NotImplementedError, match="Unsupported gateway data format: xml"):
             shard.GatewayShardImpl(
                 event_manager=mock.Mock(),
                 event_factory=mock.Mock(),
                 http_settings=http_settings,
                 proxy_settings=proxy_settings,
                 token=mock.Mock(),
-                url="wss://erlpack-is-broken-lol.discord.meh",
+                url="wss://gaytewhuy.discord.meh",
                 intents=intents.Intents.ALL,
-                data_format="etf",
-                compression=True,
+                data_format="xml",
             )
 
     def test_heartbeat_latency_property(self, client):
@@ -644,6 +858,23 @@ class TestGatewayShardImpl:
         client._shard_count = 69
         assert client.shard_count == 69
 
+    def test_session_property(self, client):
+        client._shard_id = 1
+        client._shard_count = 2
+        client._session_id = "abc"
+        client._seq = 420
+        client._user_id = snowflakes.Snowflake(123)
+
+        assert client.session == session_store.GatewaySession(
+            shard_id=1, shard_count=2, session_id="abc", seq=420, user_id=snowflakes.Snowflake(123)
+        )
+
+    def test_session_property_when_no_session(self, client):
+        client._session_id = None
+        client._seq = None
+
+        assert client.session is None
+
     def test_shard__check_if_alive_when_not_alive(self, client):
         with mock.patch.object(shard.GatewayShardImpl, "is_alive", new=False):
             with pytest.raises(errors.ComponentStateConflictError):
@@ -685,6 +916,18 @@ class TestGatewayShardImpl:
         client._total_rate_limit.close.assert_called_once_with()
         client._closed_event.wait.assert_awaited_once_with()
 
+    async def test_close_when_resumable(self, client):
+        client._closing_event = mock.Mock(is_set=mock.Mock(return_value=False))
+        client._closed_event = mock.Mock(wait=mock.AsyncMock())
+        client._ws = mock.Mock(send_close=mock.AsyncMock())
+        client._chunking_rate_limit = mock.Mock()
+        client._total_rate_limit = mock.Mock()
+
+        await client.close(resumable=True)
+
+        client._ws.send_close.assert_awaited_once_with(code=shard._RESUME_CLOSE_CODE, message=b"shard disconnecting")
+        assert client._close_code == shard._RESUME_CLOSE_CODE
+
     async def test_close_when_closing_event_not_set_and_ws_is_None(self, client):
         client._closing_event = mock.Mock(is_set=mock.Mock(return_value=False))
         client._closed_event = mock.Mock(wait=mock.AsyncMock())
@@ -728,6 +971,16 @@ class TestGatewayShardImpl:
 
         client._closed_event.wait.assert_awaited_once_with()
 
+    async def test__send_json(self, client):
+        client._total_rate_limit = mock.Mock(acquire=mock.AsyncMock())
+        client._ws = mock.Mock(send_json=mock.AsyncMock())
+        client._dumps = mock.Mock()
+
+        await client._send_json({"op": 1}, 9)
+
+        client._total_rate_limit.acquire.assert_awaited_once_with()
+        client._ws.send_json.assert_awaited_once_with(data={"op": 1}, compress=9, dumps=client._dumps)
+
     async def test_request_guild_members_when_no_query_and_no_limit_and_GUILD_MEMBERS_not_enabled(self, client):
         client._check_if_alive = mock.Mock()
         client._intents = intents.Intents.GUILD_INTEGRATIONS
@@ -947,27 +1200,28 @@ class TestGatewayShardImpl:
             pl,
         )
 
-    def test__dipatch_when_RESUME(self, client):
+    def test__dipatch_when_RESUMED(self, client):
         client._seq = 0
         client._session_id = 123
         client._logger = mock.Mock()
         client._handshake_completed = mock.Mock()
         client._event_manager = mock.Mock()
 
-        client._dispatch("RESUME", 10, {})
+        client._dispatch("RESUMED", 10, {})
 
         assert client._seq == 10
         client._logger.info.assert_called_once_with("shard has resumed [session:%s, seq:%s]", 123, 10)
         client._handshake_completed.set.assert_called_once_with()
-        client._event_manager.consume_raw_event.assert_called_once_with("RESUME", client, {})
+        client._event_manager.consume_raw_event.assert_called_once_with("RESUMED", client, {})
 
     def test__dipatch(self, client):
         client._logger = mock.Mock()
         client._handshake_completed = mock.Mock()
         client._event_manager = mock.Mock()
 
-        client._dispatch("EVENT NAME", 10, {"payload": None})
+        result = client._dispatch("EVENT NAME", 10, {"payload": None})
 
+        assert result is client._event_manager.consume_raw_event.return_value
         client._logger.info.assert_not_called()
         client._logger.debug.assert_not_called()
         client._handshake_completed.set.assert_not_called()
@@ -978,7 +1232,7 @@ class TestGatewayShardImpl:
         client._handshake_completed = mock.Mock()
         client._event_manager = mock.Mock(consume_raw_event=mock.Mock(side_effect=LookupError))
 
-        client._dispatch("UNEXISTING_EVENT", 10, {"payload": None})
+        assert client._dispatch("UNEXISTING_EVENT", 10, {"payload": None}) is None
 
         client._logger.info.assert_not_called()
         client._handshake_completed.set.assert_not_called()
@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import copy
+import datetime
+import pickle  # noqa: S403 - Consider possible security implications associated with pickle module
+
+import mock
+import pytest
+
+from hikari import snowflakes
+from hikari import undefined
+from hikari import users
+from hikari.internal import cache
+
+
+def _make_member_data(user, **kwargs):
+    fields = {
+        "user": user,
+        "guild_id": snowflakes.Snowflake(123),
+        "nickname": "nick",
+        "role_ids": (snowflakes.Snowflake(1), snowflakes.Snowflake(2)),
+        "joined_at": datetime.datetime(2020, 7, 15, 23, 30, 59, 501602, tzinfo=datetime.timezone.utc),
+        "premium_since": None,
+        "is_deaf": True,
+        "is_mute": False,
+        "is_pending": undefined.UNDEFINED,
+    }
+    fields.update(kwargs)
+    return cache.MemberData(**fields)
+
+
+def _make_user(user_id):
+    # The user's app is left out so that the cells holding it can be pickled.
+    return users.UserImpl(
+        id=snowflakes.Snowflake(user_id),
+        app=None,
+        discriminator="0001",
+        username="nyaa",
+        avatar_hash=None,
+        is_bot=False,
+        is_system=False,
+        flags=users.UserFlag.NONE,
+    )
+
+
+class TestBaseRefCell:
+    def test_setters_are_abstract(self):
+        class Cell(cache.BaseRefCell[int]):
+            __slots__ = ()
+
+            object = cache.BaseRefCell.object.getter(lambda self: 1)
+            ref_count = cache.BaseRefCell.ref_count.getter(lambda self: 0)
+
+        with pytest.raises(TypeError):
+            Cell()
+
+    def test_ref_cell_is_concrete(self):
+        cell = cache.RefCell(1, ref_count=2)
+
+        assert isinstance(cell, cache.BaseRefCell)
+        assert cell.object == 1
+        assert cell.ref_count == 2
+
+
+class TestColumnarMemberStore:
+    @pytest.fixture()
+    def user_entries(self):
+        return {
+            snowflakes.Snowflake(user_id): cache.RefCell(mock.Mock(users.User, id=snowflakes.Snowflake(user_id)))
+            for user_id in (111, 222, 333)
+        }
+
+    @pytest.fixture()
+    def store(self, user_entries):
+        return cache.ColumnarMemberStore(snowflakes.Snowflake(123), user_entries)
+
+    def test_set_and_get(self, store, user_entries):
+        user = user_entries[snowflakes.Snowflake(111)]
+        data = _make_member_data(
+            user,
+            premium_since=datetime.datetime(2021, 1, 2, 3, 4, 5, 6, tzinfo=datetime.timezone.utc),
+            has_been_deleted=True,
+        )
+
+        store[snowflakes.Snowflake(111)] = cache.RefCell(data, ref_count=3)
+
+        cell = store[snowflakes.Snowflake(111)]
+        assert isinstance(cell, cache.ColumnarMemberCell)
+        assert cell.ref_count == 3
+        result = cell.object
+        assert result.user is user
+        assert result.guild_id == 123
+        assert result.nickname == "nick"
+        assert result.role_ids == (1, 2)
+        assert result.joined_at == data.joined_at
+        assert result.premium_since == data.premium_since
+        assert result.is_deaf is True
+        assert result.is_mute is False
+        assert result.is_pending is undefined.UNDEFINED
+        assert result.has_been_deleted is True
+
+    def test_getitem_returns_the_same_cell_while_referenced(self, store, user_entries):
+        store[snowflakes.Snowflake(111)] = cache.RefCell(_make_member_data(user_entries[snowflakes.Snowflake(111)]))
+
+        assert store[snowflakes.Snowflake(111)] is store[snowflakes.Snowflake(111)]
+
+    def test_getitem_for_unknown_member(self, store):
+        with pytest.raises(KeyError):
+            store[snowflakes.Snowflake(111)]
+
+    def test_cell_setters_write_to_columns(self, store, user_entries):
+        user = user_entries[snowflakes.Snowflake(111)]
+        store[snowflakes.Snowflake(111)] = cache.RefCell(_make_member_data(user), ref_count=1)
+        cell = store[snowflakes.Snowflake(111)]
+
+        cell.object = _make_member_data(user, nickname=None, role_ids=())
+        cell.ref_count += 1
+
+        del cell
+        cell = store[snowflakes.Snowflake(111)]
+        assert cell.object.nickname is None
+        assert cell.object.role_ids == ()
+        assert cell.ref_count == 2
+
+    def test_role_ids_are_shared(self, store, user_entries):
+        for user_id in (111, 222):
+            user = user_entries[snowflakes.Snowflake(user_id)]
+            role_ids = (snowflakes.Snowflake(1), snowflakes.Snowflake(2))
+            store[snowflakes.Snowflake(user_id)] = cache.RefCell(_make_member_data(user, role_ids=role_ids))
+
+        first = store[snowflakes.Snowflake(111)].object.role_ids
+        second = store[snowflakes.Snowflake(222)].object.role_ids
+        assert first is second
+        assert store._role_sets[first].ref_count == 2
+
+        del store[snowflakes.Snowflake(111)]
+        del store[snowflakes.Snowflake(222)]
+
+        assert store._role_sets == {}
+
+    def test_delitem_moves_last_row(self, store, user_entries):
+        for user_id in (111, 222, 333):
+            user = user_entries[snowflakes.Snowflake(user_id)]
+            store[snowflakes.Snowflake(user_id)] = cache.RefCell(_make_member_data(user, nickname=str(user_id)))
+
+        del store[snowflakes.Snowflake(111)]
+
+        assert list(store) == [333, 222]
+        assert snowflakes.Snowflake(111) not in store
+        assert store[snowflakes.Snowflake(222)].object.nickname == "222"
+        assert store[snowflakes.Snowflake(333)].object.nickname == "333"
+
+    def test_delitem_detaches_referenced_cell(self, store, user_entries):
+        user = user_entries[snowflakes.Snowflake(111)]
+        store[snowflakes.Snowflake(111)] = cache.RefCell(_make_member_data(user), ref_count=2)
+        cell = store[snowflakes.Snowflake(111)]
+
+        del store[snowflakes.Snowflake(111)]
+
+        assert cell.object.user is user
+        assert cell.object.nickname == "nick"
+        assert cell.ref_count == 2
+        cell.ref_count = 1
+        assert cell.ref_count == 1
+
+    def test_clear_detaches_referenced_cells(self, store, user_entries):
+        user = user_entries[snowflakes.Snowflake(111)]
+        store[snowflakes.Snowflake(111)] = cache.RefCell(_make_member_data(user))
+        cell = store[snowflakes.Snowflake(111)]
+
+        store.clear()
+
+        assert len(store) == 0
+        assert store._role_sets == {}
+        assert cell.object.nickname == "nick"
+
+    def test_copy(self, store, user_entries):
+        user = user_entries[snowflakes.Snowflake(111)]
+        store[snowflakes.Snowflake(111)] = cache.RefCell(_make_member_data(user))
+
+        store_copy = store.copy()
+        del store[snowflakes.Snowflake(111)]
+
+        assert list(store_copy) == [111]
+        assert store_copy[snowflakes.Snowflake(111)].object.nickname == "nick"
+
+    def test_freeze(self, store, user_entries):
+        user = user_entries[snowflakes.Snowflake(111)]
+        store[snowflakes.Snowflake(111)] = cache.RefCell(_make_member_data(user))
+
+        frozen = store.freeze()
+
+        assert frozen == {snowflakes.Snowflake(111): store[snowflakes.Snowflake(111)]}
+
+    def test_copy_cell(self, store, user_entries):
+        user = user_entries[snowflakes.Snowflake(111)]
+        store[snowflakes.Snowflake(111)] = cache.RefCell(_make_member_data(user), ref_count=4)
+
+        result = copy.copy(store[snowflakes.Snowflake(111)])
+
+        assert type(result) is cache.RefCell
+        assert result.object.nickname == "nick"
+        assert result.ref_count == 4
+
+    def test_pickle_detached_cell(self, store, user_entries):
+        user = user_entries[snowflakes.Snowflake(111)] = cache.RefCell(_make_user(111))
+        store[snowflakes.Snowflake(111)] = cache.RefCell(_make_member_data(user), ref_count=2)
+        cell = store[snowflakes.Snowflake(111)]
+        del store[snowflakes.Snowflake(111)]
+
+        result = pickle.loads(pickle.dumps(cell))  # noqa: S301 - pickle loads is unsafe with untrusted data
+
+        assert type(result) is cache.RefCell
+        assert result.object.nickname == "nick"
+        assert result.ref_count == 2
+
+
+class TestLazyMemberCell:
+    @pytest.fixture()
+    def user(self):
+        return cache.RefCell(_make_user(111))
+
+    @pytest.fixture()
+    def cell(self, user):
+        payload = {
+            "user": {"id": "111"},
+            "nick": "nick",
+            "roles": ["1", "2"],
+            "joined_at": "2020-07-15T23:30:59.501602+00:00",
+            "premium_since": None,
+            "deaf": True,
+            "mute": False,
+        }
+        return cache.LazyMemberCell(
+            payload, user, snowflakes.Snowflake(123), (snowflakes.Snowflake(1), snowflakes.Snowflake(2))
+        )
+
+    def test_object(self, cell, user):
+        result = cell.object
+
+        assert result.user is user
+        assert result.guild_id == 123
+        assert result.nickname == "nick"
+        assert result.role_ids == (1, 2)
+        assert result.joined_at == datetime.datetime(2020, 7, 15, 23, 30, 59, 501602, tzinfo=datetime.timezone.utc)
+        assert result.premium_since is None
+        assert result.is_deaf is True
+        assert result.is_mute is False
+        assert result.is_pending is undefined.UNDEFINED
+        assert result.has_been_deleted is False
+        assert cell.is_materialized is False
+
+    def test_object_builds_new_data_each_time(self, cell):
+        assert cell.object is not cell.object
+
+    def test_materialize(self, cell):
+        result = cell.materialize()
+
+        assert cell.is_materialized is True
+        assert cell.object is result
+        assert cell.materialize() is result
+
+    def test_dematerialize(self, cell):
+        cell.materialize()
+
+        cell.dematerialize()
+
+        assert cell.is_materialized is False
+
+    def test_object_setter(self, cell, user):
+        data = _make_member_data(user, nickname="new nick", has_been_deleted=True)
+
+        cell.object = data
+        cell.dematerialize()
+
+        assert cell.object is data
+
+    def test_set_payload(self, cell, user):
+        cell.object = _make_member_data(user)
+
+        cell.set_payload(
+            {"nick": None, "joined_at": "2021-01-01T00:00:00+00:00", "premium_since": "2021-01-02T00:00:00+00:00"},
+            user,
+            snowflakes.Snowflake(123),
+            (),
+        )
+
+        assert cell.is_materialized is False
+        result = cell.object
+        assert result.nickname is None
+        assert result.role_ids == ()
+        assert result.premium_since == datetime.datetime(2021, 1, 2, tzinfo=datetime.timezone.utc)
+        assert result.is_deaf is undefined.UNDEFINED
+
+    def test_copy(self, cell):
+        cell.ref_count = 3
+
+        result = copy.copy(cell)
+
+        assert type(result) is cache.RefCell
+        assert result.object.nickname == "nick"
+        assert result.ref_count == 3
+
+    def test_pickle(self, cell):
+        cell.ref_count = 2
+        cell.materialize()
+
+        result = pickle.loads(pickle.dumps(cell))  # noqa: S301 - pickle loads is unsafe with untrusted data
+
+        assert type(result) is cache.LazyMemberCell
+        assert result.ref_count == 2
+        assert result.is_materialized is False
+        assert result.object.nickname == "nick"
+        assert result.object.user.object.id == 111
+
+    def test_pickle_after_object_set(self, cell, user):
+        cell.object = _make_member_data(user, nickname="new nick")
+
+        result = pickle.loads(pickle.dumps(cell))  # noqa: S301 - pickle loads is unsafe with untrusted data
+
+        assert result.object.nickname == "new nick"
@@ -23,6 +23,7 @@ import array as array_
 import asyncio
 import datetime
 import operator
+import pickle  # noqa: S403 - Consider possible security implications associated with pickle module
 import sys
 import time
 
@@ -59,6 +60,36 @@ class TestFreezableDict:
         assert result == {"hikari": "shinji", "gendo": "san"}
         assert isinstance(result, dict)
 
+    def test_view(self):
+        mock_map = collections.FreezableDict({"hikari": "shinji", "gendo": "san"})
+        result = mock_map.view()
+
+        assert result == {"hikari": "shinji", "gendo": "san"}
+        assert mock_map._shared is True
+
+        with pytest.raises(TypeError):
+            result["ok"] = "no"
+
+    def test_view_is_not_changed_by_later_modifications(self):
+        mock_map = collections.FreezableDict({"hikari": "shinji", "gendo": "san"})
+        result = mock_map.view()
+
+        mock_map["ayanami"] = "rei"
+        del mock_map["hikari"]
+
+        assert result == {"hikari": "shinji", "gendo": "san"}
+        assert mock_map == {"gendo": "san", "ayanami": "rei"}
+        assert mock_map._shared is False
+
+    def test_view_is_not_changed_by_later_clear(self):
+        mock_map = collections.FreezableDict({"hikari": "shinji", "gendo": "san"})
+        result = mock_map.view()
+
+        mock_map.clear()
+
+        assert result == {"hikari": "shinji", "gendo": "san"}
+        assert mock_map == {}
+
     def test___delitem__(self):
         mock_map = collections.FreezableDict({"hikari": "shinji", "gendo": "san", "screwed": "up"})
         del mock_map["hikari"]
@@ -77,6 +108,10 @@ class TestFreezableDict:
         mock_map = collections.FreezableDict({"hmm": "blam", "cat": "bag", "ok": "bye"})
         assert len(mock_map) == 3
 
+    def test___sizeof__(self):
+        mock_map = collections.FreezableDict({"hmm": "blam", "cat": "bag", "ok": "bye"})
+        assert mock_map.__sizeof__() == object.__sizeof__(mock_map) + sys.getsizeof(mock_map._data)
+
     def test___setitem__(self):
         mock_map = collections.FreezableDict({"hmm": "forearm", "cat": "bag", "ok": "bye"})
         mock_map["bye"] = 4
@@ -166,6 +201,20 @@ class TestTimedCacheMap:
         assert result == {"bash": "gtuutueu", "blam": "poke", "owowo": "no you"}
         assert isinstance(result, collections._FrozenDict)
 
+    def test_view(self):
+        raw_map = {
+            "bash": (999999999999999999999999, "gtuutueu"),
+            "blam": (999999999999999999999999, "poke"),
+        }
+        mock_map = collections.TimedCacheMap(raw_map, expiry=datetime.timedelta(seconds=6523423))
+        result = mock_map.view()
+
+        mock_map["owowo"] = "no you"
+        del mock_map["bash"]
+
+        assert result == {"bash": "gtuutueu", "blam": "poke"}
+        assert mock_map == {"blam": "poke", "owowo": "no you"}
+
     def test___delitem__(self):
         mock_map = collections.TimedCacheMap(expiry=datetime.timedelta(seconds=100))
         mock_map.update({"ok": "no", "ayanami": "rei qt"})
@@ -222,6 +271,11 @@ class TestTimedCacheMap:
         mock_map.update({"o": "k", "boop": "bop", "k": "o", "awoo": "blam", "rei": "cute", "hikari": "rei"})
         assert len(mock_map) == 6
 
+    def test___sizeof__(self):
+        mock_map = collections.TimedCacheMap(expiry=datetime.timedelta(seconds=100))
+        mock_map.update({"o": "k", "boop": "bop"})
+        assert mock_map.__sizeof__() == object.__sizeof__(mock_map) + sys.getsizeof(mock_map._data)
+
     def test___setitem__(self):
         mock_map = collections.TimedCacheMap(expiry=datetime.timedelta(seconds=100))
         mock_map["blat"] = 42
@@ -253,6 +307,46 @@ class TestTimedCacheMap:
         mock_map["nyaa"] = "qt"
         assert mock_map == {"ayanami": "rei", "nyaa": "qt"}
 
+    def test___setitem___evicts_oldest_over_limit(self):
+        mock_callback = mock.Mock()
+        mock_map = collections.TimedCacheMap(expiry=datetime.timedelta(seconds=100), limit=2, on_expire=mock_callback)
+        mock_map["ok"] = "no"
+        mock_map["blam"] = "bye"
+        mock_map["bam"] = "hi"
+
+        assert mock_map == {"blam": "bye", "bam": "hi"}
+        mock_callback.assert_called_once_with("no")
+
+    def test___setitem___evicts_oldest_over_limit_when_shared(self):
+        mock_map = collections.TimedCacheMap(expiry=datetime.timedelta(seconds=100), limit=1)
+        mock_map["ok"] = "no"
+        view = mock_map.view()
+
+        mock_map["blam"] = "bye"
+
+        assert mock_map == {"blam": "bye"}
+        assert view == {"ok": "no"}
+
+    def test_copy_keeps_limit(self):
+        mock_map = collections.TimedCacheMap(expiry=datetime.timedelta(seconds=100), limit=1)
+
+        result = mock_map.copy()
+        result["ok"] = "no"
+        result["blam"] = "bye"
+
+        assert result == {"blam": "bye"}
+
+    def test_pickle_round_trip(self):
+        mock_map = collections.TimedCacheMap(expiry=datetime.timedelta(seconds=100), limit=2)
+        mock_map["ok"] = "no"
+        mock_map["blam"] = "bye"
+
+        result = pickle.loads(pickle.dumps(mock_map))  # noqa: S301 - pickle loads is unsafe with untrusted data
+        result["bam"] = "hi"
+
+        assert result == {"blam": "bye", "bam": "hi"}
+        assert all(0 <= time.perf_counter() - timestamp < 100 for timestamp, _ in result._data.values())
+
 
 class TestLimitedCapacityCacheMap:
     def test___init___with_source(self):
@@ -281,6 +375,15 @@ class TestLimitedCapacityCacheMap:
         assert isinstance(result, dict)
         assert result == {"o": "no", "good": "bye"}
 
+    def test_view(self):
+        mock_map = collections.LimitedCapacityCacheMap({"o": "no", "good": "bye"}, limit=2)
+        result = mock_map.view()
+
+        mock_map["ayanami"] = "rei"
+
+        assert result == {"o": "no", "good": "bye"}
+        assert mock_map == {"good": "bye", "ayanami": "rei"}
+
     def test___delitem___for_existing_entry(self):
         mock_map = collections.LimitedCapacityCacheMap(limit=50)
         mock_map["Ok"] = 42
@@ -312,6 +415,11 @@ class TestLimitedCapacityCacheMap:
         mock_map.update({"ooga": "blam", "blaaa": "neoeo", "the": "boys", "neon": "genesis", "evangelion": None})
         assert len(mock_map) == 5
 
+    def test___sizeof__(self):
+        mock_map = collections.LimitedCapacityCacheMap(limit=50)
+        mock_map.update({"ooga": "blam", "blaaa": "neoeo"})
+        assert mock_map.__sizeof__() == object.__sizeof__(mock_map) + sys.getsizeof(mock_map._data)
+
     def test___setitem___when_limit_not_reached(self):
         mock_map = collections.LimitedCapacityCacheMap(limit=50)
         mock_map["OK"] = 523
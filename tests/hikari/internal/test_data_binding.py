@@ -261,3 +261,25 @@ class TestCastJSONArray:
         assert cast.call_args_list[0] == mock.call("foo", foo=42, bar="OK")
         assert cast.call_args_list[1] == mock.call("bar", foo=42, bar="OK")
         assert cast.call_args_list[2] == mock.call("baz", foo=42, bar="OK")
+
+
+class TestJSONCodecs:
+    def test_slow_json_dumps_is_compact(self):
+        assert data_binding.slow_json_dumps({"a": [1, 2], "b": None}) == '{"a":[1,2],"b":null}'
+
+    @pytest.mark.parametrize("payload", ['{"a": [1, 2], "b": null}', b'{"a": [1, 2], "b": null}'])
+    def test_slow_json_loads(self, payload):
+        assert data_binding.slow_json_loads(payload) == {"a": [1, 2], "b": None}
+
+    @pytest.mark.skipif(data_binding.fast_json_dumps is None, reason="No speedup JSON library installed")
+    def test_fast_json_round_trip(self):
+        payload = {"id": "123", "a": [1, 2.5, True, None], "b": {"c": "こんにちは"}}
+
+        assert data_binding.fast_json_loads(data_binding.fast_json_dumps(payload)) == payload
+        assert data_binding.fast_json_loads(data_binding.fast_json_dumps(payload).encode("utf-8")) == payload
+
+    def test_default_json_dumps(self):
+        assert data_binding.default_json_dumps is (data_binding.fast_json_dumps or data_binding.slow_json_dumps)
+
+    def test_default_json_loads(self):
+        assert data_binding.default_json_loads is (data_binding.fast_json_loads or data_binding.slow_json_loads)
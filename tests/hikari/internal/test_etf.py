@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import zlib
+
+import pytest
+
+from hikari.internal import etf
+
+_PAYLOAD = {
+    "op": 0,
+    "t": "GUILD_CREATE",
+    "s": 42,
+    "d": {
+        "id": 123456789012345678,
+        "name": "こんにちは",
+        "large": True,
+        "unavailable": False,
+        "icon": None,
+        "member_count": 70000,
+        "offset": -5,
+        "ratio": 1.5,
+        "roles": [{"id": 987654321098765432, "permissions": "1071698660929", "tags": {}}],
+        "features": [],
+    },
+}
+
+
+class TestSlowETF:
+    @pytest.mark.parametrize(
+        ("obj", "expected"),
+        [
+            (None, b"\x83s\x03nil"),
+            (True, b"\x83s\x04true"),
+            (False, b"\x83s\x05false"),
+            (1, b"\x83a\x01"),
+            (-1, b"\x83b\xff\xff\xff\xff"),
+            (2 ** 32, b"\x83n\x05\x00\x00\x00\x00\x00\x01"),
+            (-(2 ** 32), b"\x83n\x05\x01\x00\x00\x00\x00\x01"),
+            (1.5, b"\x83F?\xf8\x00\x00\x00\x00\x00\x00"),
+            ("hi", b"\x83m\x00\x00\x00\x02hi"),
+            ([], b"\x83j"),
+            ([1], b"\x83l\x00\x00\x00\x01a\x01j"),
+            ({"a": 1}, b"\x83t\x00\x00\x00\x01m\x00\x00\x00\x01aa\x01"),
+        ],
+    )
+    def test_slow_etf_dumps(self, obj, expected):
+        assert etf.slow_etf_dumps(obj) == expected
+
+    def test_slow_etf_dumps_when_unsupported_type(self):
+        with pytest.raises(TypeError, match="Cannot encode object of type object to ETF"):
+            etf.slow_etf_dumps(object())
+
+    def test_slow_etf_round_trip(self):
+        assert etf.slow_etf_loads(etf.slow_etf_dumps(_PAYLOAD)) == _PAYLOAD
+
+    def test_slow_etf_round_trip_large_big(self):
+        assert etf.slow_etf_loads(etf.slow_etf_dumps(-(2 ** 2100))) == -(2 ** 2100)
+
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            (b"\x83d\x00\x04test", "test"),
+            (b"\x83v\x00\x04true", True),
+            (b"\x83w\x03nil", None),
+            (b"\x83k\x00\x03\x01\x02\x03", [1, 2, 3]),
+            (b"\x83h\x02a\x01a\x02", (1, 2)),
+            (b"\x83i\x00\x00\x00\x01a\x01", (1,)),
+            (b"\x83l\x00\x00\x00\x01a\x01a\x02", [1, 2]),
+            (b"\x83c" + b"1.50000000000000000000e+00".ljust(31, b"\x00"), 1.5),
+            (b"\x83t\x00\x00\x00\x01s\x02idn\x08\x00N\x01\x00\x00\x00\x00\x00\x01", {"id": 72057594037928270}),
+        ],
+    )
+    def test_slow_etf_loads(self, data, expected):
+        assert etf.slow_etf_loads(data) == expected
+
+    def test_slow_etf_loads_when_compressed(self):
+        term = etf.slow_etf_dumps(_PAYLOAD)[1:]
+        data = b"\x83P" + len(term).to_bytes(4, "big") + zlib.compress(term)
+
+        assert etf.slow_etf_loads(data) == _PAYLOAD
+
+    @pytest.mark.parametrize(
+        ("data", "message"),
+        [
+            (b"\x82j", "Unsupported ETF version 130"),
+            (b"\x83", "Malformed ETF term"),
+            (b"\x83m\x00\x00", "Malformed ETF term"),
+            (b"\x83\x00", "Malformed ETF term"),
+            (b"\x83jj", "Unexpected trailing data after ETF term"),
+        ],
+    )
+    def test_slow_etf_loads_when_invalid(self, data, message):
+        with pytest.raises(ValueError, match=message):
+            etf.slow_etf_loads(data)
+
+
+class TestFastETF:
+    @pytest.mark.skipif(etf.fast_etf_dumps is None, reason="No speedup ETF library installed")
+    def test_fast_etf_dumps_is_compatible_with_slow_etf_dumps(self):
+        assert etf.fast_etf_dumps(_PAYLOAD) == etf.slow_etf_dumps(_PAYLOAD)
+
+    def test_default_etf_dumps(self):
+        assert etf.default_etf_dumps is (etf.fast_etf_dumps or etf.slow_etf_dumps)
+
+    def test_default_etf_loads(self):
+        assert etf.default_etf_loads is etf.slow_etf_loads
@@ -20,12 +20,14 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import datetime
 import ssl
 
 import pytest
 import yarl
 
 from hikari import config as config_
+from hikari.internal import routes
 
 
 class TestSSLFactory:
@@ -124,3 +126,95 @@ class TestProxySettings:
     def test_all_headers_when_headers_and_auth_are_not_None(self):
         config = config_.ProxySettings(headers={"header1": "header1 info"}, auth="some auth")
         assert config.all_headers == {"header1": "header1 info", config_._PROXY_AUTHENTICATION_HEADER: "some auth"}
+
+
+class TestCacheSettings:
+    @pytest.mark.parametrize("field", ["max_members_per_guild", "max_presences_per_guild"])
+    @pytest.mark.parametrize("value", [0, -1])
+    def test_limit_validator_when_not_positive(self, field, value):
+        with pytest.raises(ValueError, match=rf"CacheSettings.{field} must be None or a POSITIVE integer"):
+            config_.CacheSettings(**{field: value})
+
+    @pytest.mark.parametrize("field", ["member_expiry", "presence_expiry"])
+    @pytest.mark.parametrize("value", [datetime.timedelta(), datetime.timedelta(seconds=-1)])
+    def test_expiry_validator_when_not_positive(self, field, value):
+        with pytest.raises(ValueError, match=rf"CacheSettings.{field} must be None or a POSITIVE timedelta"):
+            config_.CacheSettings(**{field: value})
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"max_members_per_guild": 10}, {"member_expiry": datetime.timedelta(minutes=10)}]
+    )
+    def test_columnar_members_validator_when_member_policy_set(self, kwargs):
+        with pytest.raises(ValueError, match="CacheSettings.columnar_members cannot be used with a member limit"):
+            config_.CacheSettings(columnar_members=True, **kwargs)
+
+    @pytest.mark.parametrize(
+        ("field", "value"), [("max_members_per_guild", 10), ("member_expiry", datetime.timedelta(minutes=10))]
+    )
+    def test_member_policy_validator_when_columnar_members(self, field, value):
+        settings = config_.CacheSettings(columnar_members=True)
+
+        with pytest.raises(ValueError, match=rf"CacheSettings.{field} cannot be used with columnar_members"):
+            setattr(settings, field, value)
+
+    def test_lazy_members_validator_when_columnar_members(self):
+        settings = config_.CacheSettings(columnar_members=True)
+
+        with pytest.raises(ValueError, match="CacheSettings.lazy_members cannot be used with columnar_members"):
+            settings.lazy_members = True
+
+    def test_max_materialized_members_validator_when_negative(self):
+        with pytest.raises(ValueError, match="CacheSettings.max_materialized_members must be a NON-NEGATIVE integer"):
+            config_.CacheSettings(max_materialized_members=-1)
+
+    def test_columnar_members_validator_when_lazy_members(self):
+        with pytest.raises(ValueError, match="CacheSettings.columnar_members cannot be used with lazy_members"):
+            config_.CacheSettings(columnar_members=True, lazy_members=True)
+
+    def test_eviction_policies(self):
+        settings = config_.CacheSettings(
+            max_members_per_guild=10,
+            member_expiry=datetime.timedelta(minutes=10),
+            max_presences_per_guild=5,
+            presence_expiry=datetime.timedelta(minutes=5),
+        )
+
+        assert settings.max_members_per_guild == 10
+        assert settings.member_expiry == datetime.timedelta(minutes=10)
+        assert settings.max_presences_per_guild == 5
+        assert settings.presence_expiry == datetime.timedelta(minutes=5)
+
+
+class TestDispatchSettings:
+    @pytest.mark.parametrize("field", ["max_queue_size", "workers"])
+    @pytest.mark.parametrize("value", [0, -1, 1.5])
+    def test_validator_when_not_positive_int(self, field, value):
+        with pytest.raises(ValueError, match=rf"DispatchSettings.{field} must be a POSITIVE integer"):
+            config_.DispatchSettings(**{field: value})
+
+    def test_droppable_events_is_frozen(self):
+        settings = config_.DispatchSettings(droppable_events=["TYPING_START"])
+
+        assert settings.droppable_events == frozenset(("TYPING_START",))
+
+
+class TestResponseCacheSettings:
+    @pytest.mark.parametrize("value", [0, -1, 1.5])
+    def test_max_entries_validator_when_not_positive_int(self, value):
+        with pytest.raises(ValueError, match="ResponseCacheSettings.max_entries must be a POSITIVE integer"):
+            config_.ResponseCacheSettings(max_entries=value)
+
+    @pytest.mark.parametrize("value", [0, -1, "60"])
+    def test_ttls_validator_when_not_positive(self, value):
+        with pytest.raises(ValueError, match="ResponseCacheSettings.ttls must map routes to POSITIVE numbers"):
+            config_.ResponseCacheSettings(ttls={routes.GET_GUILD: value})
+
+    def test_ttls_validator_when_not_get_route(self):
+        with pytest.raises(ValueError, match="ResponseCacheSettings.ttls can only contain GET routes"):
+            config_.ResponseCacheSettings(ttls={routes.PATCH_GUILD: 60})
+
+    def test_ttls_default(self):
+        ttls = config_.ResponseCacheSettings().ttls
+
+        assert ttls[routes.GET_GUILD] == 60
+        assert ttls is not config_.ResponseCacheSettings().ttls